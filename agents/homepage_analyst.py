@@ -6,10 +6,12 @@ Uses OpenAI GPT-4o for complex reasoning and analysis.
 
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 
-homepage_analyst = Agent(
+homepage_analyst = lazy_agent(lambda: Agent(
     name="Homepage Analyst",
-    model=config.DEFAULT_MODEL,
+    model=resolve_model(config.DEFAULT_MODEL),
     instructions="""
     You are a B2B company analyst specializing in homepage analysis.
 
@@ -40,4 +42,4 @@ homepage_analyst = Agent(
     Keep it concise but comprehensive.
     """,
     markdown=True
-)
+))
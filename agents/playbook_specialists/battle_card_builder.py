@@ -1,17 +1,24 @@
 from agno.agent import Agent
 import config
-from models.playbook import BattleCard
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
+from models.playbook import BattleCard, BattleCardTailoring
 from typing import List
 from pydantic import BaseModel
+from utils.context_compiler import ContextSpec
 
 
 class BattleCardResult(BaseModel):
     battle_cards: List[BattleCard]
 
 
-battle_card_builder = Agent(
+class BattleCardTailoringResult(BaseModel):
+    tailorings: List[BattleCardTailoring]
+
+
+battle_card_builder = lazy_agent(lambda: Agent(
     name="Battle Card Specialist",
-    model=config.DEFAULT_MODEL,
+    model=resolve_model(config.DEFAULT_MODEL),
     instructions="""
     You are a competitive intelligence expert creating sales battle cards for ABM (Account-Based Marketing) campaigns.
 
@@ -180,4 +187,80 @@ battle_card_builder = Agent(
     Focus on what they'll encounter most: objections and "why you?" questions.
     """,
     output_schema=BattleCardResult
+))
+
+
+# Intelligence fields this agent reads (compiled by utils/context_compiler.py)
+battle_card_context = ContextSpec(
+    fields={
+        "vendor.offerings": ["name", "description"],
+        "vendor.value_propositions": ["statement", "differentiation"],
+        "vendor.differentiators": ["category", "statement", "vs_alternative", "evidence"],
+        "vendor.proof_points": ["type", "content", "source_attribution"],
+        "vendor.case_studies": ["customer_name", "results", "metrics"],
+        "vendor.customers": ["name", "industry"],
+        "prospect.company_profile": ["company_name", "industry", "company_size", "what_they_do"],
+        "prospect.pain_points": ["description", "category", "evidence"],
+        "prospect.target_buyer_personas": ["persona_title", "pain_points"]
+    },
+    token_budget=25000
+)
+
+
+# Fields for the vendor-level base cards (no prospect data, so the cards are cached per vendor)
+battle_card_base_context = ContextSpec(
+    fields={
+        "vendor.offerings": ["name", "description"],
+        "vendor.value_propositions": ["statement", "differentiation"],
+        "vendor.differentiators": ["category", "statement", "vs_alternative", "evidence"],
+        "vendor.proof_points": ["type", "content", "source_attribution"],
+        "vendor.case_studies": ["customer_name", "results", "metrics"],
+        "vendor.customers": ["name", "industry"],
+        "vendor.vendor_icp_personas": ["persona_title", "pain_points"]
+    },
+    token_budget=25000
+)
+
+
+battle_card_tailor = lazy_agent(lambda: Agent(
+    name="Battle Card Tailoring Specialist",
+    model=resolve_model(config.DEFAULT_MODEL),
+    instructions="""
+    You adapt a vendor's standard sales battle cards to one specific prospect account (ABM).
+
+    YOU WILL RECEIVE:
+    - Base battle cards: the vendor's standard Why We Win, Objection Handling and
+      Competitive Positioning cards (written for any prospect)
+    - Prospect intelligence: the target account's company profile, pain points and personas
+    - Relevant vendor proof: the vendor's proof points and case studies most relevant to this prospect
+
+    YOUR TASK:
+    Return one tailoring per base card (same card_type). Do NOT rewrite the base cards -
+    only return what changes for this prospect:
+
+    1. key_differentiators (3-5): the base card's differentiators reframed around the
+       prospect's pain points, strongest for this prospect first
+    2. proof_points (3-5): the proof this prospect will find most convincing
+       (similar industry, size or pain point) - use only proof you were given
+    3. objection_responses (objection_handling card only, 2-4): objections THIS prospect is
+       likely to raise given their pain points and situation, with exact talk tracks
+       (Acknowledge → Reframe → Proof). Do not repeat the base card's objections.
+    4. persona_focus: the prospect persona the card matters most for (optional)
+
+    Keep it specific to the prospect. Leave a list empty if nothing changes.
+    """,
+    output_schema=BattleCardTailoringResult
+))
+
+
+# Fields for the prospect tailoring pass (base cards are added to the prompt separately)
+battle_card_tailoring_context = ContextSpec(
+    fields={
+        "vendor.proof_points": ["type", "content", "source_attribution"],
+        "vendor.case_studies": ["customer_name", "industry", "results", "metrics"],
+        "prospect.company_profile": ["company_name", "industry", "company_size", "what_they_do"],
+        "prospect.pain_points": ["description", "category", "evidence"],
+        "prospect.target_buyer_personas": ["persona_title", "pain_points"]
+    },
+    token_budget=15000
 )
@@ -1,17 +1,20 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from models.playbook import EmailSequence
 from typing import List
 from pydantic import BaseModel
+from utils.context_compiler import ContextSpec
 
 
 class EmailSequenceResult(BaseModel):
     email_sequences: List[EmailSequence]
 
 
-email_sequence_writer = Agent(
+email_sequence_writer = lazy_agent(lambda: Agent(
     name="Email Sequence Specialist",
-    model=config.DEFAULT_MODEL,
+    model=resolve_model(config.DEFAULT_MODEL),
     instructions="""
     You are an expert B2B sales email copywriter creating ABM (Account-Based Marketing) email sequences.
 
@@ -202,4 +205,19 @@ email_sequence_writer = Agent(
     Make it conversational, human, and value-focused.
     """,
     output_schema=EmailSequenceResult
+))
+
+
+# Intelligence fields this agent reads (compiled by utils/context_compiler.py)
+email_sequence_context = ContextSpec(
+    fields={
+        "persona": ["persona_title", "department", "why_they_care", "pain_points", "goals", "suggested_talking_points"],
+        "vendor.offerings": ["name", "description"],
+        "vendor.case_studies": ["customer_name", "industry", "results", "metrics"],
+        "vendor.value_propositions": ["statement", "benefits"],
+        "vendor.proof_points": ["content", "source_attribution"],
+        "vendor.differentiators": ["statement"],
+        "prospect.pain_points": ["description", "evidence"]
+    },
+    token_budget=20000
 )
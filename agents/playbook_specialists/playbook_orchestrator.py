@@ -1,6 +1,9 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from pydantic import BaseModel
+from utils.context_compiler import ContextSpec
 from typing import List, Dict
 
 
@@ -11,9 +14,9 @@ class PlaybookSummary(BaseModel):
     success_metrics: Dict[str, str]
 
 
-playbook_orchestrator = Agent(
+playbook_orchestrator = lazy_agent(lambda: Agent(
     name="Sales Playbook Orchestrator",
-    model=config.DEFAULT_MODEL,
+    model=resolve_model(config.DEFAULT_MODEL),
     instructions="""
     You are a sales playbook strategist creating ABM (Account-Based Marketing) playbooks.
 
@@ -72,4 +75,23 @@ playbook_orchestrator = Agent(
     persona titles list. Do NOT abbreviate, rephrase, or modify persona titles.
     """,
     output_schema=PlaybookSummary
+))
+
+
+# Intelligence fields this agent reads (compiled by utils/context_compiler.py)
+playbook_orchestrator_context = ContextSpec(
+    fields={
+        "vendor.offerings": ["name", "description"],
+        "vendor.case_studies": ["customer_name", "industry", "results", "metrics"],
+        "vendor.value_propositions": ["statement"],
+        "vendor.use_cases": ["title", "problems_solved"],
+        "vendor.vendor_icp_personas": ["title"],
+        "vendor.differentiators": ["statement"],
+        "vendor.proof_points": ["type", "content"],
+        "vendor.customers": ["name", "industry"],
+        "prospect.company_profile": ["company_name", "industry", "company_size", "what_they_do", "target_market"],
+        "prospect.pain_points": ["description", "affected_personas"],
+        "prospect.target_buyer_personas": ["persona_title", "department", "why_they_care", "priority_score"]
+    },
+    token_budget=30000
 )
@@ -1,17 +1,20 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from models.playbook import TalkTrack
 from typing import List
 from pydantic import BaseModel
+from utils.context_compiler import ContextSpec
 
 
 class TalkTrackResult(BaseModel):
     talk_tracks: List[TalkTrack]
 
 
-talk_track_creator = Agent(
+talk_track_creator = lazy_agent(lambda: Agent(
     name="Talk Track Specialist",
-    model=config.DEFAULT_MODEL,
+    model=resolve_model(config.DEFAULT_MODEL),
     instructions="""
     You are a sales call coaching expert creating talk tracks for ABM (Account-Based Marketing) outreach.
 
@@ -186,4 +189,20 @@ talk_track_creator = Agent(
     Focus on questions that uncover pain and qualify the prospect.
     """,
     output_schema=TalkTrackResult
+))
+
+
+# Intelligence fields this agent reads (compiled by utils/context_compiler.py)
+talk_track_context = ContextSpec(
+    fields={
+        "persona": ["persona_title", "department", "why_they_care", "pain_points", "goals", "suggested_talking_points"],
+        "vendor.offerings": ["name", "description", "features"],
+        "vendor.case_studies": ["customer_name", "challenge", "results"],
+        "vendor.value_propositions": ["statement", "benefits", "target_persona"],
+        "vendor.use_cases": ["title", "problems_solved", "key_features_used"],
+        "vendor.differentiators": ["statement", "vs_alternative"],
+        "prospect.company_profile": ["company_name", "industry", "what_they_do"],
+        "prospect.pain_points": ["description", "affected_personas"]
+    },
+    token_budget=25000
 )
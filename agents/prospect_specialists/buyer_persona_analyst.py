@@ -1,17 +1,20 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from models.prospect_intelligence import TargetBuyerPersona
 from typing import List
 from pydantic import BaseModel
+from utils.context_compiler import ContextSpec
 
 
 class BuyerPersonasResult(BaseModel):
     target_buyer_personas: List[TargetBuyerPersona]
 
 
-buyer_persona_analyst = Agent(
+buyer_persona_analyst = lazy_agent(lambda: Agent(
     name="Strategic Buyer Persona Analyst",
-    model=config.REASONING_MODEL,
+    model=resolve_model(config.REASONING_MODEL),
     instructions="""
     You are a strategic sales intelligence analyst identifying WHO at the prospect company the vendor should target for outreach.
 
@@ -70,4 +73,20 @@ buyer_persona_analyst = Agent(
     Make talking points specific to vendor's actual offerings.
     """,
     output_schema=BuyerPersonasResult
+))
+
+
+# Intelligence fields this agent reads (compiled by utils/context_compiler.py)
+buyer_persona_context = ContextSpec(
+    fields={
+        "vendor.offerings": ["name", "description", "target_audience"],
+        "vendor.case_studies": ["customer_name", "industry", "challenge", "results"],
+        "vendor.value_propositions": ["statement", "target_persona"],
+        "vendor.use_cases": ["title", "target_persona", "problems_solved"],
+        "vendor.vendor_icp_personas": ["title", "department", "pain_points"],
+        "vendor.differentiators": ["statement"],
+        "prospect.company_profile": ["company_name", "industry", "company_size", "what_they_do", "target_market"],
+        "prospect.pain_points": ["description", "category", "affected_personas", "confidence"]
+    },
+    token_budget=30000
 )
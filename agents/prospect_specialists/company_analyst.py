@@ -1,5 +1,7 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from models.prospect_intelligence import CompanyProfile
 from pydantic import BaseModel
 
@@ -8,9 +10,9 @@ class CompanyProfileResult(BaseModel):
     company_profile: CompanyProfile
 
 
-company_analyst = Agent(
+company_analyst = lazy_agent(lambda: Agent(
     name="Company Profile Analyst",
-    model=config.REASONING_MODEL,
+    model=resolve_model(config.REASONING_MODEL),
     instructions="""
     You are a B2B company analyst extracting minimal company context for sales intelligence.
 
@@ -37,4 +39,4 @@ company_analyst = Agent(
     Be specific and action-oriented.
     """,
     output_schema=CompanyProfileResult
-)
+))
@@ -1,5 +1,7 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from models.prospect_intelligence import PainPoint
 from typing import List
 from pydantic import BaseModel
@@ -9,9 +11,9 @@ class PainPointsResult(BaseModel):
     pain_points: List[PainPoint]
 
 
-pain_point_analyst = Agent(
+pain_point_analyst = lazy_agent(lambda: Agent(
     name="Pain Point Analyst",
-    model=config.REASONING_MODEL,
+    model=resolve_model(config.REASONING_MODEL),
     instructions="""
     You are an expert at inferring company pain points and challenges from their content.
 
@@ -51,4 +53,4 @@ pain_point_analyst = Agent(
     Focus on pain points that would make them receptive to sales outreach.
     """,
     output_schema=PainPointsResult
-)
+))
@@ -8,6 +8,8 @@ from agno.agent import Agent
 from pydantic import BaseModel, Field
 from typing import List
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 
 
 class PrioritizedURL(BaseModel):
@@ -24,9 +26,9 @@ class URLPrioritizationResult(BaseModel):
     prospect_selected_urls: List[PrioritizedURL]
 
 
-url_prioritizer = Agent(
+url_prioritizer = lazy_agent(lambda: Agent(
     name="Strategic URL Selector",
-    model=config.FAST_MODEL,  # gpt-4o-mini: 40-60% faster!
+    model=resolve_model(config.FAST_MODEL),  # gpt-4o-mini: 40-60% faster!
     instructions="""
     You are a content strategist selecting the most valuable pages for B2B sales intelligence.
 
@@ -55,4 +57,4 @@ url_prioritizer = Agent(
     Return top 10-15 URLs per company, prioritized.
     """,
     output_schema=URLPrioritizationResult
-)
+))
@@ -1,5 +1,7 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from models.vendor_elements import CaseStudy
 from typing import List
 from pydantic import BaseModel
@@ -9,9 +11,9 @@ class CaseStudiesExtractionResult(BaseModel):
     case_studies: List[CaseStudy]
 
 
-case_study_extractor = Agent(
+case_study_extractor = lazy_agent(lambda: Agent(
     name="Case Study Extractor",
-    model=config.EXTRACTION_MODEL,  # gpt-4o-mini for fast extraction
+    model=resolve_model(config.EXTRACTION_MODEL),  # gpt-4o-mini for fast extraction
     instructions="""
     You are an expert at extracting customer success stories and case studies.
 
@@ -38,4 +40,4 @@ case_study_extractor = Agent(
     Extract metrics whenever available - numbers matter.
     """,
     output_schema=CaseStudiesExtractionResult
-)
+))
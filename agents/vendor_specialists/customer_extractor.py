@@ -1,5 +1,7 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from models.vendor_elements import ReferenceCustomer
 from typing import List
 from pydantic import BaseModel
@@ -9,9 +11,9 @@ class ReferenceCustomersExtractionResult(BaseModel):
     reference_customers: List[ReferenceCustomer]
 
 
-customer_extractor = Agent(
+customer_extractor = lazy_agent(lambda: Agent(
     name="Reference Customer Extractor",
-    model=config.EXTRACTION_MODEL,  # gpt-4o-mini for fast extraction
+    model=resolve_model(config.EXTRACTION_MODEL),  # gpt-4o-mini for fast extraction
     instructions="""
     You are an expert at identifying customer references and logos.
 
@@ -47,4 +49,4 @@ customer_extractor = Agent(
     - Employee count if mentioned
     """,
     output_schema=ReferenceCustomersExtractionResult
-)
+))
@@ -1,5 +1,7 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from models.vendor_elements import Differentiator
 from typing import List
 from pydantic import BaseModel
@@ -9,9 +11,9 @@ class DifferentiatorsExtractionResult(BaseModel):
     differentiators: List[Differentiator]
 
 
-differentiator_extractor = Agent(
+differentiator_extractor = lazy_agent(lambda: Agent(
     name="Competitive Differentiator Extractor",
-    model=config.EXTRACTION_MODEL,  # gpt-4o-mini for fast extraction
+    model=resolve_model(config.EXTRACTION_MODEL),  # gpt-4o-mini for fast extraction
     instructions="""
     You are an expert at identifying competitive differentiation.
 
@@ -51,4 +53,4 @@ differentiator_extractor = Agent(
     Extract evidence when available (customer proof, metrics, third-party validation).
     """,
     output_schema=DifferentiatorsExtractionResult
-)
+))
@@ -1,5 +1,7 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from models.vendor_elements import Offering
 from typing import List
 from pydantic import BaseModel
@@ -9,9 +11,9 @@ class OfferingsExtractionResult(BaseModel):
     offerings: List[Offering]
 
 
-offerings_extractor = Agent(
+offerings_extractor = lazy_agent(lambda: Agent(
     name="Offerings Extractor",
-    model=config.EXTRACTION_MODEL,  # gpt-4o-mini for fast extraction
+    model=resolve_model(config.EXTRACTION_MODEL),  # gpt-4o-mini for fast extraction
     instructions="""
     You are an expert at identifying and cataloging product offerings from company content.
 
@@ -36,4 +38,4 @@ offerings_extractor = Agent(
     Be thorough - capture every distinct product or service offering.
     """,
     output_schema=OfferingsExtractionResult
-)
+))
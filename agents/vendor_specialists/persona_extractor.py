@@ -1,5 +1,7 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from models.vendor_elements import TargetPersona
 from typing import List
 from pydantic import BaseModel
@@ -9,9 +11,9 @@ class TargetPersonasExtractionResult(BaseModel):
     target_personas: List[TargetPersona]
 
 
-persona_extractor = Agent(
+persona_extractor = lazy_agent(lambda: Agent(
     name="Vendor ICP Persona Extractor",
-    model=config.EXTRACTION_MODEL,  # gpt-4o-mini for fast extraction
+    model=resolve_model(config.EXTRACTION_MODEL),  # gpt-4o-mini for fast extraction
     instructions="""
     You are an expert at identifying a vendor's ICP (Ideal Customer Profile) personas.
 
@@ -55,4 +57,4 @@ persona_extractor = Agent(
     Remember: These are the vendor's TYPICAL buyer personas (their ICP), not specific people at a prospect company.
     """,
     output_schema=TargetPersonasExtractionResult
-)
+))
@@ -1,5 +1,7 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from models.vendor_elements import ProofPoint
 from typing import List
 from pydantic import BaseModel
@@ -9,9 +11,9 @@ class ProofPointsExtractionResult(BaseModel):
     proof_points: List[ProofPoint]
 
 
-proof_points_extractor = Agent(
+proof_points_extractor = lazy_agent(lambda: Agent(
     name="Proof Points Extractor",
-    model=config.EXTRACTION_MODEL,  # gpt-4o-mini for fast extraction
+    model=resolve_model(config.EXTRACTION_MODEL),  # gpt-4o-mini for fast extraction
     instructions="""
     You are an expert at identifying credibility indicators and social proof.
 
@@ -40,4 +42,4 @@ proof_points_extractor = Agent(
     Capture exact wording and attribution when available.
     """,
     output_schema=ProofPointsExtractionResult
-)
+))
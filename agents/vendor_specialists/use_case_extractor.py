@@ -1,5 +1,7 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from models.vendor_elements import UseCase
 from typing import List
 from pydantic import BaseModel
@@ -9,9 +11,9 @@ class UseCasesExtractionResult(BaseModel):
     use_cases: List[UseCase]
 
 
-use_case_extractor = Agent(
+use_case_extractor = lazy_agent(lambda: Agent(
     name="Use Case Extractor",
-    model=config.EXTRACTION_MODEL,  # gpt-4o-mini for fast extraction
+    model=resolve_model(config.EXTRACTION_MODEL),  # gpt-4o-mini for fast extraction
     instructions="""
     You are an expert at identifying use cases and workflow solutions.
 
@@ -50,4 +52,4 @@ use_case_extractor = Agent(
     - What product features enable it
     """,
     output_schema=UseCasesExtractionResult
-)
+))
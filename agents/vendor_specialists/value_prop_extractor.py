@@ -1,5 +1,7 @@
 from agno.agent import Agent
 import config
+from utils.fake_llm import resolve_model
+from utils.lazy_agent import lazy_agent
 from models.vendor_elements import ValueProposition
 from typing import List
 from pydantic import BaseModel
@@ -9,9 +11,9 @@ class ValuePropositionsExtractionResult(BaseModel):
     value_propositions: List[ValueProposition]
 
 
-value_prop_extractor = Agent(
+value_prop_extractor = lazy_agent(lambda: Agent(
     name="Value Proposition Extractor",
-    model=config.EXTRACTION_MODEL,  # gpt-4o-mini for fast extraction
+    model=resolve_model(config.EXTRACTION_MODEL),  # gpt-4o-mini for fast extraction
     instructions="""
     You are an expert at identifying core value propositions and positioning statements.
 
@@ -44,4 +46,4 @@ value_prop_extractor = Agent(
     Extract both primary value prop and secondary/supporting value propositions.
     """,
     output_schema=ValuePropositionsExtractionResult
-)
+))
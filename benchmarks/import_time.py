@@ -0,0 +1,144 @@
+"""
+Import Time Benchmark
+Measures the cost of importing the pipeline's entry modules with `python -X importtime`,
+in fresh interpreters without API keys, and fails (exit 1) on a regression:
+
+    - a module takes longer to import than its budget (best of --repeat runs)
+    - a module imports a package that should be deferred to first use: the Firecrawl
+      SDK (imported by utils/firecrawl_helpers.get_firecrawl()) or the OpenAI SDK
+      (imported once the first agent is built, see utils/lazy_agent.py)
+    - a module fails to import without API keys (keys are checked by config.validate()
+      at startup, not on import)
+
+Agent construction counts towards a module's import time, so agents built on import
+(instead of through utils/lazy_agent.py) show up as a regression too.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --modules main serve --repeat 10 --top 15
+    python benchmarks/import_time.py --budget serve=2500
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Budgets (ms, best of --repeat) with headroom over the measured import times (main ~0.5-0.7s,
+# serve ~1.3-1.8s; ~1.9s / ~2.3s with agents and the Firecrawl client built on import).
+# Agno itself accounts for most of workflow/main/serve.
+IMPORT_BUDGETS_MS = {
+    "config": 50,
+    "workflow": 1000,
+    "main": 1000,
+    "serve": 2200,
+}
+
+# Packages each module must not import (they are imported on first use)
+DEFERRED_IMPORTS = {
+    "config": ["agno", "firecrawl", "openai"],
+    "workflow": ["firecrawl", "openai"],
+    "main": ["firecrawl", "openai"],
+    "serve": ["firecrawl", "openai"],
+}
+
+# Settings removed from the environment so imports run as they would without a .env
+SCRUBBED_ENV = ("FIRECRAWL_API_KEY", "OPENAI_API_KEY", "ANTHROPIC_API_KEY",
+                "DEFAULT_MODEL", "FAST_MODEL", "REASONING_MODEL", "EXTRACTION_MODEL")
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int]]:
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        (module, self_us, cumulative_us) per imported module, in import order
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        imports.append((name.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def measure(module: str) -> List[Tuple[str, int, int]]:
+    """Import a module in a fresh interpreter and return its importtime records"""
+    env = {key: value for key, value in os.environ.items() if key not in SCRUBBED_ENV}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        error = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"import {module} failed without API keys:\n" + "\n".join(error[-5:]))
+    return parse_importtime(result.stderr)
+
+
+def by_package(imports: List[Tuple[str, int, int]], top: int) -> List[Tuple[str, float]]:
+    """Self import time (ms) grouped by top-level package, slowest first"""
+    packages: Dict[str, int] = {}
+    for name, self_us, _ in imports:
+        root = name.split(".")[0]
+        packages[root] = packages.get(root, 0) + self_us
+    return sorted(((name, us / 1000) for name, us in packages.items()), key=lambda item: item[1], reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", nargs="+", default=list(IMPORT_BUDGETS_MS), help="Modules to import")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per module (the best run is gated)")
+    parser.add_argument("--top", type=int, default=8, help="Slowest packages to list per module")
+    parser.add_argument("--budget", action="append", default=[], metavar="MODULE=MS", help="Override a module's budget")
+    args = parser.parse_args()
+
+    budgets = dict(IMPORT_BUDGETS_MS)
+    for override in args.budget:
+        module, _, ms = override.partition("=")
+        budgets[module] = float(ms)
+
+    failures = []
+    for module in args.modules:
+        try:
+            runs = [measure(module) for _ in range(max(1, args.repeat))]
+        except RuntimeError as e:
+            failures.append(str(e))
+            print(f"\n{module}: FAILED")
+            continue
+
+        totals = [next(cumulative for name, _, cumulative in reversed(run) if name == module) / 1000 for run in runs]
+        best = min(totals)
+        budget = budgets.get(module)
+        imported = {name.split(".")[0] for name, _, _ in runs[0]}
+        deferred = [package for package in DEFERRED_IMPORTS.get(module, []) if package in imported]
+
+        status = "ok"
+        if budget is not None and best > budget:
+            status = "OVER BUDGET"
+            failures.append(f"import {module}: {best:.0f}ms (budget {budget:.0f}ms)")
+        if deferred:
+            status = "EAGER IMPORT"
+            failures.append(f"import {module} imports {', '.join(deferred)} (should be deferred to first use)")
+
+        print(f"\n{module}: best {best:.0f}ms, median {statistics.median(totals):.0f}ms "
+              f"(budget {f'{budget:.0f}ms' if budget is not None else '-'}) - {status}")
+        best_run = runs[totals.index(best)]
+        for package, ms in by_package(best_run, args.top):
+            print(f"  {package:<28} {ms:>8.1f}ms")
+
+    print()
+    if failures:
+        print("Import time regressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("All imports within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Persona Matching Benchmark
+Compares the indexed persona matcher (utils/persona_index.py) with the previous
+difflib.SequenceMatcher scan used by Step 8, on synthetic persona lists of growing size.
+
+Every query is derived from a known persona, so besides speed the benchmark checks which
+persona each matcher picked: a lookup is correct if it returns that persona or one whose
+title rephrases to the same query, up to abbreviations and punctuation ("VP of Sales" /
+"Vice President of Sales"; the synthetic lists contain both).
+It fails (exit 1) if the index gets a lookup wrong that difflib gets right.
+
+Usage:
+    python benchmarks/persona_matching.py
+    python benchmarks/persona_matching.py --sizes 10 100 1000 --lookups 300
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.persona_index import PersonaIndex, normalize_title  # noqa: E402
+
+LEVELS = ["VP", "Vice President", "Head", "Director", "Senior Director", "Manager", "Chief"]
+FUNCTIONS = [
+    "Sales", "Marketing", "Revenue Operations", "Sales Operations", "Customer Success",
+    "Demand Generation", "Product Marketing", "Finance", "Engineering", "IT", "People",
+    "Partnerships", "Growth", "Field Marketing", "Sales Enablement", "Procurement"
+]
+QUALIFIERS = ["", " (or Chief Revenue Officer)", ", North America", ", Enterprise", " / GTM Lead"]
+
+
+def sequence_matcher_match(persona_title: str, all_personas: list, threshold: float = 0.7):
+    """Previous Step 8 implementation: SequenceMatcher against every persona"""
+    best_match = None
+    best_score = 0
+
+    for persona in all_personas:
+        similarity = SequenceMatcher(None, persona_title.lower(), persona["persona_title"].lower()).ratio()
+        if similarity > best_score:
+            best_score = similarity
+            best_match = persona
+
+    return best_match if best_score >= threshold else None
+
+
+def make_personas(count: int, rng: random.Random) -> list:
+    # There are only so many distinct titles to draw
+    count = min(count, len(LEVELS) * len(FUNCTIONS) * len(QUALIFIERS))
+    titles = set()
+    while len(titles) < count:
+        titles.add(f"{rng.choice(LEVELS)} of {rng.choice(FUNCTIONS)}{rng.choice(QUALIFIERS)}")
+    return [{"persona_title": title} for title in sorted(titles)]
+
+
+def rephrase(title: str, variant: int) -> str:
+    """Exact title (0) or one of the rephrasings an LLM tends to return"""
+    if variant == 1:
+        return title.replace("Vice President", "VP").replace(" of ", " ")
+    if variant == 2:
+        return title.split(" (")[0].split(",")[0]
+    if variant == 3:
+        return title.lower()
+    return title
+
+
+def make_queries(personas: list, count: int, rng: random.Random) -> list:
+    """
+    Queries with their expected matches.
+
+    Returns:
+        (query, titles of the personas it may match) pairs: the persona it was derived
+        from and any other persona whose title rephrases to the same query once normalized
+    """
+    queries = []
+    for _ in range(count):
+        variant = rng.randrange(4)
+        query = rephrase(rng.choice(personas)["persona_title"], variant)
+        normalized = normalize_title(query)
+        expected = {
+            p["persona_title"] for p in personas
+            if normalize_title(rephrase(p["persona_title"], variant)) == normalized
+        }
+        queries.append((query, expected))
+    return queries
+
+
+def bench(match, queries: list) -> tuple:
+    start = time.perf_counter()
+    results = [match(query) for query, _ in queries]
+    elapsed = time.perf_counter() - start
+    return elapsed, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 50, 500])
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    print(f"{'personas':>9} {'lookups':>8} {'difflib ms/lookup':>18} {'index ms/lookup':>16} {'build ms':>9} "
+          f"{'speedup':>8} {'difflib correct':>16} {'index correct':>14} {'agreement':>10}")
+
+    regressions = []
+
+    for size in args.sizes:
+        personas = make_personas(size, rng)
+        queries = make_queries(personas, args.lookups, rng)
+
+        start = time.perf_counter()
+        index = PersonaIndex(personas)
+        build_time = time.perf_counter() - start
+
+        baseline_time, baseline_results = bench(lambda q: sequence_matcher_match(q, personas), queries)
+        index_time, index_results = bench(index.match, queries)
+        index_results = [result and result.persona for result in index_results]
+
+        def correct(result, expected) -> bool:
+            return result is not None and result["persona_title"] in expected
+
+        baseline_correct = sum(correct(result, expected) for result, (_, expected) in zip(baseline_results, queries))
+        index_correct = sum(correct(result, expected) for result, (_, expected) in zip(index_results, queries))
+        agreement = sum(
+            (baseline and baseline["persona_title"]) == (indexed and indexed["persona_title"])
+            for baseline, indexed in zip(baseline_results, index_results)
+        )
+
+        for (query, expected), baseline, indexed in zip(queries, baseline_results, index_results):
+            if correct(baseline, expected) and not correct(indexed, expected):
+                regressions.append(
+                    f"{size} personas: {query!r} -> {indexed and indexed['persona_title']!r} "
+                    f"(difflib: {baseline['persona_title']!r})"
+                )
+
+        print(f"{size:>9} {len(queries):>8} {baseline_time * 1000 / len(queries):>18.3f} "
+              f"{index_time * 1000 / len(queries):>16.3f} {build_time * 1000:>9.2f} "
+              f"{baseline_time / max(index_time, 1e-9):>7.1f}x "
+              f"{baseline_correct * 100 / len(queries):>15.1f}% {index_correct * 100 / len(queries):>13.1f}% "
+              f"{agreement * 100 / len(queries):>9.1f}%")
+
+    if regressions:
+        print(f"\n❌ Index picked the wrong persona where difflib was right ({len(regressions)} lookups):")
+        for regression in sorted(set(regressions))[:20]:
+            print(f"  - {regression}")
+        sys.exit(1)
+    print("\n✅ Index matched the expected persona wherever difflib did")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+"""
+Pipeline Benchmark
+Runs the phase workflows end to end against replayed Firecrawl fixtures and a deterministic
+fake model (utils/fake_llm.py), so pipeline performance changes can be measured without
+API keys or credits. Reports throughput, critical-path latency, per-step timings (from the
+run traces, see utils/tracing.py) and peak memory.
+
+Fixtures are a JSON file of mapped URLs per domain and page markdown per URL. Record
+them from real sites with --record (needs FIRECRAWL_API_KEY); without --fixtures, a
+deterministic synthetic vendor and prospect site is generated.
+
+Caches, stores and checkpoints are disabled (or pointed at a temporary directory) so every
+run does the full work. A Phase 4 run only counts as successful if its playbook has every
+component (priority personas, email sequences, talk tracks, battle cards); the benchmark
+exits 1 if any run failed, since the timings of runs that skipped work are meaningless.
+
+Usage:
+    python benchmarks/pipeline.py
+    python benchmarks/pipeline.py --phases 4 --runs 6 --concurrency 3 --llm-latency 0.5
+    python benchmarks/pipeline.py --fixtures fixtures.json --vendor octavehq.com --prospect sendoso.com
+    python benchmarks/pipeline.py --record fixtures.json --vendor octavehq.com --prospect sendoso.com
+"""
+
+import argparse
+import contextlib
+import contextvars
+import hashlib
+import io
+import itertools
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Every run does the full work: no caches, stores or checkpoints shared between runs
+BENCHMARK_DIR = tempfile.mkdtemp(prefix="playbook_benchmark_")
+BENCHMARK_ENV = {
+    "LLM_CACHE_ENABLED": "false",
+    "STEP_MEMO_ENABLED": "false",
+    "RUN_CHECKPOINTS_ENABLED": "false",
+    "BATTLE_CARD_CACHE_ENABLED": "false",
+    "INCREMENTAL_EXTRACTION_ENABLED": "false",
+    "VENDOR_PROFILE_MAX_AGE_HOURS": "0",
+    "VENDOR_STORE_DIR": os.path.join(BENCHMARK_DIR, "vendors"),
+    "TRACING_ENABLED": "true",
+    "OTLP_TRACES_ENDPOINT": "",
+    # Agents are built on the fake model (their models are then set from the flags below);
+    # deadline runs degraded to the fast tier get a zero-latency fake
+    "DEFAULT_MODEL": "fake",
+    "FAST_MODEL": "fake",
+    "REASONING_MODEL": "fake",
+    "EXTRACTION_MODEL": "fake",
+}
+os.environ.update(BENCHMARK_ENV)
+# The fake model is not rate limited unless LLM_DEFAULT_TPM / LLM_DEFAULT_RPM are set
+os.environ.setdefault("LLM_DEFAULT_TPM", str(10 ** 9))
+os.environ.setdefault("LLM_DEFAULT_RPM", str(10 ** 6))
+
+from agno.agent import Agent  # noqa: E402
+
+import config  # noqa: E402
+from main import get_run_error, get_step_content_by_name  # noqa: E402
+from models.workflow_input import WorkflowInput  # noqa: E402
+from utils import firecrawl_helpers  # noqa: E402
+from utils.fake_llm import FakeModel, WORDS, parse_fake_model  # noqa: E402
+from utils.lazy_agent import LazyAgent  # noqa: E402
+from utils.step_graph import StepGraph  # noqa: E402
+from utils.tracing import trace_run  # noqa: E402
+from utils.workflow_helpers import normalize_domain  # noqa: E402
+from workflow import PIPELINE_STEP_NAME, build_phase_workflow, pipeline_steps  # noqa: E402
+
+PAGE_SECTIONS = ("customers", "case-studies", "product", "pricing", "about", "blog", "solutions", "integrations")
+
+
+class FixtureFirecrawl:
+    """Firecrawl client replaying fixture responses (map, scrape, batch scrape jobs)"""
+
+    def __init__(self, fixtures: dict, latency: float = 0.0, page_chars: int = 0):
+        self.domains = fixtures.get("domains", {})
+        self.pages = fixtures.get("pages", {})
+        self.latency = latency
+        # Synthetic fixtures generate any page on demand
+        self.page_chars = page_chars
+        self.jobs = {}
+        self._job_ids = itertools.count()
+
+    def _page(self, url: str):
+        if url in self.pages:
+            return self.pages[url]
+        if self.page_chars:
+            rng = random.Random(hashlib.sha256(url.encode("utf-8")).hexdigest())
+            words = " ".join(rng.choice(WORDS) for _ in range(self.page_chars // 8))
+            return f"# {url.rsplit('/', 1)[-1] or 'Home'}\n\n{words}"
+        return None
+
+    def _document(self, url: str, markdown: str):
+        return SimpleNamespace(markdown=markdown, html="", metadata=SimpleNamespace(source_url=url))
+
+    def map(self, url: str, limit: int = None, **kwargs):
+        time.sleep(self.latency)
+        urls = self.domains.get(normalize_domain(url), {}).get("urls", [])[:limit]
+        return SimpleNamespace(links=[SimpleNamespace(url=link) for link in urls])
+
+    def scrape(self, url: str, **kwargs):
+        time.sleep(self.latency)
+        markdown = self._page(url)
+        if markdown is None:
+            raise ValueError(f"No fixture for {url}")
+        return self._document(url, markdown)
+
+    def start_batch_scrape(self, urls: list, **kwargs):
+        # Replayed jobs finish within the call latency, so they complete on the first poll
+        time.sleep(self.latency)
+        job_id = f"fixture-{next(self._job_ids)}"
+        self.jobs[job_id] = list(urls)
+        return SimpleNamespace(id=job_id)
+
+    def get_batch_scrape_status(self, job_id: str, **kwargs):
+        urls = self.jobs[job_id]
+        return SimpleNamespace(status="completed", completed=len(urls), total=len(urls), data=[
+            self._document(url, markdown)
+            for url in urls
+            for markdown in [self._page(url)] if markdown is not None
+        ])
+
+    def cancel_batch_scrape(self, job_id: str) -> bool:
+        return True
+
+
+def synthetic_fixtures(domains: list, mapped_urls: int) -> dict:
+    """Mapped URLs for each domain (pages are generated on demand)"""
+    return {
+        "domains": {
+            domain: {"urls": [domain] + [
+                f"{domain}/{PAGE_SECTIONS[i % len(PAGE_SECTIONS)]}/page-{i}" for i in range(mapped_urls - 1)
+            ]}
+            for domain in domains
+        },
+        "pages": {}
+    }
+
+
+def record_fixtures(path: str, domains: list, pages_per_domain: int) -> None:
+    """Map each domain and scrape its homepage and first pages with the real Firecrawl client"""
+    fixtures = {"domains": {}, "pages": {}}
+    for domain in domains:
+        mapped = firecrawl_helpers.map_website(domain)
+        if not mapped["success"]:
+            sys.exit(f"Could not map {domain}: {mapped.get('error')}")
+        fixtures["domains"][domain] = {"urls": mapped["urls"]}
+
+        homepage = firecrawl_helpers.scrape_url(domain)
+        if homepage["success"]:
+            fixtures["pages"][domain] = homepage["markdown"]
+
+        batch = firecrawl_helpers.batch_scrape_urls(mapped["urls"][:pages_per_domain])
+        fixtures["pages"].update({url: data["markdown"] for url, data in batch["results"].items()})
+        print(f"Recorded {domain}: {len(mapped['urls'])} mapped URLs, {len(batch['results']) + 1} pages")
+
+    with open(path, "w") as f:
+        json.dump(fixtures, f)
+    print(f"Fixtures written to {path}")
+
+
+def install_fakes(fixtures: dict, args) -> int:
+    """Replace the Firecrawl client with fixtures and every agent's model with a FakeModel"""
+    firecrawl_helpers.fc = FixtureFirecrawl(fixtures, args.scrape_latency, 0 if args.fixtures else args.page_chars)
+
+    agents = {
+        id(value): value
+        for name, module in list(sys.modules.items()) if name.startswith("agents.")
+        for value in vars(module).values() if isinstance(value, (Agent, LazyAgent))
+    }
+    for agent in agents.values():
+        if args.model:
+            agent.model = parse_fake_model(args.model)
+        else:
+            agent.model = FakeModel(latency=args.llm_latency, output_tokens=args.output_tokens, list_items=args.list_items)
+    return len(agents)
+
+
+def critical_path(step_spans: dict, graph: StepGraph) -> tuple:
+    """Chain of steps, each the last-finishing dependency of the next, ending at the last step"""
+    name = max(step_spans, key=lambda step: step_spans[step]["end"])
+    path = [name]
+    while True:
+        deps = [dep for dep in graph.dependencies(name) if dep in step_spans]
+        if not deps:
+            break
+        name = max(deps, key=lambda step: step_spans[step]["end"])
+        path.append(name)
+    path.reverse()
+    return path, step_spans[path[-1]]["end"] - step_spans[path[0]]["start"]
+
+
+# Playbook fields that must be non-empty for a Phase 4 run to count as successful
+PLAYBOOK_COMPONENTS = ("priority_personas", "email_sequences", "talk_tracks", "battle_cards")
+
+
+def run_once(through_phase: int, workflow_input: dict, run_id: str) -> dict:
+    """One workflow run; returns its wall time, success and step spans"""
+    workflow = build_phase_workflow(through_phase, name=f"benchmark_phase_{through_phase}", input_schema=WorkflowInput)
+    started = time.perf_counter()
+    with trace_run(run_id) as trace:
+        result = workflow.run(input=workflow_input)
+    elapsed = time.perf_counter() - started
+
+    step_spans = {
+        span.name.split(":", 1)[1]: {"start": span.start, "end": span.end, "ms": span.duration_ms}
+        for span in trace.spans if span.kind == "step"
+    }
+    error = get_run_error(result)
+    success = error is None
+
+    if success and through_phase >= 4:
+        final = get_step_content_by_name(result.step_results, "assemble_final_playbook") or {}
+        empty = [key for key in PLAYBOOK_COMPONENTS if not (final.get("sales_playbook") or {}).get(key)]
+        if empty:
+            success, error = False, f"empty playbook components: {', '.join(empty)}"
+
+    return {"elapsed": elapsed, "success": success, "error": error, "steps": step_spans}
+
+
+def benchmark_phase(through_phase: int, args, workflow_input: dict) -> int:
+    """Benchmark one phase workflow and print its report; returns the number of failed runs"""
+    graph = StepGraph(PIPELINE_STEP_NAME, pipeline_steps(through_phase, workflow_input["persona_selection"]))
+    output = None if args.verbose else io.StringIO()
+
+    def run(i: int) -> dict:
+        return run_once(through_phase, workflow_input, f"benchmark_{through_phase}_{i}")
+
+    with contextlib.redirect_stdout(output) if output else contextlib.nullcontext():
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            runs = list(executor.map(lambda i: contextvars.copy_context().run(run, i), range(args.runs)))
+        wall = time.perf_counter() - started
+
+        # Peak memory of one run, measured separately so tracing allocations doesn't skew timings
+        tracemalloc.start()
+        run(args.runs)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    failed = [run for run in runs if not run["success"]]
+    elapsed = [run["elapsed"] for run in runs]
+    paths = [critical_path(run["steps"], graph) for run in runs if run["steps"]]
+
+    print(f"\nPhases 1-{through_phase}: {args.runs} runs, concurrency {args.concurrency}")
+    if failed:
+        print(f"  {len(failed)} runs FAILED: {failed[0]['error']}")
+    print(f"  throughput      {args.runs / wall * 60:,.1f} runs/min ({wall:.2f}s wall)")
+    print(f"  run latency     p50 {statistics.median(elapsed):.2f}s  max {max(elapsed):.2f}s")
+    if paths:
+        path, length = max(paths, key=lambda item: item[1])
+        print(f"  critical path   {length:.2f}s: {' -> '.join(path)}")
+    print(f"  peak memory     {peak / 1024 / 1024:,.1f}MB traced per run, "
+          f"{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:,.0f}MB process RSS")
+
+    print(f"  {'step':<28}{'p50':>10}{'max':>10}")
+    for step in [step.name for step in graph.steps]:
+        durations = [run["steps"][step]["ms"] for run in runs if step in run["steps"]]
+        if durations:
+            print(f"  {step:<28}{statistics.median(durations):>8.0f}ms{max(durations):>8.0f}ms")
+
+    return len(failed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vendor", default="vendor.example.com", help="Vendor domain")
+    parser.add_argument("--prospect", default="prospect.example.com", help="Prospect domain")
+    parser.add_argument("--fixtures", help="Recorded fixtures JSON (default: synthetic sites)")
+    parser.add_argument("--record", metavar="PATH", help="Record fixtures for --vendor/--prospect to PATH and exit")
+    parser.add_argument("--phases", default="1,2,3,4", help="Phase workflows to run (through phase N)")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per phase workflow")
+    parser.add_argument("--concurrency", type=int, default=1, help="Runs in flight at once")
+    parser.add_argument("--persona-selection", default="summary", choices=["summary", "score", "speculative"])
+    parser.add_argument("--model", help='Fake model spec for every agent, e.g. "fake:latency=1s-3s,rate_limit=0.02" (overrides the --llm-latency/--output-tokens/--list-items flags)')
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Fake model seconds per call")
+    parser.add_argument("--output-tokens", type=int, default=400, help="Fake model output tokens per call")
+    parser.add_argument("--list-items", type=int, default=3, help="Items per list field in fake outputs")
+    parser.add_argument("--scrape-latency", type=float, default=0.1, help="Seconds per replayed Firecrawl call")
+    parser.add_argument("--mapped-urls", type=int, default=300, help="Mapped URLs per synthetic site")
+    parser.add_argument("--page-chars", type=int, default=12000, help="Markdown characters per synthetic page")
+    parser.add_argument("--deadline", type=float, help="Run deadline in seconds (degrades steps as it runs short)")
+    parser.add_argument("--verbose", action="store_true", help="Show the pipeline's progress output")
+    args = parser.parse_args()
+
+    domains = [normalize_domain(args.vendor), normalize_domain(args.prospect)]
+    if args.record:
+        config.validate()
+        record_fixtures(args.record, domains, args.mapped_urls)
+        return
+
+    if args.fixtures:
+        with open(args.fixtures, "r") as f:
+            fixtures = json.load(f)
+    else:
+        fixtures = synthetic_fixtures(domains, args.mapped_urls)
+
+    agent_count = install_fakes(fixtures, args)
+    print(f"{agent_count} agents on {args.model or f'FakeModel ({args.llm_latency}s/call)'}, "
+          f"Firecrawl replayed from {args.fixtures or 'synthetic sites'} ({args.scrape_latency}s/call)")
+
+    workflow_input = {
+        "vendor_domain": domains[0],
+        "prospect_domain": domains[1],
+        "persona_selection": args.persona_selection,
+        "deadline_seconds": args.deadline
+    }
+    failed = 0
+    for through_phase in sorted({int(phase) for phase in args.phases.split(",")}):
+        failed += benchmark_phase(through_phase, args, workflow_input)
+
+    if failed:
+        print(f"\n❌ {failed} runs failed - their timings do not reflect a full run")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
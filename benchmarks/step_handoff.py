@@ -0,0 +1,190 @@
+"""
+Step Handoff Benchmark
+Compares reading parallel step results by re-parsing Agno's stringified sub-step content
+with ast.literal_eval (the previous get_parallel_step_content) with reading the original
+objects from the run's step outputs (utils/workflow_helpers.py), on a synthetic 50-page
+run (25 vendor + 25 prospect pages) and the reads Steps 6-8 make. The "JSON-serialized"
+row is the fallback for runs whose sub-step content was serialized (decoded once per run).
+
+Usage:
+    python benchmarks/step_handoff.py
+    python benchmarks/step_handoff.py --pages 50 --page-chars 12000 --repeat 5
+"""
+
+import argparse
+import ast
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agno.workflow.types import StepInput, StepOutput  # noqa: E402
+from utils.workflow_helpers import get_parallel_step_content  # noqa: E402
+
+EXTRACTORS = {
+    "extract_offerings": "offerings",
+    "extract_case_studies": "case_studies",
+    "extract_proof_points": "proof_points",
+    "extract_value_props": "value_propositions",
+    "extract_customers": "reference_customers",
+    "extract_use_cases": "use_cases",
+    "extract_personas": "vendor_icp_personas",
+    "extract_differentiators": "differentiators",
+}
+
+WORDS = (
+    "revenue pipeline platform customers teams workflow automation insights analytics "
+    "integration enterprise scale growth marketing sales data security onboarding"
+).split()
+
+
+def literal_eval_parallel_step_content(step_input: StepInput, parallel_block_name: str, step_name: str):
+    """Previous implementation: stringified block from get_step_content, then ast.literal_eval"""
+    parallel_block = step_input.get_step_content(parallel_block_name)
+    if not isinstance(parallel_block, dict):
+        return None
+    step_content = parallel_block.get(step_name)
+    if isinstance(step_content, str):
+        step_content = ast.literal_eval(step_content)
+    return step_content if isinstance(step_content, dict) else None
+
+
+def make_text(chars: int, rng: random.Random) -> str:
+    words = []
+    size = 0
+    while size < chars:
+        word = rng.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def make_pages(side: str, count: int, page_chars: int, rng: random.Random) -> dict:
+    return {f"https://{side}.example.com/page-{i}": f"# Page {i}\n\n{make_text(page_chars, rng)}" for i in range(count)}
+
+
+def make_items(count: int, urls: list, rng: random.Random) -> list:
+    return [
+        {
+            "name": make_text(30, rng),
+            "description": make_text(300, rng),
+            "sources": [{"url": rng.choice(urls), "excerpt": make_text(250, rng)} for _ in range(2)]
+        }
+        for _ in range(count)
+    ]
+
+
+def build_run(pages: int, page_chars: int, items: int, seed: int = 7) -> dict:
+    """Step outputs of a Steps 5-7 run, shaped like StepGraph exposes them"""
+    rng = random.Random(seed)
+    vendor_pages = make_pages("vendor", pages // 2, page_chars, rng)
+    prospect_pages = make_pages("prospect", pages - pages // 2, page_chars, rng)
+    vendor_urls = list(vendor_pages)
+    prospect_urls = list(prospect_pages)
+
+    def parallel(name: str, steps: dict) -> StepOutput:
+        return StepOutput(
+            step_name=name,
+            step_type="Parallel",
+            steps=[StepOutput(step_name=step, step_type="Step", content=content) for step, content in steps.items()]
+        )
+
+    return {
+        "batch_scrape": parallel("batch_scrape", {
+            "scrape_vendor_pages": {"vendor_content": vendor_pages, "vendor_urls_scraped": vendor_urls},
+            "scrape_prospect_pages": {"prospect_content": prospect_pages, "prospect_urls_scraped": prospect_urls},
+        }),
+        "vendor_element_extraction": parallel("vendor_element_extraction", {
+            step: {key: make_items(items, vendor_urls, rng)} for step, key in EXTRACTORS.items()
+        }),
+        "prospect_context_analysis": parallel("prospect_context_analysis", {
+            "analyze_company": {"company_profile": {"company_name": "Prospect", "summary": make_text(2000, rng)}},
+            "analyze_pain_points": {"pain_points": make_items(items, prospect_urls, rng)},
+        }),
+    }
+
+
+def serialize_run(step_outputs: dict) -> dict:
+    """Copy of a run's step outputs with sub-step content serialized to JSON"""
+    return {
+        name: StepOutput(
+            step_name=output.step_name,
+            step_type=output.step_type,
+            steps=[StepOutput(step_name=step.step_name, content=json.dumps(step.content)) for step in output.steps]
+        )
+        for name, output in step_outputs.items()
+    }
+
+
+def reads() -> list:
+    """(block, step) reads made by Steps 6-8 in one run"""
+    vendor_pages = [("batch_scrape", "scrape_vendor_pages")]
+    prospect_pages = [("batch_scrape", "scrape_prospect_pages")]
+    extractors = [("vendor_element_extraction", step) for step in EXTRACTORS]
+    prospect_context = [("prospect_context_analysis", "analyze_company"), ("prospect_context_analysis", "analyze_pain_points")]
+
+    return (
+        vendor_pages * len(EXTRACTORS)           # Step 6 extractors
+        + extractors + vendor_pages              # save_vendor_profile
+        + prospect_pages * 2                     # Step 7a analysts
+        + extractors[:6] + prospect_context      # Step 7b
+        + extractors + prospect_context          # Step 8 prep
+    )
+
+
+def measure(read, make_step_input, repeat: int) -> tuple:
+    """Best wall time and peak traced memory for one run's reads (fresh step outputs per run)"""
+    best = float("inf")
+    for _ in range(repeat):
+        step_input = make_step_input()
+        started = time.perf_counter()
+        for block, step in reads():
+            assert read(step_input, block, step) is not None
+        best = min(best, time.perf_counter() - started)
+
+    step_input = make_step_input()
+    tracemalloc.start()
+    for block, step in reads():
+        read(step_input, block, step)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=50, help="Scraped pages (split between vendor and prospect)")
+    parser.add_argument("--page-chars", type=int, default=12000, help="Markdown characters per page")
+    parser.add_argument("--items", type=int, default=12, help="Items per extractor / analyst output")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions (best is reported)")
+    args = parser.parse_args()
+
+    step_outputs = build_run(args.pages, args.page_chars, args.items)
+    cases = (
+        ("ast.literal_eval", literal_eval_parallel_step_content, step_outputs),
+        ("step outputs", get_parallel_step_content, step_outputs),
+        ("JSON-serialized", get_parallel_step_content, None),
+    )
+
+    print(f"{args.pages} pages x {args.page_chars:,} chars, {len(reads())} parallel step reads per run\n")
+    print(f"{'implementation':<20}{'time/run':>12}{'peak memory':>14}")
+    results = {}
+    for label, read, outputs in cases:
+        def make_step_input(outputs=outputs):
+            return StepInput(input={}, previous_step_outputs=outputs or serialize_run(step_outputs))
+
+        elapsed, peak = measure(read, make_step_input, args.repeat)
+        results[label] = elapsed
+        print(f"{label:<20}{elapsed * 1000:>10.3f}ms{peak / 1024:>12,.0f}KB")
+
+    baseline = results["ast.literal_eval"]
+    for label in ("step outputs", "JSON-serialized"):
+        print(f"{label}: {baseline / max(results[label], 1e-9):,.0f}x faster than ast.literal_eval")
+
+
+if __name__ == "__main__":
+    main()
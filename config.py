@@ -15,17 +15,19 @@ FIRECRAWL_API_KEY = os.getenv("FIRECRAWL_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 
-# Validate required keys
-if not FIRECRAWL_API_KEY:
-    raise ValueError("FIRECRAWL_API_KEY not found in environment variables")
-if not OPENAI_API_KEY:
-    raise ValueError("OPENAI_API_KEY not found in environment variables")
+# Required keys are checked by validate() at startup (main.py, serve.py), not on import
 
 # Workflow Settings
 MAX_URLS_TO_SCRAPE = int(os.getenv("MAX_URLS_TO_SCRAPE", "50"))  # 25 vendor + 25 prospect
 BATCH_SCRAPE_TIMEOUT = int(os.getenv("BATCH_SCRAPE_TIMEOUT", "180"))  # 3 minutes
 BATCH_SCRAPE_POLL_INTERVAL = 2  # Poll every 2 seconds
 
+# Vendor and prospect pages are scraped as separate batch jobs, each with its own budget
+MAX_VENDOR_URLS_TO_SCRAPE = int(os.getenv("MAX_VENDOR_URLS_TO_SCRAPE", str(MAX_URLS_TO_SCRAPE // 2)))
+MAX_PROSPECT_URLS_TO_SCRAPE = int(os.getenv("MAX_PROSPECT_URLS_TO_SCRAPE", str(MAX_URLS_TO_SCRAPE - MAX_URLS_TO_SCRAPE // 2)))
+VENDOR_BATCH_SCRAPE_TIMEOUT = int(os.getenv("VENDOR_BATCH_SCRAPE_TIMEOUT", str(BATCH_SCRAPE_TIMEOUT)))
+PROSPECT_BATCH_SCRAPE_TIMEOUT = int(os.getenv("PROSPECT_BATCH_SCRAPE_TIMEOUT", str(BATCH_SCRAPE_TIMEOUT)))
+
 # Model Configuration (model-as-string format)
 # Agno 2.2.6+ supports model-as-string format: "provider:model_id"
 # See: https://docs.agno.com/concepts/models/model-as-string
@@ -37,10 +39,12 @@ BATCH_SCRAPE_POLL_INTERVAL = 2  # Poll every 2 seconds
 # - Supports structured outputs, function calling, tool use
 
 # Primary models for different task types
-DEFAULT_MODEL = "openai:gpt-5.1"           # Complex reasoning, synthesis, creative writing
-FAST_MODEL = "openai:gpt-5.1"              # Simple tasks, pattern matching
-REASONING_MODEL = "openai:gpt-5.1"         # Analysis, complex reasoning tasks
-EXTRACTION_MODEL = "openai:gpt-5.1"        # Data extraction, entity extraction
+# Each can be overridden from the environment. "fake:..." strings select the offline fake
+# model (e.g., DEFAULT_MODEL="fake:latency=2s" for load tests; see utils/fake_llm.py)
+DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "openai:gpt-5.1")        # Complex reasoning, synthesis, creative writing
+FAST_MODEL = os.getenv("FAST_MODEL", "openai:gpt-5.1")              # Simple tasks, pattern matching
+REASONING_MODEL = os.getenv("REASONING_MODEL", "openai:gpt-5.1")    # Analysis, complex reasoning tasks
+EXTRACTION_MODEL = os.getenv("EXTRACTION_MODEL", "openai:gpt-5.1")  # Data extraction, entity extraction
 
 # Legacy constant (kept for compatibility)
 OPENAI_MODEL = "gpt-4o"
@@ -58,5 +62,149 @@ SCRAPE_MAX_AGE = 172800000  # 48 hours in milliseconds (2 days)
 # URL Mapping Configuration
 MAX_URLS_TO_MAP = 5000  # Maximum URLs to discover per domain
 
+# LLM Response Cache
+# Reuses agent outputs across reruns with identical inputs (same model, instructions,
+# output schema and prompt). Opt-in because LLM outputs are otherwise re-sampled each run.
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true"
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".cache/llm")
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "604800"))  # 7 days
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(500 * 1024 * 1024)))  # 500 MB
+
+# Incremental Vendor Extraction
+# Stores Step 6 results per scraped page (keyed by content hash) so reruns only send
+# new or changed pages to the extractors and reuse stored results for the rest.
+INCREMENTAL_EXTRACTION_ENABLED = os.getenv("INCREMENTAL_EXTRACTION_ENABLED", "false").lower() == "true"
+PAGE_EXTRACTION_STORE_DIR = os.getenv("PAGE_EXTRACTION_STORE_DIR", ".cache/extractions")
+
+# Vendor Intelligence Store
+# Persists each vendor's extracted VendorElements so one vendor can be run against many
+# prospects without repeating the vendor half of Phases 1-2. Stored profiles younger than
+# VENDOR_PROFILE_MAX_AGE_HOURS are reused; set it to 0 to always rebuild the vendor side.
+VENDOR_STORE_DIR = os.getenv("VENDOR_STORE_DIR", ".cache/vendors")
+VENDOR_PROFILE_MAX_AGE_HOURS = int(os.getenv("VENDOR_PROFILE_MAX_AGE_HOURS", "168"))  # 7 days
+
+# Battle Card Cache
+# Step 8d builds vendor-level base battle cards once per VendorElements hash and only runs a
+# small prospect-specific tailoring pass per prospect. Disable to generate cards in one pass.
+BATTLE_CARD_CACHE_ENABLED = os.getenv("BATTLE_CARD_CACHE_ENABLED", "true").lower() == "true"
+BATTLE_CARD_STORE_DIR = os.getenv("BATTLE_CARD_STORE_DIR", ".cache/battle_cards")
+
+# LLM Rate Limits
+# All agent calls share one scheduler that keeps each model under its tokens-per-minute
+# (TPM) and requests-per-minute (RPM) quota and serves interactive runs before bulk runs.
+# Defaults match the GPT-5.1 Tier 1 limits above; override per model in MODEL_RATE_LIMITS.
+LLM_DEFAULT_TPM = int(os.getenv("LLM_DEFAULT_TPM", "500000"))
+LLM_DEFAULT_RPM = int(os.getenv("LLM_DEFAULT_RPM", "500"))
+MODEL_RATE_LIMITS = {
+    # "provider:model_id": {"tpm": ..., "rpm": ...}
+    DEFAULT_MODEL: {"tpm": LLM_DEFAULT_TPM, "rpm": LLM_DEFAULT_RPM},
+}
+LLM_ESTIMATED_OUTPUT_TOKENS = int(os.getenv("LLM_ESTIMATED_OUTPUT_TOKENS", "4000"))  # Reserved per call until actual usage is known
+LLM_RATE_LIMIT_MAX_RETRIES = int(os.getenv("LLM_RATE_LIMIT_MAX_RETRIES", "5"))
+LLM_BACKOFF_BASE_SECONDS = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "2"))
+LLM_BACKOFF_MAX_SECONDS = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "60"))
+
+# Token Budgets
+# Every prompt in Steps 3-8 is token-estimated. A prompt over its step's limit (or over
+# what is left of the run budget) first drops its lowest-priority scraped pages, then
+# the `sources` excerpts of the intelligence package. Per-step usage goes to metadata.json.
+RUN_TOKEN_BUDGET = int(os.getenv("RUN_TOKEN_BUDGET", "2000000"))  # Estimated prompt tokens per run
+DEFAULT_STEP_TOKEN_LIMIT = int(os.getenv("DEFAULT_STEP_TOKEN_LIMIT", "120000"))  # Per prompt
+STEP_TOKEN_LIMITS = {
+    # Step name -> max estimated tokens per prompt (steps not listed use DEFAULT_STEP_TOKEN_LIMIT)
+    "analyze_vendor_home": 20000,
+    "analyze_prospect_home": 20000,
+    "prioritize_urls": 20000,
+    "identify_buyer_personas": 60000,
+    "generate_playbook_summary": 60000,
+    "generate_email_sequences": 60000,
+    "generate_talk_tracks": 60000,
+    "speculate_email_sequence": 60000,
+    "speculate_talk_track": 60000,
+    "generate_battle_cards": 60000,
+}
+MIN_PROMPT_TOKENS = 4000  # Prompts are never trimmed below this, even once the run budget is spent
+
+# Playbook Generation
+# Email sequences and talk tracks are generated for the top personas concurrently
+PERSONA_GENERATION_CONCURRENCY = int(os.getenv("PERSONA_GENERATION_CONCURRENCY", "3"))
+# Vendor elements per type (offerings, case studies, proof points, ...) ranked most relevant
+# to the prospect's pain points, industry and personas and included in Step 8 prompts
+VENDOR_INTEL_TOP_K = int(os.getenv("VENDOR_INTEL_TOP_K", "6"))
+# How priority personas are chosen for Steps 8b-c:
+# "summary" - the playbook summary's priority_personas (Steps 8b-c wait for Step 8a)
+# "score"   - Step 7b's top priority_score personas (Steps 8b-c start right after Step 7b,
+#             the summary is generated alongside them)
+# "speculative" - as "summary", but the top priority_score persona's email sequence and talk
+#             track start alongside the summary and are kept if the summary picks that persona
+# Override per run with persona_selection
+PERSONA_SELECTION = os.getenv("PERSONA_SELECTION", "summary")
+# Multi-prospect runs: prospects processed concurrently once the vendor profile is built
+PROSPECT_BATCH_CONCURRENCY = int(os.getenv("PROSPECT_BATCH_CONCURRENCY", "3"))
+
+# Run checkpoints: every successful step output is saved as it completes, so a failed or
+# interrupted run can be resumed (python main.py --resume <run_id>) without repeating it
+RUN_CHECKPOINTS_ENABLED = os.getenv("RUN_CHECKPOINTS_ENABLED", "true").lower() == "true"
+RUN_CHECKPOINT_DIR = os.getenv("RUN_CHECKPOINT_DIR", ".cache/runs")
+
+# Step Memo
+# Reuses whole step outputs across runs when a step's declared inputs, code, agents and
+# config are unchanged (see utils/step_memo.py). Opt-in like the LLM response cache.
+# Rerun steps for one run with --refresh-steps; never memoize the steps listed here.
+STEP_MEMO_ENABLED = os.getenv("STEP_MEMO_ENABLED", "false").lower() == "true"
+STEP_MEMO_DIR = os.getenv("STEP_MEMO_DIR", ".cache/steps")
+STEP_MEMO_TTL_HOURS = int(os.getenv("STEP_MEMO_TTL_HOURS", "168"))  # 7 days
+STEP_MEMO_EXCLUDE_STEPS = [step.strip() for step in os.getenv("STEP_MEMO_EXCLUDE_STEPS", "").split(",") if step.strip()]
+
+# Tracing
+# Every step and agent call is recorded as a span (wall time, queue wait, tokens, model,
+# cache hits, retries). CLI runs write trace.json next to metadata.json; set
+# OTLP_TRACES_ENDPOINT (e.g., http://localhost:4318) to also send traces to a collector.
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() == "true"
+OTLP_TRACES_ENDPOINT = os.getenv("OTLP_TRACES_ENDPOINT", "")
+TRACING_SERVICE_NAME = os.getenv("TRACING_SERVICE_NAME", "playbook-ai")
+
+# Run Deadlines
+# A run with deadline_seconds (--deadline) degrades, in this order, once fewer than the
+# listed seconds are left when the step that can apply a degradation starts (see
+# utils/run_deadline.py). Thresholds must decrease along the order.
+RUN_DEADLINE_DEGRADATIONS = {
+    "fewer_pages": 180,               # Step 5: scrape at most DEADLINE_MAX_URLS_PER_COMPANY pages
+    "routed_extraction": 150,         # Step 6: each extractor sees only the pages routed to it
+    "skip_optional_extractors": 120,  # Step 6: skip DEADLINE_OPTIONAL_EXTRACTORS
+    "fewer_personas": 90,             # Phase 4: DEADLINE_PERSONA_LIMIT personas
+    "fast_model": 45,                 # Agent calls use FAST_MODEL
+}
+DEADLINE_MAX_URLS_PER_COMPANY = int(os.getenv("DEADLINE_MAX_URLS_PER_COMPANY", "8"))
+DEADLINE_ROUTED_PAGES = int(os.getenv("DEADLINE_ROUTED_PAGES", "4"))  # Pages per extractor when routed
+DEADLINE_OPTIONAL_EXTRACTORS = [
+    step.strip() for step in os.getenv("DEADLINE_OPTIONAL_EXTRACTORS", "extract_proof_points,extract_customers").split(",") if step.strip()
+]
+DEADLINE_PERSONA_LIMIT = int(os.getenv("DEADLINE_PERSONA_LIMIT", "1"))
+# Runs still going this long after their deadline are cancelled (see utils/cancellation.py)
+DEADLINE_CANCEL_GRACE_SECONDS = float(os.getenv("DEADLINE_CANCEL_GRACE_SECONDS", "30"))
+
 # Logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+
+
+def validate() -> None:
+    """
+    Startup check for the settings a run needs.
+
+    Called once by the CLI (main.py) and the API server (serve.py) instead of on import,
+    so importing the pipeline (benchmarks, tooling, test collection) needs no keys.
+
+    Raises:
+        ValueError: If a required API key is missing (the OpenAI key is only required
+            while an OpenAI model is configured)
+    """
+    missing = []
+    if not FIRECRAWL_API_KEY:
+        missing.append("FIRECRAWL_API_KEY")
+    if not OPENAI_API_KEY and any(
+        model.startswith("openai:") for model in (DEFAULT_MODEL, FAST_MODEL, REASONING_MODEL, EXTRACTION_MODEL)
+    ):
+        missing.append("OPENAI_API_KEY")
+    if missing:
+        raise ValueError(f"{' and '.join(missing)} not found in environment variables")
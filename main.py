@@ -3,7 +3,8 @@ Playbook AI - Main Entry Point
 CLI for running the complete sales intelligence pipeline (all 4 phases).
 
 Usage:
-    python main.py <vendor_domain> <prospect_domain>
+    python main.py <vendor_domain> <prospect_domain> [<prospect_domain> ...] [--refresh-vendor] [--bulk] [--score-personas | --speculate-personas] [--workers N] [--refresh-steps STEPS] [--deadline SECONDS]
+    python main.py --resume <run_id>
 
 Examples (all formats accepted):
     python main.py octavehq.com sendoso.com
@@ -12,160 +13,538 @@ Examples (all formats accepted):
 
 All domain formats are automatically normalized to https://
 
+Vendor intelligence is stored per vendor domain and reused while fresh
+(see VENDOR_PROFILE_MAX_AGE_HOURS). Pass --refresh-vendor to rebuild it.
+
+With several prospects, the vendor phases run once and the prospects fan out across
+--workers concurrent runs, writing one playbook per prospect to output/batches/<timestamp>/.
+
+Every step's output is checkpointed as it completes; --resume <run_id> reruns a failed or
+interrupted run from the steps that did not complete.
+
+With STEP_MEMO_ENABLED, unchanged steps are served from earlier runs; --refresh-steps
+step_a,step_b (or "all") reruns them.
+
+--deadline SECONDS gives the run a latency budget: once it runs short, steps degrade in a
+fixed order (see utils/run_deadline.py) and metadata.json records what was degraded.
+
 https://github.com/orchidautomation/playbook_ai-oss
 """
 
+import asyncio
 import sys
 import json
 import os
+import re
 from datetime import datetime
-from agno.workflow import Workflow, Step, Parallel
-from models.workflow_input import WorkflowInput
-
-# Import Phase 1 step executors
-from steps.step1_domain_validation import validate_vendor_domain, validate_prospect_domain
-from steps.step2_homepage_scraping import scrape_vendor_homepage, scrape_prospect_homepage
-from steps.step3_initial_analysis import analyze_vendor_homepage, analyze_prospect_homepage
-from steps.step4_url_prioritization import prioritize_urls
-from steps.step5_batch_scraping import batch_scrape_selected_pages
-
-# Import Phase 2 step executors (Step 6)
-from steps.step6_vendor_extraction import (
-    extract_offerings,
-    extract_case_studies,
-    extract_proof_points,
-    extract_value_props,
-    extract_customers,
-    extract_use_cases,
-    extract_personas,
-    extract_differentiators
-)
+from typing import Any, Callable, Optional
+from agno.workflow import Workflow, Step
+from agno.workflow.types import StepInput, StepOutput
+from models.workflow_input import WorkflowInput, BatchWorkflowInput
+import config
+from utils.cancellation import cancellation_scope
+from utils.llm_cache import llm_cache
+from utils.prospect_batch import run_prospect_batch, summarize_batch
+from utils.run_checkpoint import new_run_id, run_checkpoints
+from utils.step_memo import step_memo, summarize_step_memo
+from utils.token_budget import summarize_token_usage
+from utils.run_deadline import RunDeadline, run_deadline
+from utils.tracing import RunTrace, trace_run
+
+# Every pipeline workflow is generated from the step spec in workflow.py
+from workflow import build_phase_workflow
+from steps.step8_playbook_generation import summarize_speculation
+
+
+def build_pipeline_workflow(async_executor: bool = False) -> Workflow:
+    """
+    Build the complete sales intelligence pipeline (all 4 phases, 8 steps).
+
+    Multi-prospect runs build one workflow per prospect so concurrent runs never share
+    workflow run state.
+
+    Args:
+        async_executor: Build it for arun (the API server, see build_phase_workflow)
+    """
+    return build_phase_workflow(
+        4,
+        async_executor=async_executor,
+        name="Octave Clone - Complete Sales Intelligence Pipeline",
+        description="End-to-end: Intelligence, vendor extraction, prospect analysis, and actionable playbooks",
+        input_schema=WorkflowInput  # AgentOS API support with automatic domain normalization
+    )
 
-# Import Phase 3 step executors (Step 7)
-from steps.step7_prospect_analysis import (
-    analyze_company_profile,
-    analyze_pain_points,
-    identify_buyer_personas
-)
 
-# Import Phase 4 step executors (Step 8)
-from steps.step8_playbook_generation import (
-    generate_playbook_summary,
-    generate_email_sequences,
-    generate_talk_tracks,
-    generate_battle_cards,
-    assemble_final_playbook
-)
+# Complete Sales Intelligence Pipeline - All 4 Phases (8 Steps)
+workflow = build_pipeline_workflow()
+
+
+# Helper functions to extract step content from a WorkflowRunOutput
+# (searches nested step outputs, e.g. the Steps 5-8 dependency graph)
+def find_step_output(step_results, step_name):
+    """Find a step output by name at any nesting depth"""
+    for step_output in step_results or []:
+        if step_output.step_name == step_name:
+            return step_output
+        nested = find_step_output(getattr(step_output, 'steps', None), step_name)
+        if nested:
+            return nested
+    return None
+
+
+def get_step_content_by_name(step_results, step_name):
+    """Find and return content from a step by name"""
+    step_output = find_step_output(step_results, step_name)
+    return step_output.content if step_output else None
+
+
+def get_parallel_substep_content(step_results, parallel_step_name, substep_name):
+    """Extract content from a specific substep within a parallel step"""
+    parallel_step = find_step_output(step_results, parallel_step_name)
+    if parallel_step and parallel_step.step_type == "Parallel" and parallel_step.steps:
+        for sub_step in parallel_step.steps:
+            if sub_step.step_name == substep_name:
+                return sub_step.content
+    return None
+
+
+def save_run_outputs(
+    result,
+    run_dir: str,
+    timestamp: str,
+    vendor_domain: str,
+    prospect_domain: str,
+    run_id: Optional[str] = None,
+    trace: Optional[RunTrace] = None,
+    deadline: Optional[RunDeadline] = None
+) -> None:
+    """
+    Save a pipeline run's outputs (metadata, Step 6-8 files, complete output) to run_dir.
+
+    Args:
+        result: WorkflowRunOutput of the pipeline
+        run_dir: Output directory for this run
+        timestamp: Run timestamp recorded in metadata.json
+        vendor_domain: Normalized vendor domain
+        prospect_domain: Normalized prospect domain
+        run_id: Checkpoint id of the run
+        trace: The run's trace, written to trace.json
+        deadline: The run's deadline (degradations applied to meet it go to metadata.json)
+    """
+    os.makedirs(run_dir, exist_ok=True)
+
+    # Save metadata about the run
+    metadata = {
+        "timestamp": timestamp,
+        "run_id": run_id,
+        "vendor_domain": vendor_domain,
+        "prospect_domain": prospect_domain,
+        "workflow_name": workflow.name,
+        "completed_at": datetime.now().isoformat(),
+        "llm_cache": llm_cache.stats() if llm_cache else None,
+        "step_memo": {"served": summarize_step_memo(result.step_results)} if step_memo else None,
+        "token_usage": summarize_token_usage(result.step_results),
+        "speculation": (get_step_content_by_name(result.step_results, "assemble_final_playbook") or {}).get("speculation"),
+        "trace_id": trace.trace_id if trace else None,
+        "deadline": deadline.summary() if deadline else None
+    }
 
+    with open(f"{run_dir}/metadata.json", "w") as f:
+        json.dump(metadata, f, indent=2)
+
+    # Per-step and per-agent spans (wall time, queue wait, tokens, cache hits, retries)
+    if trace:
+        trace.save(f"{run_dir}/trace.json")
+
+    # Save Step 6: Vendor element extraction (all 8 extractors)
+    # Create subdirectory for Step 6 outputs
+    step6_dir = f"{run_dir}/step6_vendor_extraction"
+    os.makedirs(step6_dir, exist_ok=True)
+
+    step6_extractors = {
+        "extract_offerings": "offerings.json",
+        "extract_case_studies": "case_studies.json",
+        "extract_proof_points": "proof_points.json",
+        "extract_value_props": "value_props.json",
+        "extract_customers": "customers.json",
+        "extract_use_cases": "use_cases.json",
+        "extract_personas": "personas.json",
+        "extract_differentiators": "differentiators.json"
+    }
 
-# Complete Sales Intelligence Pipeline - All 4 Phases (8 Steps)
-workflow = Workflow(
-    name="Octave Clone - Complete Sales Intelligence Pipeline",
-    description="End-to-end: Intelligence, vendor extraction, prospect analysis, and actionable playbooks",
-    input_schema=WorkflowInput,  # AgentOS API support with automatic domain normalization
+    for extractor_name, filename in step6_extractors.items():
+        try:
+            content = get_parallel_substep_content(result.step_results, "vendor_element_extraction", extractor_name)
+            with open(f"{step6_dir}/{filename}", "w") as f:
+                json.dump(content if content else {}, f, indent=2)
+        except Exception as e:
+            print(f"Warning: Could not save {filename}: {e}")
+            with open(f"{step6_dir}/{filename}", "w") as f:
+                json.dump({"error": str(e)}, f, indent=2)
+
+    # Save Step 7: Prospect analysis (all 3 analysts)
+    # Create subdirectory for Step 7 outputs
+    step7_dir = f"{run_dir}/step7_prospect_analysis"
+    os.makedirs(step7_dir, exist_ok=True)
+
+    # Step 7a: Parallel analysts
+    step7_parallel_analysts = {
+        "analyze_company": "company_profile.json",
+        "analyze_pain_points": "pain_points.json"
+    }
+
+    for analyst_name, filename in step7_parallel_analysts.items():
+        try:
+            content = get_parallel_substep_content(result.step_results, "prospect_context_analysis", analyst_name)
+            with open(f"{step7_dir}/{filename}", "w") as f:
+                json.dump(content if content else {}, f, indent=2)
+        except Exception as e:
+            print(f"Warning: Could not save {filename}: {e}")
+            with open(f"{step7_dir}/{filename}", "w") as f:
+                json.dump({"error": str(e)}, f, indent=2)
+
+    # Step 7b: Buyer personas (sequential)
+    try:
+        personas_content = get_step_content_by_name(result.step_results, "identify_buyer_personas")
+        with open(f"{step7_dir}/buyer_personas.json", "w") as f:
+            json.dump(personas_content if personas_content else {}, f, indent=2)
+    except Exception as e:
+        print(f"Warning: Could not save buyer_personas.json: {e}")
+        with open(f"{step7_dir}/buyer_personas.json", "w") as f:
+            json.dump({"error": str(e)}, f, indent=2)
+
+    # Save Step 8: Playbook generation (all components)
+    # Create subdirectory for Step 8 outputs
+    step8_dir = f"{run_dir}/step8_playbook_generation"
+    os.makedirs(step8_dir, exist_ok=True)
+
+    # Step 8a: Summary (sequential)
+    try:
+        summary = get_step_content_by_name(result.step_results, "generate_playbook_summary")
+        with open(f"{step8_dir}/playbook_summary.json", "w") as f:
+            json.dump(summary if summary else {}, f, indent=2)
+    except Exception as e:
+        print(f"Warning: Could not save playbook_summary.json: {e}")
+        with open(f"{step8_dir}/playbook_summary.json", "w") as f:
+            json.dump({"error": str(e)}, f, indent=2)
+
+    # Step 8b-d: Parallel components
+    step8_parallel_components = {
+        "generate_email_sequences": "email_sequences.json",
+        "generate_talk_tracks": "talk_tracks.json",
+        "generate_battle_cards": "battle_cards.json"
+    }
+
+    for component_name, filename in step8_parallel_components.items():
+        try:
+            content = get_parallel_substep_content(result.step_results, "playbook_component_generation", component_name)
+            with open(f"{step8_dir}/{filename}", "w") as f:
+                json.dump(content if content else {}, f, indent=2)
+        except Exception as e:
+            print(f"Warning: Could not save {filename}: {e}")
+            with open(f"{step8_dir}/{filename}", "w") as f:
+                json.dump({"error": str(e)}, f, indent=2)
+
+    # Step 8e: Final assembly (sequential)
+    try:
+        final_playbook = get_step_content_by_name(result.step_results, "assemble_final_playbook")
+        with open(f"{step8_dir}/final_playbook.json", "w") as f:
+            json.dump(final_playbook if final_playbook else {}, f, indent=2)
+    except Exception as e:
+        print(f"Warning: Could not save final_playbook.json: {e}")
+        with open(f"{step8_dir}/final_playbook.json", "w") as f:
+            json.dump({"error": str(e)}, f, indent=2)
+
+    # Also save the complete final output for backwards compatibility
+    output_filename = f"{run_dir}/complete_output.json"
+    with open(output_filename, "w") as f:
+        json.dump(result.content, f, indent=2)
+
+
+def get_run_error(result) -> Optional[str]:
+    """
+    Get the error of a finished pipeline run, if it failed.
+
+    A run fails when a step stopped it, or when steps failed without stopping it (their
+    outputs are empty fallbacks, e.g. no battle cards); either way completed steps stay
+    checkpointed for --resume.
+
+    Args:
+        result: WorkflowRunOutput of the pipeline
+
+    Returns:
+        Error message, or None if the run produced a result
+    """
+    if not result or not result.content:
+        return "No result returned from workflow."
+    if isinstance(result.content, dict) and result.content.get("error"):
+        return str(result.content["error"])
+    if isinstance(result.content, dict) and result.content.get("failed_steps"):
+        return "Steps failed: " + "; ".join(f"{name}: {error}" for name, error in result.content["failed_steps"].items())
+    return None
+
+
+def run_batch(batch_input: BatchWorkflowInput) -> dict:
+    """
+    Run one vendor against several prospects, saving one playbook per prospect.
+
+    Each prospect's outputs go to output/batches/<timestamp>/<prospect>/ (same layout as
+    a single run), and the batch summary to output/batches/<timestamp>/batch_summary.json.
+
+    Args:
+        batch_input: Vendor, prospects and batch options
+
+    Returns:
+        Batch summary (see utils.prospect_batch.summarize_batch) with batch_dir
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    batch_dir = f"output/batches/{timestamp}"
+
+    def run_prospect(workflow_input: WorkflowInput) -> dict:
+        slug = re.sub(r"[^a-z0-9.-]+", "_", re.sub(r"^https?://", "", workflow_input.prospect_domain)).strip("_")
+        # One checkpoint per prospect, resumable with --resume <run_id>
+        run_id = f"{timestamp}_{slug}"
+
+        # No streaming: concurrent runs would interleave Agno's live output
+        with trace_run(run_id) as trace, run_deadline(workflow_input.deadline_seconds) as deadline:
+            result = build_pipeline_workflow().run(input={**workflow_input.to_workflow_dict(), "run_id": run_id})
+        error = get_run_error(result)
+        if error:
+            raise RuntimeError(f"{error} (resume with: python main.py --resume {run_id})")
+
+        run_dir = f"{batch_dir}/{slug}"
+        save_run_outputs(result, run_dir, timestamp, workflow_input.vendor_domain, workflow_input.prospect_domain, run_id, trace, deadline)
+        speculation = (get_step_content_by_name(result.step_results, "assemble_final_playbook") or {}).get("speculation")
+        return {"run_dir": run_dir, "speculation": speculation}
+
+    # Cancelling the batch (interrupt, API client disconnect) cancels every prospect run
+    with cancellation_scope() as token:
+        try:
+            results = run_prospect_batch(batch_input, run_prospect)
+        except KeyboardInterrupt:
+            token.cancel("interrupted")
+            raise
+    summary = {**summarize_batch(batch_input, results), "batch_dir": batch_dir}
+
+    # Kept/wasted speculative generations across the batch
+    speculation = summarize_speculation([
+        report
+        for result in results if result.success and result.output["speculation"]
+        for report in result.output["speculation"]["components"]
+    ])
+    if speculation:
+        summary["speculation"] = {key: value for key, value in speculation.items() if key != "components"}
+
+    os.makedirs(batch_dir, exist_ok=True)
+    with open(f"{batch_dir}/batch_summary.json", "w") as f:
+        json.dump(summary, f, indent=2)
+
+    return summary
+
+
+def run_prospect_fan_out(step_input: StepInput) -> StepOutput:
+    """
+    Workflow step running a multi-prospect batch (AgentOS entry point).
+
+    Args:
+        step_input: StepInput whose input is a BatchWorkflowInput (or equivalent dict)
+
+    Returns:
+        StepOutput with the batch summary; fails only if every prospect failed
+    """
+    batch_input = step_input.input
+    if not isinstance(batch_input, BatchWorkflowInput):
+        batch_input = BatchWorkflowInput.model_validate(batch_input)
+
+    summary = run_batch(batch_input)
+    return StepOutput(content=summary, success=summary["succeeded"] > 0)
+
+
+async def arun_prospect_fan_out(step_input: StepInput) -> StepOutput:
+    """Async run_prospect_fan_out for AgentOS: the batch runs in a worker thread"""
+    # to_thread copies the context, so the request's cancellation token is the batch's parent
+    return await asyncio.to_thread(run_prospect_fan_out, step_input)
+
+
+# Multi-Prospect Pipeline - one vendor, many prospects (vendor phases run once)
+batch_workflow = Workflow(
+    id="playbook-ai-multi-prospect-pipeline",
+    name="Octave Clone - Multi-Prospect Sales Intelligence Pipeline",
+    description="One vendor against a list of prospects: vendor intelligence is built once, then one playbook per prospect",
+    input_schema=BatchWorkflowInput,
     steps=[
-        # Phase 1: Intelligence Gathering (Steps 1-5)
-
-        # Step 1: Parallel domain validation
-        Parallel(
-            Step(name="validate_vendor", executor=validate_vendor_domain),
-            Step(name="validate_prospect", executor=validate_prospect_domain),
-            name="parallel_validation"
-        ),
-
-        # Step 2: Parallel homepage scraping
-        Parallel(
-            Step(name="scrape_vendor_home", executor=scrape_vendor_homepage),
-            Step(name="scrape_prospect_home", executor=scrape_prospect_homepage),
-            name="parallel_homepage_scraping"
-        ),
-
-        # Step 3: Parallel homepage analysis
-        Parallel(
-            Step(name="analyze_vendor_home", executor=analyze_vendor_homepage),
-            Step(name="analyze_prospect_home", executor=analyze_prospect_homepage),
-            name="parallel_homepage_analysis"
-        ),
-
-        # Step 4: URL prioritization
-        Step(name="prioritize_urls", executor=prioritize_urls),
-
-        # Step 5: Batch scraping
-        Step(name="batch_scrape", executor=batch_scrape_selected_pages),
-
-        # Phase 2: Vendor Extraction (Step 6)
-
-        # Step 6: Vendor element extraction (8 parallel specialists)
-        Parallel(
-            Step(name="extract_offerings", executor=extract_offerings),
-            Step(name="extract_case_studies", executor=extract_case_studies),
-            Step(name="extract_proof_points", executor=extract_proof_points),
-            Step(name="extract_value_props", executor=extract_value_props),
-            Step(name="extract_customers", executor=extract_customers),
-            Step(name="extract_use_cases", executor=extract_use_cases),
-            Step(name="extract_personas", executor=extract_personas),
-            Step(name="extract_differentiators", executor=extract_differentiators),
-            name="vendor_element_extraction"
-        ),
-
-        # Phase 3: Prospect Analysis (Step 7)
-
-        # Step 7a: Prospect context analysis (2 parallel analysts)
-        Parallel(
-            Step(name="analyze_company", executor=analyze_company_profile),
-            Step(name="analyze_pain_points", executor=analyze_pain_points),
-            name="prospect_context_analysis"
-        ),
-
-        # Step 7b: Buyer persona identification (uses vendor + prospect data)
-        Step(name="identify_buyer_personas", executor=identify_buyer_personas),
-
-        # Phase 4: Playbook Generation (Step 8)
-
-        # Step 8a: Playbook summary (sequential - needs all Phase 1-3 data)
-        Step(name="generate_playbook_summary", executor=generate_playbook_summary),
-
-        # Step 8b-d: Playbook components (3 parallel specialists)
-        Parallel(
-            Step(name="generate_email_sequences", executor=generate_email_sequences),
-            Step(name="generate_talk_tracks", executor=generate_talk_tracks),
-            Step(name="generate_battle_cards", executor=generate_battle_cards),
-            name="playbook_component_generation"
-        ),
-
-        # Step 8e: Final playbook assembly
-        Step(name="assemble_final_playbook", executor=assemble_final_playbook)
+        Step(name="prospect_fan_out", executor=arun_prospect_fan_out)
     ]
 )
 
 
+def main_batch(batch_input: BatchWorkflowInput) -> None:
+    """Run a multi-prospect batch from the CLI and print per-prospect results."""
+    print("\n" + "=" * 80)
+    print("OCTAVE CLONE MVP - MULTI-PROSPECT PIPELINE")
+    print("=" * 80)
+    print(f"\n📊 Vendor:    {batch_input.vendor_domain}")
+    print(f"🎯 Prospects: {len(batch_input.prospect_domains)}")
+    for prospect_domain in batch_input.prospect_domains:
+        print(f"   • {prospect_domain}")
+    if batch_input.refresh_vendor:
+        print("♻️  Refreshing stored vendor profile")
+    print("\n" + "=" * 80 + "\n")
+
+    summary = run_batch(batch_input)
+
+    print("\n" + "=" * 80)
+    print(f"{'✅' if summary['failed'] == 0 else '⚠️ '} BATCH FINISHED: {summary['succeeded']}/{summary['prospects']} prospects succeeded")
+    print("=" * 80)
+    for result in summary["results"]:
+        if result["success"]:
+            print(f"  ✅ {result['prospect_domain']} → {result['output']['run_dir']}/ ({result['elapsed_seconds']}s)")
+        else:
+            print(f"  ❌ {result['prospect_domain']}: {result['error']}")
+    print(f"\n📁 Batch summary: {summary['batch_dir']}/batch_summary.json")
+    print("=" * 80 + "\n")
+
+    if summary["succeeded"] == 0:
+        sys.exit(1)
+
+
+def print_usage() -> None:
+    """Print command line usage."""
+    print("=" * 80)
+    print("OCTAVE CLONE MVP - COMPLETE SALES INTELLIGENCE PIPELINE")
+    print("=" * 80)
+    print("\nUsage: python main.py <vendor_domain> <prospect_domain> [<prospect_domain> ...] [options]")
+    print("\nExamples (all formats work):")
+    print("  python main.py octavehq.com sendoso.com")
+    print("  python main.py https://octavehq.com https://sendoso.com")
+    print("  python main.py www.octavehq.com www.sendoso.com")
+    print("  python main.py octavehq.com sendoso.com gong.io clay.com --workers 3")
+    print("  python main.py --resume 20250101_120000_3fa2c1")
+    print("\nThis runs all 4 phases:")
+    print("  Phase 1: Intelligence Gathering (Steps 1-5)")
+    print("  Phase 2: Vendor GTM Extraction (Step 6)")
+    print("  Phase 3: Prospect Analysis (Step 7)")
+    print("  Phase 4: Sales Playbook Generation (Step 8)")
+    print("\nOptions:")
+    print("  --refresh-vendor  Rebuild the stored vendor profile instead of reusing it")
+    print("  --bulk            Run at bulk priority (LLM calls yield to interactive runs)")
+    print("  --score-personas  Pick priority personas by Step 7b's priority_score so Phase 4 starts without waiting for the summary")
+    print("  --speculate-personas  Start the top-scored persona's emails and talk track alongside the summary (kept if the summary picks it)")
+    print("  --workers N       Prospects run concurrently with several prospects (default: PROSPECT_BATCH_CONCURRENCY)")
+    print("  --resume RUN_ID   Resume a failed or interrupted run, skipping the steps it completed")
+    print("  --refresh-steps STEPS  Rerun these steps (comma-separated, or \"all\") instead of serving them from the step memo")
+    print("  --deadline SECONDS  Latency budget: degrade (fewer pages, routed extraction, fewer personas, faster model) to finish in time")
+    print("\n" + "=" * 80)
+
+
+def parse_positive(option: str, value: Optional[str], parse: Callable[[str], Any]) -> Any:
+    """
+    Parse a positive numeric option value, exiting with usage on a bad value.
+
+    Args:
+        option: Option name (e.g., "--workers")
+        value: Raw value following the option (None if it was the last argument)
+        parse: int or float
+
+    Returns:
+        Parsed value
+    """
+    try:
+        parsed = parse(value)
+        if parsed > 0:
+            return parsed
+    except (TypeError, ValueError):
+        pass
+    print_usage()
+    print(f"\n❌ {option} expects a positive {'integer' if parse is int else 'number'}, got {value!r}")
+    sys.exit(1)
+
+
 def main():
     """Main entry point for complete sales intelligence pipeline."""
 
     # Parse command line arguments
-    if len(sys.argv) < 3:
-        print("=" * 80)
-        print("OCTAVE CLONE MVP - COMPLETE SALES INTELLIGENCE PIPELINE")
-        print("=" * 80)
-        print("\nUsage: python main.py <vendor_domain> <prospect_domain>")
-        print("\nExamples (all formats work):")
-        print("  python main.py octavehq.com sendoso.com")
-        print("  python main.py https://octavehq.com https://sendoso.com")
-        print("  python main.py www.octavehq.com www.sendoso.com")
-        print("\nThis runs all 4 phases:")
-        print("  Phase 1: Intelligence Gathering (Steps 1-5)")
-        print("  Phase 2: Vendor GTM Extraction (Step 6)")
-        print("  Phase 3: Prospect Analysis (Step 7)")
-        print("  Phase 4: Sales Playbook Generation (Step 8)")
-        print("\n" + "=" * 80)
+    refresh_vendor = "--refresh-vendor" in sys.argv
+    priority = "bulk" if "--bulk" in sys.argv else "interactive"
+    persona_selection = None
+    if "--score-personas" in sys.argv:
+        persona_selection = "score"
+    elif "--speculate-personas" in sys.argv:
+        persona_selection = "speculative"
+    max_workers = None
+    resume_run_id = None
+    refresh_steps = None
+    deadline_seconds = None
+    args = []
+    argv = iter(sys.argv[1:])
+    for arg in argv:
+        if arg == "--workers":
+            max_workers = parse_positive(arg, next(argv, None), int)
+        elif arg == "--resume":
+            resume_run_id = next(argv, None)
+        elif arg == "--refresh-steps":
+            refresh_steps = [step.strip() for step in next(argv, "").split(",") if step.strip()] or None
+        elif arg == "--deadline":
+            deadline_seconds = parse_positive(arg, next(argv, None), float)
+        elif arg not in ("--refresh-vendor", "--bulk", "--score-personas", "--speculate-personas"):
+            args.append(arg)
+
+    if len(args) < 2 and not resume_run_id:
+        print_usage()
+        sys.exit(1)
+
+    # Startup check (importing the pipeline does not check API keys)
+    try:
+        config.validate()
+    except ValueError as e:
+        print(f"\n❌ {str(e)}")
+        print("Add the missing keys to .env and try again.")
         sys.exit(1)
 
+    # Resume: rerun a checkpointed run with its original input
+    if resume_run_id:
+        stored_input = run_checkpoints.load_input(resume_run_id) if run_checkpoints else None
+        if not stored_input:
+            print(f"\n❌ No checkpoint found for run {resume_run_id} (completed runs are not kept)")
+            sys.exit(1)
+        args = [stored_input["vendor_domain"], stored_input["prospect_domain"]]
+        refresh_vendor = False
+        priority = stored_input.get("priority") or priority
+        persona_selection = stored_input.get("persona_selection")
+        refresh_steps = refresh_steps or stored_input.get("refresh_steps")
+        deadline_seconds = deadline_seconds or stored_input.get("deadline_seconds")
+
+    # Several prospects: build vendor intelligence once, then fan out
+    if len(args) > 2:
+        try:
+            batch_input = BatchWorkflowInput(
+                vendor_domain=args[0],
+                prospect_domains=args[1:],
+                refresh_vendor=refresh_vendor,
+                priority=priority,
+                persona_selection=persona_selection,
+                refresh_steps=refresh_steps,
+                deadline_seconds=deadline_seconds,
+                max_workers=max_workers
+            )
+        except Exception as e:
+            print(f"\n❌ INVALID DOMAIN INPUT: {str(e)}")
+            sys.exit(1)
+        main_batch(batch_input)
+        return
+
     # Normalize domains using Pydantic validation
     # This accepts flexible inputs: sendoso.com, www.sendoso.com, https://sendoso.com
     try:
         validated_input = WorkflowInput(
-            vendor_domain=sys.argv[1],
-            prospect_domain=sys.argv[2]
+            vendor_domain=args[0],
+            prospect_domain=args[1],
+            refresh_vendor=refresh_vendor,
+            priority=priority,
+            persona_selection=persona_selection,
+            refresh_steps=refresh_steps,
+            deadline_seconds=deadline_seconds,
+            run_id=resume_run_id or new_run_id()
         )
         vendor_domain = validated_input.vendor_domain
         prospect_domain = validated_input.prospect_domain
@@ -186,7 +565,15 @@ def main():
     print("OCTAVE CLONE MVP - COMPLETE SALES INTELLIGENCE PIPELINE")
     print("=" * 80)
     print(f"\n📊 Vendor:   {vendor_domain}")
-    print(f"🎯 Prospect: {prospect_domain}\n")
+    print(f"🎯 Prospect: {prospect_domain}")
+    print(f"💾 Run ID:   {validated_input.run_id}{' (resuming)' if resume_run_id else ''}")
+    if refresh_vendor:
+        print("♻️  Refreshing stored vendor profile")
+    if refresh_steps:
+        print(f"🔄 Refreshing steps: {', '.join(refresh_steps)}")
+    if deadline_seconds:
+        print(f"⏱️  Deadline: {deadline_seconds:.0f}s")
+    print()
     print("=" * 80)
     print("\n🚀 Starting Complete Workflow (All 4 Phases)...")
     print("   Phase 1: Intelligence Gathering")
@@ -196,169 +583,38 @@ def main():
     print("\n" + "=" * 80 + "\n")
 
     # Prepare workflow input
-    workflow_input = {
-        "vendor_domain": vendor_domain,
-        "prospect_domain": prospect_domain
-    }
+    workflow_input = validated_input.to_workflow_dict()
 
     try:
         # Run workflow with streaming (single execution)
         print("🔥 Workflow executing with real-time visualization...\n")
-        response_stream = workflow.run(input=workflow_input, stream=True)
+        with trace_run(validated_input.run_id) as trace, run_deadline(validated_input.deadline_seconds) as deadline:
+            response_stream = workflow.run(input=workflow_input, stream=True)
 
-        # Process stream events and get final result
-        result = None
-        for event in response_stream:
-            # The stream displays automatically via Agno's TUI
-            # Last event is the final WorkflowRunOutput
-            result = event
+            # Process stream events and get final result
+            result = None
+            for event in response_stream:
+                # The stream displays automatically via Agno's TUI
+                # Last event is the final WorkflowRunOutput
+                result = event
 
         # Check if workflow was successful
-        if not result or not result.content:
+        error = get_run_error(result)
+        if error:
             print("\n" + "=" * 80)
             print("❌ WORKFLOW FAILED")
             print("=" * 80)
-            print("\nNo result returned from workflow.")
+            print(f"\n{error}")
+            if run_checkpoints:
+                print(f"\nCompleted steps are checkpointed. Resume with: python main.py --resume {validated_input.run_id}")
             sys.exit(1)
 
-        # Helper functions to extract step content from WorkflowCompletedEvent
-        def get_step_content_by_name(step_results, step_name):
-            """Find and return content from a step by name"""
-            for step_output in step_results:
-                if step_output.step_name == step_name:
-                    return step_output.content
-            return None
-
-        def get_parallel_substep_content(step_results, parallel_step_name, substep_name):
-            """Extract content from a specific substep within a parallel step"""
-            for step_output in step_results:
-                if step_output.step_name == parallel_step_name and step_output.step_type == "Parallel":
-                    if hasattr(step_output, 'steps') and step_output.steps:
-                        for sub_step in step_output.steps:
-                            if sub_step.step_name == substep_name:
-                                return sub_step.content
-            return None
-
         # Save results in organized directory structure
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         run_dir = f"output/runs/{timestamp}"
         os.makedirs(run_dir, exist_ok=True)
 
-        # Save metadata about the run
-        metadata = {
-            "timestamp": timestamp,
-            "vendor_domain": vendor_domain,
-            "prospect_domain": prospect_domain,
-            "workflow_name": workflow.name,
-            "completed_at": datetime.now().isoformat()
-        }
-
-        with open(f"{run_dir}/metadata.json", "w") as f:
-            json.dump(metadata, f, indent=2)
-
-        # Save Step 6: Vendor element extraction (all 8 extractors)
-        # Create subdirectory for Step 6 outputs
-        step6_dir = f"{run_dir}/step6_vendor_extraction"
-        os.makedirs(step6_dir, exist_ok=True)
-
-        step6_extractors = {
-            "extract_offerings": "offerings.json",
-            "extract_case_studies": "case_studies.json",
-            "extract_proof_points": "proof_points.json",
-            "extract_value_props": "value_props.json",
-            "extract_customers": "customers.json",
-            "extract_use_cases": "use_cases.json",
-            "extract_personas": "personas.json",
-            "extract_differentiators": "differentiators.json"
-        }
-
-        for extractor_name, filename in step6_extractors.items():
-            try:
-                content = get_parallel_substep_content(result.step_results, "vendor_element_extraction", extractor_name)
-                with open(f"{step6_dir}/{filename}", "w") as f:
-                    json.dump(content if content else {}, f, indent=2)
-            except Exception as e:
-                print(f"Warning: Could not save {filename}: {e}")
-                with open(f"{step6_dir}/{filename}", "w") as f:
-                    json.dump({"error": str(e)}, f, indent=2)
-
-        # Save Step 7: Prospect analysis (all 3 analysts)
-        # Create subdirectory for Step 7 outputs
-        step7_dir = f"{run_dir}/step7_prospect_analysis"
-        os.makedirs(step7_dir, exist_ok=True)
-
-        # Step 7a: Parallel analysts
-        step7_parallel_analysts = {
-            "analyze_company": "company_profile.json",
-            "analyze_pain_points": "pain_points.json"
-        }
-
-        for analyst_name, filename in step7_parallel_analysts.items():
-            try:
-                content = get_parallel_substep_content(result.step_results, "prospect_context_analysis", analyst_name)
-                with open(f"{step7_dir}/{filename}", "w") as f:
-                    json.dump(content if content else {}, f, indent=2)
-            except Exception as e:
-                print(f"Warning: Could not save {filename}: {e}")
-                with open(f"{step7_dir}/{filename}", "w") as f:
-                    json.dump({"error": str(e)}, f, indent=2)
-
-        # Step 7b: Buyer personas (sequential)
-        try:
-            personas_content = get_step_content_by_name(result.step_results, "identify_buyer_personas")
-            with open(f"{step7_dir}/buyer_personas.json", "w") as f:
-                json.dump(personas_content if personas_content else {}, f, indent=2)
-        except Exception as e:
-            print(f"Warning: Could not save buyer_personas.json: {e}")
-            with open(f"{step7_dir}/buyer_personas.json", "w") as f:
-                json.dump({"error": str(e)}, f, indent=2)
-
-        # Save Step 8: Playbook generation (all components)
-        # Create subdirectory for Step 8 outputs
-        step8_dir = f"{run_dir}/step8_playbook_generation"
-        os.makedirs(step8_dir, exist_ok=True)
-
-        # Step 8a: Summary (sequential)
-        try:
-            summary = get_step_content_by_name(result.step_results, "generate_playbook_summary")
-            with open(f"{step8_dir}/playbook_summary.json", "w") as f:
-                json.dump(summary if summary else {}, f, indent=2)
-        except Exception as e:
-            print(f"Warning: Could not save playbook_summary.json: {e}")
-            with open(f"{step8_dir}/playbook_summary.json", "w") as f:
-                json.dump({"error": str(e)}, f, indent=2)
-
-        # Step 8b-d: Parallel components
-        step8_parallel_components = {
-            "generate_email_sequences": "email_sequences.json",
-            "generate_talk_tracks": "talk_tracks.json",
-            "generate_battle_cards": "battle_cards.json"
-        }
-
-        for component_name, filename in step8_parallel_components.items():
-            try:
-                content = get_parallel_substep_content(result.step_results, "playbook_component_generation", component_name)
-                with open(f"{step8_dir}/{filename}", "w") as f:
-                    json.dump(content if content else {}, f, indent=2)
-            except Exception as e:
-                print(f"Warning: Could not save {filename}: {e}")
-                with open(f"{step8_dir}/{filename}", "w") as f:
-                    json.dump({"error": str(e)}, f, indent=2)
-
-        # Step 8e: Final assembly (sequential)
-        try:
-            final_playbook = get_step_content_by_name(result.step_results, "assemble_final_playbook")
-            with open(f"{step8_dir}/final_playbook.json", "w") as f:
-                json.dump(final_playbook if final_playbook else {}, f, indent=2)
-        except Exception as e:
-            print(f"Warning: Could not save final_playbook.json: {e}")
-            with open(f"{step8_dir}/final_playbook.json", "w") as f:
-                json.dump({"error": str(e)}, f, indent=2)
-
-        # Also save the complete final output for backwards compatibility
-        output_filename = f"{run_dir}/complete_output.json"
-        with open(output_filename, "w") as f:
-            json.dump(result.content, f, indent=2)
+        save_run_outputs(result, run_dir, timestamp, vendor_domain, prospect_domain, validated_input.run_id, trace, deadline)
 
         # Display success message
         print("\n" + "=" * 80)
@@ -369,6 +625,8 @@ def main():
         content = result.content
         print(f"\n📁 All outputs saved to: {run_dir}/")
         print(f"   • metadata.json - Run information")
+        if trace:
+            print(f"   • trace.json - Step and agent call timings")
         print(f"   • step6_vendor_extraction/ - Vendor GTM elements (8 files)")
         print(f"   • step7_prospect_analysis/ - Prospect insights (3 files)")
         print(f"   • step8_playbook_generation/ - Playbook components (5 files)")
@@ -408,12 +666,20 @@ def main():
         print("🎉 All phases complete! Sales playbook ready.")
         print("=" * 80 + "\n")
 
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Interrupted.")
+        if run_checkpoints:
+            print(f"Completed steps are checkpointed. Resume with: python main.py --resume {validated_input.run_id}")
+        sys.exit(130)
+
     except Exception as e:
         print("\n" + "=" * 80)
         print("❌ WORKFLOW ERROR")
         print("=" * 80)
         print(f"\nError: {str(e)}")
         print("\nPlease check your API keys in .env and try again.")
+        if run_checkpoints:
+            print(f"Completed steps are checkpointed. Resume with: python main.py --resume {validated_input.run_id}")
         print("=" * 80)
         sys.exit(1)
 
@@ -175,6 +175,29 @@ class BattleCard(BaseModel):
     )
 
 
+class BattleCardTailoring(BaseModel):
+    """Prospect-specific adjustments to one vendor-level base battle card"""
+    card_type: str = Field(
+        description="Type of the base card being tailored: why_we_win, objection_handling, competitive_positioning"
+    )
+    persona_focus: Optional[str] = Field(
+        default=None,
+        description="Prospect persona this card should focus on (optional)"
+    )
+    key_differentiators: List[str] = Field(
+        default_factory=list,
+        description="Differentiators reframed around the prospect's pain points, strongest first"
+    )
+    proof_points: List[str] = Field(
+        default_factory=list,
+        description="Proof most relevant to the prospect, to lead with"
+    )
+    objection_responses: List[ObjectionResponse] = Field(
+        default_factory=list,
+        description="Objections this prospect is likely to raise, tied to their pain points"
+    )
+
+
 # ============================================================================
 # COMPLETE PLAYBOOK MODEL
 # ============================================================================
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from models.common import Source
 
 
@@ -100,3 +100,22 @@ class VendorElements(BaseModel):
         description="Vendor's ICP - types of buyers they typically sell to (not prospect-specific)"
     )
     differentiators: List[Differentiator] = Field(default_factory=list)
+
+
+class VendorProfile(BaseModel):
+    """
+    Persisted vendor intelligence for one vendor domain.
+
+    Lets one vendor be run against many prospects without re-mapping, re-scraping
+    and re-extracting the vendor side on every run (see utils/vendor_store.py).
+    """
+    vendor_domain: str
+    version: int = Field(default=1, description="Incremented every time the profile is refreshed")
+    schema_version: int = Field(default=1, description="Profile format version; mismatches are treated as stale")
+    scraped_at: str = Field(description="ISO timestamp of the scrape the elements were extracted from")
+    source_page_hashes: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Content hash per scraped vendor page (URL -> hash)"
+    )
+    homepage_analysis: Optional[str] = None
+    elements: VendorElements = Field(default_factory=VendorElements)
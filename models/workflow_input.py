@@ -4,7 +4,9 @@ Pydantic models for workflow input validation with automatic domain normalizatio
 Supports AgentOS API integration with structured input schemas.
 """
 
-from pydantic import BaseModel, field_validator
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, field_validator
 from utils.workflow_helpers import normalize_domain
 
 
@@ -29,6 +31,30 @@ class WorkflowInput(BaseModel):
     vendor_domain: str
     prospect_domain: str
 
+    # Rebuild the vendor side even if a fresh stored vendor profile exists
+    refresh_vendor: bool = False
+
+    # LLM scheduling priority: "interactive" runs are served before "bulk" runs
+    priority: Literal["interactive", "bulk"] = "interactive"
+
+    # Priority persona selection for Phase 4: "summary" (Step 8a), "score" (Step 7b's
+    # priority_score) or "speculative" (Step 8a, with the top-scored persona's components
+    # started early); None uses config.PERSONA_SELECTION
+    persona_selection: Optional[Literal["summary", "score", "speculative"]] = None
+
+    # Checkpoint id: pass the id of a failed or interrupted run to resume it (completed steps
+    # are restored, not rerun); None starts a new run with a generated id
+    run_id: Optional[str] = None
+
+    # Steps to rerun instead of serving them from the step memo ("all" for every step);
+    # their fresh outputs replace the memoized ones
+    refresh_steps: Optional[List[str]] = None
+
+    # Latency budget in seconds: once it runs short, steps degrade in a fixed order (fewer
+    # pages, routed extraction, fewer extractors, fewer personas, faster model - see
+    # utils/run_deadline.py); None runs at full fidelity however long it takes
+    deadline_seconds: Optional[float] = Field(default=None, gt=0)
+
     @field_validator('vendor_domain', mode='before')
     @classmethod
     def normalize_vendor_domain(cls, v):
@@ -50,14 +76,93 @@ class WorkflowInput(BaseModel):
         Convert to dictionary format expected by Agno workflow.
 
         Returns:
-            Dict with vendor_domain and prospect_domain keys
+            Dict with vendor_domain, prospect_domain and run option keys
         """
         return {
             "vendor_domain": self.vendor_domain,
-            "prospect_domain": self.prospect_domain
+            "prospect_domain": self.prospect_domain,
+            "refresh_vendor": self.refresh_vendor,
+            "priority": self.priority,
+            "persona_selection": self.persona_selection,
+            "run_id": self.run_id,
+            "refresh_steps": self.refresh_steps,
+            "deadline_seconds": self.deadline_seconds
         }
 
 
+class BatchWorkflowInput(BaseModel):
+    """
+    Input model for a multi-prospect run: one vendor against a list of prospects.
+
+    The vendor side (Phases 1-2) runs once; every prospect then reuses the stored
+    vendor profile. Prospect domains are normalized and de-duplicated.
+    """
+
+    vendor_domain: str
+    prospect_domains: List[str] = Field(min_length=1)
+
+    # Rebuild the vendor side once at the start of the batch
+    refresh_vendor: bool = False
+
+    # LLM scheduling priority for every prospect run
+    priority: Literal["interactive", "bulk"] = "interactive"
+
+    # Priority persona selection for every prospect run (see WorkflowInput)
+    persona_selection: Optional[Literal["summary", "score", "speculative"]] = None
+
+    # Steps every prospect run reruns instead of serving from the step memo (see WorkflowInput)
+    refresh_steps: Optional[List[str]] = None
+
+    # Latency budget of each prospect run, from when that prospect starts (see WorkflowInput)
+    deadline_seconds: Optional[float] = Field(default=None, gt=0)
+
+    # Prospects processed concurrently (default: PROSPECT_BATCH_CONCURRENCY)
+    max_workers: Optional[int] = Field(default=None, gt=0)
+
+    @field_validator('vendor_domain', mode='before')
+    @classmethod
+    def normalize_vendor_domain(cls, v):
+        """Normalize vendor domain to https:// format"""
+        if not v:
+            raise ValueError("vendor_domain is required")
+        return normalize_domain(v)
+
+    @field_validator('prospect_domains', mode='before')
+    @classmethod
+    def normalize_prospect_domains(cls, v):
+        """Normalize prospect domains to https:// format, dropping duplicates"""
+        if not v:
+            raise ValueError("prospect_domains must contain at least one domain")
+        domains = []
+        for domain in v:
+            if not domain:
+                raise ValueError("prospect_domains must not contain empty domains")
+            normalized = normalize_domain(domain)
+            if normalized not in domains:
+                domains.append(normalized)
+        return domains
+
+    def to_workflow_inputs(self) -> List[WorkflowInput]:
+        """
+        Split into one single-prospect WorkflowInput per prospect.
+
+        Returns:
+            List of WorkflowInput (refresh_vendor is applied by the batch runner)
+        """
+        return [
+            WorkflowInput(
+                vendor_domain=self.vendor_domain,
+                prospect_domain=prospect_domain,
+                refresh_vendor=self.refresh_vendor,
+                priority=self.priority,
+                persona_selection=self.persona_selection,
+                refresh_steps=self.refresh_steps,
+                deadline_seconds=self.deadline_seconds
+            )
+            for prospect_domain in self.prospect_domains
+        ]
+
+
 # Example usage:
 # from models.workflow_input import WorkflowInput
 #
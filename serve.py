@@ -7,6 +7,7 @@ Usage:
 
 API Endpoints:
     POST /workflows/playbook-ai-sales-intelligence-pipeline/runs
+    POST /workflows/playbook-ai-multi-prospect-pipeline/runs (one vendor, many prospects)
     GET  /docs (OpenAPI documentation)
     GET  /health (Health check)
     GET  /config (AgentOS configuration)
@@ -19,23 +20,114 @@ Example API Call:
         "prospect_domain": "sendoso.com"
       }'
 
+Multi-prospect API Call (vendor phases run once, one playbook per prospect):
+    curl -X POST 'http://localhost:8080/workflows/playbook-ai-multi-prospect-pipeline/runs' \
+      -H 'Content-Type: application/json' \
+      -d '{
+        "vendor_domain": "octavehq.com",
+        "prospect_domains": ["sendoso.com", "gong.io", "clay.com"],
+        "max_workers": 3
+      }'
+
+A run's output includes its "run_id". Pass it back in the input ("run_id": "...") to
+resume a failed run: completed steps are restored from its checkpoint.
+
 Control Plane UI:
     http://localhost:8080
+
+Runs execute in worker threads, and a run whose client disconnects is cancelled: its
+remaining agent and Firecrawl calls are skipped (see utils/cancellation.py).
+
+API keys are checked when the server (each uvicorn worker) starts; agents and the
+Firecrawl client are built on first use.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from agno.os import AgentOS
-from main import workflow
+from main import batch_workflow, build_pipeline_workflow
+from utils.cancellation import cancellation_scope
+import config
 import os
 
+# Async executor: the pipeline runs off the event loop, which keeps serving requests
+workflow = build_pipeline_workflow(async_executor=True)
+
+
+class CancelOnDisconnectMiddleware:
+    """
+    ASGI middleware cancelling a workflow run when its client disconnects.
+
+    Each POST .../runs request gets a cancellation token, the parent of the token of every
+    run it starts. The middleware reads the request body up front and replays it to the
+    app, then watches the client connection: a disconnect before the response is complete
+    fires the token.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or not scope["path"].rstrip("/").endswith("/runs"):
+            await self.app(scope, receive, send)
+            return
+
+        body = []
+        while True:
+            message = await receive()
+            body.append(message)
+            if message["type"] != "http.request" or not message.get("more_body", False):
+                break
+
+        disconnected = asyncio.Event()
+        response_complete = False
+
+        async def receive_request():
+            if body:
+                return body.pop(0)
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send_response(message):
+            nonlocal response_complete
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+            await send(message)
+
+        async def watch_disconnect(token):
+            while (await receive())["type"] != "http.disconnect":
+                pass
+            disconnected.set()
+            if not response_complete:
+                token.cancel("client disconnected")
+
+        with cancellation_scope() as token:
+            watcher = asyncio.create_task(watch_disconnect(token))
+            try:
+                await self.app(scope, receive_request, send_response)
+            finally:
+                watcher.cancel()
+
+
+@asynccontextmanager
+async def startup_check(app):
+    """Fail the server start when required API keys are missing"""
+    config.validate()
+    yield
+
+
 # Initialize AgentOS with the complete sales intelligence workflow
 agent_os = AgentOS(
     id="playbook-ai-sales-intelligence",
     description="Complete sales intelligence pipeline API - End-to-end vendor analysis, prospect research, and sales playbook generation",
-    workflows=[workflow],
+    workflows=[workflow, batch_workflow],
+    lifespan=startup_check,
 )
 
 # Get the FastAPI app
 app = agent_os.get_app()
+app.add_middleware(CancelOnDisconnectMiddleware)
 
 # Add custom health check endpoint
 @app.get("/health")
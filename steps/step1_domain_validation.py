@@ -6,6 +6,7 @@ Runs in parallel for both domains.
 
 from agno.workflow.types import StepInput, StepOutput
 from utils.firecrawl_helpers import map_website
+from utils.vendor_store import vendor_store, get_batch_vendor_profile
 from utils.workflow_helpers import validate_single_domain, create_error_response, create_success_response
 
 
@@ -18,6 +19,7 @@ def validate_vendor_domain(step_input: StepInput) -> StepOutput:
 
     Returns:
         StepOutput with vendor_domain, vendor_urls, vendor_total_urls
+        (or vendor_profile when a fresh stored profile is reused)
     """
     # Get vendor domain from workflow input (Pydantic model from AgentOS)
     vendor_domain = step_input.input.vendor_domain
@@ -27,6 +29,24 @@ def validate_vendor_domain(step_input: StepInput) -> StepOutput:
     if not is_valid:
         return create_error_response(error_msg)
 
+    # Reuse the profile built earlier in this batch, or stored vendor intelligence when
+    # fresh - skips the vendor half of Phases 1-2
+    if not getattr(step_input.input, "refresh_vendor", False):
+        profile = get_batch_vendor_profile(vendor_domain)
+        if profile:
+            print(f"♻️  Reusing vendor profile v{profile.version} built earlier in this batch")
+        else:
+            profile = vendor_store.get_fresh_profile(vendor_domain)
+            if profile:
+                print(f"♻️  Reusing stored vendor profile v{profile.version} (scraped {profile.scraped_at})")
+        if profile:
+            return create_success_response({
+                "vendor_domain": vendor_domain,
+                "vendor_urls": [],
+                "vendor_total_urls": 0,
+                "vendor_profile": profile.model_dump(mode="json")
+            })
+
     # Map the website
     print(f"🔍 Mapping vendor domain: {vendor_domain}")
     result = map_website(vendor_domain)  # Uses config.MAX_URLS_TO_MAP (5000)
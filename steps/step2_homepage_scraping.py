@@ -35,6 +35,13 @@ def scrape_vendor_homepage(step_input: StepInput) -> StepOutput:
     if not vendor_domain:
         return create_error_response("Step 1 vendor validation failed: no vendor_domain in data")
 
+    if vendor_data.get("vendor_profile"):
+        print(f"♻️  Skipping vendor homepage scrape (stored vendor profile reused)")
+        return create_success_response({
+            "vendor_domain": vendor_domain,
+            "vendor_profile_reused": True
+        })
+
     print(f"📄 Scraping vendor homepage: {vendor_domain}")
     result = scrape_url(vendor_domain, formats=['markdown', 'html'])
 
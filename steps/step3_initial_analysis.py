@@ -6,6 +6,9 @@ Runs in parallel for both homepages.
 
 from agno.workflow.types import StepInput, StepOutput
 from agents.homepage_analyst import homepage_analyst
+from utils.agent_helpers import run_agent, get_run_priority
+from utils.token_budget import StepTokenBudget, fit_pages_and_record
+from utils.vendor_store import get_reused_vendor_profile
 from utils.workflow_helpers import get_parallel_step_content, create_error_response, create_success_response
 
 
@@ -25,6 +28,13 @@ def analyze_vendor_homepage(step_input: StepInput) -> StepOutput:
     if not vendor_homepage_data or "error" in vendor_homepage_data:
         return create_error_response(f"Step 2 vendor scraping failed: {vendor_homepage_data.get('error', 'no data returned')}")
 
+    if vendor_homepage_data.get("vendor_profile_reused"):
+        profile = get_reused_vendor_profile(step_input)
+        print(f"♻️  Using stored vendor homepage analysis")
+        return create_success_response({
+            "vendor_homepage_analysis": profile.homepage_analysis if profile else None
+        })
+
     markdown_content = vendor_homepage_data.get("vendor_homepage_markdown", "")
 
     if not markdown_content or len(markdown_content) < 100:
@@ -33,14 +43,21 @@ def analyze_vendor_homepage(step_input: StepInput) -> StepOutput:
     print(f"🤖 Analyzing vendor homepage with AI...")
 
     try:
-        response = homepage_analyst.run(
-            input=f"Analyze this homepage:\n\n{markdown_content}"
+        budget = StepTokenBudget(step_input, "analyze_vendor_home")
+        _, prompt = fit_pages_and_record(
+            budget,
+            {"homepage": markdown_content},
+            None,
+            lambda pages: "Analyze this homepage:\n\n" + "".join(pages.values())
         )
 
+        response = run_agent(homepage_analyst, input=prompt, priority=get_run_priority(step_input))
+
         print(f"✅ Vendor homepage analyzed")
 
         return create_success_response({
-            "vendor_homepage_analysis": response.content
+            "vendor_homepage_analysis": response.content,
+            "token_usage": budget.usage()
         })
 
     except Exception as e:
@@ -71,14 +88,21 @@ def analyze_prospect_homepage(step_input: StepInput) -> StepOutput:
     print(f"🤖 Analyzing prospect homepage with AI...")
 
     try:
-        response = homepage_analyst.run(
-            input=f"Analyze this homepage:\n\n{markdown_content}"
+        budget = StepTokenBudget(step_input, "analyze_prospect_home")
+        _, prompt = fit_pages_and_record(
+            budget,
+            {"homepage": markdown_content},
+            None,
+            lambda pages: "Analyze this homepage:\n\n" + "".join(pages.values())
         )
 
+        response = run_agent(homepage_analyst, input=prompt, priority=get_run_priority(step_input))
+
         print(f"✅ Prospect homepage analyzed")
 
         return create_success_response({
-            "prospect_homepage_analysis": response.content
+            "prospect_homepage_analysis": response.content,
+            "token_usage": budget.usage()
         })
 
     except Exception as e:
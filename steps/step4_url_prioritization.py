@@ -6,6 +6,8 @@ Sequential step (runs after parallel homepage analysis).
 
 from agno.workflow.types import StepInput, StepOutput
 from agents.url_prioritizer import url_prioritizer
+from utils.agent_helpers import run_agent, get_run_priority
+from utils.token_budget import StepTokenBudget
 from utils.workflow_helpers import get_parallel_step_content, create_error_response, create_success_response
 from config import MAX_URLS_TO_SCRAPE
 
@@ -39,16 +41,23 @@ def prioritize_urls(step_input: StepInput) -> StepOutput:
     vendor_urls = vendor_data.get("vendor_urls", [])
     prospect_urls = prospect_data.get("prospect_urls", [])
 
-    if not vendor_urls or not prospect_urls:
+    # A reused vendor profile means there are no vendor pages to select
+    vendor_profile_reused = bool(vendor_data.get("vendor_profile"))
+
+    if (not vendor_urls and not vendor_profile_reused) or not prospect_urls:
         return create_error_response("No URLs found from Step 1 validation")
 
     print(f"🎯 Prioritizing {len(vendor_urls)} vendor URLs and {len(prospect_urls)} prospect URLs...")
 
     # Prepare input for agent - limit URLs to avoid token overflow
     # Note: Consider moving 200 to config.MAX_URLS_FOR_PRIORITIZATION
+    if vendor_profile_reused:
+        vendor_section = "VENDOR URLs: none (vendor intelligence already stored - return an empty vendor list)"
+    else:
+        vendor_section = f"VENDOR URLs ({len(vendor_urls)} total):\n{chr(10).join(vendor_urls[:200])}"
+
     prompt = f"""
-VENDOR URLs ({len(vendor_urls)} total):
-{chr(10).join(vendor_urls[:200])}
+{vendor_section}
 
 PROSPECT URLs ({len(prospect_urls)} total):
 {chr(10).join(prospect_urls[:200])}
@@ -57,22 +66,32 @@ Select the top 10-15 most valuable URLs from each company for sales intelligence
 """
 
     try:
+        budget = StepTokenBudget(step_input, "prioritize_urls")
+        budget.record(prompt)
+
         # Run agent
-        response = url_prioritizer.run(input=prompt)
+        response = run_agent(url_prioritizer, input=prompt, priority=get_run_priority(step_input))
         result = response.content
 
         # Extract URLs from structured output
-        vendor_selected = [item.url for item in result.vendor_selected_urls]
-        prospect_selected = [item.url for item in result.prospect_selected_urls]
+        # URL details as dicts: step outputs are checkpointed and memoized as JSON, and
+        # restored outputs must read the same as fresh ones
+        vendor_url_details = [] if vendor_profile_reused else [item.model_dump() for item in result.vendor_selected_urls]
+        prospect_url_details = [item.model_dump() for item in result.prospect_selected_urls]
+
+        vendor_selected = [item["url"] for item in vendor_url_details]
+        prospect_selected = [item["url"] for item in prospect_url_details]
 
         print(f"✅ Selected {len(vendor_selected)} vendor URLs and {len(prospect_selected)} prospect URLs")
 
-        # ✅ Pass Pydantic models directly (per CLAUDE.md code preferences)
         return create_success_response({
             "vendor_selected_urls": vendor_selected,
             "prospect_selected_urls": prospect_selected,
-            "vendor_url_details": result.vendor_selected_urls,
-            "prospect_url_details": result.prospect_selected_urls
+            "vendor_url_details": vendor_url_details,
+            "prospect_url_details": prospect_url_details,
+            # Step 5 skips the vendor scrape only when a stored vendor profile is reused
+            "vendor_profile_reused": vendor_profile_reused,
+            "token_usage": budget.usage()
         })
 
     except Exception as e:
@@ -1,95 +1,116 @@
 """
 Step 5: Batch Scraping
-Batch scrapes all selected URLs from vendor and prospect websites.
-Sequential step (runs after URL prioritization).
+Batch scrapes the selected URLs as two independent Firecrawl jobs, one per company.
+Each job has its own URL budget and timeout, so a slow site only delays its own
+downstream branch (vendor extraction or prospect analysis).
+
+Runs short on their deadline scrape only the highest-priority pages (fewer_pages, see
+utils/run_deadline.py).
 """
 
 from agno.workflow.types import StepInput, StepOutput
 from utils.firecrawl_helpers import batch_scrape_urls
-from utils.workflow_helpers import validate_previous_step_data, create_error_response, create_success_response
+from utils.page_store import hash_pages
+from utils.run_deadline import should_degrade
+from utils.token_budget import estimate_tokens, order_pages_by_priority
+from utils.workflow_helpers import safe_get_step_content, create_error_response, create_success_response
 import config
 
 
-def batch_scrape_selected_pages(step_input: StepInput) -> StepOutput:
+def _scrape_pages(step_input: StepInput, side: str, max_urls: int, timeout: int) -> StepOutput:
     """
-    Batch scrape all selected URLs from vendor and prospect.
+    Batch scrape one company's selected URLs.
 
     Args:
         step_input: StepInput with access to Step 4 prioritize_urls output
+        side: "vendor" or "prospect"
+        max_urls: Maximum URLs to scrape for this company
+        timeout: Seconds to wait for the batch job
 
     Returns:
-        StepOutput with scraped content separated by vendor/prospect
+        StepOutput with {side}_content, {side}_urls_scraped, {side}_page_hashes and stats
     """
-    # Get selected URLs from Step 4
-    is_valid, url_data, error_msg = validate_previous_step_data(
+    is_valid, url_data, error_msg = safe_get_step_content(
         step_input,
-        required_keys=["vendor_selected_urls", "prospect_selected_urls"],
-        step_name="Step 4 (URL prioritization)"
+        "prioritize_urls",
+        required_keys=[f"{side}_selected_urls"]
     )
 
     if not is_valid:
         return create_error_response(error_msg)
 
-    vendor_urls = url_data.get("vendor_selected_urls", [])
-    prospect_urls = url_data.get("prospect_selected_urls", [])
+    urls = url_data.get(f"{side}_selected_urls", [])
 
-    # Combine and limit total URLs
-    all_urls = vendor_urls + prospect_urls
+    if len(urls) > config.DEADLINE_MAX_URLS_PER_COMPANY and should_degrade("fewer_pages", f"scrape_{side}_pages"):
+        ranked = order_pages_by_priority(dict.fromkeys(urls, ""), url_data.get(f"{side}_url_details"))
+        print(f"⏱️  Scraping only the top {config.DEADLINE_MAX_URLS_PER_COMPANY} of {len(urls)} {side} URLs")
+        urls = ranked[:config.DEADLINE_MAX_URLS_PER_COMPANY]
 
-    if len(all_urls) > config.MAX_URLS_TO_SCRAPE:
-        print(f"⚠️  Too many URLs ({len(all_urls)}), limiting to {config.MAX_URLS_TO_SCRAPE}")
-        # Take proportionally from each
-        vendor_limit = int(config.MAX_URLS_TO_SCRAPE * len(vendor_urls) / len(all_urls))
-        prospect_limit = config.MAX_URLS_TO_SCRAPE - vendor_limit
-        vendor_urls = vendor_urls[:vendor_limit]
-        prospect_urls = prospect_urls[:prospect_limit]
-        all_urls = vendor_urls + prospect_urls
+    if side == "vendor" and url_data.get("vendor_profile_reused"):
+        # Step 1 reused a stored vendor profile, so Step 4 selected no vendor pages
+        print("♻️  No vendor pages to scrape (stored vendor profile reused)")
+        pages = {}
+    elif not urls:
+        return create_error_response(f"{side.capitalize()} batch scraping failed: Step 4 selected no {side} URLs")
+    else:
+        if len(urls) > max_urls:
+            print(f"⚠️  Too many {side} URLs ({len(urls)}), limiting to {max_urls}")
+            urls = urls[:max_urls]
 
-    print(f"📚 Batch scraping {len(all_urls)} URLs ({len(vendor_urls)} vendor + {len(prospect_urls)} prospect)...")
-    print(f"⏱️  This may take up to {config.BATCH_SCRAPE_TIMEOUT} seconds...")
+        print(f"📚 Batch scraping {len(urls)} {side} URLs (timeout {timeout}s)...")
 
-    try:
-        # Batch scrape
-        result = batch_scrape_urls(all_urls, formats=['markdown'])
+        result = batch_scrape_urls(urls, formats=config.BATCH_SCRAPE_FORMAT, wait_timeout=timeout)
 
         if not result["success"]:
-            error_msg = f"Batch scraping failed: {result.get('error', 'Unknown error')}"
-            return create_error_response(error_msg)
-
-        scraped_results = result["results"]
-
-        # Separate vendor and prospect content
-        vendor_content = {}
-        prospect_content = {}
-
-        for url, data in scraped_results.items():
-            if url in vendor_urls:
-                vendor_content[url] = data["markdown"]
-            elif url in prospect_urls:
-                prospect_content[url] = data["markdown"]
-
-        print(f"✅ Scraped {len(vendor_content)} vendor pages and {len(prospect_content)} prospect pages")
-
-        # Calculate total content size
-        total_vendor_chars = sum(len(content) for content in vendor_content.values())
-        total_prospect_chars = sum(len(content) for content in prospect_content.values())
-
-        print(f"📊 Vendor content: {total_vendor_chars:,} characters")
-        print(f"📊 Prospect content: {total_prospect_chars:,} characters")
-
-        return create_success_response({
-            "vendor_content": vendor_content,
-            "prospect_content": prospect_content,
-            "vendor_urls_scraped": list(vendor_content.keys()),
-            "prospect_urls_scraped": list(prospect_content.keys()),
-            "total_scraped": len(scraped_results),
-            "stats": {
-                "vendor_pages": len(vendor_content),
-                "prospect_pages": len(prospect_content),
-                "vendor_chars": total_vendor_chars,
-                "prospect_chars": total_prospect_chars
-            }
-        })
+            return create_error_response(f"{side.capitalize()} batch scraping failed: {result.get('error', 'Unknown error')}")
+
+        pages = {url: data["markdown"] for url, data in result["results"].items() if url in urls}
+
+    total_chars = sum(len(content) for content in pages.values())
+    total_tokens = sum(estimate_tokens(content) for content in pages.values())
+
+    print(f"✅ Scraped {len(pages)} {side} pages: {total_chars:,} characters (~{total_tokens:,} tokens)")
+
+    return create_success_response({
+        f"{side}_content": pages,
+        f"{side}_urls_scraped": list(pages.keys()),
+        f"{side}_page_hashes": hash_pages(pages),
+        "total_scraped": len(pages),
+        "stats": {
+            f"{side}_pages": len(pages),
+            f"{side}_chars": total_chars,
+            f"{side}_tokens": total_tokens
+        }
+    })
+
+
+def scrape_vendor_pages(step_input: StepInput) -> StepOutput:
+    """
+    Batch scrape the vendor URLs selected in Step 4.
+
+    Args:
+        step_input: StepInput with access to Step 4 prioritize_urls output
+
+    Returns:
+        StepOutput with vendor_content, vendor_urls_scraped, vendor_page_hashes and stats
+    """
+    try:
+        return _scrape_pages(step_input, "vendor", config.MAX_VENDOR_URLS_TO_SCRAPE, config.VENDOR_BATCH_SCRAPE_TIMEOUT)
+    except Exception as e:
+        return create_error_response(f"Vendor batch scraping failed: {str(e)}")
+
+
+def scrape_prospect_pages(step_input: StepInput) -> StepOutput:
+    """
+    Batch scrape the prospect URLs selected in Step 4.
 
+    Args:
+        step_input: StepInput with access to Step 4 prioritize_urls output
+
+    Returns:
+        StepOutput with prospect_content, prospect_urls_scraped, prospect_page_hashes and stats
+    """
+    try:
+        return _scrape_pages(step_input, "prospect", config.MAX_PROSPECT_URLS_TO_SCRAPE, config.PROSPECT_BATCH_SCRAPE_TIMEOUT)
     except Exception as e:
-        return create_error_response(f"Batch scraping failed: {str(e)}")
+        return create_error_response(f"Prospect batch scraping failed: {str(e)}")
@@ -3,9 +3,18 @@ Step 6: Vendor Element Extraction
 Extracts 8 key GTM elements from vendor content using specialized AI agents.
 Runs in parallel for efficiency: offerings, case studies, testimonials, clients,
 differentiators, objections, buyer personas, and competitors.
+
+With INCREMENTAL_EXTRACTION_ENABLED, results are stored per page (keyed by content
+hash) and each extractor only sees pages that are new or changed since the last run.
+When Step 1 reuses a stored vendor profile, the extractors return its elements instead.
+
+Runs short on their deadline route each extractor to the few pages most likely to hold
+its element instead of the full corpus, and skip DEADLINE_OPTIONAL_EXTRACTORS
+(see utils/run_deadline.py). Degraded runs do not update the per-page store.
 """
 
 from agno.workflow.types import StepInput, StepOutput
+from datetime import datetime
 from agents.vendor_specialists.offerings_extractor import offerings_extractor
 from agents.vendor_specialists.case_study_extractor import case_study_extractor
 from agents.vendor_specialists.proof_points_extractor import proof_points_extractor
@@ -14,82 +23,237 @@ from agents.vendor_specialists.customer_extractor import customer_extractor
 from agents.vendor_specialists.use_case_extractor import use_case_extractor
 from agents.vendor_specialists.persona_extractor import persona_extractor
 from agents.vendor_specialists.differentiator_extractor import differentiator_extractor
-from utils.workflow_helpers import create_error_response
+from utils.agent_helpers import run_agent, get_run_priority
+from utils.page_store import page_extraction_store, extractor_fingerprint, hash_pages, attribute_items_to_pages, merge_items
+from utils.run_deadline import current_deadline, should_degrade
+from utils.token_budget import StepTokenBudget, combine_pages, fit_pages_and_record, order_pages_by_priority
+from utils.vendor_store import vendor_store, get_reused_vendor_profile, share_vendor_profile
+from utils.workflow_helpers import (
+    get_parallel_step_content,
+    create_error_response,
+    create_success_response,
+    extract_domains_from_input
+)
+from models.vendor_elements import VendorElements, VendorProfile
+import config
+
+# Step name in the vendor_element_extraction block -> key of its results
+VENDOR_EXTRACTION_STEPS = {
+    "extract_offerings": "offerings",
+    "extract_case_studies": "case_studies",
+    "extract_proof_points": "proof_points",
+    "extract_value_props": "value_propositions",
+    "extract_customers": "reference_customers",
+    "extract_use_cases": "use_cases",
+    "extract_personas": "vendor_icp_personas",
+    "extract_differentiators": "differentiators"
+}
+
+
+# Routed extraction: URL / page type keywords of the pages each extractor is routed to
+EXTRACTION_ROUTES = {
+    "extract_offerings": ("product", "platform", "solution", "feature", "pricing", "service"),
+    "extract_case_studies": ("case", "customer", "success", "stor"),
+    "extract_proof_points": ("case", "customer", "testimonial", "review", "award", "result", "roi"),
+    "extract_value_props": ("why", "platform", "product", "solution", "about", "home"),
+    "extract_customers": ("customer", "case", "partner", "stor"),
+    "extract_use_cases": ("use", "solution", "industr", "team", "role"),
+    "extract_personas": ("solution", "role", "team", "industr", "for-"),
+    "extract_differentiators": ("why", "compar", "vs", "alternative", "competit", "platform")
+}
+
+
+def route_pages(pages: dict, url_details: list, keywords: tuple, limit: int) -> dict:
+    """
+    Pick the pages an extractor is routed to instead of the full vendor corpus.
 
+    Pages whose URL or Step 4 page type contains one of the keywords come first; the
+    remaining slots go to the highest-priority other pages.
 
-def extract_offerings(step_input: StepInput) -> StepOutput:
-    """Extract all product/service offerings"""
-    try:
-        # Get vendor content from Step 5
-        scrape_data = step_input.get_step_content("batch_scrape")
+    Args:
+        pages: Dict mapping URL -> content
+        url_details: Step 4 URL details (url, page_type, priority)
+        keywords: Lower-case keywords of the extractor's route
+        limit: Maximum pages
 
-        if not scrape_data:
-            return StepOutput(
-                content={"error": "No batch scrape data available", "offerings": []},
-                success=False
-            )
+    Returns:
+        Dict mapping URL -> content for the routed pages
+    """
+    page_types = {}
+    for detail in url_details or []:
+        url = detail.get("url") if isinstance(detail, dict) else getattr(detail, "url", None)
+        page_type = detail.get("page_type") if isinstance(detail, dict) else getattr(detail, "page_type", None)
+        if url:
+            page_types[url] = str(page_type or "").lower()
+
+    ranked = order_pages_by_priority(pages, url_details)
+    matched = [
+        url for url in ranked
+        if any(keyword in url.lower() or keyword in page_types.get(url, "") for keyword in keywords)
+    ]
+    routed = (matched + [url for url in ranked if url not in matched])[:limit]
+    return {url: pages[url] for url in routed}
+
+
+def _run_extractor(
+    step_input: StepInput,
+    agent,
+    content_key: str,
+    response_field: str,
+    item_key_field: str,
+    instruction: str,
+    progress_msg: str,
+    result_label: str
+) -> StepOutput:
+    """
+    Run one vendor extractor over the scraped vendor pages.
+
+    Args:
+        step_input: StepInput with access to Step 5 scrape_vendor_pages output
+        agent: Extractor agent
+        content_key: Key for the results in the step output (e.g., "offerings")
+        response_field: Field on the agent's output schema holding the items
+        item_key_field: Field identifying an item, used to merge per-page results
+        instruction: Prompt prefix for the agent
+        progress_msg: Progress message, formatted with {pages}
+        result_label: Label for the result count message (e.g., "offerings")
+
+    Returns:
+        StepOutput with {content_key: [item dicts]}
+    """
+    profile = get_reused_vendor_profile(step_input)
+    if profile:
+        items = getattr(profile.elements, content_key)
+        print(f"♻️  Loaded {len(items)} {result_label} from stored vendor profile v{profile.version}")
+        return StepOutput(content={content_key: [item.model_dump() for item in items]}, success=True)
+
+    scrape_data = get_parallel_step_content(step_input, "batch_scrape", "scrape_vendor_pages")
+
+    if not scrape_data:
+        return StepOutput(
+            content={"error": "No vendor scrape data available", content_key: []},
+            success=False
+        )
 
-        vendor_content = scrape_data.get("vendor_content", {})
+    vendor_content = scrape_data.get("vendor_content", {})
 
-        if not vendor_content:
-            print("⚠️  No vendor content found - returning empty offerings")
-            return StepOutput(content={"offerings": []}, success=True)
+    if not vendor_content:
+        print(f"⚠️  No vendor content found - returning empty {result_label}")
+        return StepOutput(content={content_key: []}, success=True)
 
-        # Combine all content with URL labels
-        full_content = "\n\n---\n\n".join([
-            f"URL: {url}\n\n{content}"
-            for url, content in vendor_content.items()
-        ])
+    step_name = next(name for name, key in VENDOR_EXTRACTION_STEPS.items() if key == content_key)
+    if step_name in config.DEADLINE_OPTIONAL_EXTRACTORS and should_degrade("skip_optional_extractors", step_name):
+        print(f"⏱️  Skipping {result_label} extraction to meet the run deadline")
+        return StepOutput(content={content_key: [], "skipped": "deadline"}, success=True)
 
-        print(f"🔍 Extracting offerings from {len(vendor_content)} vendor pages...")
+    budget = StepTokenBudget(step_input, step_name)
+    url_details = (step_input.get_step_content("prioritize_urls") or {}).get("vendor_url_details")
 
-        # Run agent
-        response = offerings_extractor.run(
-            input=f"Extract all offerings from this content:\n\n{full_content}"
-        )
+    def build_prompt(pages: dict) -> str:
+        return f"{instruction}:\n\n{combine_pages(pages)}"
 
-        offerings = response.content.offerings
-        print(f"✅ Found {len(offerings)} offerings")
+    def route(pages: dict) -> dict:
+        if len(pages) > config.DEADLINE_ROUTED_PAGES and should_degrade("routed_extraction", step_name):
+            return route_pages(pages, url_details, EXTRACTION_ROUTES[step_name], config.DEADLINE_ROUTED_PAGES)
+        return pages
 
-        return StepOutput(content={"offerings": [o.model_dump() for o in offerings]}, success=True)
+    if not config.INCREMENTAL_EXTRACTION_ENABLED:
+        vendor_content = route(vendor_content)
+        print(progress_msg.format(pages=len(vendor_content)))
 
-    except Exception as e:
-        return create_error_response(f"Offerings extraction failed: {str(e)}")
+        _, prompt = fit_pages_and_record(budget, vendor_content, url_details, build_prompt)
+        response = run_agent(agent, input=prompt, priority=get_run_priority(step_input))
 
+        items = getattr(response.content, response_field)
+        print(f"✅ Found {len(items)} {result_label}")
 
-def extract_case_studies(step_input: StepInput) -> StepOutput:
-    """Extract all case studies"""
-    try:
-        scrape_data = step_input.get_step_content("batch_scrape")
+        return StepOutput(
+            content={content_key: [item.model_dump() for item in items], "token_usage": budget.usage()},
+            success=True
+        )
 
-        if not scrape_data:
-            return StepOutput(
-                content={"error": "No batch scrape data available", "case_studies": []},
-                success=False
-            )
+    # Incremental mode: reuse stored results for pages whose content hash is unchanged
+    vendor_domain, _ = extract_domains_from_input(step_input)
+    page_hashes = scrape_data.get("vendor_page_hashes") or hash_pages(vendor_content)
+    # Items stored by an extractor with other instructions, model or schema are not reused
+    extractor = extractor_fingerprint(agent, instruction)
+    stored_pages = page_extraction_store.load(vendor_domain, content_key, extractor)
+
+    pages = {}
+    unattributed = []
+    changed_content = {}
+    for url, content in vendor_content.items():
+        stored = stored_pages.get(url)
+        if stored and stored.get("hash") == page_hashes.get(url):
+            pages[url] = stored
+        else:
+            changed_content[url] = content
+
+    if changed_content:
+        print(progress_msg.format(pages=len(changed_content)) + f" ({len(pages)} unchanged pages reused)")
+
+        # Pages left out by routing or dropped to fit the token budget are not stored, so
+        # the next run extracts them
+        changed_content, prompt = fit_pages_and_record(budget, route(changed_content), url_details, build_prompt)
+        response = run_agent(agent, input=prompt, priority=get_run_priority(step_input))
+
+        new_items = [item.model_dump() for item in getattr(response.content, response_field)]
+        # Items that cite none of the extracted pages are kept for this run only
+        by_page, unattributed = attribute_items_to_pages(new_items, list(changed_content))
+        for url, page_items in by_page.items():
+            pages[url] = {"hash": page_hashes.get(url), "items": page_items}
+    else:
+        print(f"♻️  All {len(pages)} vendor pages unchanged - reusing stored {result_label}")
+
+    deadline = current_deadline()
+    if deadline and deadline.degraded:
+        # Items from a degraded run (routed pages, fast model) are not stored for later runs
+        print(f"⏱️  Not storing {result_label} per page - run degraded to meet its deadline")
+    else:
+        # Pages that are no longer scraped drop out of the store here
+        page_extraction_store.save(vendor_domain, content_key, extractor, pages)
+
+    items = merge_items(
+        [item for url in vendor_content if url in pages for item in pages[url]["items"]] + unattributed,
+        item_key_field
+    )
+    print(f"✅ Found {len(items)} {result_label}")
+
+    return StepOutput(content={content_key: items, "token_usage": budget.usage()}, success=True)
 
-        vendor_content = scrape_data.get("vendor_content", {})
 
-        if not vendor_content:
-            print("⚠️  No vendor content found - returning empty case studies")
-            return StepOutput(content={"case_studies": []}, success=True)
+def extract_offerings(step_input: StepInput) -> StepOutput:
+    """Extract all product/service offerings"""
+    try:
+        return _run_extractor(
+            step_input,
+            offerings_extractor,
+            content_key="offerings",
+            response_field="offerings",
+            item_key_field="name",
+            instruction="Extract all offerings from this content",
+            progress_msg="🔍 Extracting offerings from {pages} vendor pages...",
+            result_label="offerings"
+        )
 
-        full_content = "\n\n---\n\n".join([
-            f"URL: {url}\n\n{content}"
-            for url, content in vendor_content.items()
-        ])
+    except Exception as e:
+        return create_error_response(f"Offerings extraction failed: {str(e)}")
 
-        print(f"📚 Extracting case studies from {len(vendor_content)} vendor pages...")
 
-        response = case_study_extractor.run(
-            input=f"Extract all case studies:\n\n{full_content}"
+def extract_case_studies(step_input: StepInput) -> StepOutput:
+    """Extract all case studies"""
+    try:
+        return _run_extractor(
+            step_input,
+            case_study_extractor,
+            content_key="case_studies",
+            response_field="case_studies",
+            item_key_field="customer_name",
+            instruction="Extract all case studies",
+            progress_msg="📚 Extracting case studies from {pages} vendor pages...",
+            result_label="case studies"
         )
 
-        case_studies = response.content.case_studies
-        print(f"✅ Found {len(case_studies)} case studies")
-
-        return StepOutput(content={"case_studies": [cs.model_dump() for cs in case_studies]}, success=True)
-
     except Exception as e:
         return create_error_response(f"Case studies extraction failed: {str(e)}")
 
@@ -97,36 +261,17 @@ def extract_case_studies(step_input: StepInput) -> StepOutput:
 def extract_proof_points(step_input: StepInput) -> StepOutput:
     """Extract all proof points"""
     try:
-        scrape_data = step_input.get_step_content("batch_scrape")
-
-        if not scrape_data:
-            return StepOutput(
-                content={"error": "No batch scrape data available", "proof_points": []},
-                success=False
-            )
-
-        vendor_content = scrape_data.get("vendor_content", {})
-
-        if not vendor_content:
-            print("⚠️  No vendor content found - returning empty proof points")
-            return StepOutput(content={"proof_points": []}, success=True)
-
-        full_content = "\n\n---\n\n".join([
-            f"URL: {url}\n\n{content}"
-            for url, content in vendor_content.items()
-        ])
-
-        print(f"🏆 Extracting proof points from {len(vendor_content)} vendor pages...")
-
-        response = proof_points_extractor.run(
-            input=f"Extract all proof points:\n\n{full_content}"
+        return _run_extractor(
+            step_input,
+            proof_points_extractor,
+            content_key="proof_points",
+            response_field="proof_points",
+            item_key_field="content",
+            instruction="Extract all proof points",
+            progress_msg="🏆 Extracting proof points from {pages} vendor pages...",
+            result_label="proof points"
         )
 
-        proof_points = response.content.proof_points
-        print(f"✅ Found {len(proof_points)} proof points")
-
-        return StepOutput(content={"proof_points": [pp.model_dump() for pp in proof_points]}, success=True)
-
     except Exception as e:
         return create_error_response(f"Proof points extraction failed: {str(e)}")
 
@@ -134,36 +279,17 @@ def extract_proof_points(step_input: StepInput) -> StepOutput:
 def extract_value_props(step_input: StepInput) -> StepOutput:
     """Extract all value propositions"""
     try:
-        scrape_data = step_input.get_step_content("batch_scrape")
-
-        if not scrape_data:
-            return StepOutput(
-                content={"error": "No batch scrape data available", "value_propositions": []},
-                success=False
-            )
-
-        vendor_content = scrape_data.get("vendor_content", {})
-
-        if not vendor_content:
-            print("⚠️  No vendor content found - returning empty value propositions")
-            return StepOutput(content={"value_propositions": []}, success=True)
-
-        full_content = "\n\n---\n\n".join([
-            f"URL: {url}\n\n{content}"
-            for url, content in vendor_content.items()
-        ])
-
-        print(f"💎 Extracting value propositions from {len(vendor_content)} vendor pages...")
-
-        response = value_prop_extractor.run(
-            input=f"Extract all value propositions:\n\n{full_content}"
+        return _run_extractor(
+            step_input,
+            value_prop_extractor,
+            content_key="value_propositions",
+            response_field="value_propositions",
+            item_key_field="statement",
+            instruction="Extract all value propositions",
+            progress_msg="💎 Extracting value propositions from {pages} vendor pages...",
+            result_label="value propositions"
         )
 
-        value_props = response.content.value_propositions
-        print(f"✅ Found {len(value_props)} value propositions")
-
-        return StepOutput(content={"value_propositions": [vp.model_dump() for vp in value_props]}, success=True)
-
     except Exception as e:
         return create_error_response(f"Value propositions extraction failed: {str(e)}")
 
@@ -171,36 +297,17 @@ def extract_value_props(step_input: StepInput) -> StepOutput:
 def extract_customers(step_input: StepInput) -> StepOutput:
     """Extract all reference customers"""
     try:
-        scrape_data = step_input.get_step_content("batch_scrape")
-
-        if not scrape_data:
-            return StepOutput(
-                content={"error": "No batch scrape data available", "reference_customers": []},
-                success=False
-            )
-
-        vendor_content = scrape_data.get("vendor_content", {})
-
-        if not vendor_content:
-            print("⚠️  No vendor content found - returning empty customers")
-            return StepOutput(content={"reference_customers": []}, success=True)
-
-        full_content = "\n\n---\n\n".join([
-            f"URL: {url}\n\n{content}"
-            for url, content in vendor_content.items()
-        ])
-
-        print(f"🏢 Extracting reference customers from {len(vendor_content)} vendor pages...")
-
-        response = customer_extractor.run(
-            input=f"Extract all reference customers:\n\n{full_content}"
+        return _run_extractor(
+            step_input,
+            customer_extractor,
+            content_key="reference_customers",
+            response_field="reference_customers",
+            item_key_field="name",
+            instruction="Extract all reference customers",
+            progress_msg="🏢 Extracting reference customers from {pages} vendor pages...",
+            result_label="reference customers"
         )
 
-        customers = response.content.reference_customers
-        print(f"✅ Found {len(customers)} reference customers")
-
-        return StepOutput(content={"reference_customers": [c.model_dump() for c in customers]}, success=True)
-
     except Exception as e:
         return create_error_response(f"Reference customers extraction failed: {str(e)}")
 
@@ -208,36 +315,17 @@ def extract_customers(step_input: StepInput) -> StepOutput:
 def extract_use_cases(step_input: StepInput) -> StepOutput:
     """Extract all use cases"""
     try:
-        scrape_data = step_input.get_step_content("batch_scrape")
-
-        if not scrape_data:
-            return StepOutput(
-                content={"error": "No batch scrape data available", "use_cases": []},
-                success=False
-            )
-
-        vendor_content = scrape_data.get("vendor_content", {})
-
-        if not vendor_content:
-            print("⚠️  No vendor content found - returning empty use cases")
-            return StepOutput(content={"use_cases": []}, success=True)
-
-        full_content = "\n\n---\n\n".join([
-            f"URL: {url}\n\n{content}"
-            for url, content in vendor_content.items()
-        ])
-
-        print(f"🎯 Extracting use cases from {len(vendor_content)} vendor pages...")
-
-        response = use_case_extractor.run(
-            input=f"Extract all use cases:\n\n{full_content}"
+        return _run_extractor(
+            step_input,
+            use_case_extractor,
+            content_key="use_cases",
+            response_field="use_cases",
+            item_key_field="title",
+            instruction="Extract all use cases",
+            progress_msg="🎯 Extracting use cases from {pages} vendor pages...",
+            result_label="use cases"
         )
 
-        use_cases = response.content.use_cases
-        print(f"✅ Found {len(use_cases)} use cases")
-
-        return StepOutput(content={"use_cases": [uc.model_dump() for uc in use_cases]}, success=True)
-
     except Exception as e:
         return create_error_response(f"Use cases extraction failed: {str(e)}")
 
@@ -250,36 +338,17 @@ def extract_personas(step_input: StepInput) -> StepOutput:
     NOT specific personas at the prospect company.
     """
     try:
-        scrape_data = step_input.get_step_content("batch_scrape")
-
-        if not scrape_data:
-            return StepOutput(
-                content={"error": "No batch scrape data available", "vendor_icp_personas": []},
-                success=False
-            )
-
-        vendor_content = scrape_data.get("vendor_content", {})
-
-        if not vendor_content:
-            print("⚠️  No vendor content found - returning empty ICP personas")
-            return StepOutput(content={"vendor_icp_personas": []}, success=True)
-
-        full_content = "\n\n---\n\n".join([
-            f"URL: {url}\n\n{content}"
-            for url, content in vendor_content.items()
-        ])
-
-        print(f"👥 Extracting vendor ICP personas from {len(vendor_content)} vendor pages...")
-
-        response = persona_extractor.run(
-            input=f"Extract vendor's ICP (Ideal Customer Profile) personas - the types of buyers they typically sell to:\n\n{full_content}"
+        return _run_extractor(
+            step_input,
+            persona_extractor,
+            content_key="vendor_icp_personas",
+            response_field="target_personas",
+            item_key_field="title",
+            instruction="Extract vendor's ICP (Ideal Customer Profile) personas - the types of buyers they typically sell to",
+            progress_msg="👥 Extracting vendor ICP personas from {pages} vendor pages...",
+            result_label="vendor ICP personas"
         )
 
-        personas = response.content.target_personas
-        print(f"✅ Found {len(personas)} vendor ICP personas")
-
-        return StepOutput(content={"vendor_icp_personas": [p.model_dump() for p in personas]}, success=True)
-
     except Exception as e:
         return create_error_response(f"Vendor ICP personas extraction failed: {str(e)}")
 
@@ -287,35 +356,66 @@ def extract_personas(step_input: StepInput) -> StepOutput:
 def extract_differentiators(step_input: StepInput) -> StepOutput:
     """Extract all competitive differentiators"""
     try:
-        scrape_data = step_input.get_step_content("batch_scrape")
-
-        if not scrape_data:
-            return StepOutput(
-                content={"error": "No batch scrape data available", "differentiators": []},
-                success=False
-            )
-
-        vendor_content = scrape_data.get("vendor_content", {})
-
-        if not vendor_content:
-            print("⚠️  No vendor content found - returning empty differentiators")
-            return StepOutput(content={"differentiators": []}, success=True)
-
-        full_content = "\n\n---\n\n".join([
-            f"URL: {url}\n\n{content}"
-            for url, content in vendor_content.items()
-        ])
+        return _run_extractor(
+            step_input,
+            differentiator_extractor,
+            content_key="differentiators",
+            response_field="differentiators",
+            item_key_field="statement",
+            instruction="Extract all competitive differentiators",
+            progress_msg="⚡ Extracting differentiators from {pages} vendor pages...",
+            result_label="differentiators"
+        )
 
-        print(f"⚡ Extracting differentiators from {len(vendor_content)} vendor pages...")
+    except Exception as e:
+        return create_error_response(f"Differentiators extraction failed: {str(e)}")
 
-        response = differentiator_extractor.run(
-            input=f"Extract all competitive differentiators:\n\n{full_content}"
-        )
 
-        differentiators = response.content.differentiators
-        print(f"✅ Found {len(differentiators)} differentiators")
+def save_vendor_profile(step_input: StepInput) -> StepOutput:
+    """
+    Persist this run's vendor intelligence to the vendor store.
 
-        return StepOutput(content={"differentiators": [d.model_dump() for d in differentiators]}, success=True)
+    Runs after the vendor_element_extraction block. Skipped when the run reused a
+    stored profile or any extractor failed (a partial profile must not be reused).
+    """
+    try:
+        if get_reused_vendor_profile(step_input):
+            return create_success_response({"vendor_profile_saved": False, "reason": "stored profile reused"})
+
+        vendor_domain, _ = extract_domains_from_input(step_input)
+
+        # A profile built under deadline degradations is incomplete and must not be reused
+        deadline = current_deadline()
+        if deadline and deadline.degraded:
+            print(f"⚠️  Not saving vendor profile: built with deadline degradations ({', '.join(deadline.degraded)})")
+            return create_success_response({"vendor_profile_saved": False, "reason": "deadline degradations"})
+
+        elements = {}
+        for step_name, content_key in VENDOR_EXTRACTION_STEPS.items():
+            step_content = get_parallel_step_content(step_input, "vendor_element_extraction", step_name)
+            if not step_content or "error" in step_content:
+                print(f"⚠️  Not saving vendor profile: {step_name} did not succeed")
+                return create_success_response({"vendor_profile_saved": False, "reason": f"{step_name} failed"})
+            elements[content_key] = step_content.get(content_key, [])
+
+        scrape_data = get_parallel_step_content(step_input, "batch_scrape", "scrape_vendor_pages") or {}
+        homepage_analysis = get_parallel_step_content(step_input, "parallel_homepage_analysis", "analyze_vendor_home") or {}
+
+        profile = vendor_store.save(VendorProfile(
+            vendor_domain=vendor_domain,
+            scraped_at=datetime.now().isoformat(),
+            source_page_hashes=scrape_data.get("vendor_page_hashes")
+            or hash_pages(scrape_data.get("vendor_content", {})),
+            homepage_analysis=homepage_analysis.get("vendor_homepage_analysis"),
+            elements=VendorElements.model_validate(elements)
+        ))
+
+        print(f"💾 Saved vendor profile v{profile.version} for {vendor_domain}")
+        share_vendor_profile(profile)
+
+        return create_success_response({"vendor_profile_saved": True, "version": profile.version})
 
     except Exception as e:
-        return create_error_response(f"Differentiators extraction failed: {str(e)}")
+        # Failing to persist the profile should never fail the playbook run
+        print(f"⚠️  Could not save vendor profile: {str(e)}")
+        return StepOutput(content={"vendor_profile_saved": False, "reason": str(e)}, success=True)
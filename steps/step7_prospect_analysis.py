@@ -1,20 +1,22 @@
 from agno.workflow.types import StepInput, StepOutput
 from agents.prospect_specialists.company_analyst import company_analyst
 from agents.prospect_specialists.pain_point_analyst import pain_point_analyst
-from agents.prospect_specialists.buyer_persona_analyst import buyer_persona_analyst
+from agents.prospect_specialists.buyer_persona_analyst import buyer_persona_analyst, buyer_persona_context
+from utils.agent_helpers import run_agent, get_run_priority
+from utils.context_compiler import compile_context
+from utils.token_budget import StepTokenBudget, combine_pages, fit_pages_and_record
 from utils.workflow_helpers import get_parallel_step_content, create_error_response, create_success_response
-import json
 
 
 def analyze_company_profile(step_input: StepInput) -> StepOutput:
     """Extract minimal company profile from prospect content"""
     try:
         # Get prospect content from Step 5
-        scrape_data = step_input.get_step_content("batch_scrape")
+        scrape_data = get_parallel_step_content(step_input, "batch_scrape", "scrape_prospect_pages")
 
         if not scrape_data:
             return StepOutput(
-                content={"error": "No batch scrape data available"},
+                content={"error": "No prospect scrape data available"},
                 success=False
             )
 
@@ -27,24 +29,30 @@ def analyze_company_profile(step_input: StepInput) -> StepOutput:
                 success=False
             )
 
-        # Combine prospect content
-        full_content = "\n\n---\n\n".join([
-            f"URL: {url}\n\n{content}"
-            for url, content in prospect_content.items()
-        ])
-
         print(f"🏢 Analyzing company profile from {len(prospect_content)} prospect pages...")
 
+        # Combine prospect content, dropping low-priority pages if over the token limit
+        budget = StepTokenBudget(step_input, "analyze_company")
+        url_details = (step_input.get_step_content("prioritize_urls") or {}).get("prospect_url_details")
+        _, prompt = fit_pages_and_record(
+            budget,
+            prospect_content,
+            url_details,
+            lambda pages: f"Extract company profile from this content:\n\n" + combine_pages(pages)
+        )
+
         # Run agent
-        response = company_analyst.run(
-            input=f"Extract company profile from this content:\n\n{full_content}"
+        response = run_agent(
+            company_analyst,
+            input=prompt,
+            priority=get_run_priority(step_input)
         )
 
         company_profile = response.content.company_profile
         print(f"✅ Company profile extracted: {company_profile.company_name}")
 
         return StepOutput(
-            content={"company_profile": company_profile.model_dump()},
+            content={"company_profile": company_profile.model_dump(), "token_usage": budget.usage()},
             success=True
         )
 
@@ -60,11 +68,11 @@ def analyze_pain_points(step_input: StepInput) -> StepOutput:
     """Infer prospect pain points from their content"""
     try:
         # Get prospect content from Step 5
-        scrape_data = step_input.get_step_content("batch_scrape")
+        scrape_data = get_parallel_step_content(step_input, "batch_scrape", "scrape_prospect_pages")
 
         if not scrape_data:
             return StepOutput(
-                content={"error": "No batch scrape data available", "pain_points": []},
+                content={"error": "No prospect scrape data available", "pain_points": []},
                 success=False
             )
 
@@ -74,24 +82,30 @@ def analyze_pain_points(step_input: StepInput) -> StepOutput:
             print("⚠️  No prospect content found")
             return StepOutput(content={"pain_points": []}, success=True)
 
-        # Combine prospect content
-        full_content = "\n\n---\n\n".join([
-            f"URL: {url}\n\n{content}"
-            for url, content in prospect_content.items()
-        ])
-
         print(f"💡 Inferring pain points from {len(prospect_content)} prospect pages...")
 
+        # Combine prospect content, dropping low-priority pages if over the token limit
+        budget = StepTokenBudget(step_input, "analyze_pain_points")
+        url_details = (step_input.get_step_content("prioritize_urls") or {}).get("prospect_url_details")
+        _, prompt = fit_pages_and_record(
+            budget,
+            prospect_content,
+            url_details,
+            lambda pages: f"Infer pain points from this company's content:\n\n" + combine_pages(pages)
+        )
+
         # Run agent
-        response = pain_point_analyst.run(
-            input=f"Infer pain points from this company's content:\n\n{full_content}"
+        response = run_agent(
+            pain_point_analyst,
+            input=prompt,
+            priority=get_run_priority(step_input)
         )
 
         pain_points = response.content.pain_points
         print(f"✅ Identified {len(pain_points)} pain points")
 
         return StepOutput(
-            content={"pain_points": [pp.model_dump() for pp in pain_points]},
+            content={"pain_points": [pp.model_dump() for pp in pain_points], "token_usage": budget.usage()},
             success=True
         )
 
@@ -155,6 +169,14 @@ def identify_buyer_personas(step_input: StepInput) -> StepOutput:
         print(f"   Vendor elements: {sum(len(v) if isinstance(v, list) else 1 for v in vendor_intelligence.values())} items")
         print(f"   Prospect context: {len(prospect_intelligence['pain_points'])} pain points identified")
 
+        # Compile only the intelligence fields the persona analyst reads
+        budget = StepTokenBudget(step_input, "identify_buyer_personas")
+        context = compile_context(
+            {"vendor": vendor_intelligence, "prospect": prospect_intelligence},
+            buyer_persona_context,
+            max_tokens=budget.limit
+        )
+
         # Build comprehensive prompt
         prompt = f"""
 ABM CONTEXT:
@@ -163,10 +185,10 @@ This is an Account-Based Marketing motion. You are identifying the buying commit
 - PROSPECT = the target account (the company vendor wants as a customer)
 
 VENDOR INTELLIGENCE (what the vendor offers):
-{json.dumps(vendor_intelligence, indent=2)}
+{context['vendor']}
 
 PROSPECT INTELLIGENCE (the target account):
-{json.dumps(prospect_intelligence, indent=2)}
+{context['prospect']}
 
 YOUR TASK:
 Identify the 3-5 KEY BUYER PERSONAS at the PROSPECT company that the VENDOR should target for sales outreach.
@@ -186,8 +208,10 @@ Return 3-5 personas ranked by priority (highest first).
 Make this actionable - these are the specific people at this account that sales reps will call.
 """
 
+        budget.record(prompt)
+
         # Run agent
-        response = buyer_persona_analyst.run(input=prompt)
+        response = run_agent(buyer_persona_analyst, input=prompt, priority=get_run_priority(step_input))
 
         personas = response.content.target_buyer_personas
         print(f"✅ Identified {len(personas)} target buyer personas")
@@ -197,7 +221,7 @@ Make this actionable - these are the specific people at this account that sales
             print(f"   {i}. {persona.persona_title} (Priority: {persona.priority_score}/10)")
 
         return StepOutput(
-            content={"target_buyer_personas": [p.model_dump() for p in personas]},
+            content={"target_buyer_personas": [p.model_dump() for p in personas], "token_usage": budget.usage()},
             success=True
         )
 
@@ -4,54 +4,190 @@ Transforms vendor + prospect intelligence into actionable sales playbooks
 """
 
 from agno.workflow.types import StepInput, StepOutput
-from agents.playbook_specialists.playbook_orchestrator import playbook_orchestrator
-from agents.playbook_specialists.email_sequence_writer import email_sequence_writer
-from agents.playbook_specialists.talk_track_creator import talk_track_creator
-from agents.playbook_specialists.battle_card_builder import battle_card_builder
-from utils.workflow_helpers import get_parallel_step_content, create_error_response, create_success_response
+from agents.playbook_specialists.playbook_orchestrator import playbook_orchestrator, playbook_orchestrator_context
+from agents.playbook_specialists.email_sequence_writer import email_sequence_writer, email_sequence_context
+from agents.playbook_specialists.talk_track_creator import talk_track_creator, talk_track_context
+from agents.playbook_specialists.battle_card_builder import (
+    battle_card_builder,
+    battle_card_context,
+    battle_card_base_context,
+    battle_card_tailor,
+    battle_card_tailoring_context
+)
+from models.playbook import EmailSequence, TalkTrack
+from utils.agent_helpers import run_agent, get_run_priority
+from utils.battle_card_store import battle_card_store, vendor_elements_from_intel
+from utils.cancellation import CancellationToken, cancellation_scope, current_token
+from utils.context_compiler import compile_context
+from utils.persona_index import get_persona_index
+from utils.relevance import select_relevant_vendor_intel
+from utils.run_deadline import current_deadline, should_degrade
+from utils.token_budget import StepTokenBudget
+from utils.workflow_helpers import (
+    get_parallel_step_content,
+    get_workflow_option,
+    create_error_response,
+    create_success_response
+)
+import contextvars
 import json
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Optional, Tuple
+import config
 
 
 def find_matching_persona(persona_title: str, all_personas: list, threshold: float = 0.7) -> dict:
     """
-    Find a persona using fuzzy string matching.
+    Find a persona by title using the run's shared persona index.
 
     Args:
         persona_title: The persona title to search for
         all_personas: List of persona dictionaries with 'persona_title' field
-        threshold: Similarity threshold (0-1), default 0.7 (70% match)
+        threshold: Match confidence threshold (0-1), default 0.7
 
     Returns:
         Matching persona dict, or None if no match above threshold
     """
-    best_match = None
-    best_score = 0
+    match = get_persona_index(all_personas).match(persona_title, threshold)
+    return match.persona if match else None
 
-    for persona in all_personas:
-        # Calculate similarity ratio
-        similarity = SequenceMatcher(None,
-                                    persona_title.lower(),
-                                    persona["persona_title"].lower()).ratio()
 
-        if similarity > best_score:
-            best_score = similarity
-            best_match = persona
+def generate_for_personas(
+    persona_titles: List[str],
+    all_personas: list,
+    generate: Callable[[str, dict], list],
+    action: str
+) -> Tuple[list, List[dict]]:
+    """
+    Run a per-persona generator for each priority persona concurrently.
+
+    Generations run on a bounded thread pool (config.PERSONA_GENERATION_CONCURRENCY).
+    Results keep the order of persona_titles, and a failure for one persona is
+    reported without discarding the others.
+
+    Args:
+        persona_titles: Priority persona titles from the playbook summary
+        all_personas: Full persona dicts from Step 7b
+        generate: Function (persona_title, persona_data) -> list of generated items
+        action: Progress label (e.g., "✉️  Generating 4-touch email sequence")
 
-    # Return match only if above threshold
-    if best_score >= threshold:
-        return best_match
+    Returns:
+        Tuple of (generated items in persona order, [{"persona", "error"}] for failures)
+    """
+    persona_index = get_persona_index(all_personas)
 
-    return None
+    jobs = []
+    for persona_title in persona_titles:
+        match = persona_index.match(persona_title)
 
+        if not match:
+            print(f"⚠️  Persona data not found for {persona_title} (no fuzzy match)")
+            continue
 
-def generate_playbook_summary(step_input: StepInput) -> StepOutput:
+        # Show matched title if different from searched title
+        persona_data = match.persona
+        matched_title = persona_data["persona_title"]
+        if not match.exact:
+            print(f"{action} for {persona_title} (matched: {matched_title}, confidence {match.confidence:.2f})...")
+        else:
+            print(f"{action} for {persona_title}...")
+
+        jobs.append((persona_title, persona_data))
+
+    if not jobs:
+        return [], []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(config.PERSONA_GENERATION_CONCURRENCY, len(jobs)))) as executor:
+        # copy_context keeps per-run context (e.g., tracing) inside the worker threads
+        futures = [
+            executor.submit(contextvars.copy_context().run, generate, persona_title, persona_data)
+            for persona_title, persona_data in jobs
+        ]
+
+        items = []
+        errors = []
+        for (persona_title, _), future in zip(jobs, futures):
+            try:
+                items.extend(future.result())
+            except Exception as e:
+                print(f"   ❌ {persona_title}: {str(e)}")
+                errors.append({"persona": persona_title, "error": str(e)})
+
+    return items, errors
+
+
+# Email sequences and talk tracks are generated for this many priority personas
+PRIORITY_PERSONA_LIMIT = 3
+
+
+def get_persona_selection(step_input: StepInput) -> str:
     """
-    Step 8a: Generate executive summary and identify priority personas
+    How this run picks its priority personas.
 
-    This step runs AFTER Phases 1-3 complete, and synthesizes all intelligence
-    into a strategic playbook summary.
+    Args:
+        step_input: StepInput object
+
+    Returns:
+        "summary" (the playbook summary's priority_personas, Step 8b-c wait for Step 8a),
+        "score" (Step 7b's priority_score, Step 8b-c start right after Step 7b) or
+        "speculative" (as "summary", but the top-scored persona's email sequence and talk
+        track are generated alongside Step 8a and kept if the summary picks that persona)
+    """
+    return get_workflow_option(step_input, "persona_selection") or config.PERSONA_SELECTION
+
+
+def select_priority_personas(personas: List[dict], limit: int = PRIORITY_PERSONA_LIMIT) -> List[str]:
+    """
+    Pick priority personas deterministically by Step 7b's priority_score.
+
+    Args:
+        personas: target_buyer_personas from Step 7b
+        limit: Number of personas to return
+
+    Returns:
+        Persona titles, highest priority_score first (ties keep Step 7b's order)
+    """
+    ranked = sorted(personas, key=lambda persona: -(persona.get("priority_score") or 0))
+    return [persona["persona_title"] for persona in ranked[:limit]]
+
+
+def get_priority_personas(step_input: StepInput) -> List[str]:
+    """
+    Priority personas for Steps 8b-c and 8e.
+
+    Uses the playbook summary's priority_personas when Step 8a is an input of the
+    calling step (persona_selection "summary" or "speculative"), otherwise Step 7b's
+    scored selection.
+
+    Args:
+        step_input: StepInput object
+
+    Returns:
+        Up to PRIORITY_PERSONA_LIMIT persona titles (DEADLINE_PERSONA_LIMIT once the run
+        degrades to fewer_personas)
+    """
+    summary = step_input.get_step_content("generate_playbook_summary")
+    if get_persona_selection(step_input) != "score" and summary and summary.get("priority_personas"):
+        personas = summary["priority_personas"][:PRIORITY_PERSONA_LIMIT]
+    else:
+        playbook_context = step_input.get_step_content("prepare_playbook_context") or {}
+        personas = playbook_context.get("scored_priority_personas", [])
+
+    # Runs short on their deadline write emails and talk tracks for fewer personas
+    if len(personas) > config.DEADLINE_PERSONA_LIMIT and should_degrade("fewer_personas", "priority_personas"):
+        personas = personas[:config.DEADLINE_PERSONA_LIMIT]
+    return personas
+
+
+def prepare_playbook_context(step_input: StepInput) -> StepOutput:
+    """
+    Step 8 (prep): Collect vendor + prospect intelligence for Phase 4
+
+    No LLM call: gathers Step 6 and Step 7 outputs into the intelligence package every
+    Step 8 generator reads, and ranks priority personas by Step 7b's priority_score.
     """
     try:
         # Get vendor intelligence from Step 6 (vendor_element_extraction Parallel block)
@@ -96,6 +232,39 @@ def generate_playbook_summary(step_input: StepInput) -> StepOutput:
             "target_buyer_personas": target_personas
         }
 
+        persona_selection = get_persona_selection(step_input)
+        scored_personas = select_priority_personas(target_personas)
+        if persona_selection == "score":
+            print(f"🎯 Priority personas by score: {', '.join(scored_personas)}")
+
+        return create_success_response({
+            "vendor_intelligence": vendor_intel,
+            "prospect_intelligence": prospect_intel,
+            "persona_selection": persona_selection,
+            "scored_priority_personas": scored_personas
+        })
+
+    except Exception as e:
+        return create_error_response(f"Could not prepare playbook context: {str(e)}")
+
+
+def generate_playbook_summary(step_input: StepInput) -> StepOutput:
+    """
+    Step 8a: Generate executive summary and identify priority personas
+
+    This step runs AFTER Phases 1-3 complete, and synthesizes all intelligence
+    into a strategic playbook summary. With persona_selection "score" it runs
+    alongside Steps 8b-d instead of gating them.
+    """
+    try:
+        playbook_context = step_input.get_step_content("prepare_playbook_context")
+        if not playbook_context:
+            return create_error_response("No playbook context available")
+
+        vendor_intel = playbook_context["vendor_intelligence"]
+        prospect_intel = playbook_context["prospect_intelligence"]
+        target_personas = prospect_intel["target_buyer_personas"]
+
         print(f"\n📋 Generating playbook executive summary...")
         print(f"   Vendor elements: {sum(len(v) if isinstance(v, list) else 0 for v in vendor_intel.values())} items")
         print(f"   Prospect personas: {len(target_personas)}")
@@ -106,6 +275,18 @@ def generate_playbook_summary(step_input: StepInput) -> StepOutput:
 
         # Extract exact persona titles for orchestrator to use
         available_persona_titles = [p["persona_title"] for p in target_personas]
+        if playbook_context["persona_selection"] == "score":
+            # Steps 8b-c already target these - keep the summary consistent with them
+            available_persona_titles = playbook_context["scored_priority_personas"]
+
+        # Compile only the most relevant vendor elements and the fields the orchestrator reads
+        # (the step output keeps the full intelligence package)
+        budget = StepTokenBudget(step_input, "generate_playbook_summary")
+        context = compile_context(
+            {"vendor": select_relevant_vendor_intel(vendor_intel, prospect_intel), "prospect": prospect_intel},
+            playbook_orchestrator_context,
+            max_tokens=budget.limit
+        )
 
         prompt = f"""
 ABM CONTEXT:
@@ -115,10 +296,10 @@ This is an Account-Based Marketing playbook for a specific account.
 - This playbook helps {vendor_name}'s sales reps sell TO {prospect_name}
 
 VENDOR INTELLIGENCE (what {vendor_name} offers):
-{json.dumps(vendor_intel, indent=2)}
+{context['vendor']}
 
 PROSPECT INTELLIGENCE (the target account - {prospect_name}):
-{json.dumps(prospect_intel, indent=2)}
+{context['prospect']}
 
 AVAILABLE PERSONA TITLES (from prospect analysis):
 {json.dumps(available_persona_titles, indent=2)}
@@ -148,21 +329,36 @@ Provide:
 4. Success metrics to track for this account
 """
 
+        budget.record(prompt)
+
         # Run orchestrator
-        response = playbook_orchestrator.run(input=prompt)
+        response = run_agent(playbook_orchestrator, input=prompt, priority=get_run_priority(step_input))
 
         summary_data = response.content
         print(f"✅ Playbook summary generated")
         print(f"   Priority personas: {', '.join(summary_data.priority_personas)}")
 
+        # Resolve priority titles against Step 7b's personas once (the index is shared with 8b/8c)
+        persona_index = get_persona_index(target_personas)
+        persona_matches = []
+        for title in summary_data.priority_personas:
+            match = persona_index.match(title)
+            persona_matches.append({
+                "title": title,
+                "matched_title": match.persona["persona_title"] if match else None,
+                "confidence": match.confidence if match else 0.0
+            })
+
         return StepOutput(
             content={
                 "executive_summary": summary_data.executive_summary,
                 "priority_personas": summary_data.priority_personas,
+                "priority_persona_matches": persona_matches,
                 "quick_wins": summary_data.quick_wins,
                 "success_metrics": summary_data.success_metrics,
                 "vendor_intelligence": vendor_intel,
-                "prospect_intelligence": prospect_intel
+                "prospect_intelligence": prospect_intel,
+                "token_usage": budget.usage()
             },
             success=True
         )
@@ -177,6 +373,319 @@ Provide:
         )
 
 
+def _write_email_sequences(
+    persona_title: str,
+    persona_data: dict,
+    vendor_intel: dict,
+    prospect_intel: dict,
+    budget: StepTokenBudget,
+    priority: str
+) -> list:
+    """Generate the email sequence(s) for one persona (Step 8b and its speculative run)"""
+    context = compile_context(
+        {
+            "persona": persona_data,
+            "vendor": select_relevant_vendor_intel(vendor_intel, prospect_intel, persona=persona_data),
+            "prospect": prospect_intel
+        },
+        email_sequence_context,
+        max_tokens=budget.limit
+    )
+
+    prompt = budget.record(f"""
+TARGET PERSONA:
+{context['persona']}
+
+VENDOR INTELLIGENCE:
+{context['vendor']}
+
+PROSPECT CONTEXT:
+Company: {prospect_intel['company_profile'].get('company_name')}
+Industry: {prospect_intel['company_profile'].get('industry')}
+Pain Points: {context['prospect']}
+
+TASK:
+Create a 4-touch email sequence over 14 days for this persona.
+Follow the pain→value→follow-up→breakup framework.
+Day 1, Day 3, Day 7, Day 14.
+""")
+
+    response = run_agent(email_sequence_writer, input=prompt, priority=priority)
+
+    seq_count = len(response.content.email_sequences)
+    print(f"   ✅ {persona_title}: {seq_count} sequence(s) created")
+
+    return response.content.email_sequences
+
+
+def _write_talk_tracks(
+    persona_title: str,
+    persona_data: dict,
+    vendor_intel: dict,
+    prospect_intel: dict,
+    budget: StepTokenBudget,
+    priority: str
+) -> list:
+    """Generate the talk track(s) for one persona (Step 8c and its speculative run)"""
+    context = compile_context(
+        {
+            "persona": persona_data,
+            "vendor": select_relevant_vendor_intel(vendor_intel, prospect_intel, persona=persona_data),
+            "prospect": prospect_intel
+        },
+        talk_track_context,
+        max_tokens=budget.limit
+    )
+
+    prompt = budget.record(f"""
+TARGET PERSONA:
+{context['persona']}
+
+VENDOR INTELLIGENCE:
+{context['vendor']}
+
+PROSPECT CONTEXT:
+{context['prospect']}
+
+TASK:
+Create comprehensive talk tracks for this persona including:
+- Elevator pitch (30 seconds)
+- Cold call script
+- Discovery call script
+- Demo talking points
+- Value mapping (connect vendor capabilities to persona pain points)
+""")
+
+    response = run_agent(talk_track_creator, input=prompt, priority=priority)
+
+    print(f"   ✅ {persona_title}: talk track created")
+
+    return response.content.talk_tracks
+
+
+class _Speculation:
+    """A speculative generation in flight: its persona, cancellation token and result"""
+
+    def __init__(self, persona_title: str, token: CancellationToken):
+        self.persona_title = persona_title
+        self.token = token
+        self.budget: Optional[StepTokenBudget] = None
+        self.output: Optional[dict] = None
+        self.done = threading.Event()
+
+    def prompt_tokens(self) -> int:
+        """Prompt tokens spent so far"""
+        return self.budget.prompt_tokens if self.budget else 0
+
+
+# Speculative generations by run (cancellation token), then speculative step name. Step
+# 8b/8c find them here rather than through the graph, so they never wait for a
+# speculation the summary did not pick.
+_speculations: "weakref.WeakKeyDictionary[CancellationToken, Dict[str, Optional[_Speculation]]]" = weakref.WeakKeyDictionary()
+_speculations_lock = threading.Lock()
+
+
+def _register_speculation(run_token: Optional[CancellationToken], step_name: str, speculation: _Speculation) -> bool:
+    """
+    Publish a speculative generation to Step 8b/8c.
+
+    Args:
+        run_token: The run's cancellation token (the speculation's token is its child)
+        step_name: Speculative step name
+        speculation: The generation about to start
+
+    Returns:
+        False if Step 8b/8c already went ahead without it (or outside a run)
+    """
+    if run_token is None:
+        return False
+    with _speculations_lock:
+        run_speculations = _speculations.setdefault(run_token, {})
+        if step_name in run_speculations:
+            return False
+        run_speculations[step_name] = speculation
+    return True
+
+
+def _take_speculation(step_name: str) -> Optional[_Speculation]:
+    """The run's speculative generation for step_name (a speculation starting later is skipped)"""
+    run_token = current_token()
+    if run_token is None:
+        return None
+    with _speculations_lock:
+        return _speculations.setdefault(run_token, {}).setdefault(step_name, None)
+
+
+def _speculate_top_persona(step_input: StepInput, step_name: str, write: Callable, items_key: str) -> StepOutput:
+    """
+    Generate one component for Step 7b's top-scored persona while Step 8a is still running.
+
+    The generation runs under a child cancellation token, cancelled by Step 8b/8c as soon
+    as the summary's priority personas exclude the persona. Failures and cancellations
+    never fail the run: Step 8b/8c simply generate the persona themselves.
+
+    Args:
+        step_input: StepInput with access to prepare_playbook_context
+        step_name: Speculative step name (also its token budget name)
+        write: _write_email_sequences or _write_talk_tracks
+        items_key: Output key for the generated items
+
+    Returns:
+        StepOutput with persona, items and token_usage
+    """
+    persona_title = None
+    try:
+        playbook_context = step_input.get_step_content("prepare_playbook_context")
+        if not playbook_context or not playbook_context["scored_priority_personas"]:
+            return StepOutput(content={"persona": None, items_key: []}, success=True)
+
+        prospect_intel = playbook_context["prospect_intelligence"]
+        persona_title = playbook_context["scored_priority_personas"][0]
+        persona_data = find_matching_persona(persona_title, prospect_intel["target_buyer_personas"])
+
+        run_token = current_token()
+        with cancellation_scope(run_id=step_name) as token:
+            speculation = _Speculation(persona_title, token)
+            if not _register_speculation(run_token, step_name, speculation):
+                print(f"🔮 Not speculating {items_key.replace('_', ' ')}: the summary is already in")
+                return StepOutput(content={"persona": None, items_key: []}, success=True)
+
+            try:
+                print(f"🔮 Speculating {items_key.replace('_', ' ')} for top-scored persona {persona_title}...")
+
+                speculation.budget = StepTokenBudget(step_input, step_name)
+                items = write(
+                    persona_title,
+                    persona_data,
+                    playbook_context["vendor_intelligence"],
+                    prospect_intel,
+                    speculation.budget,
+                    get_run_priority(step_input)
+                )
+                speculation.output = {
+                    "persona": persona_title,
+                    items_key: [item.model_dump() for item in items],
+                    "token_usage": speculation.budget.usage()
+                }
+            except Exception as e:
+                if token.cancelled:
+                    print(f"🔮 Speculative {items_key.replace('_', ' ')} for {persona_title} cancelled: {token.reason}")
+                else:
+                    print(f"⚠️  Speculative {items_key.replace('_', ' ')} failed: {str(e)}")
+                speculation.output = {"persona": persona_title, items_key: [], "error": str(e), "cancelled": token.cancelled}
+                if speculation.budget:
+                    speculation.output["token_usage"] = speculation.budget.usage()
+            finally:
+                speculation.done.set()
+
+        return StepOutput(content=speculation.output, success=True)
+
+    except Exception as e:
+        print(f"⚠️  Speculative {items_key.replace('_', ' ')} failed: {str(e)}")
+        return StepOutput(content={"persona": persona_title, items_key: [], "error": str(e)}, success=True)
+
+
+def speculate_email_sequence(step_input: StepInput) -> StepOutput:
+    """
+    Step 8b (speculative): Email sequence for the top-scored persona, alongside Step 8a
+
+    Only runs with persona_selection "speculative"; Step 8b reuses the result if the
+    summary keeps the persona among its priority personas and cancels it otherwise.
+    """
+    return _speculate_top_persona(step_input, "speculate_email_sequence", _write_email_sequences, "email_sequences")
+
+
+def speculate_talk_track(step_input: StepInput) -> StepOutput:
+    """
+    Step 8c (speculative): Talk track for the top-scored persona, alongside Step 8a
+
+    Only runs with persona_selection "speculative"; Step 8c reuses the result if the
+    summary keeps the persona among its priority personas and cancels it otherwise.
+    """
+    return _speculate_top_persona(step_input, "speculate_talk_track", _write_talk_tracks, "talk_tracks")
+
+
+def get_speculation(
+    step_name: str,
+    items_key: str,
+    priority_personas: List[str],
+    all_personas: list
+) -> Tuple[Optional[str], list, Optional[dict]]:
+    """
+    Keep or discard the run's speculative generation once the priority personas are known.
+
+    A kept speculation still running is waited for; a discarded one is cancelled without
+    waiting, so its remaining agent calls are skipped.
+
+    Args:
+        step_name: Speculative step name ("speculate_email_sequence" or "speculate_talk_track")
+        items_key: Key of the generated items in the speculative output
+        priority_personas: Priority persona titles from the playbook summary
+        all_personas: Full persona dicts from Step 7b
+
+    Returns:
+        Tuple of (kept Step 7b persona title or None, kept items, report or None when
+        nothing was speculated)
+    """
+    speculation = _take_speculation(step_name)
+    if speculation is None:
+        return None, [], None
+
+    persona_title = speculation.persona_title
+    persona_index = get_persona_index(all_personas)
+    matches = [persona_index.match(title) for title in priority_personas]
+    kept = any(match and match.persona["persona_title"] == persona_title for match in matches)
+
+    cancelled = False
+    if kept:
+        speculation.done.wait()
+    elif not speculation.done.is_set():
+        cancelled = speculation.token.cancel(f"{persona_title} is not among the summary's priority personas")
+
+    output = speculation.output if speculation.done.is_set() else {}
+    kept = kept and not output.get("error")
+    items = output.get(items_key, []) if kept else []
+    report = {
+        "step": step_name,
+        "persona": persona_title,
+        "kept": kept,
+        "cancelled": cancelled,
+        "items": len(output.get(items_key, [])),
+        "prompt_tokens": speculation.prompt_tokens(),
+        "error": output.get("error")
+    }
+    status = "kept" if kept else ("discarded and cancelled" if cancelled else "discarded")
+    print(f"🔮 Speculative {items_key.replace('_', ' ')} for {persona_title}: {status}")
+
+    return (persona_title, items, report) if kept else (None, [], report)
+
+
+def summarize_speculation(reports: List[dict]) -> Optional[dict]:
+    """
+    Kept/wasted totals of speculative generations (one report per speculative step).
+
+    Args:
+        reports: Reports from get_speculation (possibly from several runs)
+
+    Returns:
+        Dict with kept/wasted/cancelled counts, wasted prompt tokens and ratios, or None
+        if nothing was speculated
+    """
+    if not reports:
+        return None
+
+    kept = sum(report["kept"] for report in reports)
+    wasted = len(reports) - kept
+    return {
+        "kept": kept,
+        "wasted": wasted,
+        "cancelled": sum(report.get("cancelled", False) for report in reports),
+        "kept_ratio": round(kept / len(reports), 2),
+        "wasted_prompt_tokens": sum(report["prompt_tokens"] for report in reports if not report["kept"]),
+        "components": reports
+    }
+
+
 def generate_email_sequences(step_input: StepInput) -> StepOutput:
     """
     Step 8b: Generate 4-touch email sequences for top 3 personas
@@ -184,68 +693,53 @@ def generate_email_sequences(step_input: StepInput) -> StepOutput:
     ABM Context: Creates emails FROM vendor sales reps TO prospect stakeholders
     """
     try:
-        # Get playbook summary from Step 8a
-        summary = step_input.get_step_content("generate_playbook_summary")
+        # Intelligence from the prep step; personas from Step 8a or Step 7b's scores
+        playbook_context = step_input.get_step_content("prepare_playbook_context")
+        priority_personas = get_priority_personas(step_input)  # Top 3
 
-        if not summary or not summary.get("priority_personas"):
+        if not playbook_context or not priority_personas:
             return StepOutput(
-                content={"error": "No playbook summary available", "email_sequences": []},
+                content={"error": "No priority personas available", "email_sequences": []},
                 success=False
             )
 
-        priority_personas = summary["priority_personas"][:3]  # Top 3
-        vendor_intel = summary["vendor_intelligence"]
-        prospect_intel = summary["prospect_intelligence"]
+        vendor_intel = playbook_context["vendor_intelligence"]
+        prospect_intel = playbook_context["prospect_intelligence"]
 
         # Find full persona data
         all_personas = prospect_intel["target_buyer_personas"]
 
-        sequences = []
-
-        for persona_title in priority_personas:
-            # Find matching persona using fuzzy matching
-            persona_data = find_matching_persona(persona_title, all_personas)
-
-            if not persona_data:
-                print(f"⚠️  Persona data not found for {persona_title} (no fuzzy match)")
-                continue
-
-            # Show matched title if different from searched title
-            matched_title = persona_data["persona_title"]
-            if matched_title != persona_title:
-                print(f"✉️  Generating 4-touch email sequence for {persona_title} (matched: {matched_title})...")
-            else:
-                print(f"✉️  Generating 4-touch email sequence for {persona_title}...")
-
-            prompt = f"""
-TARGET PERSONA:
-{json.dumps(persona_data, indent=2)}
-
-VENDOR INTELLIGENCE:
-{json.dumps(vendor_intel, indent=2)}
-
-PROSPECT CONTEXT:
-Company: {prospect_intel['company_profile'].get('company_name')}
-Industry: {prospect_intel['company_profile'].get('industry')}
-Pain Points: {json.dumps(prospect_intel['pain_points'], indent=2)}
+        # Speculative mode: reuse the top-scored persona's sequence if the summary kept it
+        kept_persona, kept_items, speculation = get_speculation(
+            "speculate_email_sequence", "email_sequences", priority_personas, all_personas
+        )
 
-TASK:
-Create a 4-touch email sequence over 14 days for this persona.
-Follow the pain→value→follow-up→breakup framework.
-Day 1, Day 3, Day 7, Day 14.
-"""
+        budget = StepTokenBudget(step_input, "generate_email_sequences")
+        priority = get_run_priority(step_input)
 
-            response = email_sequence_writer.run(input=prompt)
-            sequences.extend(response.content.email_sequences)
+        def generate_sequences(persona_title: str, persona_data: dict) -> list:
+            if persona_data["persona_title"] == kept_persona:
+                print(f"   ♻️  {persona_title}: reusing speculative sequence(s)")
+                return [EmailSequence.model_validate(seq) for seq in kept_items]
+            return _write_email_sequences(persona_title, persona_data, vendor_intel, prospect_intel, budget, priority)
 
-            seq_count = len(response.content.email_sequences)
-            print(f"   ✅ {seq_count} sequence(s) created")
+        sequences, persona_errors = generate_for_personas(
+            priority_personas,
+            all_personas,
+            generate_sequences,
+            "✉️  Generating 4-touch email sequence"
+        )
 
         print(f"✅ Total email sequences generated: {len(sequences)}")
 
         return StepOutput(
-            content={"email_sequences": [seq.model_dump() for seq in sequences]},
-            success=True
+            content={
+                "email_sequences": [seq.model_dump() for seq in sequences],
+                "persona_errors": persona_errors,
+                "speculation": speculation,
+                "token_usage": budget.usage()
+            },
+            success=bool(sequences) or not persona_errors
         )
 
     except Exception as e:
@@ -265,65 +759,49 @@ def generate_talk_tracks(step_input: StepInput) -> StepOutput:
     ABM Context: Creates scripts for vendor sales reps calling prospect stakeholders
     """
     try:
-        summary = step_input.get_step_content("generate_playbook_summary")
+        playbook_context = step_input.get_step_content("prepare_playbook_context")
+        priority_personas = get_priority_personas(step_input)
 
-        if not summary:
+        if not playbook_context or not priority_personas:
             return StepOutput(
-                content={"error": "No playbook summary", "talk_tracks": []},
+                content={"error": "No priority personas available", "talk_tracks": []},
                 success=False
             )
 
-        priority_personas = summary["priority_personas"][:3]
-        vendor_intel = summary["vendor_intelligence"]
-        prospect_intel = summary["prospect_intelligence"]
+        vendor_intel = playbook_context["vendor_intelligence"]
+        prospect_intel = playbook_context["prospect_intelligence"]
         all_personas = prospect_intel["target_buyer_personas"]
 
-        talk_tracks = []
-
-        for persona_title in priority_personas:
-            # Find matching persona using fuzzy matching
-            persona_data = find_matching_persona(persona_title, all_personas)
-
-            if not persona_data:
-                print(f"⚠️  Persona data not found for {persona_title} (no fuzzy match)")
-                continue
-
-            # Show matched title if different from searched title
-            matched_title = persona_data["persona_title"]
-            if matched_title != persona_title:
-                print(f"🎯 Generating talk tracks for {persona_title} (matched: {matched_title})...")
-            else:
-                print(f"🎯 Generating talk tracks for {persona_title}...")
-
-            prompt = f"""
-TARGET PERSONA:
-{json.dumps(persona_data, indent=2)}
+        kept_persona, kept_items, speculation = get_speculation(
+            "speculate_talk_track", "talk_tracks", priority_personas, all_personas
+        )
 
-VENDOR INTELLIGENCE:
-{json.dumps(vendor_intel, indent=2)}
+        budget = StepTokenBudget(step_input, "generate_talk_tracks")
+        priority = get_run_priority(step_input)
 
-PROSPECT CONTEXT:
-{json.dumps(prospect_intel, indent=2)}
+        def generate_talk_track(persona_title: str, persona_data: dict) -> list:
+            if persona_data["persona_title"] == kept_persona:
+                print(f"   ♻️  {persona_title}: reusing speculative talk track")
+                return [TalkTrack.model_validate(track) for track in kept_items]
+            return _write_talk_tracks(persona_title, persona_data, vendor_intel, prospect_intel, budget, priority)
 
-TASK:
-Create comprehensive talk tracks for this persona including:
-- Elevator pitch (30 seconds)
-- Cold call script
-- Discovery call script
-- Demo talking points
-- Value mapping (connect vendor capabilities to persona pain points)
-"""
-
-            response = talk_track_creator.run(input=prompt)
-            talk_tracks.extend(response.content.talk_tracks)
-
-            print(f"   ✅ Talk track created")
+        talk_tracks, persona_errors = generate_for_personas(
+            priority_personas,
+            all_personas,
+            generate_talk_track,
+            "🎯 Generating talk tracks"
+        )
 
         print(f"✅ Total talk tracks generated: {len(talk_tracks)}")
 
         return StepOutput(
-            content={"talk_tracks": [tt.model_dump() for tt in talk_tracks]},
-            success=True
+            content={
+                "talk_tracks": [tt.model_dump() for tt in talk_tracks],
+                "persona_errors": persona_errors,
+                "speculation": speculation,
+                "token_usage": budget.usage()
+            },
+            success=bool(talk_tracks) or not persona_errors
         )
 
     except Exception as e:
@@ -336,32 +814,147 @@ Create comprehensive talk tracks for this persona including:
         )
 
 
-def generate_battle_cards(step_input: StepInput) -> StepOutput:
+def _merge_unique(leading: List[str], rest: List[str]) -> List[str]:
+    """Leading items first, then items from rest not already present (case-insensitive)"""
+    seen = {item.strip().lower() for item in leading}
+    return list(leading) + [item for item in rest if item.strip().lower() not in seen]
+
+
+def apply_battle_card_tailoring(base_cards: List[dict], tailorings: List[dict]) -> List[dict]:
     """
-    Step 8d: Generate battle cards (objection handling, competitive positioning)
+    Merge prospect-specific tailorings into vendor-level base battle cards.
 
-    ABM Context: Creates battle cards for vendor's sales team to overcome prospect objections
+    Tailored differentiators replace the base ones (they are reframings of them),
+    tailored proof points and prospect-specific objections lead, and the base card's
+    remaining proof and objections follow.
+
+    Args:
+        base_cards: Base battle card dicts
+        tailorings: BattleCardTailoring dicts (matched to cards by card_type)
+
+    Returns:
+        Tailored battle card dicts
     """
-    try:
-        summary = step_input.get_step_content("generate_playbook_summary")
+    by_type = {tailoring.get("card_type"): tailoring for tailoring in tailorings}
+    cards = []
 
-        if not summary:
-            return StepOutput(
-                content={"error": "No playbook summary", "battle_cards": []},
-                success=False
-            )
+    for card in base_cards:
+        tailoring = by_type.get(card.get("card_type"))
+        if not tailoring:
+            cards.append(card)
+            continue
 
-        vendor_intel = summary["vendor_intelligence"]
-        prospect_intel = summary["prospect_intelligence"]
+        tailored_objections = tailoring.get("objection_responses", [])
+        tailored_texts = {objection["objection"].strip().lower() for objection in tailored_objections}
 
-        print(f"⚔️  Generating battle cards...")
+        cards.append({
+            **card,
+            "persona_focus": tailoring.get("persona_focus") or card.get("persona_focus"),
+            "key_differentiators": tailoring.get("key_differentiators") or card.get("key_differentiators", []),
+            "proof_points": _merge_unique(tailoring.get("proof_points", []), card.get("proof_points", [])),
+            "objection_responses": tailored_objections + [
+                objection for objection in card.get("objection_responses", [])
+                if objection["objection"].strip().lower() not in tailored_texts
+            ]
+        })
 
-        prompt = f"""
+    return cards
+
+
+def _generate_base_battle_cards(vendor_intel: dict, budget: StepTokenBudget, priority: str) -> List[dict]:
+    """Generate vendor-level battle cards from vendor intelligence only (no prospect data)"""
+    context = compile_context({"vendor": vendor_intel}, battle_card_base_context, max_tokens=budget.limit)
+
+    prompt = f"""
 VENDOR INTELLIGENCE:
-{json.dumps(vendor_intel, indent=2)}
+{context['vendor']}
+
+TASK:
+Create the vendor's standard battle cards for its sales team:
+1. Why We Win battle card
+2. Objection Handling battle card (7-10 common objections)
+3. Competitive Positioning (vs. manual/in-house solutions or competitors if intel available)
+
+There is no specific prospect yet: write for the vendor's typical buyers (the ICP personas
+above). The cards are tailored to each prospect afterwards.
+
+Use Fact-Impact-Act framework.
+Be specific and actionable.
+Include exact talk tracks.
+"""
+
+    budget.record(prompt)
+
+    response = run_agent(battle_card_builder, input=prompt, priority=priority)
+    return [bc.model_dump() for bc in response.content.battle_cards]
+
+
+def _tailor_battle_cards(
+    base_cards: List[dict],
+    vendor_intel: dict,
+    prospect_intel: dict,
+    budget: StepTokenBudget,
+    priority: str
+) -> List[dict]:
+    """Run the prospect tailoring pass and merge it into the base cards"""
+    base_outline = [
+        {
+            "title": card.get("title"),
+            "card_type": card.get("card_type"),
+            "key_differentiators": card.get("key_differentiators", []),
+            "proof_points": card.get("proof_points", []),
+            "objections": [objection["objection"] for objection in card.get("objection_responses", [])]
+        }
+        for card in base_cards
+    ]
+    context = compile_context(
+        {"vendor": select_relevant_vendor_intel(vendor_intel, prospect_intel), "prospect": prospect_intel},
+        battle_card_tailoring_context,
+        max_tokens=budget.limit
+    )
+
+    prompt = f"""
+BASE BATTLE CARDS:
+{json.dumps(base_outline, separators=(",", ":"), ensure_ascii=False)}
 
 PROSPECT INTELLIGENCE:
-{json.dumps(prospect_intel, indent=2)}
+{context['prospect']}
+
+RELEVANT VENDOR PROOF:
+{context['vendor']}
+
+TASK:
+Tailor each base battle card to this prospect: reframe differentiators around their
+pain points, pick the proof they will find most convincing, and add the objections
+they are likely to raise.
+"""
+
+    budget.record(prompt)
+
+    response = run_agent(battle_card_tailor, input=prompt, priority=priority)
+    tailorings = [tailoring.model_dump() for tailoring in response.content.tailorings]
+    return apply_battle_card_tailoring(base_cards, tailorings)
+
+
+def _generate_battle_cards_single_pass(
+    vendor_intel: dict,
+    prospect_intel: dict,
+    budget: StepTokenBudget,
+    priority: str
+) -> List[dict]:
+    """Generate prospect-specific battle cards in one pass (battle card cache disabled)"""
+    context = compile_context(
+        {"vendor": select_relevant_vendor_intel(vendor_intel, prospect_intel), "prospect": prospect_intel},
+        battle_card_context,
+        max_tokens=budget.limit
+    )
+
+    prompt = f"""
+VENDOR INTELLIGENCE:
+{context['vendor']}
+
+PROSPECT INTELLIGENCE:
+{context['prospect']}
 
 TASK:
 Create battle cards for the sales team:
@@ -374,15 +967,64 @@ Be specific and actionable.
 Include exact talk tracks.
 """
 
-        response = battle_card_builder.run(input=prompt)
-        battle_cards = response.content.battle_cards
+    budget.record(prompt)
+
+    response = run_agent(battle_card_builder, input=prompt, priority=priority)
+    return [bc.model_dump() for bc in response.content.battle_cards]
+
+
+def generate_battle_cards(step_input: StepInput) -> StepOutput:
+    """
+    Step 8d: Generate battle cards (objection handling, competitive positioning)
+
+    ABM Context: Creates battle cards for vendor's sales team to overcome prospect objections.
+    Vendor-level base cards are cached by VendorElements hash (utils/battle_card_store.py);
+    each prospect only runs a tailoring pass over them.
+    """
+    try:
+        # Battle cards do not use the summary, so they only wait for the prep step
+        playbook_context = step_input.get_step_content("prepare_playbook_context")
+
+        if not playbook_context:
+            return StepOutput(
+                content={"error": "No playbook context available", "battle_cards": []},
+                success=False
+            )
+
+        vendor_intel = playbook_context["vendor_intelligence"]
+        prospect_intel = playbook_context["prospect_intelligence"]
+        priority = get_run_priority(step_input)
+
+        print(f"⚔️  Generating battle cards...")
+
+        budget = StepTokenBudget(step_input, "generate_battle_cards")
+
+        if battle_card_store is None:
+            battle_cards = _generate_battle_cards_single_pass(vendor_intel, prospect_intel, budget, priority)
+            base_info = None
+        else:
+            key = battle_card_store.make_key(vendor_elements_from_intel(vendor_intel), battle_card_builder)
+            base_cards, cache_hit = battle_card_store.get_or_create(
+                key,
+                lambda: _generate_base_battle_cards(vendor_intel, budget, priority)
+            )
+            print(f"{'♻️  Reused' if cache_hit else '🧱 Built'} {len(base_cards)} vendor-level base battle cards")
+
+            base_info = {"key": key[:16], "cache_hit": cache_hit, "tailored": True}
+            try:
+                battle_cards = _tailor_battle_cards(base_cards, vendor_intel, prospect_intel, budget, priority)
+            except Exception as e:
+                # Untailored base cards are still a usable playbook component
+                print(f"⚠️  Battle card tailoring failed, using base cards: {str(e)}")
+                battle_cards = base_cards
+                base_info.update({"tailored": False, "tailoring_error": str(e)})
 
         print(f"✅ {len(battle_cards)} battle cards generated")
         for card in battle_cards:
-            print(f"   - {card.title} ({card.card_type})")
+            print(f"   - {card['title']} ({card['card_type']})")
 
         return StepOutput(
-            content={"battle_cards": [bc.model_dump() for bc in battle_cards]},
+            content={"battle_cards": battle_cards, "battle_card_base": base_info, "token_usage": budget.usage()},
             success=True
         )
 
@@ -416,6 +1058,18 @@ def assemble_final_playbook(step_input: StepInput) -> StepOutput:
         vendor_name = summary["vendor_intelligence"]["offerings"][0]["name"] if summary["vendor_intelligence"].get("offerings") else "Vendor"
         prospect_name = summary["prospect_intelligence"]["company_profile"].get("company_name", "Prospect")
 
+        # With score-based selection, Steps 8b-c targeted Step 7b's top-scored personas
+        persona_selection = get_persona_selection(step_input)
+        priority_personas = summary["priority_personas"]
+        if persona_selection == "score":
+            priority_personas = get_priority_personas(step_input)
+
+        # Speculative mode: how much of the work started before the summary was kept
+        speculation = summarize_speculation([
+            data["speculation"] for data in (email_sequences_data, talk_tracks_data)
+            if data and data.get("speculation")
+        ])
+
         # Assemble final playbook
         final_playbook = {
             "vendor_name": vendor_name,
@@ -424,7 +1078,8 @@ def assemble_final_playbook(step_input: StepInput) -> StepOutput:
 
             # From summary
             "executive_summary": summary["executive_summary"],
-            "priority_personas": summary["priority_personas"],
+            "priority_personas": priority_personas,
+            "persona_selection": persona_selection,
             "quick_wins": summary["quick_wins"],
             "success_metrics": summary["success_metrics"],
 
@@ -447,10 +1102,19 @@ def assemble_final_playbook(step_input: StepInput) -> StepOutput:
         print(f"   • Talk Tracks: {len(final_playbook['talk_tracks'])}")
         print(f"   • Battle Cards: {len(final_playbook['battle_cards'])}")
         print(f"   • Quick Wins: {len(final_playbook['quick_wins'])}")
+        if speculation:
+            print(f"   • Speculative Generations: {speculation['kept']} kept, {speculation['wasted']} wasted ({speculation['cancelled']} cancelled)")
+        deadline = current_deadline()
+        if deadline and deadline.degraded:
+            print(f"   • Degraded for Deadline: {', '.join(deadline.degraded)}")
         print(f"=" * 60)
 
         return StepOutput(
-            content={"sales_playbook": final_playbook},
+            content={
+                "sales_playbook": final_playbook,
+                "speculation": speculation,
+                "deadline": deadline.summary() if deadline else None
+            },
             success=True
         )
 
@@ -0,0 +1,36 @@
+"""
+Shared test setup.
+
+Tests run offline: every model is the fake model (utils/fake_llm.py), caches, stores
+and checkpoints are disabled (tests build their own in tmp_path), and no API key is
+needed. The environment is set before the pipeline modules read config on import.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.update({
+    "DEFAULT_MODEL": "fake",
+    "FAST_MODEL": "fake",
+    "REASONING_MODEL": "fake",
+    "EXTRACTION_MODEL": "fake",
+    "LLM_CACHE_ENABLED": "false",
+    "STEP_MEMO_ENABLED": "false",
+    "RUN_CHECKPOINTS_ENABLED": "false",
+    "BATTLE_CARD_CACHE_ENABLED": "false",
+    "INCREMENTAL_EXTRACTION_ENABLED": "false",
+    "TRACING_ENABLED": "false",
+})
+
+import pytest  # noqa: E402
+from agno.workflow.types import StepInput  # noqa: E402
+
+
+@pytest.fixture
+def make_step_input():
+    """Build the StepInput a workflow passes to a graph, from workflow input options"""
+    def make(**options) -> StepInput:
+        return StepInput(input={"vendor_domain": "https://vendor.com", "prospect_domain": "https://prospect.com", **options})
+    return make
@@ -0,0 +1,33 @@
+"""
+Tests for steps/step5_batch_scraping.py: when the vendor scrape is skipped.
+"""
+
+from agno.workflow.types import StepOutput
+
+from steps.step5_batch_scraping import scrape_vendor_pages
+
+
+def step_input_after_step4(make_step_input, **url_data):
+    step_input = make_step_input()
+    step_input.previous_step_outputs = {
+        "prioritize_urls": StepOutput(step_name="prioritize_urls", content={"prospect_selected_urls": ["https://prospect.com"], **url_data})
+    }
+    return step_input
+
+
+def test_vendor_scrape_is_skipped_when_a_stored_profile_is_reused(make_step_input):
+    output = scrape_vendor_pages(step_input_after_step4(
+        make_step_input, vendor_selected_urls=[], vendor_profile_reused=True
+    ))
+
+    assert output.success
+    assert output.content["vendor_content"] == {}
+
+
+def test_empty_vendor_selection_without_a_stored_profile_fails(make_step_input):
+    output = scrape_vendor_pages(step_input_after_step4(
+        make_step_input, vendor_selected_urls=[], vendor_profile_reused=False
+    ))
+
+    assert not output.success and output.stop
+    assert "selected no vendor URLs" in output.content["error"]
@@ -0,0 +1,86 @@
+"""
+Tests for utils/context_compiler.py: field projection and trimming to the token budget.
+"""
+
+import json
+
+from utils.context_compiler import ContextSpec, compile_context
+from utils.token_budget import estimate_tokens
+
+
+def make_package(count):
+    """Intelligence package with `count` offerings and pain points, each citing a source"""
+    def sources(i):
+        return [{"url": f"https://example.com/{i}", "excerpt": "Supporting quote " * 20}]
+
+    return {
+        "vendor": {
+            "offerings": [
+                {"name": f"Offering {i}", "description": f"Does thing {i} " * 5, "sources": sources(i)}
+                for i in range(count)
+            ]
+        },
+        "prospect": {
+            "pain_points": [
+                {"description": f"Pain point {i}", "impact": "High", "sources": sources(i)}
+                for i in range(count // 4)
+            ]
+        }
+    }
+
+
+def rendered_tokens(context):
+    return sum(estimate_tokens(text) for text in context.values())
+
+
+def test_compile_context_projects_fields_and_drops_duplicates():
+    data = make_package(3)
+    data["vendor"]["offerings"].append(dict(data["vendor"]["offerings"][0]))
+    spec = ContextSpec(fields={"vendor.offerings": ["name"]}, token_budget=10000)
+
+    context = compile_context(data, spec)
+
+    assert json.loads(context["vendor"]) == {"offerings": [{"name": f"Offering {i}"} for i in range(3)]}
+    assert json.loads(context["prospect"]) == {}
+
+
+def test_compile_context_trims_longest_sections_to_the_budget():
+    spec = ContextSpec(
+        fields={"vendor.offerings": ["name", "description"], "prospect.pain_points": ["description", "impact"]},
+        token_budget=300
+    )
+
+    context = compile_context(make_package(40), spec)
+    vendor = json.loads(context["vendor"])["offerings"]
+    prospect = json.loads(context["prospect"])["pain_points"]
+
+    assert rendered_tokens(context) <= 300
+    # Leading (most important) items are kept, and every section keeps at least one
+    assert vendor == [{"name": f"Offering {i}", "description": f"Does thing {i} " * 5} for i in range(len(vendor))]
+    assert 1 <= len(vendor) < 40
+    assert 1 <= len(prospect) <= 10
+
+
+def test_compile_context_keeps_one_item_per_section_when_the_budget_is_too_small():
+    spec = ContextSpec(fields={"vendor.offerings": ["name"], "prospect.pain_points": ["description"]}, token_budget=1)
+
+    context = compile_context(make_package(8), spec)
+
+    assert len(json.loads(context["vendor"])["offerings"]) == 1
+    assert len(json.loads(context["prospect"])["pain_points"]) == 1
+
+
+def test_compile_context_drops_source_excerpts_before_items():
+    spec = ContextSpec(fields={"vendor.offerings": ["name", "sources"]}, token_budget=10000)
+    data = make_package(10)
+
+    full = compile_context(data, spec)
+    assert "Supporting quote" in full["vendor"]
+
+    budget = rendered_tokens(full) - 1
+    fitted = compile_context(data, spec, max_tokens=budget)
+    offerings = json.loads(fitted["vendor"])["offerings"]
+
+    assert rendered_tokens(fitted) <= budget
+    assert len(offerings) == 10
+    assert all("excerpt" not in source for offering in offerings for source in offering["sources"])
@@ -0,0 +1,153 @@
+"""
+Tests for utils/llm_scheduler.py: admission inside the rate window, priority order,
+rate-limit backoff and reservation release.
+"""
+
+import threading
+import time
+
+import pytest
+from agno.agent import Agent
+from agno.exceptions import ModelProviderError, ModelRateLimitError
+
+from utils import llm_scheduler as scheduler_module
+from utils.fake_llm import FakeModel
+from utils.llm_scheduler import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    LLMScheduler,
+    RateLimitExceeded,
+    is_rate_limit_error,
+    watch_provider_errors,
+)
+
+
+def make_scheduler(tpm=10 ** 6, rpm=1000, max_retries=2) -> LLMScheduler:
+    return LLMScheduler(
+        rate_limits={},
+        default_tpm=tpm,
+        default_rpm=rpm,
+        max_retries=max_retries,
+        backoff_base_seconds=0.05,
+        backoff_max_seconds=0.1
+    )
+
+
+@pytest.fixture
+def short_window(monkeypatch):
+    """Shrink the one-minute rate window so admission waits take a fraction of a second"""
+    monkeypatch.setattr(scheduler_module, "_WINDOW_SECONDS", 0.3)
+
+
+def test_calls_over_rpm_wait_for_the_window(short_window):
+    scheduler = make_scheduler(rpm=2)
+    admitted = []
+
+    for _ in range(3):
+        scheduler.run("model", 10, PRIORITY_INTERACTIVE, lambda: admitted.append(time.monotonic()))
+
+    assert admitted[1] - admitted[0] < 0.1
+    assert admitted[2] - admitted[0] >= 0.25
+
+
+def test_calls_over_tpm_wait_for_the_window(short_window):
+    scheduler = make_scheduler(tpm=100)
+    admitted = []
+
+    for _ in range(2):
+        scheduler.run("model", 60, PRIORITY_INTERACTIVE, lambda: admitted.append(time.monotonic()))
+
+    assert admitted[1] - admitted[0] >= 0.25
+
+
+def test_interactive_calls_are_served_before_queued_bulk_calls():
+    scheduler = make_scheduler()
+    scheduler._block("model", 0.2)
+    order = []
+
+    def submit(label, priority):
+        scheduler.run("model", 10, priority, lambda: order.append(label))
+
+    threads = [threading.Thread(target=submit, args=("bulk", PRIORITY_BULK))]
+    threads[0].start()
+    time.sleep(0.05)
+    threads.append(threading.Thread(target=submit, args=("interactive", PRIORITY_INTERACTIVE)))
+    threads[1].start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order == ["interactive", "bulk"]
+
+
+def test_rate_limit_errors_are_retried_with_backoff():
+    scheduler = make_scheduler(max_retries=3)
+    attempts = []
+
+    def call():
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise ModelRateLimitError("slow down")
+        return "ok"
+
+    assert scheduler.run("model", 10, PRIORITY_INTERACTIVE, call) == "ok"
+    assert len(attempts) == 3
+    # Each retry waits out a (jittered) backoff of at least half the base delay
+    assert attempts[1] - attempts[0] >= 0.02
+    assert attempts[2] - attempts[1] >= 0.02
+
+
+def test_rate_limited_agent_runs_raise_after_max_retries():
+    scheduler = make_scheduler(max_retries=2)
+    agent = Agent(model=FakeModel(rate_limit=1.0))
+    attempts = []
+
+    def call():
+        attempts.append(1)
+        watch_provider_errors(agent.model)
+        return agent.run(input="hello")
+
+    with pytest.raises(RateLimitExceeded):
+        scheduler.run("fake", 10, PRIORITY_INTERACTIVE, call)
+    assert len(attempts) == 3
+
+
+def test_other_failures_are_not_retried_and_release_their_reservation():
+    scheduler = make_scheduler()
+    attempts = []
+
+    def call():
+        attempts.append(1)
+        raise ModelProviderError("bad request (mentions 429 and rate limit)", status_code=400)
+
+    with pytest.raises(ModelProviderError):
+        scheduler.run("model", 10, PRIORITY_INTERACTIVE, call)
+
+    assert len(attempts) == 1
+    assert len(scheduler._budget("model").window) == 0
+
+
+def test_agent_error_results_release_their_reservation():
+    scheduler = make_scheduler()
+    model = FakeModel()
+
+    def failing_invoke(*args, **kwargs):
+        raise ModelProviderError("invalid schema", status_code=400)
+
+    model.invoke = failing_invoke
+    agent = Agent(model=model)
+
+    def call():
+        watch_provider_errors(agent.model)
+        return agent.run(input="hello")
+
+    result = scheduler.run("fake", 10, PRIORITY_INTERACTIVE, call)
+
+    assert result.status.value == "ERROR"
+    assert len(scheduler._budget("fake").window) == 0
+
+
+def test_rate_limits_are_detected_by_exception_type_and_status_code():
+    assert is_rate_limit_error(ModelRateLimitError("slow down"))
+    assert is_rate_limit_error(ModelProviderError("overloaded", status_code=529))
+    assert not is_rate_limit_error(ModelProviderError("rate limit mentioned in text", status_code=400))
+    assert not is_rate_limit_error(ValueError("429"))
@@ -0,0 +1,35 @@
+"""
+Tests for utils/page_store.py: per-page extraction results and what they are keyed by.
+"""
+
+from agno.agent import Agent
+
+from utils.fake_llm import FakeModel
+from utils.page_store import PageExtractionStore, extractor_fingerprint
+
+PAGES = {"https://vendor.com/product": {"hash": "abc", "items": [{"name": "Platform"}]}}
+
+
+def test_stored_pages_are_reused_by_the_same_extractor(tmp_path):
+    store = PageExtractionStore(str(tmp_path))
+    extractor = extractor_fingerprint(Agent(model=FakeModel(), instructions="Extract offerings"), "Extract all offerings")
+
+    store.save("https://vendor.com", "offerings", extractor, PAGES)
+
+    assert store.load("https://vendor.com", "offerings", extractor) == PAGES
+
+
+def test_changed_extractors_do_not_reuse_stored_pages(tmp_path):
+    store = PageExtractionStore(str(tmp_path))
+    agent = Agent(model=FakeModel(), instructions="Extract offerings")
+    extractor = extractor_fingerprint(agent, "Extract all offerings")
+    store.save("https://vendor.com", "offerings", extractor, PAGES)
+
+    changed = [
+        extractor_fingerprint(Agent(model=FakeModel(), instructions="Extract offerings and pricing"), "Extract all offerings"),
+        extractor_fingerprint(agent, "Extract every offering with its pricing"),
+    ]
+
+    for fingerprint in changed:
+        assert fingerprint != extractor
+        assert store.load("https://vendor.com", "offerings", fingerprint) == {}
@@ -0,0 +1,82 @@
+"""
+Tests for utils/persona_index.py: the index matches the persona the previous
+SequenceMatcher scan matched, and handles acronyms and exact titles.
+"""
+
+from difflib import SequenceMatcher
+
+import pytest
+
+from utils.persona_index import PersonaIndex, normalize_title
+
+PERSONAS = [
+    {"persona_title": "VP / Head of Sales (or Chief Revenue Officer)"},
+    {"persona_title": "Director of Revenue Operations"},
+    {"persona_title": "Head of Marketing"},
+    {"persona_title": "Chief Financial Officer"},
+    {"persona_title": "Director of Sales Enablement"},
+    {"persona_title": "IT Manager"},
+    {"persona_title": "Customer Success Lead, Enterprise"},
+]
+
+
+def sequence_matcher_match(title, personas, threshold=0.7):
+    """The previous Step 8 lookup: best SequenceMatcher ratio over every persona"""
+    best_match = None
+    best_score = 0
+    for persona in personas:
+        similarity = SequenceMatcher(None, title.lower(), persona["persona_title"].lower()).ratio()
+        if similarity > best_score:
+            best_score = similarity
+            best_match = persona
+    return best_match if best_score >= threshold else None
+
+
+@pytest.mark.parametrize("title", [
+    "VP / Head of Sales (or Chief Revenue Officer)",
+    "Director of Revenue Operations",
+    "director of revenue operations",
+    "Director of Sales Enablement",
+    "Head of Marketing",
+    "Chief Financial Officer",
+    "Customer Success Lead, Enterprise",
+    "Customer Success Lead",
+])
+def test_index_matches_the_same_persona_as_sequence_matcher(title):
+    expected = sequence_matcher_match(title, PERSONAS)
+    assert expected is not None
+
+    match = PersonaIndex(PERSONAS).match(title)
+
+    assert match is not None
+    assert match.persona is expected
+
+
+@pytest.mark.parametrize("title, expected", [
+    ("Director of RevOps", "Director of Revenue Operations"),
+    ("CFO", "Chief Financial Officer"),
+    ("VP of Sales", "VP / Head of Sales (or Chief Revenue Officer)"),
+])
+def test_acronyms_and_abbreviated_titles_match(title, expected):
+    match = PersonaIndex(PERSONAS).match(title)
+
+    assert match is not None
+    assert match.persona["persona_title"] == expected
+
+
+def test_titles_as_written_win_over_titles_that_only_normalize_alike():
+    personas = [{"persona_title": "VP of Sales"}, {"persona_title": "Vice President of Sales"}]
+    assert normalize_title("VP of Sales") == normalize_title("Vice President of Sales")
+
+    index = PersonaIndex(personas)
+
+    assert index.match("Vice President of Sales").persona is personas[1]
+    assert index.match("vp  of sales").persona is personas[0]
+    assert index.match("Vice President of Sales").exact
+
+
+def test_unrelated_titles_do_not_match():
+    index = PersonaIndex(PERSONAS)
+
+    assert index.match("Warehouse Forklift Operator") is None
+    assert index.match("") is None
@@ -0,0 +1,126 @@
+"""
+Tests for utils/run_checkpoint.py: resuming a StepGraph run from its checkpoint and
+what checkpointed content reads back as.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from agno.workflow.types import StepOutput
+
+from agents.url_prioritizer import PrioritizedURL
+from main import get_run_error
+from utils.run_checkpoint import RunCheckpoint
+from utils.step_graph import GraphStep, StepGraph
+from utils.token_budget import order_pages_by_priority
+
+
+def test_resume_restores_checkpointed_steps(make_step_input, tmp_path):
+    checkpoint_dir = tmp_path / "run"
+    checkpoint_dir.mkdir()
+    runs = {"first": 0, "second": 0}
+    fail = {"second": True}
+
+    def first(step_input):
+        runs["first"] += 1
+        return StepOutput(content={"value": 42})
+
+    def second(step_input):
+        runs["second"] += 1
+        if fail["second"]:
+            raise RuntimeError("provider down")
+        return StepOutput(content={"got": step_input.get_step_content("first")["value"]})
+
+    graph = StepGraph(
+        "graph",
+        [GraphStep("first", first), GraphStep("second", second, depends_on=["first"])],
+        checkpoints=lambda step_input: RunCheckpoint(str(checkpoint_dir), "run")
+    )
+
+    failed = graph.run(make_step_input())
+    assert failed.stop
+    assert "provider down" in failed.content["error"]
+    assert (checkpoint_dir / "first.step.json").exists()
+
+    fail["second"] = False
+    resumed = graph.run(make_step_input())
+
+    assert resumed.success
+    assert resumed.content == {"got": 42, "run_id": "run"}
+    assert runs == {"first": 1, "second": 2}
+    # A completed run's checkpoint is cleared
+    assert not checkpoint_dir.exists()
+
+
+def test_soft_failures_keep_the_checkpoint_and_fail_the_run(make_step_input, tmp_path):
+    checkpoint_dir = tmp_path / "run"
+    checkpoint_dir.mkdir()
+    runs = {"context": 0, "cards": 0}
+    fail = {"cards": True}
+
+    def context(step_input):
+        runs["context"] += 1
+        return StepOutput(content={"value": 1})
+
+    def cards(step_input):
+        runs["cards"] += 1
+        if fail["cards"]:
+            # What generate_battle_cards returns when its agent fails
+            return StepOutput(content={"battle_cards": [], "error": "provider down"}, success=False)
+        return StepOutput(content={"battle_cards": ["card"]})
+
+    def assemble(step_input):
+        return StepOutput(content={"playbook": step_input.get_step_content("cards")["battle_cards"]})
+
+    graph = StepGraph(
+        "graph",
+        [
+            GraphStep("context", context),
+            GraphStep("cards", cards, depends_on=["context"]),
+            GraphStep("assemble", assemble, depends_on=["cards"]),
+        ],
+        checkpoints=lambda step_input: RunCheckpoint(str(checkpoint_dir), "run")
+    )
+
+    failed = graph.run(make_step_input())
+
+    assert not failed.stop
+    assert failed.content["failed_steps"] == {"cards": "provider down"}
+    assert failed.content["run_id"] == "run"
+    assert get_run_error(SimpleNamespace(content=failed.content)) == "Steps failed: cards: provider down"
+    assert (checkpoint_dir / "context.step.json").exists()
+    # Neither the failed step nor the steps that used its fallback output are checkpointed
+    assert not (checkpoint_dir / "cards.step.json").exists()
+    assert not (checkpoint_dir / "assemble.step.json").exists()
+
+    fail["cards"] = False
+    resumed = graph.run(make_step_input())
+
+    assert resumed.content == {"playbook": ["card"], "run_id": "run"}
+    assert get_run_error(SimpleNamespace(content=resumed.content)) is None
+    assert runs == {"context": 1, "cards": 2}
+    assert not checkpoint_dir.exists()
+
+
+def test_pydantic_content_is_restored_as_its_json_dump(tmp_path):
+    details = [
+        PrioritizedURL(url="https://prospect.com/about", page_type="about", priority=2, reasoning="Company"),
+        PrioritizedURL(url="https://prospect.com/pricing", page_type="pricing", priority=1, reasoning="Pricing"),
+    ]
+    pages = {"https://prospect.com/about": "", "https://prospect.com/pricing": ""}
+    checkpoint = RunCheckpoint(str(tmp_path), "run")
+
+    checkpoint.save(StepOutput(step_name="prioritize_urls", content={"prospect_url_details": details}))
+    restored = checkpoint.load()["prioritize_urls"].content["prospect_url_details"]
+
+    assert restored == [detail.model_dump() for detail in details]
+    assert order_pages_by_priority(pages, restored) == order_pages_by_priority(pages, details)
+
+
+def test_unserializable_content_is_not_checkpointed(tmp_path):
+    checkpoint = RunCheckpoint(str(tmp_path), "run")
+
+    with pytest.raises(TypeError):
+        checkpoint.save(StepOutput(step_name="step", content={"value": object()}))
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,113 @@
+"""
+Tests for Step 8's speculative generations: a speculation the summary picks is reused,
+one it does not pick is cancelled without Step 8b/8c waiting for it.
+"""
+
+import contextvars
+import threading
+import time
+
+import pytest
+from agno.workflow.types import StepOutput
+from pydantic import BaseModel
+
+from steps.step8_playbook_generation import _speculate_top_persona, get_speculation
+from utils.cancellation import cancellation_scope, check_cancelled
+
+PERSONAS = [
+    {"persona_title": "Director of Revenue Operations"},
+    {"persona_title": "Head of Marketing"},
+]
+
+
+class Item(BaseModel):
+    persona: str
+
+
+@pytest.fixture
+def step_input(make_step_input):
+    step_input = make_step_input()
+    step_input.previous_step_outputs = {
+        "prepare_playbook_context": StepOutput(content={
+            "scored_priority_personas": ["Director of Revenue Operations"],
+            "vendor_intelligence": {},
+            "prospect_intelligence": {"target_buyer_personas": PERSONAS},
+        })
+    }
+    return step_input
+
+
+def start_speculation(step_input, write):
+    """Run the speculative step in a worker thread of the current run, like the StepGraph"""
+    result = {}
+    context = contextvars.copy_context()
+
+    def run():
+        result["output"] = context.run(_speculate_top_persona, step_input, "speculate_email_sequence", write, "email_sequences")
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread, result
+
+
+def test_speculation_the_summary_does_not_pick_is_cancelled(step_input):
+    started = threading.Event()
+    calls = []
+
+    def write(persona_title, *args):
+        started.set()
+        for _ in range(500):
+            check_cancelled("agent:Email Sequence Writer")
+            calls.append(persona_title)
+            time.sleep(0.01)
+        return []
+
+    with cancellation_scope(run_id="run") as run_token:
+        thread, result = start_speculation(step_input, write)
+        assert started.wait(timeout=5)
+
+        kept_persona, items, report = get_speculation("speculate_email_sequence", "email_sequences", ["Head of Marketing"], PERSONAS)
+        thread.join(timeout=5)
+
+    assert (kept_persona, items) == (None, [])
+    assert report["cancelled"] and not report["kept"]
+    assert not thread.is_alive()
+    # Only the speculation stops; the run carries on
+    assert not run_token.cancelled
+    assert result["output"].success
+    assert result["output"].content["cancelled"]
+    calls_at_cancel = len(calls)
+    time.sleep(0.05)
+    assert len(calls) == calls_at_cancel
+
+
+def test_speculation_the_summary_picks_is_waited_for_and_reused(step_input):
+    def write(persona_title, *args):
+        time.sleep(0.1)
+        return [Item(persona=persona_title)]
+
+    with cancellation_scope(run_id="run"):
+        thread, _ = start_speculation(step_input, write)
+        time.sleep(0.02)
+
+        kept_persona, items, report = get_speculation(
+            "speculate_email_sequence", "email_sequences", ["Director of RevOps", "Head of Marketing"], PERSONAS
+        )
+        thread.join(timeout=5)
+
+    assert kept_persona == "Director of Revenue Operations"
+    assert items == [{"persona": "Director of Revenue Operations"}]
+    assert report["kept"] and not report["cancelled"]
+
+
+def test_speculation_starting_after_the_summary_is_skipped(step_input):
+    def write(*args):
+        raise AssertionError("speculation should not run")
+
+    with cancellation_scope(run_id="run"):
+        assert get_speculation("speculate_email_sequence", "email_sequences", ["Head of Marketing"], PERSONAS) == (None, [], None)
+        thread, result = start_speculation(step_input, write)
+        thread.join(timeout=5)
+
+    assert result["output"].success
+    assert result["output"].content["persona"] is None
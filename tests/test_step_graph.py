@@ -0,0 +1,97 @@
+"""
+Tests for utils/step_graph.py: dependency order, grouped steps and cancellation on stop.
+"""
+
+import threading
+import time
+
+from agno.agent import Agent
+from agno.workflow.types import StepOutput
+
+from utils.agent_helpers import run_agent
+from utils.fake_llm import FakeModel
+from utils.step_graph import GraphStep, StepGraph
+from utils.workflow_helpers import get_parallel_step_content
+
+
+def recording_step(name, log, delay=0.0):
+    """Step that records when it started and finished and returns {name: True}"""
+    def executor(step_input):
+        log.append(("start", name))
+        time.sleep(delay)
+        log.append(("end", name))
+        return StepOutput(content={name: True})
+    executor.__name__ = name
+    return executor
+
+
+def test_steps_start_after_their_dependencies(make_step_input):
+    log = []
+    graph = StepGraph("graph", [
+        GraphStep("a", recording_step("a", log, delay=0.01)),
+        GraphStep("b", recording_step("b", log, delay=0.1)),
+        GraphStep("c", recording_step("c", log), depends_on=["a"]),
+        GraphStep("d", recording_step("d", log), depends_on=["b", "c"]),
+    ])
+
+    output = graph.run(make_step_input())
+
+    assert output.success and not output.stop
+    position = {event: i for i, event in enumerate(log)}
+    assert position[("start", "c")] > position[("end", "a")]
+    assert position[("start", "d")] > position[("end", "b")]
+    assert position[("start", "d")] > position[("end", "c")]
+    # c starts as soon as a is done, without waiting for b
+    assert position[("start", "c")] < position[("end", "b")]
+    assert output.content == {"d": True}
+
+
+def test_grouped_steps_are_visible_as_their_parallel_block(make_step_input):
+    seen = {}
+
+    def reader(step_input):
+        seen["x"] = get_parallel_step_content(step_input, "block", "x")
+        seen["y"] = get_parallel_step_content(step_input, "block", "y")
+        return StepOutput(content={})
+
+    graph = StepGraph("graph", [
+        GraphStep("x", lambda step_input: StepOutput(content={"value": 1}), group="block"),
+        GraphStep("y", lambda step_input: StepOutput(content={"value": 2}), group="block"),
+        GraphStep("reader", reader, depends_on=["block"]),
+    ])
+    graph.run(make_step_input())
+
+    assert seen == {"x": {"value": 1}, "y": {"value": 2}}
+
+
+def test_stop_cancels_running_siblings_and_skips_dependents(make_step_input):
+    agent = Agent(name="Sibling Agent", model=FakeModel(latency=0.05))
+    calls = []
+    dependent_ran = threading.Event()
+
+    def stopper(step_input):
+        time.sleep(0.08)
+        return StepOutput(content={"error": "stopped"}, success=False, stop=True)
+
+    def sibling(step_input):
+        for i in range(10):
+            calls.append(i)
+            run_agent(agent, f"call {i}")
+        return StepOutput(content={"calls": len(calls)})
+
+    def dependent(step_input):
+        dependent_ran.set()
+        return StepOutput(content={})
+
+    graph = StepGraph("graph", [
+        GraphStep("stopper", stopper),
+        GraphStep("sibling", sibling),
+        GraphStep("dependent", dependent, depends_on=["stopper"]),
+    ])
+    output = graph.run(make_step_input())
+
+    assert output.stop and not output.success
+    assert output.content["error"] == "stopped"
+    assert output.content["cancellation"]["reason"] == "stopper stopped the run"
+    assert len(calls) < 10
+    assert not dependent_ran.is_set()
@@ -0,0 +1,80 @@
+"""
+Tests for utils/step_memo.py: serving unchanged steps from the memo and invalidation.
+"""
+
+from agno.workflow.types import StepOutput
+
+from utils.step_graph import GraphStep, StepGraph
+from utils.step_memo import MEMO_EXECUTOR_TYPE, StepMemo, summarize_step_memo
+
+
+def test_memo_serves_unchanged_steps_and_refresh_steps_reruns_them(make_step_input, tmp_path):
+    memo = StepMemo(str(tmp_path), ttl_hours=1, exclude_steps=[])
+    runs = {"derived": 0}
+
+    def source(step_input):
+        return StepOutput(content={"value": step_input.input["prospect_domain"]})
+
+    def derived(step_input):
+        runs["derived"] += 1
+        return StepOutput(content={"derived": step_input.get_step_content("source")["value"].upper()})
+
+    graph = StepGraph(
+        "graph",
+        [GraphStep("source", source), GraphStep("derived", derived, depends_on=["source"], memo_inputs=["source.value"])],
+        memo=memo
+    )
+
+    def derived_output(output):
+        return next(step for step in output.steps if step.step_name == "derived")
+
+    first = graph.run(make_step_input())
+    assert runs["derived"] == 1
+    assert derived_output(first).executor_type != MEMO_EXECUTOR_TYPE
+
+    # Same inputs: served from the memo
+    second = graph.run(make_step_input())
+    assert runs["derived"] == 1
+    assert derived_output(second).executor_type == MEMO_EXECUTOR_TYPE
+    assert second.content == first.content
+
+    # --refresh-steps reruns the step (and stores its fresh output)
+    graph.run(make_step_input(refresh_steps=["derived"]))
+    assert runs["derived"] == 2
+    graph.run(make_step_input(refresh_steps=["all"]))
+    assert runs["derived"] == 3
+
+    # A changed memo input is a different key
+    changed = graph.run(make_step_input(prospect_domain="https://other.com"))
+    assert runs["derived"] == 4
+    assert changed.content == {"derived": "HTTPS://OTHER.COM"}
+
+
+def test_second_identical_run_serves_every_memoized_step(make_step_input, tmp_path):
+    memo = StepMemo(str(tmp_path), ttl_hours=1, exclude_steps=[])
+    calls = {"count": 0}
+
+    def step(name):
+        def executor(step_input):
+            calls["count"] += 1
+            # Token usage differs between runs; the step's result does not
+            return StepOutput(content={"result": name, "token_usage": {"prompt_tokens": calls["count"]}})
+        return executor
+
+    steps = [
+        GraphStep("source", step("source")),
+        GraphStep("extract_a", step("extract_a"), depends_on=["source"], group="extraction", memo_inputs=["source"]),
+        GraphStep("extract_b", step("extract_b"), depends_on=["source"], group="extraction", memo_inputs=["source"]),
+        GraphStep("personas", step("personas"), depends_on=["extraction"], memo_inputs=["extraction"]),
+        GraphStep("summary", step("summary"), depends_on=["personas"], memo_inputs=["personas"]),
+    ]
+    graph = StepGraph("graph", steps, memo=memo)
+    memoized = [graph_step.name for graph_step in steps if graph_step.memo_inputs]
+
+    first = graph.run(make_step_input())
+    second = graph.run(make_step_input())
+
+    assert summarize_step_memo(first.steps) == []
+    assert summarize_step_memo(second.steps) == memoized
+    assert second.content == {"result": "summary"}
+    assert calls["count"] == 6
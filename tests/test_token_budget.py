@@ -0,0 +1,75 @@
+"""
+Tests for utils/token_budget.py: page ordering, fit_pages and the run budget.
+"""
+
+import pytest
+from agno.workflow.types import StepOutput
+
+import config
+from utils.token_budget import StepTokenBudget, combine_pages, estimate_tokens, fit_pages_and_record, order_pages_by_priority
+
+
+@pytest.fixture
+def step_limit(monkeypatch):
+    """Give steps a 1,000 token prompt limit"""
+    monkeypatch.setattr(config, "STEP_TOKEN_LIMITS", {})
+    monkeypatch.setattr(config, "DEFAULT_STEP_TOKEN_LIMIT", 1000)
+    monkeypatch.setattr(config, "MIN_PROMPT_TOKENS", 100)
+    monkeypatch.setattr(config, "RUN_TOKEN_BUDGET", 10 ** 6)
+
+
+def test_pages_are_ordered_by_priority_then_scrape_order():
+    pages = {"https://a.com": "", "https://b.com": "", "https://c.com": "", "https://d.com": ""}
+    url_details = [{"url": "https://c.com", "priority": 1}, {"url": "https://b.com", "priority": 2}]
+
+    assert order_pages_by_priority(pages, url_details) == ["https://c.com", "https://b.com", "https://a.com", "https://d.com"]
+
+
+def test_fit_pages_drops_lowest_priority_pages_to_fit_the_limit(step_limit, make_step_input):
+    pages = {f"https://prospect.com/page-{i}": "x" * 1200 for i in range(6)}
+    url_details = [{"url": url, "priority": 6 - i} for i, url in enumerate(pages)]
+    overhead = "Analyze these pages:\n" * 10
+    budget = StepTokenBudget(make_step_input(), "analyze_company")
+
+    fitted = budget.fit_pages(pages, url_details, overhead=overhead)
+
+    assert estimate_tokens(overhead + combine_pages(fitted)) <= budget.limit
+    # Pages 5, 4, 3 have the highest priority (lowest number)
+    assert list(fitted) == [f"https://prospect.com/page-{i}" for i in (3, 4, 5)]
+    assert budget.dropped_pages == [f"https://prospect.com/page-{i}" for i in (2, 1, 0)]
+
+
+def test_fit_pages_truncates_a_single_oversized_page(step_limit, make_step_input):
+    pages = {"https://prospect.com/huge": "x" * 20000, "https://prospect.com/small": "y" * 100}
+    url_details = [{"url": "https://prospect.com/huge", "priority": 1}]
+    budget = StepTokenBudget(make_step_input(), "analyze_company")
+
+    fitted = budget.fit_pages(pages, url_details)
+
+    assert list(fitted) == ["https://prospect.com/huge"]
+    assert estimate_tokens(fitted["https://prospect.com/huge"]) <= budget.limit
+
+
+def test_step_limit_is_capped_by_the_remaining_run_budget(step_limit, monkeypatch, make_step_input):
+    monkeypatch.setattr(config, "RUN_TOKEN_BUDGET", 1500)
+    step_input = make_step_input()
+    step_input.previous_step_outputs = {
+        "earlier": StepOutput(content={"token_usage": {"step": "earlier", "prompt_tokens": 1200}})
+    }
+
+    budget = StepTokenBudget(step_input, "analyze_company")
+
+    assert budget.limit == 300
+    assert budget.run_budget_exhausted
+
+
+def test_fitted_prompts_with_many_small_pages_stay_within_the_limit(step_limit, make_step_input):
+    # Labels and separators are a large share of the prompt when pages are small
+    pages = {f"https://prospect.com/resources/articles/{'long-slug-' * 5}{i}": "x" * 40 for i in range(200)}
+    budget = StepTokenBudget(make_step_input(), "analyze_company")
+
+    fitted, prompt = fit_pages_and_record(budget, pages, None, lambda pages: "Analyze:\n\n" + combine_pages(pages))
+
+    assert 0 < len(fitted) < len(pages)
+    assert estimate_tokens(prompt) <= budget.limit
+    assert not budget.over_limit
@@ -0,0 +1,140 @@
+"""
+Agent Helper Functions
+Single entry point for running Agno agents from workflow steps.
+Routes every call through the shared LLM response cache (utils/llm_cache.py) and
+the shared rate-limit scheduler (utils/llm_scheduler.py), and records it as a tracing
+span (utils/tracing.py). Runs short on their deadline switch agents to the FAST_MODEL
+tier (utils/run_deadline.py), and cancelled runs skip calls that have not started yet
+(utils/cancellation.py).
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from agno.workflow.types import StepInput
+
+from utils.cancellation import check_cancelled
+from utils.llm_cache import llm_cache, get_model_id
+from utils.llm_scheduler import llm_scheduler, get_priority_value, watch_provider_errors
+from utils.fake_llm import resolve_model
+from utils.run_deadline import should_degrade
+from utils.token_budget import estimate_tokens
+from utils.tracing import span
+from utils.workflow_helpers import get_workflow_option
+import config
+
+
+@dataclass
+class CachedRunOutput:
+    """Minimal stand-in for Agno's RunOutput when the response comes from cache"""
+    content: Any
+    cached: bool = True
+
+
+def is_error_response(response) -> bool:
+    """Check whether Agno returned an errored run (it reports errors instead of raising)"""
+    status = getattr(response, "status", None)
+    return str(getattr(status, "value", status)) == "ERROR"
+
+
+def get_run_priority(step_input: StepInput) -> str:
+    """
+    Get the scheduling priority of the current run.
+
+    Args:
+        step_input: StepInput object
+
+    Returns:
+        "interactive" (default) or "bulk"
+    """
+    return get_workflow_option(step_input, "priority", "interactive")
+
+
+# Agent name -> copy of the agent on the FAST_MODEL tier
+_fast_tier_agents: Dict[str, Any] = {}
+_fast_tier_lock = threading.Lock()
+
+
+def get_fast_tier_agent(agent):
+    """
+    Copy of an agent running on config.FAST_MODEL (same instructions and output schema).
+
+    Args:
+        agent: Agno Agent
+
+    Returns:
+        Cached agent copy
+    """
+    with _fast_tier_lock:
+        if agent.name not in _fast_tier_agents:
+            _fast_tier_agents[agent.name] = agent.deep_copy(update={"model": resolve_model(config.FAST_MODEL)})
+        return _fast_tier_agents[agent.name]
+
+
+def run_agent(agent, input: str, priority: Optional[str] = None):
+    """
+    Run an agent, serving the response from the LLM cache when possible.
+
+    Cache misses go through the LLM scheduler, which waits for TPM/RPM headroom on
+    the agent's model and retries rate-limit errors with backoff. Once the run is
+    cancelled, the call is skipped before it is queued and again once it is admitted.
+
+    Only the response content is cached, so callers should rely on `.content`
+    (which is what every step uses).
+
+    Args:
+        agent: Agno Agent to run
+        input: Prompt for the agent
+        priority: "interactive" or "bulk" (see get_run_priority); None means interactive
+
+    Returns:
+        Agno RunOutput on a cache miss, CachedRunOutput on a hit
+
+    Raises:
+        RunCancelled: If the run was cancelled before the call started
+    """
+    if get_model_id(agent) != config.FAST_MODEL and should_degrade("fast_model", agent.name):
+        agent = get_fast_tier_agent(agent)
+
+    model_id = get_model_id(agent)
+    estimated_input_tokens = estimate_tokens(input)
+
+    with span(f"agent:{agent.name}", kind="agent", model=model_id, estimated_input_tokens=estimated_input_tokens) as agent_span:
+        key = None
+        if llm_cache is not None:
+            key = llm_cache.make_key(agent, input)
+            cached_content = llm_cache.get(agent, key)
+            agent_span.set(cache_hit=cached_content is not None)
+            if cached_content is not None:
+                print(f"♻️  {agent.name}: served from LLM cache")
+                return CachedRunOutput(content=cached_content)
+
+        estimated_tokens = estimated_input_tokens + config.LLM_ESTIMATED_OUTPUT_TOKENS
+        check_cancelled(f"agent:{agent.name}", estimated_tokens=estimated_tokens)
+
+        def call():
+            # The run may have been cancelled while the call waited for rate-limit headroom
+            check_cancelled(f"agent:{agent.name}", estimated_tokens=estimated_tokens)
+            watch_provider_errors(agent.model)
+            return agent.run(input=input)
+
+        # The scheduler adds queue_wait_ms and retries to the span
+        response = llm_scheduler.run(
+            model_id=model_id,
+            estimated_tokens=estimated_tokens,
+            priority=get_priority_value(priority),
+            call=call
+        )
+
+        metrics = getattr(response, "metrics", None)
+        agent_span.set(
+            input_tokens=getattr(metrics, "input_tokens", None),
+            output_tokens=getattr(metrics, "output_tokens", None),
+            error=is_error_response(response) or None
+        )
+
+        if key is not None and not is_error_response(response):
+            llm_cache.set(agent, key, response.content)
+
+        return response
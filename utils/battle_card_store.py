@@ -0,0 +1,134 @@
+"""
+Battle Card Store
+Disk-backed store of vendor-level base battle cards. Most of a battle card (why we win,
+standard objections, competitive positioning) depends only on the vendor's intelligence,
+so base cards are keyed by a hash of the VendorElements they were generated from and
+reused for every prospect; Step 8d then runs a small prospect-specific tailoring pass.
+
+Concurrent runs for the same vendor (e.g., a multi-prospect batch) generate the base
+cards once: the first run builds them while the others wait for the result.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models.vendor_elements import VendorElements
+from utils.llm_cache import get_agent_fingerprint
+import config
+
+
+def vendor_elements_from_intel(vendor_intel: dict) -> VendorElements:
+    """
+    Build VendorElements from the playbook summary's vendor_intelligence dict.
+
+    Args:
+        vendor_intel: Step 8a vendor_intelligence (uses "customers" for reference customers)
+
+    Returns:
+        VendorElements
+    """
+    data = dict(vendor_intel)
+    data["reference_customers"] = data.pop("customers", [])
+    return VendorElements.model_validate(data)
+
+
+def hash_vendor_elements(elements: VendorElements) -> str:
+    """
+    Content hash of a vendor's extracted elements.
+
+    Args:
+        elements: VendorElements
+
+    Returns:
+        Hex digest (stable across runs for identical elements)
+    """
+    canonical = json.dumps(elements.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class BattleCardStore:
+    """Stores one JSON file of base battle cards per (VendorElements hash, agent config)."""
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    def make_key(self, elements: VendorElements, agent) -> str:
+        """
+        Key for a vendor's base cards; changes when the elements or the agent's
+        model, instructions or output schema change.
+
+        Args:
+            elements: Vendor elements the cards are generated from
+            agent: Agent generating the base cards
+
+        Returns:
+            Hex digest key
+        """
+        return hashlib.sha256(f"{get_agent_fingerprint(agent)}|{hash_vendor_elements(elements)}".encode("utf-8")).hexdigest()
+
+    def load(self, key: str) -> Optional[List[dict]]:
+        """
+        Load stored base cards.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            List of battle card dicts, or None if missing or unreadable
+        """
+        try:
+            with open(self._path(key), "r") as f:
+                return json.load(f)["battle_cards"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self, key: str, battle_cards: List[dict]) -> None:
+        """
+        Store base cards.
+
+        Args:
+            key: Key from make_key()
+            battle_cards: Battle card dicts
+        """
+        os.makedirs(self.store_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"created_at": time.time(), "battle_cards": battle_cards}, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def get_or_create(self, key: str, create: Callable[[], List[dict]]) -> Tuple[List[dict], bool]:
+        """
+        Load base cards, generating and storing them on a miss.
+
+        Args:
+            key: Key from make_key()
+            create: Generates the base cards (called at most once per key at a time)
+
+        Returns:
+            Tuple of (battle card dicts, cache_hit)
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            battle_cards = self.load(key)
+            if battle_cards is not None:
+                return battle_cards, True
+
+            battle_cards = create()
+            self.save(key, battle_cards)
+            return battle_cards, False
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.store_dir, f"{key}.json")
+
+
+# Shared store instance (None when disabled)
+battle_card_store = BattleCardStore(config.BATTLE_CARD_STORE_DIR) if config.BATTLE_CARD_CACHE_ENABLED else None
@@ -0,0 +1,199 @@
+"""
+Cancellation
+Cooperative cancellation of a run's in-flight work. Each run gets a CancellationToken
+that is checked before every agent call (utils/agent_helpers.py), before Firecrawl calls
+and between batch scrape polls (utils/firecrawl_helpers.py), and before the StepGraph
+starts another step. Once it fires, those checkpoints raise RunCancelled instead of
+spending tokens or scrape credits, and a running batch scrape job is cancelled.
+
+A token fires when:
+    - a step stops the run (create_error_response(..., stop=True)) - its siblings stop
+      at their next checkpoint instead of finishing their LLM / Firecrawl calls
+    - the API client disconnects (serve.py) or the run is cancelled through AgentOS
+    - the run is DEADLINE_CANCEL_GRACE_SECONDS past its deadline (utils/run_deadline.py)
+    - the CLI run is interrupted
+
+Calls already in flight finish; only work that has not started yet is skipped. The token
+records what was skipped and the estimated cost avoided (LLM tokens, Firecrawl pages),
+which goes to the run metadata.
+
+Like the run trace, the token lives in a context variable and is visible to worker threads
+started with contextvars.copy_context(). A run's token is a child of the enclosing token
+(e.g., a multi-prospect request's), so cancelling the request cancels every prospect run
+while one prospect's stop leaves its siblings running.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from agno.run import cancel as agno_cancel
+
+from utils.run_deadline import current_deadline
+from utils.tracing import current_span
+import config
+
+
+class RunCancelled(Exception):
+    """Raised at a cancellation checkpoint once the run's token has fired"""
+
+
+class CancellationToken:
+    """Cancellation state of one run (or request) and the work it skipped"""
+
+    def __init__(self, run_id: Optional[str] = None, parent: Optional["CancellationToken"] = None, agno_run_id: Optional[str] = None):
+        self.run_id = run_id
+        self.parent = parent
+        self.agno_run_id = agno_run_id
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+        self._started_at = time.monotonic()
+        self._cancelled_at: Optional[float] = None
+        self._skipped: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def cancel(self, reason: str) -> bool:
+        """
+        Fire the token (later calls keep the first reason).
+
+        Args:
+            reason: Why the run is cancelled (recorded in the metadata)
+
+        Returns:
+            True if this call fired the token
+        """
+        with self._lock:
+            if self._event.is_set():
+                return False
+            self.reason = reason
+            self._cancelled_at = time.monotonic()
+            self._event.set()
+        label = f"run {self.run_id}" if self.run_id else ("run" if self.parent else "request")
+        print(f"🛑 Cancelling {label}: {reason}")
+        return True
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the token has fired (checks the parent, AgentOS and the run's deadline)"""
+        if self._event.is_set():
+            return True
+        if self.parent is not None and self.parent.cancelled:
+            self.cancel(self.parent.reason or "parent cancelled")
+        elif self.agno_run_id and agno_cancel.is_cancelled(self.agno_run_id):
+            self.cancel("cancelled through AgentOS")
+        else:
+            deadline = current_deadline()
+            if deadline is not None and deadline.remaining() < -config.DEADLINE_CANCEL_GRACE_SECONDS:
+                self.cancel(f"{deadline.deadline_seconds:.0f}s deadline passed")
+        return self._event.is_set()
+
+    def check(self, where: str, **avoided) -> None:
+        """
+        Cancellation checkpoint before starting a unit of work.
+
+        Args:
+            where: The work about to start (e.g., "agent:Offerings Extractor")
+            **avoided: Estimated cost of the work, recorded if it is skipped (e.g.,
+                estimated_tokens=..., scrape_pages=...)
+
+        Raises:
+            RunCancelled: If the token has fired
+        """
+        if self.cancelled:
+            self.record_skipped(where, **avoided)
+            current_span().set(cancelled=True)
+            raise RunCancelled(f"Run cancelled ({self.reason}) - skipped {where}")
+
+    def wait(self, seconds: float) -> bool:
+        """
+        Sleep between polls, waking early if the token fires.
+
+        Returns:
+            True if the token has fired
+        """
+        deadline = time.monotonic() + seconds
+        while not self.cancelled:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            # Short waits so parent, AgentOS and deadline cancellation are noticed too
+            self._event.wait(min(remaining, 0.5))
+        return True
+
+    def record_skipped(self, where: str, **avoided) -> None:
+        """Record work skipped because of the cancellation and its estimated cost"""
+        with self._lock:
+            self._skipped.append({"what": where, **avoided})
+
+    def summary(self) -> Dict[str, Any]:
+        """Cancellation section of the run metadata"""
+        with self._lock:
+            skipped = list(self._skipped)
+        return {
+            "cancelled": self._event.is_set(),
+            "reason": self.reason,
+            "cancelled_after_seconds": round(self._cancelled_at - self._started_at, 1) if self._cancelled_at else None,
+            "avoided": {
+                "agent_calls": sum(1 for item in skipped if item["what"].startswith("agent:")),
+                "estimated_tokens": sum(item.get("estimated_tokens", 0) for item in skipped),
+                "scrape_pages": sum(item.get("scrape_pages", 0) for item in skipped),
+                "steps_not_started": [item["what"][len("step:"):] for item in skipped if item["what"].startswith("step:")]
+            },
+            "skipped": skipped
+        }
+
+
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar("current_cancellation_token", default=None)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """The cancellation token of the run executing in this context, if any"""
+    return _current_token.get()
+
+
+def check_cancelled(where: str, **avoided) -> None:
+    """
+    Cancellation checkpoint (no-op outside a cancellable run).
+
+    Args:
+        where: The work about to start
+        **avoided: Estimated cost of the work (see CancellationToken.check)
+
+    Raises:
+        RunCancelled: If the run's token has fired
+    """
+    token = _current_token.get()
+    if token is not None:
+        token.check(where, **avoided)
+
+
+@contextmanager
+def cancellation_scope(run_id: Optional[str] = None, agno_run_id: Optional[str] = None) -> Iterator[CancellationToken]:
+    """
+    Give the code in this context a cancellation token.
+
+    Nested calls for the same run reuse the enclosing token; otherwise the new token is a
+    child of the enclosing one (cancelled with it, but not the other way round).
+
+    Args:
+        run_id: Run id recorded with the token (None for a request-level token)
+        agno_run_id: AgentOS run id; cancelling that run through AgentOS fires the token
+
+    Yields:
+        CancellationToken
+    """
+    enclosing = _current_token.get()
+    if enclosing is not None and run_id is not None and enclosing.run_id == run_id:
+        if agno_run_id and not enclosing.agno_run_id:
+            enclosing.agno_run_id = agno_run_id
+        yield enclosing
+        return
+
+    token = CancellationToken(run_id, parent=enclosing, agno_run_id=agno_run_id)
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
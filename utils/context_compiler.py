@@ -0,0 +1,164 @@
+"""
+Context Compiler
+Builds the intelligence context for Step 7b and Step 8 prompts from a per-agent spec.
+Each agent declares which fields of the intelligence package it reads and a token
+budget; the compiler projects the package to those fields, drops empty values and
+duplicate items, and emits compact JSON.
+
+Projection drops `sources` (URLs and excerpts) unless an agent asks for them, which is
+most of the package's size.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from utils.token_budget import CHARS_PER_TOKEN, estimate_tokens, strip_source_excerpts
+
+
+@dataclass(frozen=True)
+class ContextSpec:
+    """
+    Fields an agent needs from the intelligence package.
+
+    Attributes:
+        fields: Dotted path of a section (e.g., "vendor.offerings", "persona") -> fields to
+            keep from each of its items. Sections not listed are left out of the context.
+        token_budget: Max estimated tokens for the compiled context
+    """
+    fields: Dict[str, List[str]]
+    token_budget: int
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _project_item(item: Any, fields: List[str]) -> Any:
+    if not isinstance(item, dict):
+        return item
+    return {field: item[field] for field in fields if not _is_empty(item.get(field))}
+
+
+def _project_section(value: Any, fields: List[str]) -> Any:
+    """Project a section (list of items or single item), dropping empty and duplicate items"""
+    if not isinstance(value, list):
+        return _project_item(value, fields)
+
+    projected = []
+    seen = set()
+    for item in value:
+        item = _project_item(item, fields)
+        key = json.dumps(item, sort_keys=True, default=str)
+        if _is_empty(item) or key in seen:
+            continue
+        seen.add(key)
+        projected.append(item)
+    return projected
+
+
+def _get_path(data: Dict[str, Any], path: str) -> Any:
+    for part in path.split("."):
+        if not isinstance(data, dict) or part not in data:
+            return None
+        data = data[part]
+    return data
+
+
+def _set_path(data: Dict[str, Any], path: str, value: Any) -> None:
+    parts = path.split(".")
+    for part in parts[:-1]:
+        data = data.setdefault(part, {})
+    data[parts[-1]] = value
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _render(context: Dict[str, Any]) -> Dict[str, str]:
+    return {group: _dumps(value) for group, value in context.items()}
+
+
+def _size(context: Dict[str, Any]) -> int:
+    return sum(estimate_tokens(text) for text in _render(context).values())
+
+
+def _longest_list(kept: Dict[str, int]) -> Optional[str]:
+    """Path of the section with the most kept items (ties go to the first declared section)"""
+    longest = None
+    longest_len = 1
+    for path, count in kept.items():
+        if count > longest_len:
+            longest, longest_len = path, count
+    return longest
+
+
+def _trim_to_budget(context: Dict[str, Any], paths: List[str], budget: int) -> None:
+    """
+    Drop trailing items of the longest sections until the context fits the budget.
+
+    Each item's rendered size is measured once and subtracted from its group's size
+    as it is dropped (one character for its separating comma), so the context is
+    rendered once here and once by the caller instead of once per dropped item.
+    """
+    group_chars = {group: len(text) for group, text in _render(context).items()}
+
+    def size() -> int:
+        return sum(chars // CHARS_PER_TOKEN + 1 for chars in group_chars.values())
+
+    sections = {}
+    for path in paths:
+        value = _get_path(context, path)
+        if isinstance(value, list):
+            sections[path] = [len(_dumps(item)) + 1 for item in value]
+    kept = {path: len(item_chars) for path, item_chars in sections.items()}
+
+    while size() > budget:
+        path = _longest_list(kept)
+        if path is None:
+            break
+        kept[path] -= 1
+        group_chars[path.split(".")[0]] -= sections[path][kept[path]]
+
+    for path, count in kept.items():
+        del _get_path(context, path)[count:]
+
+
+def compile_context(data: Dict[str, Any], spec: ContextSpec, max_tokens: Optional[int] = None) -> Dict[str, str]:
+    """
+    Compile the prompt context for one agent.
+
+    If the projected context is over budget, source excerpts are dropped first (when the
+    spec keeps sources), then trailing items of the longest sections, one at a time.
+    Extracted lists are ordered most-important first, and every section keeps at least
+    one item.
+
+    Args:
+        data: Intelligence package grouped by prompt section,
+            e.g. {"vendor": vendor_intel, "prospect": prospect_intel}
+        spec: The agent's ContextSpec
+        max_tokens: Tighter budget for this call (e.g., the step's remaining token limit)
+
+    Returns:
+        Dict mapping each top-level group (e.g., "vendor") -> compact JSON string
+    """
+    budget = min(spec.token_budget, max_tokens) if max_tokens else spec.token_budget
+
+    context: Dict[str, Any] = {}
+    for path, fields in spec.fields.items():
+        value = _get_path(data, path)
+        if value is not None:
+            _set_path(context, path, _project_section(value, fields))
+
+    # Every group in the data renders, even if none of its sections were present
+    for group in data:
+        context.setdefault(group, {})
+
+    if _size(context) > budget:
+        context = strip_source_excerpts(context)
+
+    if _size(context) > budget:
+        _trim_to_budget(context, list(spec.fields), budget)
+
+    return _render(context)
@@ -0,0 +1,316 @@
+"""
+Fake LLM
+Deterministic stand-in for the pipeline's models, for benchmarks and offline runs. A
+FakeModel answers every agent call with a schema-valid instance of the agent's
+output_schema (or short markdown for text agents), after a configurable latency, and
+reports configurable token usage - no API key, no network.
+
+Outputs are derived from a hash of the prompt, so identical prompts get identical
+outputs. String fields named like URLs are filled with URLs found in the prompt, so
+URL-selecting agents (Step 4) pick pages that were actually mapped, and persona title
+lists (the playbook summary's priority_personas) are filled from the prompt's
+"AVAILABLE PERSONA TITLES", so Phase 4 generates components for real personas.
+
+Agents take their model from config strings through resolve_model(), so setting a model
+to a "fake:" spec runs the pipeline (or the API server, for load tests) without a provider:
+
+    DEFAULT_MODEL="fake:latency=2s,jitter=0.5,rate_limit=0.02" python serve.py
+
+Spec options (comma-separated key=value, all optional):
+    latency     Seconds per call: "2s", "500ms", or a uniform range "1s-4s"
+    jitter      Log-normal sigma applied to latency (heavy-tailed latencies), e.g. 0.5
+    tokens      Reported output tokens per call
+    items       Items per list field in synthesized outputs
+    seed        Varies outputs for identical prompts
+    rate_limit  Probability that a call fails with a 429 rate-limit error
+    rpm, tpm    Simulated provider quota per minute, shared by every agent on the same
+                spec; calls over it fail with 429s
+"""
+
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import typing
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from agno.exceptions import ModelRateLimitError
+from agno.metrics import MessageMetrics
+from agno.models.base import Model
+from agno.models.response import ModelResponse
+from pydantic import BaseModel
+
+from utils.token_budget import estimate_tokens
+
+URL_PATTERN = re.compile(r"https?://[^\s\"'<>)\]]+")
+PERSONA_TITLES_PATTERN = re.compile(r"AVAILABLE PERSONA TITLES[^\n]*\n(\[.*?\n\])", re.DOTALL)
+
+WORDS = (
+    "pipeline revenue platform customer team workflow automation insight analytics "
+    "integration enterprise growth marketing sales data security onboarding outreach "
+    "retention pricing adoption forecast"
+).split()
+
+
+class _Synthesizer:
+    """Builds values for type annotations from a seeded random generator"""
+
+    def __init__(self, rng: random.Random, urls: List[str], list_items: int, persona_titles: List[str] = ()):
+        self.rng = rng
+        self.urls = urls
+        self.list_items = list_items
+        self.persona_titles = list(persona_titles)
+        self._next_url = 0
+
+    def text(self, words: int) -> str:
+        return " ".join(self.rng.choice(WORDS) for _ in range(words))
+
+    def url(self) -> str:
+        if not self.urls:
+            return f"https://example.com/{self.rng.choice(WORDS)}"
+        url = self.urls[self._next_url % len(self.urls)]
+        self._next_url += 1
+        return url
+
+    def model(self, schema: type) -> dict:
+        return {
+            name: self.value(field.annotation, name)
+            for name, field in schema.model_fields.items()
+        }
+
+    def value(self, annotation: Any, name: str = "") -> Any:
+        origin = typing.get_origin(annotation)
+        args = typing.get_args(annotation)
+
+        if origin is typing.Union:
+            return self.value(next(arg for arg in args if arg is not type(None)), name)
+        if origin is typing.Literal:
+            return self.rng.choice(args)
+        if origin in (list, List):
+            item_type = args[0] if args else str
+            if item_type is str and "persona" in name.lower() and self.persona_titles:
+                # Titles picked from the prompt's list, as the prompt instructs
+                return self.rng.sample(self.persona_titles, min(self.list_items, len(self.persona_titles)))
+            count = self.list_items
+            if isinstance(item_type, type) and issubclass(item_type, BaseModel) and "url" in item_type.model_fields:
+                # One item per prompt URL (e.g., Step 4's selected pages)
+                count = max(count, min(len(self.urls), 12))
+            return [self.value(item_type, name) for _ in range(count)]
+        if origin is dict:
+            value_type = args[1] if len(args) > 1 else str
+            return {f"{name or 'key'}_{i + 1}": self.value(value_type) for i in range(2)}
+
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return self.model(annotation)
+        if annotation is bool:
+            return self.rng.random() < 0.5
+        if annotation is int:
+            return self.rng.randint(1, 10)
+        if annotation is float:
+            return round(self.rng.random(), 2)
+        if "url" in name.lower():
+            return self.url()
+        return self.text(self.rng.randint(3, 12))
+
+
+def synthesize(schema: type, prompt: str = "", seed: int = 0, list_items: int = 3) -> BaseModel:
+    """
+    Build a valid instance of a pydantic schema, deterministic for a prompt.
+
+    Args:
+        schema: Pydantic model class (e.g., an agent's output_schema)
+        prompt: Prompt the instance answers (seeds the values; URLs in it fill URL fields)
+        seed: Extra seed, to vary outputs for the same prompt
+        list_items: Items per list field
+
+    Returns:
+        Instance of schema
+    """
+    digest = hashlib.sha256(f"{seed}|{schema.__name__}|{prompt}".encode("utf-8")).hexdigest()
+    synthesizer = _Synthesizer(
+        random.Random(int(digest[:16], 16)),
+        list(dict.fromkeys(URL_PATTERN.findall(prompt))),
+        list_items,
+        _persona_titles(prompt)
+    )
+    return schema.model_validate(synthesizer.model(schema))
+
+
+def _persona_titles(prompt: str) -> List[str]:
+    """Titles from the prompt's "AVAILABLE PERSONA TITLES" JSON list (Step 8a), if any"""
+    match = PERSONA_TITLES_PATTERN.search(prompt)
+    if not match:
+        return []
+    try:
+        titles = json.loads(match.group(1))
+    except ValueError:
+        return []
+    return [title for title in titles if isinstance(title, str) and title]
+
+
+@dataclass
+class FakeModel(Model):
+    """
+    Agno model that synthesizes responses instead of calling a provider.
+
+    Usage:
+        agent.model = FakeModel(latency=0.5, output_tokens=800)
+        agent.model = resolve_model("fake:latency=1s-3s,rate_limit=0.05")
+    """
+    id: str = "fake"
+    name: str = "FakeModel"
+    provider: str = "fake"
+    # Structured output schemas are passed to invoke() as the pydantic class
+    supports_native_structured_outputs: bool = True
+
+    latency: float = 0.0  # Seconds per call (lower bound when latency_max is set)
+    latency_max: float = 0.0  # Upper bound of a uniform latency range (0 = fixed latency)
+    jitter: float = 0.0  # Log-normal sigma applied to the sampled latency
+    output_tokens: int = 400  # Reported output tokens per call
+    list_items: int = 3  # Items per list field in synthesized outputs
+    seed: int = 0
+    rate_limit: float = 0.0  # Probability of a simulated 429 per call
+    rpm: int = 0  # Simulated provider requests per minute (0 = unlimited)
+    tpm: int = 0  # Simulated provider tokens per minute (0 = unlimited)
+
+    def invoke(self, messages: List[Any], assistant_message: Any, response_format: Optional[Any] = None, **kwargs) -> ModelResponse:
+        prompt = "\n".join(str(message.content) for message in messages if message.role == "user")
+        input_tokens = sum(estimate_tokens(str(message.content)) for message in messages)
+        self._check_rate_limit(input_tokens + self.output_tokens)
+
+        latency = self._sample_latency()
+        if latency:
+            time.sleep(latency)
+
+        if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+            content = json.dumps(synthesize(response_format, prompt, self.seed, self.list_items).model_dump(mode="json"))
+        else:
+            rng = random.Random(hashlib.sha256(f"{self.seed}|{prompt}".encode("utf-8")).hexdigest())
+            content = "\n".join(f"- {' '.join(rng.choice(WORDS) for _ in range(8))}" for _ in range(self.list_items))
+
+        usage = MessageMetrics()
+        usage.input_tokens = input_tokens
+        usage.output_tokens = self.output_tokens
+        usage.total_tokens = usage.input_tokens + usage.output_tokens
+
+        response = ModelResponse(role="assistant", content=content)
+        response.response_usage = usage
+        return response
+
+    def _sample_latency(self) -> float:
+        latency = self.latency
+        if self.latency_max > self.latency:
+            latency = random.uniform(self.latency, self.latency_max)
+        if self.jitter and latency:
+            latency *= math.exp(random.gauss(0, self.jitter))
+        return latency
+
+    def _check_rate_limit(self, tokens: int) -> None:
+        """Raise a 429 for a simulated random failure or an exhausted simulated quota"""
+        if self.rate_limit and random.random() < self.rate_limit:
+            raise ModelRateLimitError("Simulated rate limit (429)", model_name=self.name, model_id=self.id)
+        if not (self.rpm or self.tpm):
+            return
+
+        now = time.monotonic()
+        with _quota_lock:
+            window = _quota_windows.setdefault(self.id, deque())
+            while window and now - window[0][0] >= 60:
+                window.popleft()
+            if (self.rpm and len(window) >= self.rpm) or (self.tpm and sum(used for _, used in window) + tokens > self.tpm):
+                raise ModelRateLimitError(
+                    f"Simulated quota exceeded (429): rpm={self.rpm or '-'} tpm={self.tpm or '-'}",
+                    model_name=self.name, model_id=self.id
+                )
+            window.append((now, tokens))
+
+    async def ainvoke(self, *args, **kwargs) -> ModelResponse:
+        return self.invoke(*args, **kwargs)
+
+    def invoke_stream(self, *args, **kwargs):
+        yield self.invoke(*args, **kwargs)
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        yield self.invoke(*args, **kwargs)
+
+    def _parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return response
+
+    def _parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return response
+
+
+# Simulated provider quotas: spec -> (timestamp, tokens) of calls in the last minute
+_quota_windows: Dict[str, Deque[Tuple[float, int]]] = {}
+_quota_lock = threading.Lock()
+
+
+def _parse_seconds(value: str) -> float:
+    value = value.strip().lower()
+    if value.endswith("ms"):
+        return float(value[:-2]) / 1000
+    return float(value.rstrip("s"))
+
+
+def parse_fake_model(spec: str) -> FakeModel:
+    """
+    Build a FakeModel from a "fake:" model string.
+
+    Args:
+        spec: "fake" or "fake:key=value,..." (see the module docstring for keys)
+
+    Returns:
+        FakeModel whose id is the spec's options, so get_model_id() returns the spec
+        itself (and MODEL_RATE_LIMITS entries keyed by the config string apply)
+
+    Raises:
+        ValueError: On an unknown option or malformed value
+    """
+    _, _, options = spec.partition(":")
+    model = FakeModel(id=options or "fake")
+    for option in filter(None, (part.strip() for part in options.split(","))):
+        key, _, value = option.partition("=")
+        key = key.strip().lower()
+        try:
+            if key == "latency":
+                low, _, high = value.partition("-")
+                model.latency = _parse_seconds(low)
+                model.latency_max = _parse_seconds(high) if high else 0.0
+            elif key == "jitter":
+                model.jitter = float(value)
+            elif key == "tokens":
+                model.output_tokens = int(value)
+            elif key == "items":
+                model.list_items = int(value)
+            elif key == "seed":
+                model.seed = int(value)
+            elif key == "rate_limit":
+                model.rate_limit = float(value)
+            elif key in ("rpm", "tpm"):
+                setattr(model, key, int(value))
+            else:
+                raise ValueError(f"unknown option '{key}'")
+        except ValueError as e:
+            raise ValueError(f"Invalid fake model spec '{spec}': {option} ({str(e)})") from e
+    return model
+
+
+def resolve_model(model: str) -> Union[str, FakeModel]:
+    """
+    Model for an Agent from a config model string.
+
+    Args:
+        model: "provider:model_id" string (e.g., config.DEFAULT_MODEL)
+
+    Returns:
+        FakeModel for "fake" / "fake:..." strings, otherwise the string unchanged (Agno
+        resolves it)
+    """
+    if model == "fake" or model.startswith("fake:"):
+        return parse_fake_model(model)
+    return model
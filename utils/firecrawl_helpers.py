@@ -1,14 +1,39 @@
 """
 Firecrawl Helper Functions
 Wrapper functions for Firecrawl Python SDK operations.
+Calls are cancellation checkpoints (utils/cancellation.py): a cancelled run skips calls
+that have not started and cancels its running batch scrape job.
+
+The client (and the Firecrawl SDK, a slow import) is created on first use, so importing
+the steps needs neither the SDK import time nor an API key.
 """
 
-from firecrawl import Firecrawl
+import threading
+import time
+
 from typing import Dict, List
+from utils.cancellation import RunCancelled, check_cancelled, current_token
 import config
 
-# Initialize Firecrawl client
-fc = Firecrawl(api_key=config.FIRECRAWL_API_KEY)
+# Firecrawl client, created by get_firecrawl() on first use (assign a client to replace it)
+fc = None
+_fc_lock = threading.Lock()
+
+
+def get_firecrawl():
+    """
+    Shared Firecrawl client, created on first use.
+
+    Returns:
+        firecrawl.Firecrawl client (or the client assigned to fc, e.g. benchmark fixtures)
+    """
+    global fc
+    if fc is None:
+        with _fc_lock:
+            if fc is None:
+                from firecrawl import Firecrawl  # Deferred: the SDK import alone takes ~0.4s
+                fc = Firecrawl(api_key=config.FIRECRAWL_API_KEY)
+    return fc
 
 
 def map_website(domain: str, limit: int = None) -> Dict:
@@ -21,12 +46,16 @@ def map_website(domain: str, limit: int = None) -> Dict:
 
     Returns:
         Dict with keys: success, domain, urls, total_urls, error (if failed)
+
+    Raises:
+        RunCancelled: If the run was cancelled
     """
     if limit is None:
         limit = config.MAX_URLS_TO_MAP
 
+    check_cancelled(f"map:{domain}")
     try:
-        result = fc.map(url=domain, limit=limit)
+        result = get_firecrawl().map(url=domain, limit=limit)
         # Firecrawl returns a MapData object with .links attribute containing LinkResult objects
         link_results = result.links if hasattr(result, 'links') else []
 
@@ -59,12 +88,16 @@ def scrape_url(url: str, formats: List[str] = None) -> Dict:
 
     Returns:
         Dict with keys: success, url, markdown, html, metadata, error (if failed)
+
+    Raises:
+        RunCancelled: If the run was cancelled
     """
     if formats is None:
         formats = config.DEFAULT_SCRAPE_FORMATS
 
+    check_cancelled(f"scrape:{url}", scrape_pages=1)
     try:
-        result = fc.scrape(
+        result = get_firecrawl().scrape(
             url,
             formats=formats,
             wait_for=config.SCRAPE_WAIT_TIME,
@@ -97,31 +130,55 @@ def scrape_url(url: str, formats: List[str] = None) -> Dict:
         }
 
 
-def batch_scrape_urls(urls: List[str], formats: List[str] = None) -> Dict[str, Dict]:
+def batch_scrape_urls(urls: List[str], formats: List[str] = None, wait_timeout: int = None) -> Dict[str, Dict]:
     """
     Batch scrape multiple URLs.
 
+    Polls the batch job every BATCH_SCRAPE_POLL_INTERVAL seconds; if the run is
+    cancelled meanwhile, the job is cancelled so its remaining pages are not scraped.
+
     Args:
         urls: List of URLs to scrape
         formats: List of formats to return (default: markdown only)
+        wait_timeout: Seconds to wait for the batch job (default: BATCH_SCRAPE_TIMEOUT)
 
     Returns:
         Dict with keys: success, results, total_scraped, error (if failed)
         results is a dict mapping URL -> {markdown, metadata}
+
+    Raises:
+        RunCancelled: If the run was cancelled
     """
     if formats is None:
         formats = config.BATCH_SCRAPE_FORMAT
+    if wait_timeout is None:
+        wait_timeout = config.BATCH_SCRAPE_TIMEOUT
 
+    check_cancelled("batch_scrape", scrape_pages=len(urls))
+    token = current_token()
+    client = get_firecrawl()
     try:
-        # Use batch_scrape waiter method with wait_timeout parameter
-        job = fc.batch_scrape(
+        started = client.start_batch_scrape(
             urls,
             formats=formats,
-            poll_interval=config.BATCH_SCRAPE_POLL_INTERVAL,
-            wait_timeout=config.BATCH_SCRAPE_TIMEOUT,  # Note: wait_timeout, not timeout!
             max_age=config.SCRAPE_MAX_AGE  # 500% faster with cached data!
         )
 
+        # Poll like the SDK's batch_scrape waiter, but stop (and cancel the job) on cancellation
+        started_at = time.monotonic()
+        while True:
+            job = client.get_batch_scrape_status(started.id)
+            if job.status in ("completed", "failed", "cancelled"):
+                break
+            if time.monotonic() - started_at > wait_timeout:
+                raise TimeoutError(f"Batch scrape job {started.id} did not complete within {wait_timeout} seconds")
+
+            if token is None:
+                time.sleep(config.BATCH_SCRAPE_POLL_INTERVAL)
+            elif token.wait(config.BATCH_SCRAPE_POLL_INTERVAL):
+                client.cancel_batch_scrape(started.id)
+                token.check("batch_scrape", scrape_pages=max(0, (job.total or len(urls)) - (job.completed or 0)))
+
         # Convert to dict keyed by URL
         results = {}
         for doc in job.data:
@@ -147,6 +204,8 @@ def batch_scrape_urls(urls: List[str], formats: List[str] = None) -> Dict[str, D
             "total_scraped": len(results)
         }
 
+    except RunCancelled:
+        raise
     except Exception as e:
         return {
             "success": False,
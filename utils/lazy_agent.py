@@ -0,0 +1,75 @@
+"""
+Lazy Agent
+Agents built on first use instead of on import. Agent modules wrap each Agent(...) in
+lazy_agent(lambda: ...); the module attribute is a LazyAgent that builds the Agent the
+first time one of its attributes is read (by run_agent, the LLM cache, the step memo, ...)
+and reuses it afterwards.
+
+Importing the steps therefore builds no agents and resolves no models, so the CLI, the API
+server's workers and tooling start without building the pipeline's 18 Agents, and models are resolved
+from config once a run actually needs them.
+"""
+
+import threading
+from typing import Callable
+
+from agno.agent import Agent
+
+
+class LazyAgent:
+    """
+    Proxy for an Agent built by a factory on first use.
+
+    Attribute reads and writes go to the built Agent, so a LazyAgent can be passed
+    wherever the steps pass an Agent (run_agent(agent, ...), agent.name, agent.model = ...).
+    """
+
+    def __init__(self, factory: Callable[[], Agent]):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_agent", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    @property
+    def built(self) -> bool:
+        """Whether the Agent has been built"""
+        return self._agent is not None
+
+    def get(self) -> Agent:
+        """The Agent, built on the first call (concurrent first calls build it once)"""
+        if self._agent is None:
+            with self._lock:
+                if self._agent is None:
+                    object.__setattr__(self, "_agent", self._factory())
+        return self._agent
+
+    def __getattr__(self, name: str):
+        return getattr(self.get(), name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self.get(), name, value)
+
+    def __repr__(self) -> str:
+        return f"LazyAgent({self._agent.name!r})" if self.built else "LazyAgent(<not built>)"
+
+
+def lazy_agent(factory: Callable[[], Agent]) -> LazyAgent:
+    """
+    Declare a module-level agent built on first use.
+
+    Usage:
+        homepage_analyst = lazy_agent(lambda: Agent(
+            name="Homepage Analyst",
+            model=resolve_model(config.DEFAULT_MODEL),
+            ...
+        ))
+
+        run_agent(homepage_analyst, prompt)  # builds the Agent on the first call
+
+    Args:
+        factory: Zero-argument function returning the Agent
+
+    Returns:
+        LazyAgent
+    """
+    return LazyAgent(factory)
+
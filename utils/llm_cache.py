@@ -0,0 +1,277 @@
+"""
+LLM Response Cache
+Disk-backed cache for agent outputs so reruns with identical inputs skip LLM calls.
+Entries are keyed by model id, instructions, output schema and input, expire a TTL after
+they were written, and the cache directory is kept under a size limit by evicting least
+recently used entries.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+import config
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def get_model_id(agent) -> str:
+    """
+    Get a stable "provider:model_id" string for an agent's model.
+
+    Args:
+        agent: Agno Agent
+
+    Returns:
+        Model identifier (e.g., "openai:gpt-5.1")
+    """
+    model = getattr(agent, "model", None)
+    if model is None or isinstance(model, str):
+        return str(model)
+
+    provider = str(getattr(model, "provider", "") or "").lower()
+    model_id = getattr(model, "id", None) or type(model).__name__
+    return f"{provider}:{model_id}" if provider else str(model_id)
+
+
+def get_output_schema(agent):
+    """Get the agent's structured output schema (None for free-text agents)."""
+    return getattr(agent, "output_schema", None)
+
+
+def get_agent_fingerprint(agent) -> str:
+    """
+    Hash everything about an agent that changes its output for a given input:
+    model id, instructions and output schema.
+
+    Args:
+        agent: Agno Agent
+
+    Returns:
+        Hex digest identifying the agent configuration
+    """
+    schema = get_output_schema(agent)
+    schema_repr = ""
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        schema_repr = f"{schema.__name__}:{json.dumps(schema.model_json_schema(), sort_keys=True)}"
+    elif schema is not None:
+        schema_repr = repr(schema)
+
+    parts = [
+        get_model_id(agent),
+        _sha256(json.dumps(getattr(agent, "instructions", None), sort_keys=True, default=str)),
+        _sha256(schema_repr),
+    ]
+    return _sha256("|".join(parts))
+
+
+class LLMResponseCache:
+    """
+    Disk-backed cache of agent outputs.
+
+    Each entry is one JSON file named by its key. Structured outputs are stored as
+    model_dump() dicts and re-validated against the agent's output_schema on read.
+    Hit/miss counters are kept per agent name for the lifetime of the process.
+
+    Eviction works from an in-memory index of the entries (created_at, last used, size)
+    instead of scanning the directory on every write: the directory is scanned once, then
+    again every RESCAN_EVERY writes to pick up entries written by other processes. A
+    file's mtime is its write time (reads don't touch it), so the TTL counts from then.
+    """
+
+    RESCAN_EVERY = 1000
+    # Evict down to this fraction of max_bytes, so a full cache doesn't evict on every write
+    EVICT_TO = 0.9
+
+    def __init__(self, cache_dir: str, ttl_seconds: int, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Dict[str, int]] = {}
+        # path -> [created_at, last_used, size]; None until the first write scans the directory
+        self._index: Optional[Dict[str, List[float]]] = None
+        self._total_bytes = 0
+        self._writes = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def make_key(self, agent, input: str) -> str:
+        """
+        Build the cache key for an agent call.
+
+        Args:
+            agent: Agno Agent
+            input: Prompt sent to the agent
+
+        Returns:
+            Hex digest cache key
+        """
+        return _sha256(f"{get_agent_fingerprint(agent)}|{_sha256(input)}")
+
+    def get(self, agent, key: str) -> Optional[Any]:
+        """
+        Look up a cached output.
+
+        Args:
+            agent: Agno Agent (used to re-validate structured output and for metrics)
+            key: Key from make_key()
+
+        Returns:
+            Cached content (pydantic instance or string), or None on miss/expiry
+        """
+        path = self._path(key)
+        content = None
+
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+            if time.time() - entry.get("created_at", 0) <= self.ttl_seconds:
+                content = self._deserialize(agent, entry.get("content"))
+        except (OSError, ValueError):
+            content = None
+
+        if content is not None:
+            with self._lock:
+                if self._index is not None and path in self._index:
+                    self._index[path][1] = time.time()
+
+        self._record(getattr(agent, "name", None), hit=content is not None)
+        return content
+
+    def set(self, agent, key: str, content: Any) -> None:
+        """
+        Store an agent output.
+
+        Args:
+            agent: Agno Agent
+            key: Key from make_key()
+            content: RunOutput.content (pydantic instance or string)
+        """
+        if content is None:
+            return
+
+        if isinstance(content, BaseModel):
+            serialized = content.model_dump(mode="json")
+        elif isinstance(content, str):
+            serialized = content
+        else:
+            # Unknown content types are not worth the risk of a lossy round trip
+            return
+
+        created_at = time.time()
+        entry = {
+            "agent": getattr(agent, "name", None),
+            "model": get_model_id(agent),
+            "created_at": created_at,
+            "content": serialized,
+        }
+
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  LLM cache write failed: {e}")
+            return
+
+        with self._lock:
+            if self._index is None or self._writes % self.RESCAN_EVERY == 0:
+                self._scan()
+            self._writes += 1
+            previous = self._index.get(path)
+            self._total_bytes += size - (previous[2] if previous else 0)
+            self._index[path] = [created_at, created_at, size]
+            self._evict()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-agent hit/miss counts and hit rate.
+
+        Returns:
+            Dict mapping agent name -> {hits, misses, hit_rate}
+        """
+        with self._lock:
+            return {
+                name: {
+                    "hits": counts["hits"],
+                    "misses": counts["misses"],
+                    "hit_rate": round(counts["hits"] / (counts["hits"] + counts["misses"]), 3)
+                    if counts["hits"] + counts["misses"] else 0.0
+                }
+                for name, counts in self._metrics.items()
+            }
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _deserialize(self, agent, content: Any) -> Optional[Any]:
+        schema = get_output_schema(agent)
+        if isinstance(schema, type) and issubclass(schema, BaseModel):
+            if not isinstance(content, dict):
+                return None
+            return schema.model_validate(content)
+        return content
+
+    def _record(self, agent_name: Optional[str], hit: bool) -> None:
+        with self._lock:
+            counts = self._metrics.setdefault(agent_name or "unknown", {"hits": 0, "misses": 0})
+            counts["hits" if hit else "misses"] += 1
+
+    def _scan(self) -> None:
+        """Rebuild the entry index from the cache directory (caller holds the lock)"""
+        index: Dict[str, List[float]] = {}
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            # Keep in-process recency for entries already indexed
+            last_used = self._index[path][1] if self._index and path in self._index else stat.st_mtime
+            index[path] = [stat.st_mtime, last_used, stat.st_size]
+        self._index = index
+        self._total_bytes = sum(size for _, _, size in index.values())
+
+    def _evict(self) -> None:
+        """
+        Drop expired entries on a rescan, and least recently used ones once over max_bytes
+        (caller holds the lock).
+        """
+        now = time.time()
+        expired = [path for path, (created_at, _, _) in self._index.items() if now - created_at > self.ttl_seconds] \
+            if self._writes % self.RESCAN_EVERY == 1 else []
+        if self._total_bytes > self.max_bytes:
+            target = self.max_bytes * self.EVICT_TO
+            over = self._total_bytes - target
+            for path in sorted(self._index, key=lambda path: self._index[path][1]):
+                if over <= 0:
+                    break
+                expired.append(path)
+                over -= self._index[path][2]
+
+        for path in dict.fromkeys(expired):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self._total_bytes -= self._index.pop(path)[2]
+
+
+# Shared cache instance (None when disabled)
+llm_cache = LLMResponseCache(
+    cache_dir=config.LLM_CACHE_DIR,
+    ttl_seconds=config.LLM_CACHE_TTL_SECONDS,
+    max_bytes=config.LLM_CACHE_MAX_BYTES
+) if config.LLM_CACHE_ENABLED else None
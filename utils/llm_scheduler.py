@@ -0,0 +1,297 @@
+"""
+LLM Scheduler
+Process-wide admission control for agent calls. Keeps every model under its
+tokens-per-minute (TPM) and requests-per-minute (RPM) quota, serves queued calls in
+priority order (interactive runs before bulk runs), and backs off on rate-limit errors.
+
+Parallel workflow blocks and concurrent API runs all share the one scheduler instance,
+so a burst of extractor calls queues briefly instead of failing with 429s.
+"""
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from agno.exceptions import ModelRateLimitError
+
+from utils.tracing import current_span
+import config
+
+# Priorities (lower value is served first)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 10
+
+PRIORITIES = {
+    "interactive": PRIORITY_INTERACTIVE,
+    "bulk": PRIORITY_BULK
+}
+
+_WINDOW_SECONDS = 60.0
+
+# HTTP statuses providers use for rate limits (529 is Anthropic's "overloaded")
+_RATE_LIMIT_STATUS_CODES = {429, 529}
+
+# Exceptions raised by models during the current scheduled call. Agno catches them and
+# returns RunOutput(status=ERROR) with only the message, so watch_provider_errors()
+# records them here for run() to classify.
+_provider_errors: ContextVar[Optional[List[BaseException]]] = ContextVar("provider_errors", default=None)
+_watch_lock = threading.Lock()
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a call still hits the provider's rate limit after all retries"""
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    Check whether an exception raised by a model provider is a rate-limit error.
+
+    Args:
+        error: Exception raised by the model (Agno's ModelProviderError or the provider SDK's)
+
+    Returns:
+        True for ModelRateLimitError and HTTP 429 / 529 errors
+    """
+    if isinstance(error, ModelRateLimitError):
+        return True
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code in _RATE_LIMIT_STATUS_CODES
+
+
+def watch_provider_errors(model: Any) -> None:
+    """
+    Record exceptions raised by a model's invoke() for the scheduled call that made it.
+
+    Agno turns provider exceptions into RunOutput(status=ERROR), so without this the
+    scheduler could only tell rate limits apart by the error message. Idempotent.
+
+    Args:
+        model: Agno Model instance (model strings Agno hasn't resolved yet are skipped)
+    """
+    if model is None or isinstance(model, str):
+        return
+
+    with _watch_lock:
+        if getattr(model, "_provider_errors_watched", False):
+            return
+        invoke = model.invoke
+
+        def watched_invoke(*args, **kwargs):
+            try:
+                return invoke(*args, **kwargs)
+            except Exception as e:
+                errors = _provider_errors.get()
+                if errors is not None:
+                    errors.append(e)
+                raise
+
+        model.invoke = watched_invoke
+        model._provider_errors_watched = True
+
+
+class _ModelBudget:
+    """Sliding one-minute window of requests and tokens for one model"""
+
+    def __init__(self, tpm: int, rpm: int):
+        self.tpm = tpm
+        self.rpm = rpm
+        # Each entry is [timestamp, tokens]; tokens are corrected to actual usage after the call
+        self.window: Deque[List[float]] = deque()
+        self.blocked_until = 0.0
+        self.queue: List = []
+
+    def prune(self, now: float) -> None:
+        while self.window and now - self.window[0][0] >= _WINDOW_SECONDS:
+            self.window.popleft()
+
+    def wait_time(self, tokens: int, now: float) -> float:
+        """Seconds until a call of `tokens` fits in the budget (0 if it fits now)"""
+        self.prune(now)
+        if now < self.blocked_until:
+            return self.blocked_until - now
+
+        used_tokens = sum(entry[1] for entry in self.window)
+        fits_tokens = used_tokens + tokens <= self.tpm or not self.window
+        fits_requests = len(self.window) < self.rpm
+
+        if fits_tokens and fits_requests:
+            return 0.0
+
+        # Wait for the oldest entry to leave the window
+        return max(0.01, _WINDOW_SECONDS - (now - self.window[0][0]))
+
+
+class LLMScheduler:
+    """
+    Priority-aware TPM/RPM scheduler shared by all agent calls in the process.
+
+    Usage:
+        result = llm_scheduler.run("openai:gpt-5.1", estimated_tokens, PRIORITY_INTERACTIVE, call)
+
+    `call` must return the Agno RunOutput so actual token usage can be recorded. Rate
+    limits are detected from the provider's exception, raised by `call` or recorded for
+    an Agno error result by watch_provider_errors().
+    """
+
+    def __init__(
+        self,
+        rate_limits: Dict[str, Dict[str, int]],
+        default_tpm: int,
+        default_rpm: int,
+        max_retries: int,
+        backoff_base_seconds: float,
+        backoff_max_seconds: float
+    ):
+        self.rate_limits = rate_limits
+        self.default_tpm = default_tpm
+        self.default_rpm = default_rpm
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self._budgets: Dict[str, _ModelBudget] = {}
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+
+    def run(self, model_id: str, estimated_tokens: int, priority: int, call: Callable[[], Any]) -> Any:
+        """
+        Run an LLM call once the model's budget allows it, retrying rate-limit errors.
+
+        Args:
+            model_id: "provider:model" string (matches config.MODEL_RATE_LIMITS keys)
+            estimated_tokens: Estimated input + output tokens for the call
+            priority: PRIORITY_INTERACTIVE or PRIORITY_BULK
+            call: Zero-argument function performing the call
+
+        Returns:
+            Whatever `call` returns
+
+        Raises:
+            RateLimitExceeded: If the call is still rate limited after max_retries
+        """
+        for attempt in range(self.max_retries + 1):
+            queued_at = time.monotonic()
+            reservation = self._acquire(model_id, estimated_tokens, priority)
+            current_span().add("queue_wait_ms", round((time.monotonic() - queued_at) * 1000, 1))
+
+            provider_errors: List[BaseException] = []
+            context_token = _provider_errors.set(provider_errors)
+            try:
+                result = call()
+            except Exception as e:
+                if not is_rate_limit_error(e):
+                    self._release(model_id, reservation)
+                    raise
+                error = e
+            else:
+                # Agno returns errors as RunOutput(status=ERROR) instead of raising
+                status = str(getattr(getattr(result, "status", None), "value", ""))
+                if status != "ERROR":
+                    self._record_usage(reservation, result)
+                    return result
+                error = next((e for e in provider_errors if is_rate_limit_error(e)), None)
+                if error is None:
+                    self._release(model_id, reservation)
+                    return result
+            finally:
+                _provider_errors.reset(context_token)
+
+            if attempt == self.max_retries:
+                raise RateLimitExceeded(f"{model_id} still rate limited after {self.max_retries} retries: {error}")
+
+            delay = min(self.backoff_max_seconds, self.backoff_base_seconds * (2 ** attempt))
+            delay *= 0.5 + random.random() / 2  # jitter so queued calls don't retry in lockstep
+            print(f"⏳ {model_id} rate limited - backing off {delay:.1f}s (retry {attempt + 1}/{self.max_retries})")
+            current_span().add("retries", 1)
+            self._block(model_id, delay)
+
+    def _budget(self, model_id: str) -> _ModelBudget:
+        if model_id not in self._budgets:
+            limits = self.rate_limits.get(model_id, {})
+            self._budgets[model_id] = _ModelBudget(
+                tpm=limits.get("tpm", self.default_tpm),
+                rpm=limits.get("rpm", self.default_rpm)
+            )
+        return self._budgets[model_id]
+
+    def _acquire(self, model_id: str, tokens: int, priority: int) -> List[float]:
+        """Block until this call is first in line and fits the budget, then reserve it"""
+        with self._condition:
+            budget = self._budget(model_id)
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(budget.queue, ticket)
+
+            while True:
+                now = time.monotonic()
+                wait = budget.wait_time(tokens, now)
+
+                if budget.queue[0] == ticket and wait == 0:
+                    heapq.heappop(budget.queue)
+                    reservation = [now, float(tokens)]
+                    budget.window.append(reservation)
+                    # Let the next caller in line re-check the budget
+                    self._condition.notify_all()
+                    return reservation
+
+                self._condition.wait(timeout=min(wait, 1.0) if wait else 1.0)
+
+    def _record_usage(self, reservation: List[float], result: Any) -> None:
+        """Replace the estimated token reservation with actual usage when Agno reports it"""
+        metrics = getattr(result, "metrics", None)
+        total_tokens = getattr(metrics, "total_tokens", None) if metrics is not None else None
+        if isinstance(metrics, dict):
+            total_tokens = metrics.get("total_tokens")
+        if isinstance(total_tokens, list):
+            total_tokens = sum(total_tokens)
+
+        if total_tokens:
+            with self._condition:
+                reservation[1] = float(total_tokens)
+                self._condition.notify_all()
+
+    def _release(self, model_id: str, reservation: List[float]) -> None:
+        """Give back the reservation of a call that failed without using the model's quota"""
+        with self._condition:
+            window = self._budget(model_id).window
+            for index, entry in enumerate(window):
+                if entry is reservation:
+                    del window[index]
+                    self._condition.notify_all()
+                    return
+
+    def _block(self, model_id: str, delay: float) -> None:
+        """Pause all calls to a model after a rate-limit error"""
+        with self._condition:
+            budget = self._budget(model_id)
+            budget.blocked_until = max(budget.blocked_until, time.monotonic() + delay)
+            self._condition.notify_all()
+
+
+def get_priority_value(priority: Optional[str]) -> int:
+    """
+    Convert a run priority name to a scheduler priority.
+
+    Args:
+        priority: "interactive" or "bulk" (None means interactive)
+
+    Returns:
+        Scheduler priority value
+    """
+    return PRIORITIES.get((priority or "interactive").lower(), PRIORITY_INTERACTIVE)
+
+
+# Shared scheduler instance
+llm_scheduler = LLMScheduler(
+    rate_limits=config.MODEL_RATE_LIMITS,
+    default_tpm=config.LLM_DEFAULT_TPM,
+    default_rpm=config.LLM_DEFAULT_RPM,
+    max_retries=config.LLM_RATE_LIMIT_MAX_RETRIES,
+    backoff_base_seconds=config.LLM_BACKOFF_BASE_SECONDS,
+    backoff_max_seconds=config.LLM_BACKOFF_MAX_SECONDS
+)
@@ -0,0 +1,194 @@
+"""
+Page Store
+Content hashing for scraped pages and a disk-backed store of per-page extraction results.
+Lets Step 6 re-run extractors only on pages that are new or changed since the last run.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Dict, List, Tuple
+
+from utils.llm_cache import get_agent_fingerprint
+import config
+
+
+def hash_page_content(markdown: str) -> str:
+    """
+    Hash scraped page content, ignoring whitespace-only differences.
+
+    Args:
+        markdown: Page markdown from Firecrawl
+
+    Returns:
+        SHA-256 hex digest of the normalized content
+    """
+    normalized = re.sub(r"\s+", " ", markdown or "").strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def hash_pages(pages: Dict[str, str]) -> Dict[str, str]:
+    """
+    Hash every page in a {url: markdown} mapping.
+
+    Args:
+        pages: Dict mapping URL -> markdown
+
+    Returns:
+        Dict mapping URL -> content hash
+    """
+    return {url: hash_page_content(content) for url, content in pages.items()}
+
+
+def extractor_fingerprint(agent, instruction: str) -> str:
+    """
+    Fingerprint of an extractor: its agent configuration and the prompt it is given.
+
+    Args:
+        agent: Extractor agent
+        instruction: Prompt prefix the pages are sent with
+
+    Returns:
+        SHA-256 hex digest
+    """
+    parts = [get_agent_fingerprint(agent), instruction]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _domain_slug(domain: str) -> str:
+    return re.sub(r"[^a-z0-9.-]+", "_", re.sub(r"^https?://", "", (domain or "unknown").lower())).strip("_")
+
+
+class PageExtractionStore:
+    """
+    Per-page extraction results, stored as one JSON file per (domain, element, extractor).
+
+    The extractor fingerprint (agent model, instructions, output schema and prompt) is part
+    of the file name, so changing an extractor re-extracts every page instead of reusing
+    items the old extractor produced.
+
+    File layout: <store_dir>/<domain>/<element_key>-<extractor fingerprint>.json
+        {"pages": {url: {"hash": "<content hash>", "items": [<element dicts>]}}}
+    """
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        self._lock = threading.Lock()
+
+    def load(self, domain: str, element_key: str, extractor: str) -> Dict[str, Dict]:
+        """
+        Load stored per-page results for one element type.
+
+        Args:
+            domain: Company domain (e.g., "https://octavehq.com")
+            element_key: Element type (e.g., "offerings")
+            extractor: Fingerprint of the extractor (see extractor_fingerprint)
+
+        Returns:
+            Dict mapping URL -> {"hash": str, "items": list}, empty if nothing stored
+        """
+        path = self._path(domain, element_key, extractor)
+        try:
+            with open(path, "r") as f:
+                return json.load(f).get("pages", {})
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, domain: str, element_key: str, extractor: str, pages: Dict[str, Dict]) -> None:
+        """
+        Replace stored per-page results for one element type.
+
+        Args:
+            domain: Company domain
+            element_key: Element type
+            extractor: Fingerprint of the extractor that produced the items
+            pages: Dict mapping URL -> {"hash": str, "items": list}
+        """
+        path = self._path(domain, element_key, extractor)
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump({"pages": pages}, f)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"⚠️  Could not save {element_key} extraction results: {e}")
+
+    def _path(self, domain: str, element_key: str, extractor: str) -> str:
+        return os.path.join(self.store_dir, _domain_slug(domain), f"{element_key}-{extractor[:16]}.json")
+
+
+def attribute_items_to_pages(items: List[Dict], page_urls: List[str]) -> Tuple[Dict[str, List[Dict]], List[Dict]]:
+    """
+    Assign extracted items to the pages they came from, using each item's `sources` URLs.
+
+    Items without a source among page_urls are attributed to no page: they are returned
+    separately so the caller can keep them for the current run without storing them.
+
+    Args:
+        items: Extracted element dicts (with optional "sources": [{"url": ...}])
+        page_urls: URLs of the pages that were sent to the extractor
+
+    Returns:
+        (dict mapping URL -> items attributed to that page, unattributed items)
+    """
+    by_page = {url: [] for url in page_urls}
+    unattributed = []
+
+    for item in items:
+        source_urls = {
+            source.get("url") for source in item.get("sources", []) or []
+            if isinstance(source, dict)
+        }
+        matched = [url for url in page_urls if url in source_urls]
+        for url in matched:
+            by_page[url].append(item)
+        if not matched:
+            unattributed.append(item)
+
+    return by_page, unattributed
+
+
+def merge_items(items: List[Dict], key_field: str) -> List[Dict]:
+    """
+    Deduplicate extracted items by an identifying field, merging their sources.
+
+    Items keep the shape the extractor returned: sources are only merged into items
+    that carry a `sources` field, and no field is added.
+
+    Args:
+        items: Extracted element dicts
+        key_field: Field identifying an item (e.g., "name" for offerings)
+
+    Returns:
+        Items in first-seen order with duplicates folded together
+    """
+    merged: Dict[str, Dict] = {}
+
+    for item in items:
+        key = re.sub(r"\s+", " ", str(item.get(key_field, ""))).strip().lower()
+        if not key:
+            key = json.dumps(item, sort_keys=True, default=str)
+
+        if key not in merged:
+            merged[key] = dict(item)
+            if "sources" in item:
+                merged[key]["sources"] = list(item["sources"] or [])
+            continue
+
+        if "sources" not in merged[key]:
+            continue
+        known_urls = {s.get("url") for s in merged[key]["sources"] if isinstance(s, dict)}
+        for source in item.get("sources", []) or []:
+            if isinstance(source, dict) and source.get("url") not in known_urls:
+                merged[key]["sources"].append(source)
+                known_urls.add(source.get("url"))
+
+    return list(merged.values())
+
+
+# Shared store instance
+page_extraction_store = PageExtractionStore(config.PAGE_EXTRACTION_STORE_DIR)
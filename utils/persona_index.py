@@ -0,0 +1,223 @@
+"""
+Persona Index
+Matches persona titles (e.g., the playbook summary's priority personas) to the full
+persona dicts from Step 7b. Titles are normalized to token sets with common acronyms
+expanded (VP, CRO, CMO, RevOps, ...), indexed by token, and scored by token overlap,
+so a lookup only scores personas that share at least one token with the query. A title
+as written wins over one that only normalizes the same, and ties in token score go to
+the title that reads closest to the query.
+
+Indexes are cached by the persona list they were built from, so every Phase 4 step
+in a run shares one index.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Set
+
+# Expanded before tokenizing, so "VP Sales" and "Vice President of Sales" match
+ACRONYMS = {
+    "vp": "vice president",
+    "svp": "senior vice president",
+    "evp": "executive vice president",
+    "avp": "assistant vice president",
+    "ceo": "chief executive officer",
+    "cfo": "chief financial officer",
+    "coo": "chief operating officer",
+    "cto": "chief technology officer",
+    "cio": "chief information officer",
+    "ciso": "chief information security officer",
+    "cmo": "chief marketing officer",
+    "cro": "chief revenue officer",
+    "cso": "chief sales officer",
+    "cpo": "chief product officer",
+    "chro": "chief human resources officer",
+    "cco": "chief customer officer",
+    "revops": "revenue operations",
+    "salesops": "sales operations",
+    "gtm": "go to market",
+    "sdr": "sales development representative",
+    "bdr": "business development representative",
+    "ae": "account executive",
+    "am": "account manager",
+    "csm": "customer success manager",
+    "hr": "human resources",
+    "it": "information technology",
+    "ops": "operations",
+    "mgr": "manager",
+    "dir": "director",
+    "sr": "senior",
+    "jr": "junior",
+    "eng": "engineering",
+    "mktg": "marketing",
+}
+
+# Filler words that should not make two titles look alike
+_STOPWORDS = {"of", "the", "and", "or", "for", "at", "a", "an", "to", "in", "e", "g"}
+
+_INDEX_CACHE_SIZE = 64
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a persona title: lowercase, punctuation removed, acronyms expanded.
+
+    Args:
+        title: Persona title (e.g., "VP / Head of Sales (or CRO)")
+
+    Returns:
+        Normalized title (e.g., "vice president head sales chief revenue officer")
+    """
+    words = re.findall(r"[a-z0-9]+", (title or "").lower())
+    expanded = " ".join(ACRONYMS.get(word, word) for word in words)
+    return " ".join(word for word in expanded.split() if word not in _STOPWORDS)
+
+
+def title_tokens(title: str) -> FrozenSet[str]:
+    """
+    Token set of a normalized persona title.
+
+    Args:
+        title: Persona title
+
+    Returns:
+        Frozen set of normalized tokens
+    """
+    return frozenset(normalize_title(title).split())
+
+
+def _verbatim_key(title: str) -> str:
+    return " ".join((title or "").lower().split())
+
+
+def score_tokens(query: FrozenSet[str], candidate: FrozenSet[str]) -> float:
+    """
+    Similarity of two title token sets (0-1).
+
+    Averages the Dice coefficient with how much of the query the candidate covers, so
+    an abbreviated title ("VP of Sales") still matches its longer original
+    ("VP / Head of Sales (or Chief Revenue Officer)").
+
+    Args:
+        query: Tokens of the title being looked up
+        candidate: Tokens of an indexed persona title
+
+    Returns:
+        Similarity score
+    """
+    if not query or not candidate:
+        return 0.0
+    overlap = len(query & candidate)
+    dice = 2 * overlap / (len(query) + len(candidate))
+    coverage = overlap / len(query)
+    return (dice + coverage) / 2
+
+
+@dataclass
+class PersonaMatch:
+    """Result of a persona lookup"""
+    persona: dict
+    confidence: float
+    exact: bool
+
+
+class PersonaIndex:
+    """Token index over persona dicts with a 'persona_title' field"""
+
+    def __init__(self, personas: List[dict]):
+        self.personas = personas
+        # Titles as written (case and spacing aside) win over titles that only normalize
+        # alike, so "Vice President of Sales" doesn't resolve to a separate "VP of Sales"
+        self._verbatim: Dict[str, int] = {}
+        self._exact: Dict[str, int] = {}
+        self._tokens: List[FrozenSet[str]] = []
+        self._postings: Dict[str, Set[int]] = {}
+
+        for i, persona in enumerate(personas):
+            title = persona.get("persona_title", "")
+            self._verbatim.setdefault(_verbatim_key(title), i)
+            self._exact.setdefault(normalize_title(title), i)
+            tokens = title_tokens(title)
+            self._tokens.append(tokens)
+            for token in tokens:
+                self._postings.setdefault(token, set()).add(i)
+
+    def match(self, title: str, threshold: float = 0.7) -> Optional[PersonaMatch]:
+        """
+        Find the persona whose title best matches a title.
+
+        Args:
+            title: Title to look up
+            threshold: Minimum confidence (0-1) for a match
+
+        Returns:
+            PersonaMatch, or None if no persona scores at least threshold
+        """
+        verbatim = _verbatim_key(title)
+        if verbatim in self._verbatim:
+            return PersonaMatch(persona=self.personas[self._verbatim[verbatim]], confidence=1.0, exact=True)
+
+        normalized = normalize_title(title)
+        if normalized in self._exact:
+            return PersonaMatch(persona=self.personas[self._exact[normalized]], confidence=1.0, exact=True)
+
+        query = frozenset(normalized.split())
+        candidates = set()
+        for token in query:
+            candidates |= self._postings.get(token, set())
+
+        best_index = None
+        best_score = 0.0
+        for i in sorted(candidates):
+            score = score_tokens(query, self._tokens[i])
+            if score > best_score:
+                best_index, best_score = i, score
+            elif score == best_score and self._closer(title, i, best_index):
+                best_index = i
+
+        if best_index is None or best_score < threshold:
+            return None
+
+        return PersonaMatch(persona=self.personas[best_index], confidence=round(best_score, 3), exact=False)
+
+
+    def _closer(self, title: str, i: int, j: int) -> bool:
+        """Break a token-score tie: whether persona i's title reads closer to title than j's"""
+        title = title.lower()
+        return (
+            SequenceMatcher(None, title, self.personas[i].get("persona_title", "").lower()).ratio()
+            > SequenceMatcher(None, title, self.personas[j].get("persona_title", "").lower()).ratio()
+        )
+
+
+_index_cache: "OrderedDict[str, PersonaIndex]" = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def get_persona_index(personas: List[dict]) -> PersonaIndex:
+    """
+    Get the index for a persona list, building it only the first time it is seen.
+
+    Args:
+        personas: Persona dicts from Step 7b (target_buyer_personas)
+
+    Returns:
+        Shared PersonaIndex
+    """
+    key = hashlib.sha256(json.dumps(personas, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is None:
+            index = PersonaIndex(personas)
+            _index_cache[key] = index
+            if len(_index_cache) > _INDEX_CACHE_SIZE:
+                _index_cache.popitem(last=False)
+        else:
+            _index_cache.move_to_end(key)
+        return index
@@ -0,0 +1,146 @@
+"""
+Prospect Batch
+Runs one vendor against many prospects. The vendor side (Phases 1-2) is built once:
+unless a fresh profile is stored, the first prospect runs alone and builds it, then
+the remaining prospects fan out across a bounded worker pool and reuse that profile,
+handed over in memory (see utils/vendor_store.batch_vendor_profile). A failing
+prospect is recorded and never aborts the batch.
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from models.workflow_input import BatchWorkflowInput, WorkflowInput
+from utils.vendor_store import vendor_store, batch_vendor_profile
+import config
+
+
+@dataclass
+class ProspectRunResult:
+    """Outcome of one prospect's run within a batch"""
+    prospect_domain: str
+    success: bool
+    elapsed_seconds: float
+    output: Any = None
+    error: Optional[str] = None
+
+
+def _run_one(run_prospect: Callable[[WorkflowInput], Any], workflow_input: WorkflowInput) -> ProspectRunResult:
+    started = time.monotonic()
+    try:
+        output = run_prospect(workflow_input)
+        return ProspectRunResult(
+            prospect_domain=workflow_input.prospect_domain,
+            success=True,
+            elapsed_seconds=round(time.monotonic() - started, 1),
+            output=output
+        )
+    except Exception as e:
+        return ProspectRunResult(
+            prospect_domain=workflow_input.prospect_domain,
+            success=False,
+            elapsed_seconds=round(time.monotonic() - started, 1),
+            error=str(e)
+        )
+
+
+def run_prospect_batch(
+    batch_input: BatchWorkflowInput,
+    run_prospect: Callable[[WorkflowInput], Any]
+) -> List[ProspectRunResult]:
+    """
+    Run the pipeline for every prospect in a batch, sharing the vendor phases.
+
+    Args:
+        batch_input: Vendor, prospects and batch options
+        run_prospect: Runs the pipeline for one prospect and returns its output;
+            raises on failure
+
+    Returns:
+        ProspectRunResult per prospect, in input order
+    """
+    workflow_inputs = batch_input.to_workflow_inputs()
+    total = len(workflow_inputs)
+    results: Dict[str, ProspectRunResult] = {}
+    print_lock = threading.Lock()
+
+    def report(result: ProspectRunResult) -> None:
+        results[result.prospect_domain] = result
+        with print_lock:
+            status = "✅" if result.success else f"❌ {result.error}"
+            print(f"🎯 [{len(results)}/{total}] {result.prospect_domain} ({result.elapsed_seconds}s) {status}")
+
+    with batch_vendor_profile(batch_input.vendor_domain) as shared:
+        if not batch_input.refresh_vendor:
+            shared.profile = vendor_store.get_fresh_profile(batch_input.vendor_domain)
+
+        # Vendor phases: the first prospect builds the vendor profile on its own. Whatever
+        # its outcome, the rest run in parallel next.
+        pending = list(workflow_inputs)
+        if shared.profile is None:
+            first = pending.pop(0)
+            print(f"🏗️  Building vendor profile for {batch_input.vendor_domain} with {first.prospect_domain}...")
+            report(_run_one(run_prospect, first))
+
+        # Prospect phases: fan out the rest. If the first run built no complete profile (it
+        # failed, or hit the deadline), each of them builds the vendor side itself.
+        if pending:
+            if shared.profile:
+                reuse = "vendor profile reused"
+                refresh_vendor = False
+            else:
+                reuse = "no vendor profile to reuse"
+                refresh_vendor = batch_input.refresh_vendor
+            max_workers = max(1, min(batch_input.max_workers or config.PROSPECT_BATCH_CONCURRENCY, len(pending)))
+            print(f"🚀 Running {len(pending)} prospects with {max_workers} workers ({reuse})...")
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        _run_one,
+                        run_prospect,
+                        workflow_input.model_copy(update={"refresh_vendor": refresh_vendor})
+                    )
+                    for workflow_input in pending
+                ]
+                for future in as_completed(futures):
+                    report(future.result())
+
+    succeeded = sum(result.success for result in results.values())
+    print(f"📦 Batch complete: {succeeded}/{total} prospects succeeded")
+
+    return [results[workflow_input.prospect_domain] for workflow_input in workflow_inputs]
+
+
+def summarize_batch(batch_input: BatchWorkflowInput, results: List[ProspectRunResult]) -> dict:
+    """
+    Summarize a batch for metadata / API responses.
+
+    Args:
+        batch_input: Batch input
+        results: Results from run_prospect_batch
+
+    Returns:
+        Dict with vendor, counts, and per-prospect status and output
+    """
+    return {
+        "vendor_domain": batch_input.vendor_domain,
+        "prospects": len(results),
+        "succeeded": sum(result.success for result in results),
+        "failed": sum(not result.success for result in results),
+        "results": [
+            {
+                "prospect_domain": result.prospect_domain,
+                "success": result.success,
+                "elapsed_seconds": result.elapsed_seconds,
+                "error": result.error,
+                "output": result.output
+            }
+            for result in results
+        ]
+    }
@@ -0,0 +1,184 @@
+"""
+Relevance Ranking
+Local BM25 ranking of vendor intelligence against a prospect. Steps 8a-8d use it to put
+only the offerings, case studies, proof points, etc. that match the prospect's pain
+points, industry and target personas into each prompt.
+
+Pure Python - vendor element lists are at most a few hundred short documents.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import config
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in",
+    "into", "is", "it", "its", "of", "on", "or", "our", "that", "the", "their", "this",
+    "to", "was", "we", "with", "you", "your"
+}
+
+# Vendor intelligence sections that are ranked (others, e.g. ICP personas, are kept whole)
+RANKED_SECTIONS = [
+    "offerings",
+    "case_studies",
+    "value_propositions",
+    "use_cases",
+    "differentiators",
+    "proof_points",
+    "customers"
+]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens, without stopwords.
+
+    Args:
+        text: Any text
+
+    Returns:
+        List of tokens
+    """
+    return [token for token in _TOKEN_PATTERN.findall((text or "").lower()) if token not in _STOPWORDS]
+
+
+def element_text(element: Any) -> str:
+    """
+    Flatten an extracted element (dict/list/str) into text, ignoring its sources.
+
+    Args:
+        element: Extracted element
+
+    Returns:
+        All string values joined by spaces
+    """
+    if isinstance(element, dict):
+        return " ".join(element_text(value) for key, value in element.items() if key != "sources")
+    if isinstance(element, list):
+        return " ".join(element_text(value) for value in element)
+    return str(element) if element is not None else ""
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed list of documents"""
+
+    def __init__(self, documents: List[str], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.doc_terms = [Counter(tokenize(doc)) for doc in documents]
+        self.doc_lengths = [sum(terms.values()) for terms in self.doc_terms]
+        self.avg_length = (sum(self.doc_lengths) / len(self.doc_lengths)) if self.doc_lengths else 0.0
+
+        doc_freq = Counter(term for terms in self.doc_terms for term in terms)
+        n = len(documents)
+        self.idf = {term: math.log(1 + (n - df + 0.5) / (df + 0.5)) for term, df in doc_freq.items()}
+
+    def scores(self, query: str) -> List[float]:
+        """
+        Score every document against a query.
+
+        Args:
+            query: Query text
+
+        Returns:
+            BM25 score per document, in document order
+        """
+        query_terms = set(tokenize(query))
+        scores = []
+        for terms, length in zip(self.doc_terms, self.doc_lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / self.avg_length) if self.avg_length else self.k1
+            score = 0.0
+            for term in query_terms:
+                tf = terms.get(term)
+                if tf:
+                    score += self.idf[term] * tf * (self.k1 + 1) / (tf + norm)
+            scores.append(score)
+        return scores
+
+
+def build_prospect_query(prospect_intel: Dict[str, Any], persona: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build the ranking query from what is known about the prospect.
+
+    Args:
+        prospect_intel: Prospect intelligence (company_profile, pain_points, target_buyer_personas)
+        persona: Optional persona the prompt is written for; its pains and goals are added
+
+    Returns:
+        Query text
+    """
+    profile = prospect_intel.get("company_profile") or {}
+    parts = [
+        profile.get("industry"),
+        profile.get("target_market"),
+        profile.get("what_they_do")
+    ]
+
+    for pain_point in prospect_intel.get("pain_points") or []:
+        parts.append(pain_point.get("description"))
+        parts.extend(pain_point.get("affected_personas") or [])
+
+    for target in prospect_intel.get("target_buyer_personas") or []:
+        parts.append(target.get("persona_title"))
+
+    if persona:
+        parts.append(element_text({
+            key: persona.get(key) for key in ("persona_title", "department", "pain_points", "goals")
+        }))
+
+    return " ".join(part for part in parts if part)
+
+
+def rank_elements(elements: List[Any], query: str, top_k: int) -> List[Any]:
+    """
+    Keep the top_k elements most relevant to the query.
+
+    Ties (including all-zero scores) keep the extraction order.
+
+    Args:
+        elements: Extracted elements of one type
+        query: Ranking query
+        top_k: Number of elements to keep
+
+    Returns:
+        Up to top_k elements, most relevant first
+    """
+    if len(elements) <= 1:
+        return list(elements)
+
+    scores = BM25Index([element_text(element) for element in elements]).scores(query)
+    ranked = sorted(range(len(elements)), key=lambda i: (-scores[i], i))
+    return [elements[i] for i in ranked[:top_k]]
+
+
+def select_relevant_vendor_intel(
+    vendor_intel: Dict[str, Any],
+    prospect_intel: Dict[str, Any],
+    persona: Optional[Dict[str, Any]] = None,
+    top_k: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Select the vendor intelligence most relevant to this prospect (and persona).
+
+    Args:
+        vendor_intel: Vendor intelligence package from the playbook summary
+        prospect_intel: Prospect intelligence package
+        persona: Optional target persona dict
+        top_k: Elements kept per ranked section (default: config.VENDOR_INTEL_TOP_K)
+
+    Returns:
+        Copy of vendor_intel with each ranked section reduced to its top_k elements
+    """
+    top_k = top_k or config.VENDOR_INTEL_TOP_K
+    query = build_prospect_query(prospect_intel, persona)
+
+    selected = dict(vendor_intel)
+    for section in RANKED_SECTIONS:
+        if isinstance(selected.get(section), list):
+            selected[section] = rank_elements(selected[section], query, top_k)
+    return selected
@@ -0,0 +1,199 @@
+"""
+Run Checkpoints
+Disk-backed checkpoints of pipeline runs: every step output is written to
+<RUN_CHECKPOINT_DIR>/<run_id>/ as soon as the step succeeds. Running again with the same
+run_id (python main.py --resume <run_id>, or "run_id" in the API input) restores those
+outputs and only runs the steps that failed or never ran. A run's checkpoint is removed
+once the run completes.
+"""
+
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Optional
+
+from agno.workflow.types import StepInput, StepOutput
+from pydantic import BaseModel
+
+from utils.workflow_helpers import get_workflow_option, to_json_content
+import config
+
+# Run ids become directory names
+RUN_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]+$")
+
+# Input fields that must match for a checkpoint to be resumed
+RUN_IDENTITY_FIELDS = ("vendor_domain", "prospect_domain")
+
+
+def new_run_id() -> str:
+    """
+    Generate a run id.
+
+    Returns:
+        Timestamp-based id (e.g., "20250101_120000_3fa2c1")
+    """
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+
+class RunCheckpoint:
+    """Step outputs of one run, one JSON file per completed step."""
+
+    def __init__(self, run_dir: str, run_id: str):
+        self.run_dir = run_dir
+        self.run_id = run_id
+
+    def load(self) -> Dict[str, StepOutput]:
+        """
+        Load the checkpointed step outputs.
+
+        Returns:
+            Dict mapping step name -> restored StepOutput (unreadable files are skipped)
+        """
+        outputs = {}
+        for filename in sorted(os.listdir(self.run_dir)) if os.path.isdir(self.run_dir) else []:
+            if not filename.endswith(".step.json"):
+                continue
+            try:
+                with open(os.path.join(self.run_dir, filename), "r") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            outputs[data["step_name"]] = StepOutput(
+                step_name=data["step_name"],
+                step_type=data.get("step_type") or "Step",
+                executor_name=data.get("executor_name"),
+                content=data["content"],
+                success=True
+            )
+        return outputs
+
+    def save(self, output: StepOutput) -> None:
+        """
+        Checkpoint a completed step's output.
+
+        Args:
+            output: Successful StepOutput (content must be JSON-serializable once pydantic
+                models are dumped)
+
+        Raises:
+            TypeError: If the content holds other values JSON can't store
+        """
+        serialized = json.dumps({
+            "step_name": output.step_name,
+            "step_type": output.step_type,
+            "executor_name": output.executor_name,
+            "completed_at": time.time(),
+            "content": to_json_content(output.content)
+        })
+        path = os.path.join(self.run_dir, f"{output.step_name}.step.json")
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(serialized)
+        os.replace(tmp_path, path)
+
+    def complete(self) -> None:
+        """Remove the checkpoint once the run has completed."""
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+
+
+class RunCheckpointStore:
+    """Stores one checkpoint directory per run id."""
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+
+    def open(self, run_id: str, workflow_input: dict) -> RunCheckpoint:
+        """
+        Open a run's checkpoint, creating it for a new run.
+
+        Args:
+            run_id: Run id
+            workflow_input: The run's workflow input (stored with a new checkpoint)
+
+        Returns:
+            RunCheckpoint
+
+        Raises:
+            ValueError: If the run id is invalid, or the checkpoint belongs to a run for
+                other domains
+        """
+        if not RUN_ID_PATTERN.match(run_id):
+            raise ValueError(f"Invalid run_id: {run_id}")
+
+        stored_input = self.load_input(run_id)
+        if stored_input is None:
+            run_dir = self._path(run_id)
+            os.makedirs(run_dir, exist_ok=True)
+            with open(os.path.join(run_dir, "run.json"), "w") as f:
+                json.dump({"run_id": run_id, "created_at": time.time(), "input": workflow_input}, f, indent=2)
+        else:
+            mismatched = [
+                field for field in RUN_IDENTITY_FIELDS
+                if stored_input.get(field) != workflow_input.get(field)
+            ]
+            if mismatched:
+                raise ValueError(f"Run {run_id} was checkpointed with a different {', '.join(mismatched)}")
+
+        return RunCheckpoint(self._path(run_id), run_id)
+
+    def load_input(self, run_id: str) -> Optional[dict]:
+        """
+        Load the workflow input a checkpointed run was started with.
+
+        Args:
+            run_id: Run id
+
+        Returns:
+            Workflow input dict, or None if there is no checkpoint for the run
+        """
+        if not RUN_ID_PATTERN.match(run_id):
+            return None
+        try:
+            with open(os.path.join(self._path(run_id), "run.json"), "r") as f:
+                return json.load(f)["input"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _path(self, run_id: str) -> str:
+        return os.path.join(self.store_dir, run_id)
+
+
+def get_run_checkpoint(step_input: StepInput) -> Optional[RunCheckpoint]:
+    """
+    Checkpoint for the run a step belongs to.
+
+    Uses the run_id from the workflow input; runs without one (e.g., API runs) get a new
+    id, which StepGraph returns to the caller as "run_id" in the pipeline's output.
+
+    Args:
+        step_input: StepInput of the workflow step running the pipeline graph
+
+    Returns:
+        RunCheckpoint, or None when checkpoints are disabled
+
+    Raises:
+        ValueError: If the run_id cannot be resumed (see RunCheckpointStore.open)
+    """
+    if run_checkpoints is None:
+        return None
+
+    workflow_input = step_input.input
+    if isinstance(workflow_input, BaseModel):
+        workflow_input = workflow_input.model_dump(mode="json")
+    workflow_input = dict(workflow_input or {})
+
+    run_id = get_workflow_option(step_input, "run_id")
+    if not run_id:
+        run_id = workflow_input["run_id"] = new_run_id()
+    print(f"💾 Checkpointing run {run_id} (resume with: python main.py --resume {run_id}, or \"run_id\" in the API input)")
+
+    return run_checkpoints.open(run_id, workflow_input)
+
+
+# Shared store instance (None when disabled)
+run_checkpoints = RunCheckpointStore(config.RUN_CHECKPOINT_DIR) if config.RUN_CHECKPOINTS_ENABLED else None
@@ -0,0 +1,155 @@
+"""
+Run Deadline
+Per-run latency budget (deadline_seconds run option / --deadline). Steps consult the
+run's deadline where they can trade quality for time, and degrade once the remaining
+budget is short, in a fixed order:
+
+    1. fewer_pages              Step 5 scrapes fewer pages per company
+    2. routed_extraction        Step 6 extractors only see pages routed to their element
+    3. skip_optional_extractors Step 6 skips non-essential extractors (e.g., proof points)
+    4. fewer_personas           Phase 4 writes emails / talk tracks for fewer personas
+    5. fast_model               Agent calls switch to the FAST_MODEL tier
+
+Each degradation applies once fewer than RUN_DEADLINE_DEGRADATIONS[name] seconds remain.
+Thresholds decrease along the order, so a tighter budget always adds the next
+degradation on top of the earlier ones. Once applied, a degradation stays on for the
+rest of the run, so concurrent steps (e.g., Steps 8b and 8c) decide alike.
+
+Like the run trace, the deadline lives in a context variable: it is opened by main.py (CLI
+runs) or by the StepGraph (API runs) and is visible to worker threads started with
+contextvars.copy_context(). Degradations are printed, added to the current tracing span
+and summarized in the run metadata.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.tracing import current_span
+import config
+
+# Degradations, in the order they are applied
+DEGRADATIONS = (
+    "fewer_pages",
+    "routed_extraction",
+    "skip_optional_extractors",
+    "fewer_personas",
+    "fast_model",
+)
+
+
+class RunDeadline:
+    """Latency budget of one run and the degradations applied to meet it"""
+
+    def __init__(self, deadline_seconds: float):
+        self.deadline_seconds = deadline_seconds
+        self.started_at = time.monotonic()
+        self.deadline_at = self.started_at + deadline_seconds
+        self._degraded: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (negative once it has passed)"""
+        return self.deadline_at - time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def degraded(self) -> List[str]:
+        """Degradations applied so far, in application order"""
+        with self._lock:
+            return [name for name in DEGRADATIONS if name in self._degraded]
+
+    def degrade(self, degradation: str, where: str) -> bool:
+        """
+        Decide whether a step should apply a degradation, and record it if so.
+
+        Args:
+            degradation: One of DEGRADATIONS
+            where: Step or agent applying it (recorded in the metadata)
+
+        Returns:
+            True if the degradation applies
+        """
+        remaining = self.remaining()
+        with self._lock:
+            record = self._degraded.get(degradation)
+            if record is None:
+                threshold = config.RUN_DEADLINE_DEGRADATIONS.get(degradation, 0)
+                if remaining >= threshold:
+                    return False
+                record = self._degraded[degradation] = {
+                    "degradation": degradation,
+                    "remaining_seconds": round(remaining, 1),
+                    "applied_to": []
+                }
+                print(f"⏱️  {remaining:.0f}s of {self.deadline_seconds:.0f}s deadline left - degrading: {degradation}")
+            if where not in record["applied_to"]:
+                record["applied_to"].append(where)
+
+        current_span().set(degraded=degradation)
+        return True
+
+    def summary(self) -> Dict[str, Any]:
+        """Deadline section of the run metadata"""
+        remaining = self.remaining()
+        with self._lock:
+            degraded = [self._degraded[name] for name in DEGRADATIONS if name in self._degraded]
+        return {
+            "deadline_seconds": self.deadline_seconds,
+            "elapsed_seconds": round(self.elapsed(), 1),
+            "met": remaining >= 0,
+            "degraded": degraded
+        }
+
+
+_current_deadline: ContextVar[Optional[RunDeadline]] = ContextVar("current_deadline", default=None)
+
+
+def current_deadline() -> Optional[RunDeadline]:
+    """The deadline of the run executing in this context, if it has one"""
+    return _current_deadline.get()
+
+
+def should_degrade(degradation: str, where: str) -> bool:
+    """
+    Whether the current run should apply a degradation (False for runs without a deadline).
+
+    Args:
+        degradation: One of DEGRADATIONS
+        where: Step or agent applying it
+
+    Returns:
+        True if the degradation applies
+    """
+    deadline = _current_deadline.get()
+    return deadline is not None and deadline.degrade(degradation, where)
+
+
+@contextmanager
+def run_deadline(deadline_seconds: Optional[float]) -> Iterator[Optional[RunDeadline]]:
+    """
+    Start a run's deadline clock for the code in this context.
+
+    Nested calls reuse the enclosing run's deadline.
+
+    Args:
+        deadline_seconds: Latency budget of the run; None or 0 means no deadline
+
+    Yields:
+        RunDeadline, or None when the run has no deadline
+    """
+    deadline = _current_deadline.get()
+    if deadline is not None or not deadline_seconds:
+        yield deadline
+        return
+
+    deadline = RunDeadline(deadline_seconds)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,448 @@
+"""
+Step Graph
+Runs workflow steps as a dependency graph: every step starts as soon as the steps it
+depends on have finished, instead of waiting for the whole previous block. A StepGraph
+runs inside an Agno workflow as a single Step executor.
+
+Steps keep reading their inputs the usual way (step_input.get_step_content(...) and
+get_parallel_step_content(step_input, block, step)): each step sees the outputs of the
+steps it depends on (directly or transitively), with grouped steps exposed as the
+Parallel block named by their group.
+
+With a checkpoint provider, successful step outputs are checkpointed as they complete and
+steps already in the run's checkpoint are restored instead of run again.
+
+Every step runs in a tracing span (utils/tracing.py) recording its wall time and how long
+it waited for a worker once ready.
+
+With a step memo, steps that declare memo_inputs are looked up by a fingerprint of those
+inputs before they run, and served from the memo (across runs) when it has their output.
+Outputs of runs that degraded to meet their deadline (utils/run_deadline.py) are not
+memoized.
+
+Each run has a cancellation token (utils/cancellation.py). A step stopping the run fires
+it, so running sibling steps skip their remaining agent and Firecrawl calls instead of
+finishing them; a token fired from outside (client disconnect, AgentOS cancel, deadline)
+stops the graph the same way.
+"""
+
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Protocol, Sequence, Set
+
+from agno.workflow.types import StepInput, StepOutput
+
+from utils.cancellation import CancellationToken, RunCancelled, cancellation_scope, current_token
+from utils.run_deadline import current_deadline, run_deadline
+from utils.tracing import span, trace_run
+from utils.workflow_helpers import get_workflow_option, to_json_content
+
+
+# Step content keys describing the run that produced an output (token usage, cache hits,
+# ...), not the output itself: left out of memo input fingerprints
+RUN_FIELDS = ("token_usage", "battle_card_base", "speculation", "deadline", "cancellation", "failed_steps", "run_id")
+
+
+def _memo_content(content: object) -> object:
+    content = to_json_content(content)
+    if isinstance(content, dict):
+        return {key: value for key, value in content.items() if key not in RUN_FIELDS}
+    return content
+
+
+@dataclass(frozen=True)
+class GraphStep:
+    """
+    One node of a StepGraph.
+
+    Attributes:
+        name: Step name (what later steps use to look up its output)
+        executor: Step function (StepInput -> StepOutput)
+        depends_on: Step or group names that must finish first
+        group: Parallel block name this step's output is exposed under
+            (e.g., "vendor_element_extraction")
+        memo_inputs: Everything the step's output depends on, as ancestor step or group
+            names, optionally with a key path into the step's content (e.g.,
+            "prioritize_urls.vendor_url_details"). Steps without memo_inputs are never
+            memoized.
+    """
+    name: str
+    executor: Callable[[StepInput], StepOutput]
+    depends_on: Sequence[str] = ()
+    group: Optional[str] = None
+    memo_inputs: Sequence[str] = ()
+
+
+class Checkpoint(Protocol):
+    """Checkpoint of one run's step outputs (e.g., utils.run_checkpoint.RunCheckpoint)"""
+
+    def load(self) -> Dict[str, StepOutput]: ...
+
+    def save(self, output: StepOutput) -> None: ...
+
+    def complete(self) -> None: ...
+
+
+class Memo(Protocol):
+    """Cross-run store of step outputs (e.g., utils.step_memo.StepMemo)"""
+
+    def make_key(self, step: GraphStep, inputs: Dict[str, object]) -> Optional[str]: ...
+
+    def load(self, step_name: str, key: str, step_input: StepInput) -> Optional[StepOutput]: ...
+
+    def save(self, step_name: str, key: str, output: StepOutput) -> None: ...
+
+
+class StepGraph:
+    """
+    Dependency-graph executor for workflow steps.
+
+    Usage:
+        graph = StepGraph("analysis", [
+            GraphStep("extract_offerings", extract_offerings, group="vendor_element_extraction"),
+            GraphStep("analyze_company", analyze_company_profile, group="prospect_context_analysis"),
+            GraphStep("identify_buyer_personas", identify_buyer_personas,
+                      depends_on=["vendor_element_extraction", "prospect_context_analysis"]),
+        ])
+        Step(name="analysis", executor=graph.run)
+
+    A step returning stop=True (e.g., via create_error_response) stops the graph: no new
+    steps are launched, the run's cancellation token fires so running steps stop at their
+    next agent or Firecrawl call, and the graph's output has stop=True.
+
+    checkpoints (optional) returns the Checkpoint for a run from the graph's StepInput.
+    Successful steps are saved to it as they complete, steps it already holds are skipped,
+    and it is completed (cleared) once every step has succeeded. Steps that fail without
+    stopping the run (success=False, stop=False) are listed under "failed_steps" in the
+    graph's content and keep the checkpoint; neither they nor the steps depending on them
+    are saved, so a resume reruns them. The graph's content includes the run's id as
+    "run_id", including for runs that were given a new one (e.g., API runs without a
+    run_id).
+
+    memo (optional) serves steps with memo_inputs from earlier runs: it returns a StepOutput
+    (executor_type "memo") for the step's resolved inputs, or None to run the step, whose
+    successful output is then stored.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        steps: List[GraphStep],
+        max_workers: Optional[int] = None,
+        checkpoints: Optional[Callable[[StepInput], Optional[Checkpoint]]] = None,
+        memo: Optional[Memo] = None
+    ):
+        self.name = name
+        self.steps = steps
+        self.max_workers = max_workers or len(steps)
+        self.checkpoints = checkpoints
+        self.memo = memo
+        self._by_name = {step.name: step for step in steps}
+
+        if len(self._by_name) != len(steps):
+            raise ValueError(f"StepGraph '{name}' has duplicate step names")
+
+        self._groups: Dict[str, List[str]] = {}
+        for step in steps:
+            if step.group:
+                if step.group in self._by_name:
+                    raise ValueError(f"StepGraph '{name}': group '{step.group}' clashes with a step name")
+                self._groups.setdefault(step.group, []).append(step.name)
+
+        self._deps: Dict[str, Set[str]] = {step.name: self._resolve(step) for step in steps}
+        self._ancestors: Dict[str, List[str]] = {}
+        self._check_acyclic()
+        self._check_memo_inputs()
+
+    def _resolve(self, step: GraphStep) -> Set[str]:
+        """Expand group names in depends_on to their member steps"""
+        deps = set()
+        for dep in step.depends_on:
+            if dep in self._by_name:
+                deps.add(dep)
+            elif dep in self._groups:
+                deps.update(self._groups[dep])
+            else:
+                raise ValueError(f"StepGraph '{self.name}': '{step.name}' depends on unknown step '{dep}'")
+        return deps
+
+    def _check_acyclic(self) -> None:
+        """Compute transitive ancestors per step (in declaration order), rejecting cycles"""
+        visiting: Set[str] = set()
+
+        def ancestors(name: str) -> Set[str]:
+            if name in self._ancestors:
+                return set(self._ancestors[name])
+            if name in visiting:
+                raise ValueError(f"StepGraph '{self.name}' has a dependency cycle through '{name}'")
+            visiting.add(name)
+            found = set()
+            for dep in self._deps[name]:
+                found.add(dep)
+                found |= ancestors(dep)
+            visiting.discard(name)
+            self._ancestors[name] = [step.name for step in self.steps if step.name in found]
+            return found
+
+        for step in self.steps:
+            ancestors(step.name)
+
+    def _check_memo_inputs(self) -> None:
+        """Memo inputs must name steps the step already sees (its ancestors)"""
+        for step in self.steps:
+            for memo_input in step.memo_inputs:
+                source = memo_input.split(".")[0]
+                members = self._groups.get(source, [source])
+                if not all(member in self._ancestors[step.name] for member in members):
+                    raise ValueError(
+                        f"StepGraph '{self.name}': '{step.name}' memo input '{memo_input}' is not one of its dependencies"
+                    )
+
+    def _resolve_memo_inputs(self, step: GraphStep, outputs: Dict[str, StepOutput]) -> Dict[str, object]:
+        """
+        Values of a step's memo inputs (groups resolve to {member: content}).
+
+        Contents are compared as stored (pydantic models dumped) and without RUN_FIELDS, so
+        an input served from the memo or a checkpoint fingerprints the same as a fresh one.
+        """
+        inputs = {}
+        for memo_input in step.memo_inputs:
+            source, *path = memo_input.split(".")
+            if source in self._groups:
+                value = {member: _memo_content(outputs[member].content) for member in self._groups[source]}
+            else:
+                value = _memo_content(outputs[source].content)
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            inputs[memo_input] = value
+        return inputs
+
+    def dependencies(self, name: str) -> Set[str]:
+        """Direct dependencies of a step (group names expanded)"""
+        return set(self._deps[name])
+
+    def _visible_outputs(self, names: List[str], outputs: Dict[str, StepOutput]) -> Dict[str, StepOutput]:
+        """Outputs of the given steps, with grouped steps wrapped in their Parallel block"""
+        visible: Dict[str, StepOutput] = {}
+        for name in names:
+            group = self._by_name[name].group
+            if not group:
+                visible[name] = outputs[name]
+                continue
+            if group not in visible:
+                visible[group] = StepOutput(step_name=group, step_type="Parallel", content=None, steps=[])
+            visible[group].steps.append(outputs[name])
+        return visible
+
+    def _step_input(self, step: GraphStep, step_input: StepInput, outputs: Dict[str, StepOutput]) -> StepInput:
+        previous_outputs = dict(step_input.previous_step_outputs or {})
+        previous_outputs.update(self._visible_outputs(self._ancestors[step.name], outputs))
+
+        direct = [name for name in self._ancestors[step.name] if name in self._deps[step.name]]
+        previous_content = outputs[direct[-1]].content if direct else step_input.previous_step_content
+
+        return StepInput(
+            input=step_input.input,
+            previous_step_content=previous_content,
+            previous_step_outputs=previous_outputs,
+            additional_data=step_input.additional_data,
+            workflow_session=step_input.workflow_session
+        )
+
+    def _execute(
+        self,
+        step: GraphStep,
+        step_input: StepInput,
+        timings: Dict[str, tuple],
+        memo_inputs: Optional[Dict[str, object]] = None,
+        ready_at: Optional[float] = None
+    ) -> StepOutput:
+        started = time.monotonic()
+        with span(f"step:{step.name}", kind="step", group=step.group) as step_span:
+            # Time the step was ready but waiting for a worker
+            step_span.set(queue_wait_ms=round((started - ready_at) * 1000, 1) if ready_at else None)
+
+            memo_key = self.memo.make_key(step, memo_inputs) if memo_inputs is not None else None
+            output = self.memo.load(step.name, memo_key, step_input) if memo_key else None
+            step_span.set(memo_hit=output is not None if memo_key else None)
+
+            if output is None:
+                try:
+                    output = step.executor(step_input)
+                except RunCancelled as e:
+                    output = StepOutput(content={"error": f"{step.name} cancelled: {str(e)}"}, success=False, stop=True)
+                except Exception as e:
+                    output = StepOutput(content={"error": f"{step.name} failed: {str(e)}"}, success=False, stop=True)
+
+                # Outputs of runs degraded for their deadline are not full fidelity
+                deadline = current_deadline()
+                if memo_key and output.success and not output.stop and not (deadline and deadline.degraded):
+                    try:
+                        self.memo.save(step.name, memo_key, output)
+                    except (OSError, TypeError, ValueError) as e:
+                        print(f"⚠️  {self.name}: could not memoize {step.name}: {str(e)}")
+
+            step_span.set(success=output.success, stop=output.stop)
+
+        output.step_name = step.name
+        output.step_type = output.step_type or "Step"
+        output.executor_name = getattr(step.executor, "__name__", None)
+        timings[step.name] = (started, time.monotonic())
+        return output
+
+    def run(self, step_input: StepInput, run_context=None) -> StepOutput:
+        """
+        Run every step in the graph, each as soon as its dependencies are done.
+
+        Args:
+            step_input: StepInput of the workflow Step wrapping this graph
+            run_context: Agno RunContext (passed by the workflow); cancelling its run
+                through AgentOS cancels the graph
+
+        Returns:
+            StepOutput whose content is the last step's content and whose steps are
+            the step outputs (grouped steps wrapped in their Parallel block)
+        """
+        run_id = get_workflow_option(step_input, "run_id")
+        # Traced, timed and cancelled as part of the caller's run, or as a run of its own (e.g., API runs)
+        with trace_run(run_id), \
+                run_deadline(get_workflow_option(step_input, "deadline_seconds")), \
+                cancellation_scope(run_id, agno_run_id=getattr(run_context, "run_id", None)), \
+                span(f"graph:{self.name}", kind="graph"):
+            return self._run(step_input)
+
+    def _run(self, step_input: StepInput) -> StepOutput:
+        outputs: Dict[str, StepOutput] = {}
+        timings: Dict[str, tuple] = {}
+        try:
+            checkpoint = self.checkpoints(step_input) if self.checkpoints else None
+        except ValueError as e:
+            print(f"🛑 {self.name}: {str(e)}")
+            return StepOutput(step_name=self.name, content={"error": str(e)}, success=False, stop=True)
+
+        if checkpoint:
+            outputs.update({name: output for name, output in checkpoint.load().items() if name in self._by_name})
+            if outputs:
+                print(f"♻️  {self.name}: resuming - {len(outputs)}/{len(self.steps)} steps restored from checkpoint")
+
+        pending = [step.name for step in self.steps if step.name not in outputs]
+        running = {}
+        tainted: Set[str] = set()
+        stopped_by = None
+        graph_started = time.monotonic()
+        token = current_token()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                while pending or running:
+                    if stopped_by is None and not token.cancelled:
+                        for name in [n for n in pending if self._deps[n].issubset(outputs)]:
+                            pending.remove(name)
+                            step = self._by_name[name]
+                            # copy_context keeps per-run context (e.g., tracing) inside the worker threads
+                            future = executor.submit(
+                                contextvars.copy_context().run,
+                                self._execute,
+                                step,
+                                self._step_input(step, step_input, outputs),
+                                timings,
+                                self._resolve_memo_inputs(step, outputs) if self.memo and step.memo_inputs else None,
+                                time.monotonic()
+                            )
+                            running[future] = name
+
+                    if not running:
+                        break
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        outputs[name] = future.result()
+                        # Steps that saw a failed step's fallback output rerun with it on resume
+                        if not outputs[name].success or tainted.intersection(self._ancestors[name]):
+                            tainted.add(name)
+                        if checkpoint and name not in tainted and not outputs[name].stop:
+                            try:
+                                checkpoint.save(outputs[name])
+                            except (OSError, TypeError, ValueError) as e:
+                                print(f"⚠️  {self.name}: could not checkpoint {name}: {str(e)}")
+                        if outputs[name].stop and stopped_by is None:
+                            stopped_by = name
+                            print(f"🛑 {self.name}: {name} stopped the run - not starting {len(pending)} remaining steps")
+                            # Running siblings skip their remaining LLM / Firecrawl calls
+                            token.cancel(f"{name} stopped the run")
+            except KeyboardInterrupt:
+                # Running steps stop at their next checkpoint while the executor shuts down
+                token.cancel("interrupted")
+                raise
+
+        self._print_timings(timings, graph_started)
+        if token.cancelled:
+            self._print_cancellation(token, pending)
+
+        memoized = [name for name in timings if outputs[name].executor_type == "memo"]
+        if memoized:
+            print(f"🧠 {self.name}: {len(memoized)} steps served from step memo ({', '.join(memoized)})")
+
+        # Cancelled from outside (disconnect, deadline, ...) before every step started
+        stopped = stopped_by is not None or bool(pending)
+
+        completed = [step.name for step in self.steps if step.name in outputs]
+        # Steps that failed without stopping the run (e.g., battle cards falling back to empty)
+        failed = {
+            name: self._error(outputs[name]) for name in completed
+            if not outputs[name].success and not outputs[name].stop
+        }
+
+        if checkpoint and not stopped and not failed:
+            checkpoint.complete()
+        elif checkpoint and failed:
+            print(f"💾 {self.name}: {len(failed)} steps failed ({', '.join(failed)}) - keeping checkpoint of run {checkpoint.run_id}")
+
+        last_content = outputs[completed[-1]].content if completed else None
+        if stopped_by:
+            last_content = outputs[stopped_by].content
+        elif stopped:
+            last_content = {"error": f"{self.name} cancelled: {token.reason}"}
+        if isinstance(last_content, dict):
+            if failed:
+                last_content = {**last_content, "failed_steps": failed}
+            if checkpoint:
+                # The caller (CLI or API) resumes the run with this id
+                last_content = {**last_content, "run_id": checkpoint.run_id}
+        if token.cancelled and isinstance(last_content, dict):
+            # What was cancelled and the cost avoided, for the run's caller (CLI or API)
+            last_content = {**last_content, "cancellation": token.summary()}
+
+        return StepOutput(
+            step_name=self.name,
+            content=last_content,
+            steps=list(self._visible_outputs(completed, outputs).values()),
+            success=not stopped,
+            stop=stopped
+        )
+
+    @staticmethod
+    def _error(output: StepOutput) -> str:
+        """Error message of a failed step output"""
+        if isinstance(output.content, dict) and output.content.get("error"):
+            return str(output.content["error"])
+        return output.error or "step reported failure"
+
+    def _print_cancellation(self, token: CancellationToken, not_started: List[str]) -> None:
+        for name in not_started:
+            token.record_skipped(f"step:{name}")
+        avoided = token.summary()["avoided"]
+        print(f"🛑 {self.name}: cancelled ({token.reason}) - skipped {len(not_started)} steps, "
+              f"{avoided['agent_calls']} agent calls (~{avoided['estimated_tokens']:,} tokens), "
+              f"{avoided['scrape_pages']} scrape pages")
+
+    def _print_timings(self, timings: Dict[str, tuple], graph_started: float) -> None:
+        if not timings:
+            return
+        total = max(end for _, end in timings.values()) - graph_started
+        busy = sum(end - start for start, end in timings.values())
+        print(f"⏱️  {self.name}: {len(timings)} steps in {total:.1f}s "
+              f"({busy:.1f}s of step time, {busy / max(total, 1e-9):.1f}x overlap)")
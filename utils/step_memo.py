@@ -0,0 +1,205 @@
+"""
+Step Memo
+Disk-backed memoization of whole pipeline steps across runs. A step declares the inputs
+its output depends on (GraphStep.memo_inputs); its output is stored under a fingerprint
+of those resolved inputs, the source of the step's module, the config of the agents it
+calls and the pipeline config. A later run whose fingerprint matches gets the stored
+StepOutput back without running the step - no prompt building, no agent calls.
+
+Unlike the LLM response cache (which skips single agent calls with identical prompts),
+a memo hit skips the step entirely. Token budget state is not part of the fingerprint:
+a memoized output is reused even if the run has less budget left than when it was stored.
+
+Invalidation:
+    - Any change to a step's inputs, module source, agents or config misses the memo
+    - STEP_MEMO_EXCLUDE_STEPS never memoizes the listed steps
+    - refresh_steps (run option / --refresh-steps) reruns the listed steps ("all" for
+      every step) and stores the fresh outputs
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+from agno.agent import Agent
+from agno.workflow.types import StepInput, StepOutput
+
+from utils.lazy_agent import LazyAgent
+from utils.llm_cache import get_agent_fingerprint
+from utils.workflow_helpers import get_workflow_option, to_json_content
+import config
+
+# Bump to invalidate every stored step output (e.g., when the stored format changes)
+STEP_MEMO_VERSION = "2"
+
+# Marks StepOutputs served from the memo
+MEMO_EXECUTOR_TYPE = "memo"
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _config_fingerprint() -> str:
+    """Hash of the pipeline config (upper-case settings, API keys excluded)"""
+    settings = {
+        name: value for name, value in vars(config).items()
+        if name.isupper() and "API_KEY" not in name
+    }
+    return _sha256(json.dumps(settings, sort_keys=True, default=str))
+
+
+class StepMemo:
+    """Stores one JSON file per (step, fingerprint) under <store_dir>/<step name>/."""
+
+    def __init__(self, store_dir: str, ttl_hours: int, exclude_steps: List[str]):
+        self.store_dir = store_dir
+        self.ttl_seconds = ttl_hours * 3600
+        self.exclude_steps = set(exclude_steps)
+        self._lock = threading.Lock()
+        self._module_fingerprints: Dict[str, str] = {}
+        self._config_fingerprint = _config_fingerprint()
+
+    def make_key(self, step, inputs: Dict[str, object]) -> Optional[str]:
+        """
+        Fingerprint of a step run.
+
+        Args:
+            step: GraphStep being run
+            inputs: The step's resolved memo inputs (memo input -> value)
+
+        Returns:
+            Hex digest key, or None if the step is excluded from memoization
+        """
+        if step.name in self.exclude_steps:
+            return None
+
+        parts = [
+            STEP_MEMO_VERSION,
+            step.name,
+            self._module_fingerprint(step.executor),
+            self._config_fingerprint,
+            _sha256(json.dumps(inputs, sort_keys=True, default=str)),
+        ]
+        return _sha256("|".join(parts))
+
+    def load(self, step_name: str, key: str, step_input: StepInput) -> Optional[StepOutput]:
+        """
+        Load a memoized step output.
+
+        Args:
+            step_name: Step name
+            key: Key from make_key()
+            step_input: The step's StepInput (for the run's refresh_steps)
+
+        Returns:
+            StepOutput with executor_type "memo", or None on a miss, expiry or refresh
+        """
+        refresh_steps = get_workflow_option(step_input, "refresh_steps") or []
+        if step_name in refresh_steps or "all" in refresh_steps:
+            return None
+
+        try:
+            with open(self._path(step_name, key), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            return None
+
+        content = entry.get("content")
+        if isinstance(content, dict):
+            # Token usage belongs to the run that produced the output, not this one
+            content.pop("token_usage", None)
+
+        return StepOutput(
+            step_name=step_name,
+            step_type=entry.get("step_type") or "Step",
+            executor_type=MEMO_EXECUTOR_TYPE,
+            content=content,
+            success=True
+        )
+
+    def save(self, step_name: str, key: str, output: StepOutput) -> None:
+        """
+        Memoize a successful step output.
+
+        Args:
+            step_name: Step name
+            key: Key from make_key()
+            output: StepOutput (content must be JSON-serializable once pydantic models
+                are dumped)
+
+        Raises:
+            TypeError: If the content holds other values JSON can't store
+        """
+        serialized = json.dumps({
+            "created_at": time.time(),
+            "step_type": output.step_type,
+            "content": to_json_content(output.content)
+        })
+        step_dir = os.path.join(self.store_dir, step_name)
+        os.makedirs(step_dir, exist_ok=True)
+        path = self._path(step_name, key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(serialized)
+        os.replace(tmp_path, path)
+
+    def _module_fingerprint(self, executor) -> str:
+        """Hash of the executor's module source and the agents defined in it"""
+        module_name = getattr(executor, "__module__", None) or ""
+        with self._lock:
+            if module_name in self._module_fingerprints:
+                return self._module_fingerprints[module_name]
+
+        module = sys.modules.get(module_name)
+        try:
+            source = inspect.getsource(module) if module else ""
+        except (OSError, TypeError):
+            source = getattr(executor, "__qualname__", "")
+        agents = sorted(
+            f"{name}:{get_agent_fingerprint(value)}"
+            for name, value in vars(module).items()
+            if isinstance(value, (Agent, LazyAgent))
+        ) if module else []
+
+        fingerprint = _sha256("|".join([module_name, _sha256(source)] + agents))
+        with self._lock:
+            self._module_fingerprints[module_name] = fingerprint
+        return fingerprint
+
+    def _path(self, step_name: str, key: str) -> str:
+        return os.path.join(self.store_dir, step_name, f"{key}.json")
+
+
+def summarize_step_memo(step_results: List[StepOutput]) -> List[str]:
+    """
+    Steps of a run that were served from the step memo.
+
+    Args:
+        step_results: WorkflowRunOutput.step_results (nested step outputs are searched)
+
+    Returns:
+        Step names, in pipeline order
+    """
+    served = []
+    for output in step_results or []:
+        if output.executor_type == MEMO_EXECUTOR_TYPE:
+            served.append(output.step_name)
+        served.extend(summarize_step_memo(output.steps))
+    return served
+
+
+# Shared memo instance (None when disabled)
+step_memo = StepMemo(
+    store_dir=config.STEP_MEMO_DIR,
+    ttl_hours=config.STEP_MEMO_TTL_HOURS,
+    exclude_steps=config.STEP_MEMO_EXCLUDE_STEPS
+) if config.STEP_MEMO_ENABLED else None
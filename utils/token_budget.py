@@ -0,0 +1,286 @@
+"""
+Token Budget
+Estimates prompt tokens for every agent call in Steps 3-8 and enforces a per-run token
+budget with per-step prompt limits. When a prompt is over its limit, content is dropped
+in a fixed order: lowest-priority scraped pages first, then `sources` excerpts (for the
+intelligence package, see utils/context_compiler.py).
+
+Each step reports its usage under the "token_usage" key of its output. Later steps sum
+those reports to see how much of the run budget is left, and main.py copies them into
+the run metadata.
+"""
+
+import copy
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.workflow.types import StepInput
+
+import config
+
+# Rough characters-per-token ratio for English web content
+CHARS_PER_TOKEN = 4
+
+# How combine_pages labels and separates pages in a prompt (fit_pages counts both)
+PAGE_LABEL = "URL: {url}\n\n"
+PAGE_SEPARATOR = "\n\n---\n\n"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token estimate for a prompt.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Estimated token count
+    """
+    return len(text or "") // CHARS_PER_TOKEN + 1
+
+
+def _collect_token_usage(step_outputs) -> List[Dict[str, Any]]:
+    """Collect "token_usage" reports from step outputs, including Parallel sub-steps"""
+    usage = []
+    for step_output in step_outputs:
+        content = getattr(step_output, "content", None)
+        if isinstance(content, dict) and isinstance(content.get("token_usage"), dict):
+            usage.append(content["token_usage"])
+        usage.extend(_collect_token_usage(getattr(step_output, "steps", None) or []))
+    return usage
+
+
+def get_run_token_usage(step_input: StepInput) -> List[Dict[str, Any]]:
+    """
+    Get the token usage reports of all steps that ran before this one.
+
+    Args:
+        step_input: StepInput object
+
+    Returns:
+        List of per-step usage dicts
+    """
+    return _collect_token_usage((step_input.previous_step_outputs or {}).values())
+
+
+def summarize_token_usage(step_outputs) -> Dict[str, Any]:
+    """
+    Build the per-step token usage section of the run metadata.
+
+    Args:
+        step_outputs: Workflow step results (e.g., WorkflowRunOutput.step_results)
+
+    Returns:
+        Dict with run budget, total prompt tokens and per-step usage
+    """
+    steps = {usage["step"]: usage for usage in _collect_token_usage(step_outputs or [])}
+    return {
+        "run_budget": config.RUN_TOKEN_BUDGET,
+        "prompt_tokens": sum(usage.get("prompt_tokens", 0) for usage in steps.values()),
+        "steps": steps
+    }
+
+
+def strip_source_excerpts(data: Any) -> Any:
+    """
+    Return a copy of data with the excerpt removed from every `sources` entry.
+
+    Args:
+        data: Nested dicts/lists of extracted elements
+
+    Returns:
+        Copy of data without source excerpts
+    """
+    data = copy.deepcopy(data)
+
+    def _strip(node):
+        if isinstance(node, dict):
+            for source in node.get("sources") or []:
+                if isinstance(source, dict):
+                    source.pop("excerpt", None)
+            for value in node.values():
+                _strip(value)
+        elif isinstance(node, list):
+            for item in node:
+                _strip(item)
+
+    _strip(data)
+    return data
+
+
+def order_pages_by_priority(pages: Dict[str, str], url_details: Optional[List[Any]]) -> List[str]:
+    """
+    Order page URLs from highest to lowest priority using Step 4's URL details.
+
+    Args:
+        pages: Dict mapping URL -> content
+        url_details: PrioritizedURL models or dicts (priority 1 = highest)
+
+    Returns:
+        URLs of pages, highest priority first (unranked pages last, in scrape order)
+    """
+    priorities = {}
+    for detail in url_details or []:
+        url = detail.get("url") if isinstance(detail, dict) else getattr(detail, "url", None)
+        priority = detail.get("priority") if isinstance(detail, dict) else getattr(detail, "priority", None)
+        if url:
+            priorities[url] = priority if isinstance(priority, int) else 10
+
+    scrape_order = {url: index for index, url in enumerate(pages)}
+    return sorted(pages, key=lambda url: (priorities.get(url, 11), scrape_order[url]))
+
+
+class StepTokenBudget:
+    """
+    Token limit and usage for one step's prompts.
+
+    The limit for each prompt is the step's limit from config.STEP_TOKEN_LIMITS, capped
+    by what is left of config.RUN_TOKEN_BUDGET when the step starts. Parallel sibling
+    steps start from the same remaining budget, so a run can overshoot by at most one
+    parallel block.
+
+    Usage:
+        budget = StepTokenBudget(step_input, "analyze_company")
+        pages = budget.fit_pages(prospect_content, url_details, overhead=prompt_prefix)
+        prompt = budget.record(f"{prompt_prefix}{combine(pages)}")
+        ...
+        return StepOutput(content={..., "token_usage": budget.usage()})
+    """
+
+    def __init__(self, step_input: StepInput, step_name: str):
+        self.step_name = step_name
+        step_limit = config.STEP_TOKEN_LIMITS.get(step_name, config.DEFAULT_STEP_TOKEN_LIMIT)
+
+        used = sum(usage.get("prompt_tokens", 0) for usage in get_run_token_usage(step_input))
+        remaining = config.RUN_TOKEN_BUDGET - used
+
+        # Never shrink a prompt below the floor, even when the run budget is spent
+        self.limit = max(min(step_limit, remaining), config.MIN_PROMPT_TOKENS)
+        self.run_budget_exhausted = remaining < step_limit
+
+        self.prompt_tokens = 0
+        self.prompts = 0
+        self.dropped_pages: List[str] = []
+        self.over_limit = False
+        self._lock = threading.Lock()
+
+    def fit_pages(
+        self,
+        pages: Dict[str, str],
+        url_details: Optional[List[Any]] = None,
+        overhead: str = ""
+    ) -> Dict[str, str]:
+        """
+        Drop the lowest-priority pages until the pages fit the prompt limit.
+
+        The highest-priority page is always kept (truncated if it alone is too large).
+
+        Args:
+            pages: Dict mapping URL -> page content
+            url_details: Step 4 URL details used to rank pages
+            overhead: Rest of the prompt, counted against the limit
+
+        Returns:
+            Pages that fit, in their original order
+        """
+        available = self.limit - estimate_tokens(overhead)
+        # Each page's content plus the label and separator combine_pages adds
+        page_cost = {
+            url: estimate_tokens(content) + estimate_tokens(PAGE_LABEL.format(url=url) + PAGE_SEPARATOR)
+            for url, content in pages.items()
+        }
+
+        if sum(page_cost.values()) <= available:
+            return pages
+
+        kept = set()
+        total = 0
+        ranked = order_pages_by_priority(pages, url_details)
+        for url in ranked:
+            if not kept or total + page_cost[url] <= available:
+                kept.add(url)
+                total += page_cost[url]
+
+        dropped = [url for url in ranked if url not in kept]
+        with self._lock:
+            self.dropped_pages.extend(dropped)
+
+        print(f"✂️  {self.step_name}: over {self.limit:,} token limit - dropped {len(dropped)} lowest-priority pages")
+
+        fitted = {url: content for url, content in pages.items() if url in kept}
+        if total > available:
+            top_url = ranked[0]
+            max_chars = max(available, 0) * CHARS_PER_TOKEN
+            fitted[top_url] = fitted[top_url][:max_chars]
+        return fitted
+
+    def record(self, prompt: str) -> str:
+        """
+        Count a prompt against this step's usage.
+
+        Args:
+            prompt: Final prompt sent to the agent
+
+        Returns:
+            The prompt, unchanged
+        """
+        tokens = estimate_tokens(prompt)
+        with self._lock:
+            self.prompt_tokens += tokens
+            self.prompts += 1
+            if tokens > self.limit:
+                self.over_limit = True
+                print(f"⚠️  {self.step_name}: prompt is ~{tokens:,} tokens, over its {self.limit:,} token limit")
+        return prompt
+
+    def usage(self) -> Dict[str, Any]:
+        """
+        Usage report for the step output's "token_usage" key.
+
+        Returns:
+            Dict with estimated prompt tokens, limit and what was dropped
+        """
+        return {
+            "step": self.step_name,
+            "prompt_tokens": self.prompt_tokens,
+            "prompts": self.prompts,
+            "limit": self.limit,
+            "run_budget_exhausted": self.run_budget_exhausted,
+            "dropped_pages": self.dropped_pages,
+            "over_limit": self.over_limit
+        }
+
+
+def combine_pages(pages: Dict[str, str]) -> str:
+    """
+    Combine pages into one prompt body with URL labels.
+
+    Args:
+        pages: Dict mapping URL -> page content
+
+    Returns:
+        Pages labelled with PAGE_LABEL, joined with PAGE_SEPARATOR
+    """
+    return PAGE_SEPARATOR.join(PAGE_LABEL.format(url=url) + content for url, content in pages.items())
+
+
+def fit_pages_and_record(
+    budget: StepTokenBudget,
+    pages: Dict[str, str],
+    url_details: Optional[List[Any]],
+    build_prompt
+) -> Tuple[Dict[str, str], str]:
+    """
+    Fit pages to the budget and build + record the prompt in one call.
+
+    Args:
+        budget: StepTokenBudget of the calling step
+        pages: Dict mapping URL -> page content
+        url_details: Step 4 URL details used to rank pages
+        build_prompt: Function turning a {url: content} dict into the prompt
+
+    Returns:
+        Tuple of (pages used, prompt)
+    """
+    fitted = budget.fit_pages(pages, url_details, overhead=build_prompt({}))
+    return fitted, budget.record(build_prompt(fitted))
@@ -0,0 +1,301 @@
+"""
+Tracing
+Lightweight per-run tracing spans for step executors and agent calls. Each span records
+wall time plus attributes such as queue wait, tokens, model, cache hits and retries.
+
+A run's trace is collected in memory (trace_run) and exported as JSON (RunTrace.save,
+written next to metadata.json for CLI runs) and, when OTLP_TRACES_ENDPOINT is set, sent
+to an OpenTelemetry collector as OTLP/HTTP JSON. The current trace and span live in
+context variables, so worker threads started with contextvars.copy_context() (StepGraph,
+persona generation, prospect batches) record into their run's trace.
+
+Code outside a traced run gets a no-op span, so instrumented helpers work unchanged.
+"""
+
+import json
+import math
+import threading
+import time
+import urllib.request
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+import config
+
+
+class Span:
+    """One timed operation (a step, an agent call, ...) within a run's trace"""
+
+    def __init__(self, name: str, kind: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.attributes = {key: value for key, value in attributes.items() if value is not None}
+        self.start = time.time()
+        self.end: Optional[float] = None
+        self.status = "ok"
+        self.error: Optional[str] = None
+
+    def set(self, **attributes) -> None:
+        """Set span attributes (None values are ignored)"""
+        self.attributes.update({key: value for key, value in attributes.items() if value is not None})
+
+    def add(self, name: str, value: float) -> None:
+        """Add to a numeric span attribute (e.g., retries, queue_wait_ms)"""
+        self.attributes[name] = self.attributes.get(name, 0) + value
+
+    @property
+    def duration_ms(self) -> float:
+        return round(((self.end or time.time()) - self.start) * 1000, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes
+        }
+
+
+class _NoOpSpan(Span):
+    """Span used outside a traced run - records nothing"""
+
+    def __init__(self):
+        super().__init__("noop", "internal", "", None, {})
+
+    def set(self, **attributes) -> None:
+        pass
+
+    def add(self, name: str, value: float) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoOpSpan()
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percentile / 100 * len(ordered)) - 1)]
+
+
+class RunTrace:
+    """All spans recorded for one run"""
+
+    def __init__(self, run_id: Optional[str] = None):
+        self.run_id = run_id
+        self.trace_id = uuid.uuid4().hex
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def record(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Latency per span name, slowest total first.
+
+        Returns:
+            Dict mapping span name -> {kind, count, total_ms, p50_ms, p95_ms}
+        """
+        by_name: Dict[str, List[Span]] = {}
+        with self._lock:
+            for span in self.spans:
+                by_name.setdefault(span.name, []).append(span)
+
+        summary = {}
+        for name, spans in by_name.items():
+            durations = [span.duration_ms for span in spans]
+            summary[name] = {
+                "kind": spans[0].kind,
+                "count": len(spans),
+                "total_ms": round(sum(durations), 1),
+                "p50_ms": _percentile(durations, 50),
+                "p95_ms": _percentile(durations, 95)
+            }
+        return dict(sorted(summary.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            spans = [span.to_dict() for span in sorted(self.spans, key=lambda span: span.start)]
+        return {
+            "run_id": self.run_id,
+            "trace_id": self.trace_id,
+            "spans": spans,
+            "summary": self.summary()
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Write the trace as JSON.
+
+        Args:
+            path: Output file (e.g., <run_dir>/trace.json)
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP/HTTP JSON payload (ExportTraceServiceRequest) for the trace"""
+        def attribute(key: str, value: Any) -> Dict[str, Any]:
+            if isinstance(value, bool):
+                return {"key": key, "value": {"boolValue": value}}
+            if isinstance(value, int):
+                return {"key": key, "value": {"intValue": str(value)}}
+            if isinstance(value, float):
+                return {"key": key, "value": {"doubleValue": value}}
+            return {"key": key, "value": {"stringValue": str(value)}}
+
+        with self._lock:
+            spans = list(self.spans)
+
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [attribute("service.name", config.TRACING_SERVICE_NAME)]},
+                "scopeSpans": [{
+                    "scope": {"name": "playbook_ai"},
+                    "spans": [
+                        {
+                            "traceId": self.trace_id,
+                            "spanId": span.span_id,
+                            "parentSpanId": span.parent_id or "",
+                            "name": span.name,
+                            "kind": 1,  # SPAN_KIND_INTERNAL
+                            "startTimeUnixNano": str(int(span.start * 1e9)),
+                            "endTimeUnixNano": str(int((span.end or span.start) * 1e9)),
+                            "attributes": [attribute("span.kind", span.kind), attribute("run_id", self.run_id or "")]
+                            + [attribute(key, value) for key, value in span.attributes.items()],
+                            "status": {"code": 2, "message": span.error or ""} if span.status == "error" else {"code": 1}
+                        }
+                        for span in spans
+                    ]
+                }]
+            }]
+        }
+
+    def export_otlp(self, endpoint: str) -> None:
+        """
+        Send the trace to an OpenTelemetry collector (OTLP/HTTP JSON).
+
+        Args:
+            endpoint: Collector base URL (e.g., http://localhost:4318); spans are
+                posted to <endpoint>/v1/traces
+        """
+        request = urllib.request.Request(
+            f"{endpoint.rstrip('/')}/v1/traces",
+            data=json.dumps(self.to_otlp()).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=5):
+            pass
+
+
+_current_trace: ContextVar[Optional[RunTrace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_trace() -> Optional[RunTrace]:
+    """The trace of the run executing in this context, if any"""
+    return _current_trace.get()
+
+
+def current_span() -> Span:
+    """The innermost open span (a no-op span outside a traced run)"""
+    return _current_span.get() or _NOOP_SPAN
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes) -> Iterator[Span]:
+    """
+    Record a span around a block of code.
+
+    Usage:
+        with span(f"agent:{agent.name}", kind="agent", model=model_id) as agent_span:
+            response = agent.run(input=prompt)
+            agent_span.set(output_tokens=...)
+
+    Exceptions mark the span as errored and propagate.
+
+    Args:
+        name: Span name (spans with the same name are aggregated in the summary)
+        kind: Span category ("run", "graph", "step", "agent", ...)
+        **attributes: Initial span attributes
+
+    Yields:
+        Span (a no-op span outside a traced run)
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield _NOOP_SPAN
+        return
+
+    parent = _current_span.get()
+    current = Span(name, kind, trace.trace_id, parent.span_id if parent else None, attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.error = str(e) or type(e).__name__
+        raise
+    finally:
+        current.end = time.time()
+        _current_span.reset(token)
+        trace.record(current)
+
+
+@contextmanager
+def trace_run(run_id: Optional[str] = None) -> Iterator[Optional[RunTrace]]:
+    """
+    Trace a run: spans recorded in this context are collected into one RunTrace.
+
+    Nested calls reuse the enclosing run's trace. The outermost call exports the trace
+    to OTLP_TRACES_ENDPOINT (when set) and prints its slowest spans.
+
+    Args:
+        run_id: Run id recorded with the trace
+
+    Yields:
+        RunTrace, or None when tracing is disabled
+    """
+    if not config.TRACING_ENABLED:
+        yield None
+        return
+
+    trace = _current_trace.get()
+    if trace is not None:
+        yield trace
+        return
+
+    trace = RunTrace(run_id)
+    token = _current_trace.set(trace)
+    try:
+        with span("run", kind="run", run_id=run_id):
+            yield trace
+    finally:
+        _current_trace.reset(token)
+        _print_slowest(trace)
+        if config.OTLP_TRACES_ENDPOINT:
+            try:
+                trace.export_otlp(config.OTLP_TRACES_ENDPOINT)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Could not export trace to {config.OTLP_TRACES_ENDPOINT}: {str(e)}")
+
+
+def _print_slowest(trace: RunTrace, top: int = 3) -> None:
+    slowest = [
+        f"{name} {stats['total_ms'] / 1000:.1f}s"
+        for name, stats in trace.summary().items() if stats["kind"] in ("step", "agent")
+    ][:top]
+    if slowest:
+        print(f"🔭 Trace {trace.trace_id[:8]}: {len(trace.spans)} spans - slowest: {', '.join(slowest)}")
@@ -0,0 +1,205 @@
+"""
+Vendor Store
+Disk-backed store of VendorProfile objects, one per vendor domain.
+Runs against a vendor with a fresh stored profile skip the vendor half of Phase 1
+and all of Phase 2 and load the stored VendorElements instead.
+
+Within a prospect batch, the profile built by the batch's first run is also handed to
+the other prospects in memory (see batch_vendor_profile), so they reuse it even when
+the store wouldn't serve it (e.g. VENDOR_PROFILE_MAX_AGE_HOURS=0).
+"""
+
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+from agno.workflow.types import StepInput
+
+from models.vendor_elements import VendorProfile
+from utils.workflow_helpers import get_parallel_step_content
+import config
+
+# Bump when VendorProfile or the extraction prompts change in ways that invalidate stored profiles
+VENDOR_PROFILE_SCHEMA_VERSION = 1
+
+
+class VendorProfileStore:
+    """Stores one VendorProfile JSON file per vendor domain."""
+
+    def __init__(self, store_dir: str, max_age_hours: int):
+        self.store_dir = store_dir
+        self.max_age_hours = max_age_hours
+        self._lock = threading.Lock()
+
+    def load(self, vendor_domain: str) -> Optional[VendorProfile]:
+        """
+        Load the stored profile for a vendor domain.
+
+        Args:
+            vendor_domain: Normalized vendor domain (e.g., "https://octavehq.com")
+
+        Returns:
+            VendorProfile, or None if missing or unreadable
+        """
+        try:
+            with open(self._path(vendor_domain), "r") as f:
+                return VendorProfile.model_validate(json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def save(self, profile: VendorProfile) -> VendorProfile:
+        """
+        Save a profile, incrementing its version over the previously stored one.
+
+        Args:
+            profile: VendorProfile to persist
+
+        Returns:
+            The saved profile (with version set)
+        """
+        with self._lock:
+            previous = self.load(profile.vendor_domain)
+            profile = profile.model_copy(update={
+                "version": previous.version + 1 if previous else 1,
+                "schema_version": VENDOR_PROFILE_SCHEMA_VERSION
+            })
+
+            path = self._path(profile.vendor_domain)
+            os.makedirs(self.store_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as f:
+                f.write(profile.model_dump_json(indent=2))
+            os.replace(tmp_path, path)
+
+        return profile
+
+    def is_fresh(self, profile: VendorProfile) -> bool:
+        """
+        Check whether a profile is recent enough to reuse.
+
+        Args:
+            profile: Stored VendorProfile
+
+        Returns:
+            True if the schema matches and the scrape is within max_age_hours
+        """
+        if self.max_age_hours <= 0 or profile.schema_version != VENDOR_PROFILE_SCHEMA_VERSION:
+            return False
+
+        try:
+            scraped_at = datetime.fromisoformat(profile.scraped_at)
+        except ValueError:
+            return False
+
+        return datetime.now() - scraped_at <= timedelta(hours=self.max_age_hours)
+
+    def get_fresh_profile(self, vendor_domain: str) -> Optional[VendorProfile]:
+        """
+        Load a vendor's profile only if it is fresh.
+
+        Args:
+            vendor_domain: Normalized vendor domain
+
+        Returns:
+            Fresh VendorProfile, or None
+        """
+        profile = self.load(vendor_domain)
+        if profile and self.is_fresh(profile):
+            return profile
+        return None
+
+    def _path(self, vendor_domain: str) -> str:
+        slug = re.sub(r"[^a-z0-9.-]+", "_", re.sub(r"^https?://", "", vendor_domain.lower())).strip("_")
+        return os.path.join(self.store_dir, f"{slug}.json")
+
+
+@dataclass
+class BatchVendorProfile:
+    """Vendor profile shared by the runs of one prospect batch"""
+    vendor_domain: str
+    profile: Optional[VendorProfile] = None
+
+
+# The current batch's shared profile. Worker threads get it through copied contexts; the
+# holder object is shared, so a profile set by one run is visible to the others.
+_batch_vendor_profile: ContextVar[Optional[BatchVendorProfile]] = ContextVar("batch_vendor_profile", default=None)
+
+
+@contextmanager
+def batch_vendor_profile(vendor_domain: str) -> Iterator[BatchVendorProfile]:
+    """
+    Share the vendor profile built by one run with the other runs of a batch.
+
+    Usage:
+        with batch_vendor_profile(vendor_domain) as shared:
+            run_first_prospect()      # save_vendor_profile sets shared.profile
+            run_other_prospects()     # Step 1 reuses shared.profile
+
+    Args:
+        vendor_domain: Normalized vendor domain of the batch
+
+    Yields:
+        BatchVendorProfile (profile is None until a run builds a complete profile)
+    """
+    shared = BatchVendorProfile(vendor_domain=vendor_domain)
+    token = _batch_vendor_profile.set(shared)
+    try:
+        yield shared
+    finally:
+        _batch_vendor_profile.reset(token)
+
+
+def share_vendor_profile(profile: VendorProfile) -> None:
+    """Hand a complete vendor profile to the current batch's other runs (no-op outside a batch)"""
+    shared = _batch_vendor_profile.get()
+    if shared is not None and shared.vendor_domain == profile.vendor_domain:
+        shared.profile = profile
+
+
+def get_batch_vendor_profile(vendor_domain: str) -> Optional[VendorProfile]:
+    """
+    Get the vendor profile shared by the current batch.
+
+    Args:
+        vendor_domain: Normalized vendor domain
+
+    Returns:
+        VendorProfile built earlier in this batch, or None
+    """
+    shared = _batch_vendor_profile.get()
+    if shared is not None and shared.vendor_domain == vendor_domain:
+        return shared.profile
+    return None
+
+
+def get_reused_vendor_profile(step_input: StepInput) -> Optional[VendorProfile]:
+    """
+    Get the stored vendor profile this run decided to reuse in Step 1, if any.
+
+    Step 1 (validate_vendor) makes the reuse decision once per run and passes the
+    profile along, so every later step sees the same profile.
+
+    Args:
+        step_input: StepInput with access to Step 1 outputs
+
+    Returns:
+        VendorProfile being reused, or None if the vendor side runs normally
+    """
+    vendor_data = get_parallel_step_content(step_input, "parallel_validation", "validate_vendor")
+    if not vendor_data or not vendor_data.get("vendor_profile"):
+        return None
+
+    return VendorProfile.model_validate(vendor_data["vendor_profile"])
+
+
+# Shared store instance
+vendor_store = VendorProfileStore(
+    store_dir=config.VENDOR_STORE_DIR,
+    max_age_hours=config.VENDOR_PROFILE_MAX_AGE_HOURS
+)
@@ -5,8 +5,71 @@ Implements fail-fast validation patterns from CLAUDE.md preferences.
 """
 
 from agno.workflow.types import StepInput, StepOutput
+from pydantic import BaseModel
 from typing import Dict, Tuple, Optional, Any
 import ast
+import json
+
+
+def decode_step_content(content: Any) -> Any:
+    """
+    Decode step content that was serialized to a string.
+
+    Step outputs normally carry the original Python objects. Content only arrives as a
+    string when Agno serialized it: JSON (e.g., a run restored from storage) is decoded
+    with the json module, Python reprs (Agno's str() of parallel sub-step content) fall
+    back to ast.literal_eval.
+
+    Args:
+        content: Step content (returned unchanged unless it is a string)
+
+    Returns:
+        Decoded content
+
+    Raises:
+        ValueError, SyntaxError: If a string is neither JSON nor a Python literal
+    """
+    if not isinstance(content, str):
+        return content
+
+    try:
+        return json.loads(content)
+    except ValueError:
+        return ast.literal_eval(content)
+
+
+def to_json_content(content: Any) -> Any:
+    """
+    Convert step content to plain JSON values for storing it (checkpoints, step memo).
+
+    Pydantic models (e.g., agent response models) are dumped to dicts, at any depth, so
+    stored content reads back the same as model_dump() output instead of as repr strings.
+    Other values are left as they are: json.dumps raises on anything not serializable.
+
+    Args:
+        content: Step content
+
+    Returns:
+        Content with pydantic models replaced by their JSON dumps
+    """
+    if isinstance(content, BaseModel):
+        return content.model_dump(mode="json")
+    if isinstance(content, dict):
+        return {key: to_json_content(value) for key, value in content.items()}
+    if isinstance(content, (list, tuple)):
+        return [to_json_content(value) for value in content]
+    return content
+
+
+def _find_substep_output(step_output: StepOutput, step_name: str) -> Optional[StepOutput]:
+    """Find a sub-step's output inside a Parallel block (including composite sub-steps)"""
+    for sub_step in step_output.steps or []:
+        if sub_step.step_name == step_name:
+            return sub_step
+        nested = _find_substep_output(sub_step, step_name)
+        if nested:
+            return nested
+    return None
 
 
 def get_parallel_step_content(
@@ -15,10 +78,13 @@ def get_parallel_step_content(
     step_name: str
 ) -> Optional[Dict]:
     """
-    Safely get content from a parallel block step with automatic deserialization.
+    Get content from a parallel block step without re-parsing it.
 
-    Agno stores parallel block step outputs as string representations when accessed
-    by later steps, so this helper automatically deserializes them.
+    The run's previous step outputs are the registry of step results: each sub-step
+    output still holds the dict its executor returned, so it is returned as-is instead
+    of going through StepInput.get_step_content (which stringifies every sub-step of the
+    block). Content that Agno did serialize is decoded once and stored back on the
+    output, so later reads in the same run are free.
 
     Args:
         step_input: StepInput object
@@ -31,38 +97,39 @@ def get_parallel_step_content(
     Example:
         vendor_data = get_parallel_step_content(step_input, "parallel_validation", "validate_vendor")
     """
-    # Get the parallel block
-    parallel_block = step_input.get_step_content(parallel_block_name)
+    parallel_block = step_input.get_step_output(parallel_block_name)
 
     if not parallel_block:
         return None
 
-    # Handle if parallel_block itself is a string (shouldn't happen but be safe)
-    if isinstance(parallel_block, str):
+    sub_step = _find_substep_output(parallel_block, step_name)
+
+    if sub_step is not None:
+        step_content = sub_step.content
+    else:
+        # No sub-step outputs (e.g., a restored run): the block content maps step name -> content
         try:
-            parallel_block = ast.literal_eval(parallel_block)
+            block_content = decode_step_content(parallel_block.content)
         except (ValueError, SyntaxError):
             return None
-
-    if not isinstance(parallel_block, dict):
-        return None
-
-    # Get the specific step content
-    step_content = parallel_block.get(step_name)
+        step_content = block_content.get(step_name) if isinstance(block_content, dict) else None
 
     if not step_content:
         return None
 
-    # Deserialize if it's a string (Agno stores parallel outputs as strings)
     if isinstance(step_content, str):
         try:
-            step_content = ast.literal_eval(step_content)
+            step_content = decode_step_content(step_content)
         except (ValueError, SyntaxError, NameError, TypeError) as e:
             # If deserialization fails, log and return None
             print(f"❌ Failed to deserialize step content from {parallel_block_name}.{step_name}: {type(e).__name__}: {str(e)[:100]}")
             print(f"   Content preview: {step_content[:200]}...")
             return None
 
+        # Decode once per run
+        if sub_step is not None and isinstance(step_content, dict):
+            sub_step.content = step_content
+
     # Ensure we're returning a dict
     if not isinstance(step_content, dict):
         print(f"❌ Step content from {parallel_block_name}.{step_name} is not a dict after deserialization: {type(step_content).__name__}")
@@ -81,11 +148,37 @@ def extract_domains_from_input(step_input: StepInput) -> Tuple[Optional[str], Op
     Returns:
         Tuple of (vendor_domain, prospect_domain)
     """
-    vendor_domain = step_input.input.get("vendor_domain")
-    prospect_domain = step_input.input.get("prospect_domain")
+    workflow_input = step_input.input
+
+    # AgentOS passes the validated WorkflowInput model; direct runs may pass a plain dict
+    if isinstance(workflow_input, dict):
+        return workflow_input.get("vendor_domain"), workflow_input.get("prospect_domain")
+
+    vendor_domain = getattr(workflow_input, "vendor_domain", None)
+    prospect_domain = getattr(workflow_input, "prospect_domain", None)
     return vendor_domain, prospect_domain
 
 
+def get_workflow_option(step_input: StepInput, name: str, default: Any = None) -> Any:
+    """
+    Read a run option (e.g., refresh_vendor, priority) from workflow input.
+
+    Args:
+        step_input: StepInput object
+        name: WorkflowInput field name
+        default: Value when the option is not set
+
+    Returns:
+        Option value, or default
+    """
+    workflow_input = step_input.input
+
+    if isinstance(workflow_input, dict):
+        return workflow_input.get(name, default)
+
+    return getattr(workflow_input, name, default)
+
+
 def extract_validated_urls_or_fail(
     step_input: StepInput,
     vendor_step_name: str = "validate_vendor",
@@ -4,14 +4,20 @@ Intelligence gathering, vendor extraction, prospect analysis, and sales playbook
 https://github.com/orchidautomation/playbook_ai-oss
 """
 
-from agno.workflow import Workflow, Step, Parallel
+import asyncio
 
-# Import Phase 1 step executors
+from agno.workflow import Workflow, Step
+from agno.workflow.types import StepInput, StepOutput
+from utils.run_checkpoint import get_run_checkpoint
+from utils.step_graph import GraphStep, StepGraph
+from utils.step_memo import step_memo
+
+# Import Phase 1 step executors (Steps 1-5)
 from steps.step1_domain_validation import validate_vendor_domain, validate_prospect_domain
 from steps.step2_homepage_scraping import scrape_vendor_homepage, scrape_prospect_homepage
 from steps.step3_initial_analysis import analyze_vendor_homepage, analyze_prospect_homepage
 from steps.step4_url_prioritization import prioritize_urls
-from steps.step5_batch_scraping import batch_scrape_selected_pages
+from steps.step5_batch_scraping import scrape_vendor_pages, scrape_prospect_pages
 
 # Import Phase 2 step executors (Step 6)
 from steps.step6_vendor_extraction import (
@@ -22,7 +28,8 @@ from steps.step6_vendor_extraction import (
     extract_customers,
     extract_use_cases,
     extract_personas,
-    extract_differentiators
+    extract_differentiators,
+    save_vendor_profile
 )
 
 # Import Phase 3 step executors (Step 7)
@@ -34,7 +41,11 @@ from steps.step7_prospect_analysis import (
 
 # Import Phase 4 step executors (Step 8)
 from steps.step8_playbook_generation import (
+    get_persona_selection,
+    prepare_playbook_context,
     generate_playbook_summary,
+    speculate_email_sequence,
+    speculate_talk_track,
     generate_email_sequences,
     generate_talk_tracks,
     generate_battle_cards,
@@ -42,214 +53,257 @@ from steps.step8_playbook_generation import (
 )
 
 
-# Phase 1 Workflow (Steps 1-5)
-phase1_workflow = Workflow(
-    name="Phase 1 - Intelligence Gathering",
-    description="Validate domains, scrape homepages, prioritize URLs, and batch scrape content",
-    steps=[
-        # Step 1: Parallel domain validation
-        Parallel(
-            Step(name="validate_vendor", executor=validate_vendor_domain),
-            Step(name="validate_prospect", executor=validate_prospect_domain),
-            name="parallel_validation"
+# Step memo inputs (see utils/step_memo.py): what an LLM step's output depends on. Scraped
+# pages are fingerprinted by their content hashes; Step 1's vendor_profile is set when a
+# stored vendor profile is reused.
+VENDOR_EXTRACTION_MEMO_INPUTS = [
+    "scrape_vendor_pages.vendor_page_hashes",
+    "prioritize_urls.vendor_url_details",
+    "validate_vendor.vendor_profile",
+]
+PROSPECT_ANALYSIS_MEMO_INPUTS = [
+    "scrape_prospect_pages.prospect_page_hashes",
+    "prioritize_urls.prospect_url_details",
+]
+
+# Pipeline spec: every step, the steps whose outputs it reads (depends_on) and the parallel
+# block its output is exposed under (group). Every workflow below is generated from these
+# phases and scheduled by StepGraph, which starts each step as soon as its inputs are ready -
+# so a step's position in the pipeline comes only from what it reads.
+PHASE_STEPS = {
+    # Phase 1: Intelligence Gathering (Steps 1-5)
+    1: [
+        # Step 1: Domain validation (maps both sites)
+        GraphStep("validate_vendor", validate_vendor_domain, group="parallel_validation"),
+        GraphStep("validate_prospect", validate_prospect_domain, group="parallel_validation"),
+
+        # Step 2: Homepage scraping
+        GraphStep("scrape_vendor_home", scrape_vendor_homepage, depends_on=["validate_vendor"], group="parallel_homepage_scraping"),
+        GraphStep("scrape_prospect_home", scrape_prospect_homepage, depends_on=["validate_prospect"], group="parallel_homepage_scraping"),
+
+        # Step 3: Homepage analysis
+        GraphStep("analyze_vendor_home", analyze_vendor_homepage, depends_on=["scrape_vendor_home"], group="parallel_homepage_analysis"),
+        GraphStep("analyze_prospect_home", analyze_prospect_homepage, depends_on=["scrape_prospect_home"], group="parallel_homepage_analysis"),
+
+        # Step 4: URL prioritization (only needs the mapped URLs, not the homepages)
+        GraphStep("prioritize_urls", prioritize_urls, depends_on=["validate_vendor", "validate_prospect"]),
+
+        # Step 5: Batch scraping (one job per company)
+        GraphStep("scrape_vendor_pages", scrape_vendor_pages, depends_on=["prioritize_urls"], group="batch_scrape"),
+        GraphStep("scrape_prospect_pages", scrape_prospect_pages, depends_on=["prioritize_urls"], group="batch_scrape"),
+    ],
+
+    # Phase 2: Vendor Extraction (Step 6)
+    2: [
+        # Step 6: Vendor element extraction (8 specialists)
+        GraphStep("extract_offerings", extract_offerings, depends_on=["scrape_vendor_pages"], group="vendor_element_extraction", memo_inputs=VENDOR_EXTRACTION_MEMO_INPUTS),
+        GraphStep("extract_case_studies", extract_case_studies, depends_on=["scrape_vendor_pages"], group="vendor_element_extraction", memo_inputs=VENDOR_EXTRACTION_MEMO_INPUTS),
+        GraphStep("extract_proof_points", extract_proof_points, depends_on=["scrape_vendor_pages"], group="vendor_element_extraction", memo_inputs=VENDOR_EXTRACTION_MEMO_INPUTS),
+        GraphStep("extract_value_props", extract_value_props, depends_on=["scrape_vendor_pages"], group="vendor_element_extraction", memo_inputs=VENDOR_EXTRACTION_MEMO_INPUTS),
+        GraphStep("extract_customers", extract_customers, depends_on=["scrape_vendor_pages"], group="vendor_element_extraction", memo_inputs=VENDOR_EXTRACTION_MEMO_INPUTS),
+        GraphStep("extract_use_cases", extract_use_cases, depends_on=["scrape_vendor_pages"], group="vendor_element_extraction", memo_inputs=VENDOR_EXTRACTION_MEMO_INPUTS),
+        GraphStep("extract_personas", extract_personas, depends_on=["scrape_vendor_pages"], group="vendor_element_extraction", memo_inputs=VENDOR_EXTRACTION_MEMO_INPUTS),
+        GraphStep("extract_differentiators", extract_differentiators, depends_on=["scrape_vendor_pages"], group="vendor_element_extraction", memo_inputs=VENDOR_EXTRACTION_MEMO_INPUTS),
+
+        # Step 6b: Persist vendor intelligence for reuse across prospects
+        GraphStep("save_vendor_profile", save_vendor_profile, depends_on=["vendor_element_extraction", "analyze_vendor_home"]),
+    ],
+
+    # Phase 3: Prospect Analysis (Step 7)
+    3: [
+        # Step 7a: Prospect context analysis (2 analysts, only need the prospect pages)
+        GraphStep(
+            "analyze_company",
+            analyze_company_profile,
+            depends_on=["scrape_prospect_pages"],
+            group="prospect_context_analysis",
+            memo_inputs=PROSPECT_ANALYSIS_MEMO_INPUTS
         ),
-
-        # Step 2: Parallel homepage scraping
-        Parallel(
-            Step(name="scrape_vendor_home", executor=scrape_vendor_homepage),
-            Step(name="scrape_prospect_home", executor=scrape_prospect_homepage),
-            name="parallel_homepage_scraping"
+        GraphStep(
+            "analyze_pain_points",
+            analyze_pain_points,
+            depends_on=["scrape_prospect_pages"],
+            group="prospect_context_analysis",
+            memo_inputs=PROSPECT_ANALYSIS_MEMO_INPUTS
         ),
 
-        # Step 3: Parallel homepage analysis
-        Parallel(
-            Step(name="analyze_vendor_home", executor=analyze_vendor_homepage),
-            Step(name="analyze_prospect_home", executor=analyze_prospect_homepage),
-            name="parallel_homepage_analysis"
+        # Step 7b: Buyer persona identification (uses vendor + prospect data)
+        GraphStep(
+            "identify_buyer_personas",
+            identify_buyer_personas,
+            depends_on=["vendor_element_extraction", "prospect_context_analysis"],
+            memo_inputs=["vendor_element_extraction", "prospect_context_analysis"]
+        )
+    ],
+}
+
+# Phase 4 (Step 8) depends on the run's persona selection (see playbook_generation_steps)
+PERSONA_SELECTIONS = ("summary", "score", "speculative")
+
+# Name of the workflow step running the pipeline graph
+PIPELINE_STEP_NAME = "sales_intelligence_pipeline"
+
+
+def playbook_generation_steps(persona_selection: str) -> list:
+    """
+    Phase 4 (Step 8) on top of Phases 1-3.
+
+    Args:
+        persona_selection: "summary" - Steps 8b-c wait for the summary's priority personas;
+            "score" - Steps 8b-c use Step 7b's priority_score and run alongside the summary;
+            "speculative" - as "summary", plus the top-scored persona's email sequence and
+            talk track run alongside the summary for Steps 8b-c to reuse (Steps 8b-c do not
+            depend on them: a speculation the summary does not pick is cancelled)
+
+    Returns:
+        GraphSteps for Step 8
+    """
+    persona_source = "prepare_playbook_context" if persona_selection == "score" else "generate_playbook_summary"
+
+    steps = [
+        # Step 8 (prep): Intelligence package + score-ranked personas (no LLM call)
+        GraphStep("prepare_playbook_context", prepare_playbook_context, depends_on=["identify_buyer_personas"]),
+
+        # Step 8a: Playbook summary
+        GraphStep(
+            "generate_playbook_summary",
+            generate_playbook_summary,
+            depends_on=["prepare_playbook_context"],
+            memo_inputs=["prepare_playbook_context"]
         ),
-
-        # Step 4: URL prioritization
-        Step(name="prioritize_urls", executor=prioritize_urls),
-
-        # Step 5: Batch scraping
-        Step(name="batch_scrape", executor=batch_scrape_selected_pages)
     ]
-)
-
 
-# Phase 1-2 Combined Workflow (Steps 1-6)
-phase1_2_workflow = Workflow(
-    name="Phase 1-2 - Intelligence Gathering & Vendor Extraction",
-    description="Gather intelligence and extract vendor GTM elements with 8 parallel specialists",
-    steps=[
-        # Step 1: Parallel domain validation
-        Parallel(
-            Step(name="validate_vendor", executor=validate_vendor_domain),
-            Step(name="validate_prospect", executor=validate_prospect_domain),
-            name="parallel_validation"
+    if persona_selection == "speculative":
+        # Step 8b-c (speculative): top-scored persona, kept or cancelled once the summary is in
+        steps += [
+            GraphStep("speculate_email_sequence", speculate_email_sequence, depends_on=["prepare_playbook_context"]),
+            GraphStep("speculate_talk_track", speculate_talk_track, depends_on=["prepare_playbook_context"]),
+        ]
+
+    return steps + [
+        # Step 8b-d: Playbook components (3 specialists)
+        GraphStep(
+            "generate_email_sequences",
+            generate_email_sequences,
+            depends_on=[persona_source],
+            group="playbook_component_generation"
         ),
-
-        # Step 2: Parallel homepage scraping
-        Parallel(
-            Step(name="scrape_vendor_home", executor=scrape_vendor_homepage),
-            Step(name="scrape_prospect_home", executor=scrape_prospect_homepage),
-            name="parallel_homepage_scraping"
+        GraphStep(
+            "generate_talk_tracks",
+            generate_talk_tracks,
+            depends_on=[persona_source],
+            group="playbook_component_generation"
         ),
-
-        # Step 3: Parallel homepage analysis
-        Parallel(
-            Step(name="analyze_vendor_home", executor=analyze_vendor_homepage),
-            Step(name="analyze_prospect_home", executor=analyze_prospect_homepage),
-            name="parallel_homepage_analysis"
+        GraphStep(
+            "generate_battle_cards",
+            generate_battle_cards,
+            depends_on=["prepare_playbook_context"],
+            group="playbook_component_generation",
+            memo_inputs=["prepare_playbook_context"]
         ),
 
-        # Step 4: URL prioritization
-        Step(name="prioritize_urls", executor=prioritize_urls),
-
-        # Step 5: Batch scraping
-        Step(name="batch_scrape", executor=batch_scrape_selected_pages),
-
-        # Step 6: Vendor element extraction (8 parallel specialists)
-        Parallel(
-            Step(name="extract_offerings", executor=extract_offerings),
-            Step(name="extract_case_studies", executor=extract_case_studies),
-            Step(name="extract_proof_points", executor=extract_proof_points),
-            Step(name="extract_value_props", executor=extract_value_props),
-            Step(name="extract_customers", executor=extract_customers),
-            Step(name="extract_use_cases", executor=extract_use_cases),
-            Step(name="extract_personas", executor=extract_personas),
-            Step(name="extract_differentiators", executor=extract_differentiators),
-            name="vendor_element_extraction"
+        # Step 8e: Final playbook assembly
+        GraphStep(
+            "assemble_final_playbook",
+            assemble_final_playbook,
+            depends_on=["generate_playbook_summary", "playbook_component_generation"]
         )
     ]
-)
 
 
-# Phase 1-2-3 Combined Workflow (Steps 1-7) - COMPLETE SALES INTELLIGENCE PIPELINE
-phase1_2_3_workflow = Workflow(
-    name="Phase 1-2-3 - Complete Sales Intelligence Pipeline",
-    description="Intelligence gathering, vendor extraction, and prospect persona identification",
-    steps=[
-        # Step 1: Parallel domain validation
-        Parallel(
-            Step(name="validate_vendor", executor=validate_vendor_domain),
-            Step(name="validate_prospect", executor=validate_prospect_domain),
-            name="parallel_validation"
-        ),
+def pipeline_steps(through_phase: int = 4, persona_selection: str = "summary") -> list:
+    """
+    Steps of the pipeline up to and including a phase.
+
+    Args:
+        through_phase: Last phase to include (1-4)
+        persona_selection: Phase 4 persona selection (see playbook_generation_steps)
+
+    Returns:
+        GraphSteps in declaration order
+    """
+    steps = [step for phase in sorted(PHASE_STEPS) if phase <= through_phase for step in PHASE_STEPS[phase]]
+    if through_phase >= 4:
+        steps += playbook_generation_steps(persona_selection)
+    return steps
+
+
+def build_phase_workflow(through_phase: int, async_executor: bool = False, **workflow_options) -> Workflow:
+    """
+    Build a workflow running the pipeline through a phase.
+
+    The steps run as one StepGraph, checkpointed per run (see utils/run_checkpoint.py).
+    Through Phase 4, one graph is built per persona selection and each run uses the one
+    matching its input.
+
+    Args:
+        through_phase: Last phase to include (1-4)
+        async_executor: Run the graph in a worker thread from an async executor, for
+            workflows run with arun (the API), so the event loop stays responsive
+        **workflow_options: Workflow arguments (name, description, id, input_schema, ...)
+
+    Returns:
+        Workflow with a single step running the graph
+
+    Raises:
+        ValueError: If a step depends on a step that is not part of the sub-pipeline
+            (e.g., a step placed in an earlier phase than one of its inputs)
+    """
+    if through_phase < 4:
+        executor = StepGraph(
+            PIPELINE_STEP_NAME,
+            pipeline_steps(through_phase),
+            checkpoints=get_run_checkpoint,
+            memo=step_memo
+        ).run
+    else:
+        graphs = {
+            persona_selection: StepGraph(
+                PIPELINE_STEP_NAME,
+                pipeline_steps(through_phase, persona_selection),
+                checkpoints=get_run_checkpoint,
+                memo=step_memo
+            )
+            for persona_selection in PERSONA_SELECTIONS
+        }
+
+        def executor(step_input: StepInput, run_context=None) -> StepOutput:
+            return graphs[get_persona_selection(step_input)].run(step_input, run_context)
+
+    if async_executor:
+        run_graph = executor
+
+        async def executor(step_input: StepInput, run_context=None) -> StepOutput:
+            # to_thread copies the context, so a request's cancellation token is the run's parent
+            return await asyncio.to_thread(run_graph, step_input, run_context)
+
+    return Workflow(steps=[Step(name=PIPELINE_STEP_NAME, executor=executor)], **workflow_options)
 
-        # Step 2: Parallel homepage scraping
-        Parallel(
-            Step(name="scrape_vendor_home", executor=scrape_vendor_homepage),
-            Step(name="scrape_prospect_home", executor=scrape_prospect_homepage),
-            name="parallel_homepage_scraping"
-        ),
 
-        # Step 3: Parallel homepage analysis
-        Parallel(
-            Step(name="analyze_vendor_home", executor=analyze_vendor_homepage),
-            Step(name="analyze_prospect_home", executor=analyze_prospect_homepage),
-            name="parallel_homepage_analysis"
-        ),
-
-        # Step 4: URL prioritization
-        Step(name="prioritize_urls", executor=prioritize_urls),
-
-        # Step 5: Batch scraping
-        Step(name="batch_scrape", executor=batch_scrape_selected_pages),
-
-        # Step 6: Vendor element extraction (8 parallel specialists)
-        Parallel(
-            Step(name="extract_offerings", executor=extract_offerings),
-            Step(name="extract_case_studies", executor=extract_case_studies),
-            Step(name="extract_proof_points", executor=extract_proof_points),
-            Step(name="extract_value_props", executor=extract_value_props),
-            Step(name="extract_customers", executor=extract_customers),
-            Step(name="extract_use_cases", executor=extract_use_cases),
-            Step(name="extract_personas", executor=extract_personas),
-            Step(name="extract_differentiators", executor=extract_differentiators),
-            name="vendor_element_extraction"
-        ),
-
-        # Step 7a: Prospect context analysis (2 parallel analysts)
-        Parallel(
-            Step(name="analyze_company", executor=analyze_company_profile),
-            Step(name="analyze_pain_points", executor=analyze_pain_points),
-            name="prospect_context_analysis"
-        ),
+# Phase 1 Workflow (Steps 1-5)
+phase1_workflow = build_phase_workflow(
+    1,
+    name="Phase 1 - Intelligence Gathering",
+    description="Validate domains, scrape homepages, prioritize URLs, and batch scrape content"
+)
 
-        # Step 7b: Buyer persona identification (uses vendor + prospect data)
-        Step(name="identify_buyer_personas", executor=identify_buyer_personas)
-    ]
+# Phase 1-2 Combined Workflow (Steps 1-6)
+phase1_2_workflow = build_phase_workflow(
+    2,
+    name="Phase 1-2 - Intelligence Gathering & Vendor Extraction",
+    description="Gather intelligence and extract vendor GTM elements with 8 parallel specialists"
 )
 
+# Phase 1-2-3 Combined Workflow (Steps 1-7) - COMPLETE SALES INTELLIGENCE PIPELINE
+phase1_2_3_workflow = build_phase_workflow(
+    3,
+    name="Phase 1-2-3 - Complete Sales Intelligence Pipeline",
+    description="Intelligence gathering, vendor extraction, and prospect persona identification"
+)
 
 # Phase 1-2-3-4 Complete Workflow (Steps 1-8) - COMPLETE MVP
-phase1_2_3_4_workflow = Workflow(
+phase1_2_3_4_workflow = build_phase_workflow(
+    4,
     name="Phase 1-2-3-4 - Complete Sales Intelligence + Playbook Generation",
-    description="End-to-end: Intelligence, vendor extraction, prospect analysis, and actionable playbooks",
-    steps=[
-        # Step 1: Parallel domain validation
-        Parallel(
-            Step(name="validate_vendor", executor=validate_vendor_domain),
-            Step(name="validate_prospect", executor=validate_prospect_domain),
-            name="parallel_validation"
-        ),
-
-        # Step 2: Parallel homepage scraping
-        Parallel(
-            Step(name="scrape_vendor_home", executor=scrape_vendor_homepage),
-            Step(name="scrape_prospect_home", executor=scrape_prospect_homepage),
-            name="parallel_homepage_scraping"
-        ),
-
-        # Step 3: Parallel homepage analysis
-        Parallel(
-            Step(name="analyze_vendor_home", executor=analyze_vendor_homepage),
-            Step(name="analyze_prospect_home", executor=analyze_prospect_homepage),
-            name="parallel_homepage_analysis"
-        ),
-
-        # Step 4: URL prioritization
-        Step(name="prioritize_urls", executor=prioritize_urls),
-
-        # Step 5: Batch scraping
-        Step(name="batch_scrape", executor=batch_scrape_selected_pages),
-
-        # Step 6: Vendor element extraction (8 parallel specialists)
-        Parallel(
-            Step(name="extract_offerings", executor=extract_offerings),
-            Step(name="extract_case_studies", executor=extract_case_studies),
-            Step(name="extract_proof_points", executor=extract_proof_points),
-            Step(name="extract_value_props", executor=extract_value_props),
-            Step(name="extract_customers", executor=extract_customers),
-            Step(name="extract_use_cases", executor=extract_use_cases),
-            Step(name="extract_personas", executor=extract_personas),
-            Step(name="extract_differentiators", executor=extract_differentiators),
-            name="vendor_element_extraction"
-        ),
-
-        # Step 7a: Prospect context analysis (2 parallel analysts)
-        Parallel(
-            Step(name="analyze_company", executor=analyze_company_profile),
-            Step(name="analyze_pain_points", executor=analyze_pain_points),
-            name="prospect_context_analysis"
-        ),
-
-        # Step 7b: Buyer persona identification (uses vendor + prospect data)
-        Step(name="identify_buyer_personas", executor=identify_buyer_personas),
-
-        # Step 8a: Playbook summary (sequential - needs all Phase 1-3 data)
-        Step(name="generate_playbook_summary", executor=generate_playbook_summary),
-
-        # Step 8b-d: Playbook components (3 parallel specialists)
-        Parallel(
-            Step(name="generate_email_sequences", executor=generate_email_sequences),
-            Step(name="generate_talk_tracks", executor=generate_talk_tracks),
-            Step(name="generate_battle_cards", executor=generate_battle_cards),
-            name="playbook_component_generation"
-        ),
-
-        # Step 8e: Final playbook assembly
-        Step(name="assemble_final_playbook", executor=assemble_final_playbook)
-    ]
+    description="End-to-end: Intelligence, vendor extraction, prospect analysis, and actionable playbooks"
 )